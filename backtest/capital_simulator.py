@@ -12,6 +12,7 @@ from config.settings import (
     CONFIDENCE_RISK_MAP,
 )
 from backtest.simple_backtest import Trade
+from monitoring.trade_stats import TradeStats
 
 
 logger = logging.getLogger(__name__)
@@ -143,21 +144,10 @@ class CapitalSimulator:
             else 0
         )
 
-        # Maximum drawdown
-        peak = self.starting_capital
-        max_drawdown = 0
-        max_drawdown_pct = 0
-
-        for equity in self.equity_curve:
-            if equity > peak:
-                peak = equity
-
-            drawdown = peak - equity
-            drawdown_pct = drawdown / peak if peak > 0 else 0
-
-            if drawdown > max_drawdown:
-                max_drawdown = drawdown
-                max_drawdown_pct = drawdown_pct
+        # Maximum drawdown (peak starts at starting capital)
+        max_drawdown, max_drawdown_pct = TradeStats.max_drawdown(
+            self.equity_curve, starting_peak=self.starting_capital
+        )
 
         return {
             "final_equity": final_equity,
@@ -7,6 +7,7 @@ import pandas as pd
 import numpy as np
 
 from backtest.simple_backtest import Trade
+from monitoring.trade_stats import TradeStats
 
 
 logger = logging.getLogger(__name__)
@@ -33,44 +34,21 @@ def calculate_metrics(trades: List[Trade]) -> pd.DataFrame:
         logger.warning("No trades to analyze")
         return pd.DataFrame()
 
-    # Convert to DataFrame for easy grouping
-    trade_data = []
-    for trade in trades:
-        trade_data.append({
-            "confidence": trade.confidence,
-            "return": trade.return_pct,
-            "symbol": trade.symbol,
-            "entry_date": trade.entry_date,
-            "exit_date": trade.exit_date,
-        })
-
-    df = pd.DataFrame(trade_data)
-
-    # Group by confidence
-    results = []
-
-    for conf in sorted(df["confidence"].unique(), reverse=True):
-        conf_trades = df[df["confidence"] == conf]
-
-        if len(conf_trades) == 0:
-            continue
-
-        returns = conf_trades["return"].values
-        win_count = (returns > 0).sum()
-        win_rate = win_count / len(returns)
-
-        avg_return = returns.mean()
-        median_return = np.median(returns)
-        max_loss = returns.min()
-
-        results.append({
-            "Confidence": int(conf),
-            "Trades": len(conf_trades),
-            "WinRate": win_rate,
-            "AvgReturn": avg_return,
-            "MedianReturn": median_return,
-            "MaxLoss": max_loss,
-        })
+    stats = TradeStats.from_trades(trades, returns="return_pct", confidence="confidence")
+
+    # Group by confidence (highest first)
+    tiers = stats.by_confidence()
+    results = [
+        {
+            "Confidence": conf,
+            "Trades": tier["count"],
+            "WinRate": tier["win_rate"],
+            "AvgReturn": tier["avg_return"],
+            "MedianReturn": tier["median_return"],
+            "MaxLoss": tier["max_loss"],
+        }
+        for conf, tier in sorted(tiers.items(), reverse=True)
+    ]
 
     results_df = pd.DataFrame(results)
 
@@ -106,6 +106,10 @@ class BrokerAdapter(ABC):
     4. Enable position queries
     5. Fail loudly on configuration errors
     """
+
+    # True only if independent calls may be in flight at once. Nonce-signed
+    # APIs (Kraken) reject out-of-order nonces, so the default is serial.
+    supports_concurrent_orders: bool = False
     
     @property
     @abstractmethod
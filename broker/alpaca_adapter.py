@@ -84,6 +84,9 @@ class AlpacaAdapter(BrokerAdapter):
     3. Safe position sizing
     4. Comprehensive error logging
     """
+
+    # Stateless key/secret headers: parallel requests are safe
+    supports_concurrent_orders = True
     
     def __init__(self):
         """
@@ -0,0 +1,311 @@
+"""
+Load driver for the execution path.
+
+Pushes orders at a fixed rate (thousands per minute) through either a
+BrokerAdapter directly or a TradingExecutor (execute_signal ->
+poll_order_fills), polls until they complete, and reports end-to-end
+latency percentiles:
+- submit latency: call start -> order acknowledged (includes rate-limit retries)
+- fill latency:   call start -> fill observed by the poller
+
+Intended to run against SimulatedExchangeAdapter for a repeatable,
+network-free performance regression harness (see
+tools/broker/exchange_load_test.py).
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from broker.adapter import BrokerAdapter, OrderStatus
+from broker.exchange_simulator import RateLimitExceeded
+
+logger = logging.getLogger(__name__)
+
+_TERMINAL_FAILURES = (OrderStatus.REJECTED, OrderStatus.CANCELLED, OrderStatus.EXPIRED)
+
+
+@dataclass
+class LatencyStats:
+    """Latency percentiles in milliseconds."""
+    count: int = 0
+    p50_ms: float = 0.0
+    p90_ms: float = 0.0
+    p99_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @classmethod
+    def from_samples(cls, samples_seconds: Sequence[float]) -> "LatencyStats":
+        if not samples_seconds:
+            return cls()
+        ms = np.asarray(samples_seconds, dtype=float) * 1000.0
+        p50, p90, p99 = np.percentile(ms, [50, 90, 99])
+        return cls(len(ms), float(p50), float(p90), float(p99), float(ms.max()))
+
+
+@dataclass
+class LoadReport:
+    """Outcome of one load run."""
+    submitted: int = 0
+    acknowledged: int = 0
+    filled: int = 0
+    failed: int = 0          # Rejected/cancelled/expired by the exchange
+    blocked: int = 0         # Not submitted (executor gate, retries exhausted, errors)
+    unfinished: int = 0      # Still open when the drain timeout expired
+    rate_limited: int = 0    # Rate-limit errors seen (submits and polls)
+    partial_seen: int = 0    # Polls that observed a partial fill
+    duration_seconds: float = 0.0
+    submit_latency: LatencyStats = field(default_factory=LatencyStats)
+    fill_latency: LatencyStats = field(default_factory=LatencyStats)
+
+    @property
+    def fills_per_minute(self) -> float:
+        return self.filled / self.duration_seconds * 60 if self.duration_seconds else 0.0
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        data["fills_per_minute"] = self.fills_per_minute
+        return data
+
+
+class LoadDriver:
+    """
+    Fixed-rate order generator with a concurrent fill poller.
+
+    Build with for_adapter() or for_executor().
+    """
+
+    def __init__(
+        self,
+        submit: Callable[[str], Optional[str]],
+        poll: Callable[[List[str]], Dict[str, OrderStatus]],
+        symbols: Sequence[str],
+        workers: int = 8,
+        poll_interval_seconds: float = 0.05,
+        max_retries: int = 3,
+        backoff_seconds: float = 0.05,
+    ):
+        """
+        Args:
+            submit: symbol -> order_id (None if the order wasn't submitted)
+            poll: open order_ids -> status for each order polled
+            symbols: Symbols to cycle through
+            workers: Concurrent submitters
+            poll_interval_seconds: Fill poller period
+            max_retries: Retries after RateLimitExceeded on submit
+            backoff_seconds: First retry delay (doubles each retry)
+        """
+        self._submit = submit
+        self._poll = poll
+        self.symbols = list(symbols)
+        self.workers = workers
+        self.poll_interval = poll_interval_seconds
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+
+        self._lock = threading.Lock()
+        self._open: Dict[str, float] = {}  # order_id -> submit start (perf_counter)
+        self._submit_samples: List[float] = []
+        self._fill_samples: List[float] = []
+        self._report = LoadReport()
+
+    @classmethod
+    def for_adapter(
+        cls,
+        adapter: BrokerAdapter,
+        symbols: Sequence[str],
+        quantity: float = 1.0,
+        side: str = "buy",
+        poll_workers: int = 8,
+        **kwargs,
+    ) -> "LoadDriver":
+        """
+        Drive a BrokerAdapter's submit_market_order / get_order_status.
+
+        Status requests are issued poll_workers at a time; polling one by
+        one would make fill latency grow with the number of open orders.
+        """
+        poll_pool = ThreadPoolExecutor(max_workers=poll_workers, thread_name_prefix="load-poll")
+
+        def submit(symbol: str) -> Optional[str]:
+            return adapter.submit_market_order(symbol, quantity, side).order_id
+
+        def status(order_id: str) -> OrderStatus:
+            return adapter.get_order_status(order_id).status
+
+        def poll(order_ids: List[str]) -> Dict[str, OrderStatus]:
+            return dict(zip(order_ids, poll_pool.map(status, order_ids)))
+
+        return cls(submit, poll, symbols, **kwargs)
+
+    @classmethod
+    def for_executor(
+        cls,
+        executor,
+        symbols: Sequence[str],
+        confidence: int = 4,
+        **kwargs,
+    ) -> "LoadDriver":
+        """
+        Drive TradingExecutor.execute_signal and poll_order_fills.
+
+        The executor isn't thread-safe (the production loop is single
+        threaded), so its calls are serialized.
+        """
+        executor_lock = threading.Lock()
+
+        def submit(symbol: str) -> Optional[str]:
+            price = executor.broker.get_last_trade_price(symbol)
+            with executor_lock:
+                ok, order_id = executor.execute_signal(
+                    symbol=symbol,
+                    confidence=confidence,
+                    signal_date=datetime.now(),
+                    features={"close": price},
+                )
+            return order_id if ok else None
+
+        def poll(order_ids: List[str]) -> Dict[str, OrderStatus]:
+            with executor_lock:
+                executor.poll_order_fills()
+                still_open = set(executor.pending_orders)
+            # poll_order_fills drops filled and failed orders alike; the
+            # ledger of pending entries tells them apart
+            filled_ids = {entry[0] for entry in executor.pending_entries.values()}
+            return {
+                order_id: (
+                    OrderStatus.PENDING if order_id in still_open
+                    else OrderStatus.FILLED if order_id in filled_ids
+                    else OrderStatus.REJECTED
+                )
+                for order_id in order_ids
+            }
+
+        kwargs.setdefault("workers", 1)
+        return cls(submit, poll, symbols, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Run
+    # ------------------------------------------------------------------
+
+    def run(
+        self,
+        orders_per_minute: float,
+        duration_seconds: float,
+        drain_timeout_seconds: float = 30.0,
+    ) -> LoadReport:
+        """
+        Submit orders at a fixed rate, then wait for them to complete.
+
+        Args:
+            orders_per_minute: Target submission rate
+            duration_seconds: How long to keep submitting
+            drain_timeout_seconds: Max wait for open orders after the last submit
+
+        Returns:
+            LoadReport
+        """
+        total = int(orders_per_minute * duration_seconds / 60)
+        interval = 60.0 / orders_per_minute
+        stop_polling = threading.Event()
+        poller = threading.Thread(target=self._poll_loop, args=(stop_polling,), daemon=True)
+
+        started = time.perf_counter()
+        poller.start()
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="load") as pool:
+            for i in range(total):
+                delay = started + i * interval - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                pool.submit(self._submit_one, self.symbols[i % len(self.symbols)])
+
+        deadline = time.perf_counter() + drain_timeout_seconds
+        while time.perf_counter() < deadline:
+            with self._lock:
+                if not self._open:
+                    break
+            time.sleep(self.poll_interval)
+        stop_polling.set()
+        poller.join()
+
+        with self._lock:
+            report = self._report
+            report.submitted = total
+            report.unfinished = len(self._open)
+            report.duration_seconds = time.perf_counter() - started
+            report.submit_latency = LatencyStats.from_samples(self._submit_samples)
+            report.fill_latency = LatencyStats.from_samples(self._fill_samples)
+
+        logger.info(
+            "LOAD_RUN_COMPLETE | submitted=%d filled=%d failed=%d blocked=%d unfinished=%d "
+            "rate_limited=%d fill_p50_ms=%.1f fill_p99_ms=%.1f",
+            report.submitted, report.filled, report.failed, report.blocked, report.unfinished,
+            report.rate_limited, report.fill_latency.p50_ms, report.fill_latency.p99_ms,
+        )
+        return report
+
+    def _submit_one(self, symbol: str) -> None:
+        started = time.perf_counter()
+        backoff = self.backoff_seconds
+        for attempt in range(self.max_retries + 1):
+            try:
+                order_id = self._submit(symbol)
+                break
+            except RateLimitExceeded:
+                with self._lock:
+                    self._report.rate_limited += 1
+                if attempt == self.max_retries:
+                    order_id = None
+                    break
+                time.sleep(backoff)
+                backoff *= 2
+            except Exception as e:
+                logger.debug(f"Load submit failed for {symbol}: {e}")
+                order_id = None
+                break
+
+        with self._lock:
+            if order_id is None:
+                self._report.blocked += 1
+                return
+            self._report.acknowledged += 1
+            self._submit_samples.append(time.perf_counter() - started)
+            self._open[order_id] = started
+
+    def _poll_loop(self, stop: threading.Event) -> None:
+        while not stop.wait(self.poll_interval):
+            with self._lock:
+                order_ids = list(self._open)
+            if not order_ids:
+                continue
+            try:
+                statuses = self._poll(order_ids)
+            except RateLimitExceeded:
+                with self._lock:
+                    self._report.rate_limited += 1
+                continue
+            except Exception as e:
+                logger.debug(f"Load poll failed: {e}")
+                continue
+
+            now = time.perf_counter()
+            with self._lock:
+                for order_id, status in statuses.items():
+                    started = self._open.get(order_id)
+                    if started is None:
+                        continue
+                    if status == OrderStatus.FILLED:
+                        self._fill_samples.append(now - started)
+                        self._report.filled += 1
+                        del self._open[order_id]
+                    elif status in _TERMINAL_FAILURES:
+                        self._report.failed += 1
+                        del self._open[order_id]
+                    elif status == OrderStatus.PARTIAL:
+                        self._report.partial_seen += 1
@@ -0,0 +1,452 @@
+"""
+Local exchange simulator for load-testing the execution path.
+
+Unlike PaperKrakenSimulator (instant fill at a placeholder price), this
+models what the execution path actually has to cope with:
+- Request latency drawn from a configurable distribution
+- Rate limiting (token bucket) surfaced as RateLimitExceeded
+- Orders that rest in a per-symbol FIFO queue and fill over time
+- Partial fills capped by a participation rate of replayed bar volume,
+  priced off the replayed bar (typical price +/- slippage)
+
+SimulatedExchange is the matching engine; SimulatedExchangeAdapter speaks
+the BrokerAdapter interface so TradingExecutor can run against it with no
+network. Bars advance either explicitly (step()) or on a background market
+clock (start()/stop()).
+
+Everything is in-process and seeded, so runs are repeatable.
+"""
+
+import logging
+import math
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from typing import Callable, Deque, Dict, List, Optional, Sequence
+
+from broker.adapter import BrokerAdapter, OrderResult, OrderStatus, Position
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitExceeded(Exception):
+    """Request rejected by the simulated exchange's rate limiter."""
+    pass
+
+
+@dataclass(frozen=True)
+class Bar:
+    """One replayed OHLCV bar."""
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+    @property
+    def typical_price(self) -> float:
+        return (self.high + self.low + self.close) / 3
+
+
+def bars_from_frame(df) -> List[Bar]:
+    """Bars from a DataFrame with open/high/low/close/volume columns (any case)."""
+    columns = {c.lower(): c for c in df.columns}
+    cols = [columns[name] for name in ("open", "high", "low", "close", "volume")]
+    return [Bar(*map(float, row)) for row in df[cols].itertuples(index=False)]
+
+
+def synthetic_bars(
+    n: int,
+    start_price: float = 100.0,
+    volatility: float = 0.002,
+    mean_volume: float = 1_000.0,
+    seed: int = 0,
+) -> List[Bar]:
+    """Seeded random-walk bars with lognormal volume (when no history is replayed)."""
+    rng = random.Random(seed)
+    bars = []
+    price = start_price
+    for _ in range(n):
+        open_ = price
+        close = open_ * math.exp(rng.gauss(0.0, volatility))
+        spread = abs(rng.gauss(0.0, volatility)) * open_
+        high = max(open_, close) + spread
+        low = min(open_, close) - spread
+        volume = mean_volume * math.exp(rng.gauss(0.0, 0.5) - 0.125)
+        bars.append(Bar(open_, high, low, close, volume))
+        price = close
+    return bars
+
+
+class LatencyModel:
+    """Lognormal request latency (median_ms <= 0 disables)."""
+
+    def __init__(self, median_ms: float = 0.0, sigma: float = 0.5, seed: Optional[int] = None):
+        """
+        Args:
+            median_ms: Median latency in milliseconds
+            sigma: Lognormal shape; 0.5 gives p99 ~3.2x the median
+            seed: Random seed for repeatable runs
+        """
+        self.median_ms = median_ms
+        self.sigma = sigma
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample(self) -> float:
+        """One latency sample in seconds."""
+        if self.median_ms <= 0:
+            return 0.0
+        with self._lock:
+            z = self._rng.gauss(0.0, 1.0)
+        return self.median_ms / 1000.0 * math.exp(self.sigma * z)
+
+
+class _TokenBucket:
+    def __init__(self, rate_per_sec: float, burst: float, clock: Callable[[], float]):
+        self.rate = rate_per_sec
+        self.capacity = burst
+        self.tokens = burst
+        self.clock = clock
+        self.updated = clock()
+
+    def try_acquire(self) -> bool:
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+
+@dataclass
+class SimOrder:
+    """Order state inside the simulated exchange."""
+    order_id: str
+    symbol: str
+    side: str
+    quantity: float
+    submit_time: datetime
+    status: OrderStatus = OrderStatus.PENDING
+    filled_qty: float = 0.0
+    notional: float = 0.0  # Sum of fill price * fill qty
+    fees: float = 0.0
+    fill_time: Optional[datetime] = None
+    rejection_reason: Optional[str] = None
+
+    @property
+    def remaining(self) -> float:
+        return self.quantity - self.filled_qty
+
+    @property
+    def avg_fill_price(self) -> Optional[float]:
+        return self.notional / self.filled_qty if self.filled_qty > 0 else None
+
+
+class SimulatedExchange:
+    """
+    In-process matching engine driven by replayed bars.
+
+    Each step() advances every symbol by one bar (replay wraps around) and
+    fills queued orders FIFO up to participation_rate * bar volume.
+    """
+
+    def __init__(
+        self,
+        bars: Dict[str, Sequence[Bar]],
+        participation_rate: float = 0.1,
+        slippage_bps: float = 5.0,
+        fee_rate: float = 0.0026,
+        starting_cash: float = 1_000_000.0,
+        max_requests_per_sec: Optional[float] = None,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            bars: symbol -> bars to replay (non-empty)
+            participation_rate: Max fraction of a bar's volume one symbol's queue can take
+            slippage_bps: Fill price offset from the bar's typical price
+            fee_rate: Fee as a fraction of fill notional
+            starting_cash: Account cash
+            max_requests_per_sec: Rate limit for all requests (None = unlimited)
+            burst: Token bucket size (default: one second of requests)
+            clock: Monotonic clock (tests)
+        """
+        if not bars or any(len(series) == 0 for series in bars.values()):
+            raise ValueError("bars must map each symbol to at least one bar")
+
+        self.bars = {symbol.upper(): list(series) for symbol, series in bars.items()}
+        self.participation_rate = participation_rate
+        self.slippage_bps = slippage_bps
+        self.fee_rate = fee_rate
+        self.cash = starting_cash
+        self.positions: Dict[str, float] = {}
+
+        self._cursor = {symbol: 0 for symbol in self.bars}
+        self._queues: Dict[str, Deque[SimOrder]] = {symbol: deque() for symbol in self.bars}
+        self._orders: Dict[str, SimOrder] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self._limiter = (
+            _TokenBucket(max_requests_per_sec, burst or max_requests_per_sec, clock)
+            if max_requests_per_sec else None
+        )
+        self.rate_limited = 0
+
+        self._clock_thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    def check_rate_limit(self) -> None:
+        """
+        Count one request against the rate limit.
+
+        Raises:
+            RateLimitExceeded: If the token bucket is empty
+        """
+        if self._limiter is None:
+            return
+        with self._lock:
+            allowed = self._limiter.try_acquire()
+            if not allowed:
+                self.rate_limited += 1
+        if not allowed:
+            raise RateLimitExceeded("EAPI:Rate limit exceeded")
+
+    def submit(self, symbol: str, quantity: float, side: str) -> SimOrder:
+        """Queue a market order; returns a snapshot of the accepted order."""
+        symbol = symbol.upper()
+        if symbol not in self.bars:
+            raise ValueError(f"Unknown symbol: {symbol}")
+        if quantity <= 0:
+            raise ValueError(f"Quantity must be positive: {quantity}")
+        if side not in ("buy", "sell"):
+            raise ValueError(f"Side must be 'buy' or 'sell': {side}")
+
+        with self._lock:
+            self._next_id += 1
+            order = SimOrder(
+                order_id=f"SIM-{self._next_id}",
+                symbol=symbol,
+                side=side,
+                quantity=quantity,
+                submit_time=datetime.now(timezone.utc),
+            )
+            self._orders[order.order_id] = order
+            self._queues[symbol].append(order)
+            return replace(order)
+
+    def order(self, order_id: str) -> SimOrder:
+        """Snapshot of an order."""
+        with self._lock:
+            order = self._orders.get(order_id)
+            if order is None:
+                raise ValueError(f"Order not found: {order_id}")
+            return replace(order)
+
+    def last_price(self, symbol: str) -> float:
+        symbol = symbol.upper()
+        with self._lock:
+            series = self.bars[symbol]
+            return series[(self._cursor[symbol] - 1) % len(series)].close
+
+    # ------------------------------------------------------------------
+    # Matching
+    # ------------------------------------------------------------------
+
+    def step(self) -> int:
+        """Advance every symbol by one bar and fill queued orders; returns fills made."""
+        fills = 0
+        with self._lock:
+            for symbol, queue in self._queues.items():
+                series = self.bars[symbol]
+                bar = series[self._cursor[symbol] % len(series)]
+                self._cursor[symbol] += 1
+                fills += self._match(symbol, queue, bar)
+        return fills
+
+    def _match(self, symbol: str, queue: Deque[SimOrder], bar: Bar) -> int:
+        capacity = self.participation_rate * bar.volume
+        fills = 0
+        now = datetime.now(timezone.utc)
+
+        while queue and capacity > 1e-12:
+            order = queue[0]
+            qty = min(order.remaining, capacity)
+            direction = 1 if order.side == "buy" else -1
+            price = bar.typical_price * (1 + direction * self.slippage_bps / 10_000)
+            fee = qty * price * self.fee_rate
+
+            if order.side == "buy" and qty * price + fee > self.cash:
+                self._reject(queue, order, "insufficient cash")
+                continue
+            if order.side == "sell" and qty > self.positions.get(symbol, 0.0) + 1e-12:
+                self._reject(queue, order, "insufficient position")
+                continue
+
+            self.cash -= direction * qty * price + fee
+            self.positions[symbol] = self.positions.get(symbol, 0.0) + direction * qty
+            order.filled_qty += qty
+            order.notional += qty * price
+            order.fees += fee
+            order.fill_time = now
+            capacity -= qty
+            fills += 1
+
+            if order.remaining <= 1e-12:
+                order.status = OrderStatus.FILLED
+                queue.popleft()
+            else:
+                order.status = OrderStatus.PARTIAL
+        return fills
+
+    @staticmethod
+    def _reject(queue: Deque[SimOrder], order: SimOrder, reason: str) -> None:
+        # A partially filled order keeps its fills; the remainder is cancelled
+        order.status = OrderStatus.CANCELLED if order.filled_qty > 0 else OrderStatus.REJECTED
+        order.rejection_reason = reason
+        queue.popleft()
+
+    # ------------------------------------------------------------------
+    # Market clock
+    # ------------------------------------------------------------------
+
+    def start(self, bar_interval_seconds: float) -> None:
+        """Advance one bar every bar_interval_seconds on a background thread."""
+        if self._clock_thread is not None:
+            return
+        self._stop.clear()
+
+        def run():
+            while not self._stop.wait(bar_interval_seconds):
+                self.step()
+
+        self._clock_thread = threading.Thread(target=run, name="sim-exchange-clock", daemon=True)
+        self._clock_thread.start()
+
+    def stop(self) -> None:
+        if self._clock_thread is None:
+            return
+        self._stop.set()
+        self._clock_thread.join()
+        self._clock_thread = None
+
+
+class SimulatedExchangeAdapter(BrokerAdapter):
+    """
+    BrokerAdapter over a SimulatedExchange.
+
+    Every request sleeps a latency sample and counts against the rate
+    limit, so callers see the same failure modes as a remote exchange.
+    """
+
+    def __init__(self, exchange: SimulatedExchange, latency: Optional[LatencyModel] = None):
+        """
+        Args:
+            exchange: Simulated exchange
+            latency: Per-request latency (default: none)
+        """
+        self.exchange = exchange
+        self.latency = latency or LatencyModel()
+
+    def _request(self) -> None:
+        delay = self.latency.sample()
+        if delay > 0:
+            time.sleep(delay)
+        self.exchange.check_rate_limit()
+
+    @staticmethod
+    def _to_result(order: SimOrder) -> OrderResult:
+        return OrderResult(
+            order_id=order.order_id,
+            symbol=order.symbol,
+            side=order.side,
+            quantity=order.quantity,
+            status=order.status,
+            filled_qty=order.filled_qty,
+            filled_price=order.avg_fill_price,
+            submit_time=order.submit_time,
+            fill_time=order.fill_time,
+            rejection_reason=order.rejection_reason,
+        )
+
+    @property
+    def is_paper_trading(self) -> bool:
+        return True
+
+    @property
+    def account_equity(self) -> float:
+        positions_value = sum(
+            qty * self.exchange.last_price(symbol)
+            for symbol, qty in list(self.exchange.positions.items())
+        )
+        return self.exchange.cash + positions_value
+
+    @property
+    def buying_power(self) -> float:
+        return self.exchange.cash
+
+    def submit_market_order(
+        self,
+        symbol: str,
+        quantity: float,
+        side: str,
+        time_in_force: str = "day",
+    ) -> OrderResult:
+        self._request()
+        return self._to_result(self.exchange.submit(symbol, quantity, side.lower()))
+
+    def get_order_status(self, order_id: str) -> OrderResult:
+        self._request()
+        return self._to_result(self.exchange.order(order_id))
+
+    def get_last_trade_price(self, symbol: str) -> float:
+        self._request()
+        return self.exchange.last_price(symbol)
+
+    def get_positions(self) -> Dict[str, Position]:
+        self._request()
+        return {
+            symbol: self._position(symbol, qty)
+            for symbol, qty in list(self.exchange.positions.items())
+            if abs(qty) > 1e-12
+        }
+
+    def get_position(self, symbol: str) -> Optional[Position]:
+        self._request()
+        qty = self.exchange.positions.get(symbol.upper(), 0.0)
+        return self._position(symbol.upper(), qty) if abs(qty) > 1e-12 else None
+
+    def _position(self, symbol: str, qty: float) -> Position:
+        price = self.exchange.last_price(symbol)
+        return Position(
+            symbol=symbol,
+            quantity=qty,
+            avg_entry_price=price,  # Cost basis is tracked by the ledger, not here
+            current_price=price,
+            unrealized_pnl=0.0,
+            unrealized_pnl_pct=0.0,
+        )
+
+    def close_position(self, symbol: str) -> OrderResult:
+        position = self.get_position(symbol)
+        if not position:
+            raise ValueError(f"No position found for {symbol}")
+        return self.submit_market_order(
+            symbol, abs(position.quantity), "sell" if position.is_long() else "buy"
+        )
+
+    def get_market_hours(self, date: datetime) -> tuple[datetime, datetime]:
+        day = date.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        return day, day.replace(hour=23, minute=59, second=59)
+
+    def is_market_open(self) -> bool:
+        return True
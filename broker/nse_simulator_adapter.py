@@ -14,11 +14,19 @@ Execution Model:
 - Full fills only (v1)
 
 State Persistence:
-- state/<scope>/broker_state.json
+- state/<scope>/broker_state.json     # compact snapshot: cash, positions, pending orders
+- state/<scope>/filled_orders.jsonl   # append-only fill history
+
+Each state change rewrites only the snapshot; fills are appended to the log
+(one write per execution batch), so persist cost doesn't grow with history.
+The snapshot records how many fills it reflects; on load, log lines beyond
+that count (a crash between log append and snapshot write) are dropped so
+their orders are still pending and execute again exactly once.
 """
 
 import logging
 import json
+import os
 import random
 from typing import Optional, Dict, List
 from datetime import datetime, timezone
@@ -58,13 +66,14 @@ class SimulatedOrder:
 
 @dataclass
 class BrokerState:
-    """Persistent broker state."""
+    """Persistent broker state snapshot (fill history lives in the fills log)."""
     account_equity: float
     cash: float
     positions: Dict[str, dict]  # symbol -> position dict
     pending_orders: List[dict]  # list of order dicts
-    filled_orders: List[dict]
     last_update: str
+    filled_orders_count: int = 0  # Fills log lines reflected in this snapshot
+    filled_orders: Optional[List[dict]] = None  # Legacy snapshots only
 
 
 class NSESimulatedBrokerAdapter(BrokerAdapter):
@@ -101,7 +110,8 @@ class NSESimulatedBrokerAdapter(BrokerAdapter):
             state_dir = get_scope_path(scope, "state")
 
         self.state_dir = Path(state_dir)
-        self.state_file = state_dir / "broker_state.json"
+        self.state_file = self.state_dir / "broker_state.json"
+        self.fills_log_file = self.state_dir / "filled_orders.jsonl"
         
         # In-memory state
         self.account_equity = self.STARTING_CAPITAL
@@ -110,6 +120,10 @@ class NSESimulatedBrokerAdapter(BrokerAdapter):
         self.pending_orders: List[SimulatedOrder] = []
         self.filled_orders: List[SimulatedOrder] = []
         
+        # order_id -> order (first order wins on duplicate IDs, as the old scans did)
+        self._pending_index: Dict[str, SimulatedOrder] = {}
+        self._filled_index: Dict[str, SimulatedOrder] = {}
+        
         # Load persisted state if exists
         self._load_state()
         
@@ -162,22 +176,102 @@ class NSESimulatedBrokerAdapter(BrokerAdapter):
                 SimulatedOrder(**order_dict)
                 for order_dict in state.pending_orders
             ]
-            self.filled_orders = [
-                SimulatedOrder(**order_dict)
-                for order_dict in state.filled_orders
-            ]
+            if state.filled_orders is not None:
+                # Legacy snapshot with inline history: move it to the fills log
+                self.filled_orders = [
+                    SimulatedOrder(**order_dict)
+                    for order_dict in state.filled_orders
+                ]
+                self._rewrite_fills_log()
+                self._rebuild_indexes()
+                self._save_state()
+                logger.info(f"Migrated {len(self.filled_orders)} filled orders to {self.fills_log_file}")
+            else:
+                self.filled_orders = self._load_fills_log(state.filled_orders_count)
+            self._rebuild_indexes()
             
             logger.info(f"Loaded broker state from {self.state_file}")
             logger.info(f"  Equity: ₹{self.account_equity:,.2f}")
             logger.info(f"  Positions: {len(self.positions)}")
             logger.info(f"  Pending: {len(self.pending_orders)}")
+            logger.info(f"  Filled: {len(self.filled_orders)}")
             
         except Exception as e:
             logger.error(f"Failed to load broker state: {e}")
             logger.warning("Starting with fresh state")
     
+    def _load_fills_log(self, expected_count: int) -> List[SimulatedOrder]:
+        """
+        Load the fills log, keeping only the fills the snapshot reflects.
+        
+        Args:
+            expected_count: filled_orders_count from the snapshot
+        
+        Returns:
+            Filled orders in fill order
+        """
+        if not self.fills_log_file.exists():
+            if expected_count:
+                logger.warning(
+                    f"Fills log missing ({self.fills_log_file}); "
+                    f"snapshot expected {expected_count} fills"
+                )
+            return []
+        
+        fills: List[SimulatedOrder] = []
+        committed_bytes = 0
+        with open(self.fills_log_file, 'rb') as f:
+            for line in f:
+                if len(fills) >= expected_count:
+                    break
+                if not line.endswith(b"\n"):
+                    break  # Torn write
+                fills.append(SimulatedOrder(**json.loads(line)))
+                committed_bytes += len(line)
+        
+        if self.fills_log_file.stat().st_size > committed_bytes:
+            # Appended after the last snapshot: those orders are still pending
+            logger.warning(
+                f"Dropping fills log entries beyond snapshot ({expected_count} fills)"
+            )
+            with open(self.fills_log_file, 'r+b') as f:
+                f.truncate(committed_bytes)
+        
+        if len(fills) < expected_count:
+            logger.warning(
+                f"Fills log has {len(fills)} entries; snapshot expected {expected_count}"
+            )
+        return fills
+    
+    def _rewrite_fills_log(self) -> None:
+        """Write the whole fill history to the log (legacy migration)."""
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.fills_log_file.with_suffix(".jsonl.tmp")
+        with open(tmp_file, 'w') as f:
+            f.writelines(json.dumps(asdict(order)) + "\n" for order in self.filled_orders)
+        os.replace(tmp_file, self.fills_log_file)
+    
+    def _append_fills(self, orders: List[SimulatedOrder]) -> None:
+        """Append newly filled orders to the fills log in one write."""
+        if not orders:
+            return
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.fills_log_file, 'a') as f:
+            f.write("".join(json.dumps(asdict(order)) + "\n" for order in orders))
+    
+    def _rebuild_indexes(self) -> None:
+        self._rebuild_pending_index()
+        self._filled_index = {}
+        for order in self.filled_orders:
+            self._filled_index.setdefault(order.order_id, order)
+    
+    def _rebuild_pending_index(self) -> None:
+        self._pending_index = {}
+        for order in self.pending_orders:
+            self._pending_index.setdefault(order.order_id, order)
+    
     def _save_state(self) -> None:
-        """Persist broker state to disk."""
+        """Persist the broker state snapshot to disk (atomic replace)."""
         try:
             state = BrokerState(
                 account_equity=self.account_equity,
@@ -187,14 +281,18 @@ class NSESimulatedBrokerAdapter(BrokerAdapter):
                     for symbol, pos in self.positions.items()
                 },
                 pending_orders=[asdict(order) for order in self.pending_orders],
-                filled_orders=[asdict(order) for order in self.filled_orders],
-                last_update=datetime.now(timezone.utc).isoformat()
+                last_update=datetime.now(timezone.utc).isoformat(),
+                filled_orders_count=len(self.filled_orders),
             )
+            data = asdict(state)
+            del data["filled_orders"]
             
             self.state_dir.mkdir(parents=True, exist_ok=True)
             
-            with open(self.state_file, 'w') as f:
-                json.dump(asdict(state), f, indent=2)
+            tmp_file = self.state_file.with_suffix(".json.tmp")
+            with open(tmp_file, 'w') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_file, self.state_file)
             
             logger.debug(f"Saved broker state to {self.state_file}")
             
@@ -286,21 +384,12 @@ class NSESimulatedBrokerAdapter(BrokerAdapter):
         )
         
         self.pending_orders.append(order)
+        self._pending_index.setdefault(order_id, order)
         self._save_state()
         
         logger.info(f"Order submitted: {order_id} | {side.upper()} {quantity} {symbol}")
         
-        return OrderResult(
-            order_id=order_id,
-            symbol=symbol.upper(),
-            side=side.lower(),
-            quantity=quantity,
-            status=OrderStatus.PENDING,
-            timestamp=datetime.now(timezone.utc),
-            filled_quantity=0.0,
-            filled_price=None,
-            avg_fill_price=None,
-        )
+        return self._order_result(order, OrderStatus.PENDING)
     
     def execute_pending_orders(self, market_prices: Dict[str, float]) -> List[OrderResult]:
         """
@@ -319,8 +408,9 @@ class NSESimulatedBrokerAdapter(BrokerAdapter):
             return []
         
         filled_results = []
+        newly_filled: List[SimulatedOrder] = []
         
-        for order in self.pending_orders[:]:  # Copy to allow modification
+        for order in self.pending_orders:
             if order.symbol not in market_prices:
                 logger.warning(f"No price data for {order.symbol} - order remains pending")
                 continue
@@ -412,26 +502,20 @@ class NSESimulatedBrokerAdapter(BrokerAdapter):
             order.fill_price = fill_price
             order.slippage_pct = slippage_pct
             
-            self.filled_orders.append(order)
+            newly_filled.append(order)
             
             # Create result
-            filled_results.append(OrderResult(
-                order_id=order.order_id,
-                symbol=order.symbol,
-                side=order.side,
-                quantity=order.quantity,
-                status=OrderStatus.FILLED,
-                timestamp=datetime.fromisoformat(order.fill_time),
-                filled_quantity=order.quantity,
-                filled_price=fill_price,
-                avg_fill_price=fill_price,
-            ))
+            filled_results.append(self._order_result(order, OrderStatus.FILLED))
         
         # Remove filled/rejected orders from pending
         self.pending_orders = [
             o for o in self.pending_orders
             if o.status == "pending"
         ]
+        self.filled_orders.extend(newly_filled)
+        self._rebuild_pending_index()
+        for order in newly_filled:
+            self._filled_index.setdefault(order.order_id, order)
         
         # Recalculate equity
         positions_value = sum(
@@ -440,7 +524,11 @@ class NSESimulatedBrokerAdapter(BrokerAdapter):
         )
         self.account_equity = self.cash + positions_value
         
-        # Persist state
+        # Persist once per batch: fills log first, then the snapshot that counts them
+        try:
+            self._append_fills(newly_filled)
+        except Exception as e:
+            logger.error(f"Failed to append fills log: {e}")
         self._save_state()
         
         logger.info(f"Executed {len(filled_results)} orders | Equity: ₹{self.account_equity:,.2f}")
@@ -449,38 +537,32 @@ class NSESimulatedBrokerAdapter(BrokerAdapter):
     
     def get_order_status(self, order_id: str) -> OrderResult:
         """Get order status by ID."""
-        # Check filled orders
-        for order in self.filled_orders:
-            if order.order_id == order_id:
-                return OrderResult(
-                    order_id=order.order_id,
-                    symbol=order.symbol,
-                    side=order.side,
-                    quantity=order.quantity,
-                    status=OrderStatus.FILLED,
-                    timestamp=datetime.fromisoformat(order.submit_time),
-                    filled_quantity=order.quantity,
-                    filled_price=order.fill_price,
-                    avg_fill_price=order.fill_price,
-                )
+        order = self._filled_index.get(order_id)
+        if order is not None:
+            return self._order_result(order, OrderStatus.FILLED)
         
-        # Check pending orders
-        for order in self.pending_orders:
-            if order.order_id == order_id:
-                return OrderResult(
-                    order_id=order.order_id,
-                    symbol=order.symbol,
-                    side=order.side,
-                    quantity=order.quantity,
-                    status=OrderStatus.PENDING,
-                    timestamp=datetime.fromisoformat(order.submit_time),
-                    filled_quantity=0.0,
-                    filled_price=None,
-                    avg_fill_price=None,
-                )
+        order = self._pending_index.get(order_id)
+        if order is not None:
+            return self._order_result(order, OrderStatus.PENDING)
         
         raise ValueError(f"Order not found: {order_id}")
     
+    @staticmethod
+    def _order_result(order: SimulatedOrder, status: OrderStatus) -> OrderResult:
+        """Build an OrderResult from a simulated order."""
+        filled = status == OrderStatus.FILLED
+        return OrderResult(
+            order_id=order.order_id,
+            symbol=order.symbol,
+            side=order.side,
+            quantity=order.quantity,
+            status=status,
+            filled_qty=order.quantity if filled else 0.0,
+            filled_price=order.fill_price if filled else None,
+            submit_time=datetime.fromisoformat(order.submit_time),
+            fill_time=datetime.fromisoformat(order.fill_time) if order.fill_time else None,
+        )
+    
     def get_positions(self) -> Dict[str, Position]:
         """Get all open positions."""
         # TODO: Need current market prices for unrealized P&L
@@ -21,13 +21,14 @@ import json
 import logging
 import uuid
 from dataclasses import dataclass, asdict
-from datetime import datetime
+from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 import csv
 
 from config.scope import get_scope
 from config.scope_paths import get_scope_path
+from monitoring.trade_stats import TradeStats
 
 logger = logging.getLogger(__name__)
 
@@ -155,6 +156,8 @@ class TradeLedger:
             ledger_file: Path to persist ledger (JSON). If None, uses ScopePathResolver.
         """
         self.trades: List[Trade] = []
+        self._stats: Optional[TradeStats] = None  # Columnar cache, rebuilt after add_trade
+        self._realized_by_day: Dict[str, float] = {}  # UTC exit date -> net PnL, updated on add
         self._open_positions: Dict[str, Dict[str, Any]] = {}  # Track external positions
         
         if ledger_file is None:
@@ -189,14 +192,28 @@ class TradeLedger:
         Args:
             trade: Complete trade object
         """
-        self.trades.append(trade)
-        logger.info(
-            f"Trade logged: {trade.symbol} | "
-            f"{trade.exit_type} | "
-            f"PnL: {trade.net_pnl_pct:+.2f}% | "
-            f"Held {trade.holding_days} days | "
-            f"Reason: {trade.exit_reason}"
-        )
+        self.add_trades([trade])
+    
+    def add_trades(self, trades: List[Trade]) -> None:
+        """
+        Add a batch of completed trades with a single persist.
+        
+        Args:
+            trades: Complete trade objects, in exit order
+        """
+        if not trades:
+            return
+        for trade in trades:
+            self.trades.append(trade)
+            self._accumulate_realized(trade)
+            logger.info(
+                f"Trade logged: {trade.symbol} | "
+                f"{trade.exit_type} | "
+                f"PnL: {trade.net_pnl_pct:+.2f}% | "
+                f"Held {trade.holding_days} days | "
+                f"Reason: {trade.exit_reason}"
+            )
+        self._stats = None
         
         # Persist immediately
         self._save_to_disk()
@@ -209,6 +226,32 @@ class TradeLedger:
             List of all Trade objects
         """
         return self.trades.copy()
+
+    def get_last_trade(self) -> Optional[Trade]:
+        """Most recently added trade, or None if the ledger is empty."""
+        return self.trades[-1] if self.trades else None
+
+    def get_realized_pnl_for_day(self, day: Optional[date] = None) -> float:
+        """
+        Net realized PnL of trades exiting on a UTC day (O(1)).
+
+        Args:
+            day: UTC date (default: today)
+        """
+        if day is None:
+            day = datetime.now(timezone.utc).date()
+        return self._realized_by_day.get(day.isoformat(), 0.0)
+
+    def _accumulate_realized(self, trade: Trade) -> None:
+        """Add a trade's net PnL to its UTC exit-day bucket (naive = UTC)."""
+        try:
+            exit_ts = datetime.fromisoformat(trade.exit_timestamp)
+            if exit_ts.tzinfo is not None:
+                exit_ts = exit_ts.astimezone(timezone.utc)
+            day = exit_ts.date().isoformat()
+            self._realized_by_day[day] = self._realized_by_day.get(day, 0.0) + float(trade.net_pnl)
+        except Exception:
+            pass
     
     def get_trades_for_symbol(self, symbol: str) -> List[Trade]:
         """
@@ -288,29 +331,43 @@ class TradeLedger:
                 "emergency_exits": 0
             }
         
-        winners = [t for t in self.trades if t.net_pnl > 0]
-        losers = [t for t in self.trades if t.net_pnl <= 0]
-        swing_exits = [t for t in self.trades if t.exit_type == "SWING_EXIT"]
-        emergency_exits = [t for t in self.trades if t.exit_type == "EMERGENCY_EXIT"]
-        
-        total_net_pnl = sum(t.net_pnl for t in self.trades)
-        avg_net_pnl = total_net_pnl / len(self.trades)
-        avg_net_pnl_pct = sum(t.net_pnl_pct for t in self.trades) / len(self.trades)
-        avg_holding_days = sum(t.holding_days for t in self.trades) / len(self.trades)
+        stats = self.get_trade_stats()
+        exit_counts = stats.label_counts()
+        winners = stats.win_count()
         
         return {
-            "total_trades": len(self.trades),
-            "winners": len(winners),
-            "losers": len(losers),
-            "win_rate_pct": (len(winners) / len(self.trades)) * 100,
-            "avg_net_pnl": avg_net_pnl,
-            "avg_net_pnl_pct": avg_net_pnl_pct,
-            "total_net_pnl": total_net_pnl,
-            "avg_holding_days": avg_holding_days,
-            "swing_exits": len(swing_exits),
-            "emergency_exits": len(emergency_exits)
+            "total_trades": len(stats),
+            "winners": winners,
+            "losers": len(stats) - winners,
+            "win_rate_pct": stats.win_rate() * 100,
+            "avg_net_pnl": stats.total_pnl() / len(stats),
+            "avg_net_pnl_pct": stats.mean_return(),
+            "total_net_pnl": stats.total_pnl(),
+            "avg_holding_days": stats.mean_holding_days(),
+            "swing_exits": exit_counts.get("SWING_EXIT", 0),
+            "emergency_exits": exit_counts.get("EMERGENCY_EXIT", 0)
         }
     
+    def get_trade_stats(self) -> TradeStats:
+        """
+        Get columnar statistics over all trades.
+        
+        Built once and cached until the next add_trade.
+        
+        Returns:
+            TradeStats (returns=net_pnl_pct, pnl=net_pnl, labels=exit_type)
+        """
+        if self._stats is None or len(self._stats) != len(self.trades):
+            self._stats = TradeStats.from_trades(
+                self.trades,
+                returns="net_pnl_pct",
+                pnl="net_pnl",
+                holding_days="holding_days",
+                confidence="confidence",
+                labels="exit_type",
+            )
+        return self._stats
+    
     def export_to_csv(self, filepath: Path) -> None:
         """
         Export all trades to CSV.
@@ -382,6 +439,7 @@ class TradeLedger:
                     trade_dict = json.loads(line)
                     trade = Trade(**trade_dict)
                     self.trades.append(trade)
+                    self._accumulate_realized(trade)
             
             logger.info(f"Loaded {len(self.trades)} trades from {self.ledger_file}")
         except Exception as e:
@@ -26,6 +26,13 @@ CRYPTO_MONITOR_INTERVAL_MINUTES = int(os.getenv("CRYPTO_MONITOR_INTERVAL_MINUTES
 # Reconciliation interval
 CRYPTO_RECONCILIATION_INTERVAL_MINUTES = int(os.getenv("CRYPTO_RECONCILIATION_INTERVAL_MINUTES", "60"))
 
+# Task lane timeouts (seconds)
+# A task exceeding its timeout is reported; its lane stays blocked (later
+# submissions on it are skipped) until the overrunning call returns
+CRYPTO_TRADING_TASK_TIMEOUT_SECONDS = int(os.getenv("CRYPTO_TRADING_TASK_TIMEOUT_SECONDS", "240"))
+CRYPTO_ML_TASK_TIMEOUT_SECONDS = int(os.getenv("CRYPTO_ML_TASK_TIMEOUT_SECONDS", "5400"))
+CRYPTO_GOVERNANCE_TASK_TIMEOUT_SECONDS = int(os.getenv("CRYPTO_GOVERNANCE_TASK_TIMEOUT_SECONDS", "900"))
+
 # Observability
 STATUS_SNAPSHOT_INTERVAL_MINUTES = int(os.getenv("STATUS_SNAPSHOT_INTERVAL_MINUTES", "15"))
 DAILY_SUMMARY_OUTPUT_PATH = os.getenv("DAILY_SUMMARY_OUTPUT_PATH", "")
@@ -36,6 +43,10 @@ AI_ADVISOR_ENABLED = os.getenv("AI_ADVISOR_ENABLED", "false").lower() == "true"
 AI_MAX_CALLS_PER_DAY = int(os.getenv("AI_MAX_CALLS_PER_DAY", "1"))
 AI_RANKING_INTERVAL_HOURS = int(os.getenv("AI_RANKING_INTERVAL_HOURS", "24"))
 AI_VALIDATE_SCHEDULER = os.getenv("AI_VALIDATE_SCHEDULER", "false").lower() == "true"
+# Response cache: identical/near-identical feature payloads reuse a ranking for the TTL
+# (default: one ranking interval, so a cached ranking outlives the interval gate)
+AI_CACHE_TTL_SECONDS = int(os.getenv("AI_CACHE_TTL_SECONDS", str(max(1, AI_RANKING_INTERVAL_HOURS) * 3600)))
+AI_CACHE_SIGNIFICANT_DIGITS = int(os.getenv("AI_CACHE_SIGNIFICANT_DIGITS", "2"))
 
 # Scan limits (Phase B)
 MAX_SYMBOLS_SCANNED_PER_CYCLE = int(os.getenv("MAX_SYMBOLS_SCANNED_PER_CYCLE", "10"))
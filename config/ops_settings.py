@@ -75,3 +75,16 @@ DURATION_HISTORY_DAYS = int(os.getenv("OPS_DURATION_HISTORY_DAYS", "90"))
 
 # Cleanup old regime events (days)
 DURATION_CLEANUP_DAYS = int(os.getenv("OPS_DURATION_CLEANUP_DAYS", "30"))
+
+# ============================================================================
+# Telegram Polling Configuration
+# ============================================================================
+
+# Server-side long-poll timeout for getUpdates (seconds; 0 = short polling)
+LONG_POLL_TIMEOUT_SECONDS = int(os.getenv("OPS_LONG_POLL_TIMEOUT_SECONDS", "25"))
+
+# Concurrent reply workers (slow replies don't block other operators)
+REPLY_WORKERS = int(os.getenv("OPS_REPLY_WORKERS", "4"))
+
+# How long reader results (snapshots, summaries, positions) are shared (seconds)
+SNAPSHOT_CACHE_TTL_SECONDS = float(os.getenv("OPS_SNAPSHOT_CACHE_TTL_SECONDS", "2"))
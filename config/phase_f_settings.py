@@ -107,6 +107,20 @@ NEWSAPI_BASE_URL = os.getenv("NEWSAPI_BASE_URL", "https://newsapi.org/v2")
 # Multi-source news fetcher (NEW)
 PHASE_F_USE_MULTI_SOURCE_FETCHER = os.getenv("PHASE_F_USE_MULTI_SOURCE_FETCHER", "true").lower() == "true"
 
+# Concurrent fetching: all keywords/feeds/sites share one pool and one deadline
+PHASE_F_FETCH_MAX_WORKERS = int(os.getenv("PHASE_F_FETCH_MAX_WORKERS", "8"))
+PHASE_F_FETCH_DEADLINE_SECONDS = float(os.getenv("PHASE_F_FETCH_DEADLINE_SECONDS", "30"))
+
+# Near-duplicate clustering (MinHash/LSH over title + description)
+# Syndicated copies collapse into one article weighted by source_count
+PHASE_F_NEAR_DUPLICATE_CLUSTERING = os.getenv("PHASE_F_NEAR_DUPLICATE_CLUSTERING", "true").lower() == "true"
+PHASE_F_NEAR_DUPLICATE_THRESHOLD = float(os.getenv("PHASE_F_NEAR_DUPLICATE_THRESHOLD", "0.5"))
+
+# Conditional GET cache (ETag/Last-Modified bodies + parsed articles)
+PHASE_F_HTTP_CACHE_DIR = os.getenv("PHASE_F_HTTP_CACHE_DIR", "persist/phase_f/http_cache")
+# Entries not fetched or revalidated for this long are deleted (0 = keep forever)
+PHASE_F_HTTP_CACHE_MAX_AGE_HOURS = float(os.getenv("PHASE_F_HTTP_CACHE_MAX_AGE_HOURS", "72"))
+
 # NewsAPI (free tier 100/day)
 # ENABLED by default - requires API key in .env
 NEWSAPI_KEY = os.getenv("NEWSAPI_KEY", "").strip()
@@ -125,6 +139,18 @@ PHASE_F_WEB_SCRAPER_ENABLED = os.getenv("PHASE_F_WEB_SCRAPER_ENABLED", "true").l
 # CryptoCompare API - REMOVED (redirects to CoinDesk RSS which we already have)
 # Twitter/X API - REMOVED (cost: $100/mo, use RSS sentiment instead)
 
+# Kraken market signals (public API)
+# Symbols snapshotted each run; responses reused for a short TTL across callers
+PHASE_F_MARKET_SIGNAL_SYMBOLS = [
+    s.strip().upper()
+    for s in os.getenv("PHASE_F_MARKET_SIGNAL_SYMBOLS", "BTC,ETH,SOL,ADA,XRP").split(",")
+    if s.strip()
+]
+PHASE_F_MARKET_SIGNALS_TTL_SECONDS = float(os.getenv("PHASE_F_MARKET_SIGNALS_TTL_SECONDS", "15"))
+# Per-symbol requests share one pool and one deadline
+PHASE_F_MARKET_SIGNALS_MAX_WORKERS = int(os.getenv("PHASE_F_MARKET_SIGNALS_MAX_WORKERS", "8"))
+PHASE_F_MARKET_SIGNALS_DEADLINE_SECONDS = float(os.getenv("PHASE_F_MARKET_SIGNALS_DEADLINE_SECONDS", "20"))
+
 # Glassnode API (on-chain data)
 GLASSNODE_API_KEY = os.getenv("GLASSNODE_API_KEY", "").strip()
 GLASSNODE_BASE_URL = os.getenv("GLASSNODE_BASE_URL", "https://api.glassnode.com")
@@ -18,9 +18,19 @@ HEALTH_CHECK_INTERVAL_MINUTES = int(os.getenv("HEALTH_CHECK_INTERVAL_MINUTES", "
 ENTRY_WINDOW_MINUTES_BEFORE_CLOSE = int(os.getenv("ENTRY_WINDOW_MINUTES_BEFORE_CLOSE", "25"))
 SWING_EXIT_DELAY_MINUTES_AFTER_CLOSE = int(os.getenv("SWING_EXIT_DELAY_MINUTES_AFTER_CLOSE", "10"))
 
+# Market clock source: "calendar" (local precomputed session calendar, no
+# broker call per tick) or "broker" (broker clock API with retries)
+SCHEDULER_CLOCK_SOURCE = os.getenv("SCHEDULER_CLOCK_SOURCE", "calendar").lower()
+
 # Tick cadence (seconds) for scheduler loop
 SCHEDULER_TICK_SECONDS = int(os.getenv("SCHEDULER_TICK_SECONDS", "60"))
 
+# Per-phase tick telemetry (logs/scheduler_telemetry*.json[l])
+SCHEDULER_TELEMETRY_ENABLED = os.getenv("SCHEDULER_TELEMETRY_ENABLED", "true").lower() == "true"
+SCHEDULER_TELEMETRY_WINDOW = int(os.getenv("SCHEDULER_TELEMETRY_WINDOW", "500"))
+# Per-tick log is rotated to scheduler_telemetry.jsonl.1 past this size
+SCHEDULER_TELEMETRY_MAX_BYTES = int(os.getenv("SCHEDULER_TELEMETRY_MAX_BYTES", str(20 * 1024 * 1024)))
+
 # Startup behaviors
 RUN_STARTUP_RECONCILIATION = os.getenv("RUN_STARTUP_RECONCILIATION", "true").lower() == "true"
 RUN_HEALTH_CHECK_ON_BOOT = os.getenv("RUN_HEALTH_CHECK_ON_BOOT", "true").lower() == "true"
@@ -36,8 +36,10 @@ Expected filesystem layout:
 
 import os
 import logging
+import threading
 from pathlib import Path
-from typing import Optional, Union
+from types import MappingProxyType
+from typing import Dict, Optional, Tuple, Union
 
 from config.scope import Scope, get_scope
 
@@ -135,6 +137,17 @@ class ScopePathResolver:
         # Create scope-specific subdirectories
         self._ensure_subdirectories()
         
+        # Component directories for get_scope_path (read-only)
+        self.components = MappingProxyType({
+            "ledger": self.get_ledger_dir(),
+            "models": self.get_models_dir(),
+            "features": self.get_features_dir(),
+            "labels": self.get_labels_dir(),
+            "state": self.get_state_dir(),
+            "logs": self.get_logs_dir(),
+            "cache": self.get_cache_dir(),
+        })
+        
         logger.info(f"ScopePathResolver initialized for {scope}")
         logger.info(f"  Persistence root: {self.base_dir.absolute()}")
         logger.info(f"  Scope directory: {self.scope_dir.absolute()}")
@@ -282,6 +295,38 @@ class ScopePathResolver:
         }
 
 
+# Resolvers are built (root validated, directories created) once per
+# (scope, PERSISTENCE_ROOT) and reused; path lookups are then dict reads
+_resolvers: Dict[Tuple[str, str], ScopePathResolver] = {}
+_resolvers_lock = threading.Lock()
+
+
+def _resolve_scope(scope: Union[Scope, str, None]) -> Scope:
+    if scope is None:
+        return get_scope()
+    if isinstance(scope, str):
+        return Scope.from_string(scope)
+    return scope
+
+
+def _get_resolver(scope: Scope) -> ScopePathResolver:
+    key = (str(scope), os.getenv("PERSISTENCE_ROOT", ""))
+    resolver = _resolvers.get(key)
+    if resolver is None:
+        with _resolvers_lock:
+            resolver = _resolvers.get(key)
+            if resolver is None:
+                resolver = ScopePathResolver(scope)
+                _resolvers[key] = resolver
+    return resolver
+
+
+def clear_scope_path_cache() -> None:
+    """Drop cached resolvers (testing, or after the persistence root is recreated)."""
+    with _resolvers_lock:
+        _resolvers.clear()
+
+
 def get_scope_path(scope: Union[Scope, str, None], component: str) -> Path:
     """
     Resolve a component path for a given scope.
@@ -295,40 +340,23 @@ def get_scope_path(scope: Union[Scope, str, None], component: str) -> Path:
     - logs
     - cache
     """
-    if scope is None:
-        scope = get_scope()
-    elif isinstance(scope, str):
-        scope = Scope.from_string(scope)
-
-    resolver = ScopePathResolver(scope)
-
-    allowed = {
-        "ledger": resolver.get_ledger_dir,
-        "models": resolver.get_models_dir,
-        "features": resolver.get_features_dir,
-        "labels": resolver.get_labels_dir,
-        "state": resolver.get_state_dir,
-        "logs": resolver.get_logs_dir,
-        "cache": resolver.get_cache_dir,
-    }
+    components = _get_resolver(_resolve_scope(scope)).components
+    if component not in components:
+        raise ValueError(f"Invalid component: {component}. Allowed: {sorted(components.keys())}")
 
-    if component not in allowed:
-        raise ValueError(f"Invalid component: {component}. Allowed: {sorted(allowed.keys())}")
-
-    return allowed[component]()
+    return components[component]
 
 
 def get_scope_paths(scope: Optional[Scope] = None) -> ScopePathResolver:
     """
     Get path resolver for a scope.
     
+    The resolver is built once per scope and persistence root and shared.
+    
     Args:
         scope: Optional Scope instance; defaults to global scope
     
     Returns:
         ScopePathResolver
     """
-    if scope is None:
-        scope = get_scope()
-    
-    return ScopePathResolver(scope)
+    return _get_resolver(_resolve_scope(scope))
@@ -147,6 +147,10 @@ RECONCILIATION_ENGINE = os.getenv("RECONCILIATION_ENGINE", "alpaca_v2")
 RECONCILIATION_BACKFILL_ENABLED = True   # Backfill ledger from broker positions
 RECONCILIATION_MARK_UNKNOWN_CLOSED = True  # Mark ledger positions not on broker as CLOSED
 
+# Liquidation sells submitted in parallel, only for brokers that set
+# supports_concurrent_orders (nonce-signed APIs such as Kraken stay serial)
+LIQUIDITY_MAX_WORKERS = int(os.getenv("LIQUIDITY_MAX_WORKERS", "4"))
+
 # ============================================================================
 # SCALE-IN / PYRAMIDING CONFIGURATION
 # ============================================================================
@@ -19,11 +19,13 @@ Workflow:
 
 import logging
 import json
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import hashlib
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -243,36 +245,65 @@ class MLPipeline:
         return sorted(all_trades, key=lambda t: t.get('timestamp', now))
     
     def _extract_features(self, trades: List[Dict], now: datetime) -> List[List[float]]:
-        """Extract features from trades for ML."""
-        features = []
-        
-        # Group trades by time windows (hourly)
-        from datetime import timedelta
-        
-        current_time = now - timedelta(days=self.training_lookback_days)
-        features_list = []
+        """
+        Extract hourly-window features from trades for ML.
         
-        while current_time < now:
-            window_end = current_time + timedelta(hours=1)
-            window_trades = [
-                t for t in trades
-                if current_time <= datetime.fromisoformat(t.get('timestamp', now.isoformat())) < window_end
-            ]
-            
-            # Extract features from this window
-            if window_trades:
-                feature_vector = [
-                    len(window_trades),  # Trade count
-                    sum(float(t.get('quantity', 0)) for t in window_trades),  # Total volume
-                    sum(float(t.get('pnl', 0)) for t in window_trades),  # Window P&L
-                    max(float(t.get('price', 0)) for t in window_trades) if window_trades else 0,  # Max price
-                    min(float(t.get('price', 0)) for t in window_trades) if window_trades else 0,  # Min price
-                ]
-                features_list.append(feature_vector)
-            
-            current_time = window_end
+        Timestamps are parsed once into an int64 epoch array and bucketed
+        into hourly bins in a single pass, so cost is O(trades log trades)
+        instead of O(hours x trades).
         
-        return features_list if features_list else [[0.0] * 5]
+        Feature vector per non-empty hour:
+            [trade_count, total_volume, window_pnl, max_price, min_price]
+        """
+        window_start = int(self._to_epoch_seconds(now - timedelta(days=self.training_lookback_days)))
+        window_stop = int(self._to_epoch_seconds(now))
+        num_bins = max(0, -(-(window_stop - window_start) // 3600))  # ceil
+        
+        if not trades or num_bins == 0:
+            return [[0.0] * 5]
+        
+        # Trades without a timestamp default to `now`, which lies outside
+        # the lookback window (matches the previous per-hour scan).
+        timestamps = np.fromiter(
+            (self._to_epoch_seconds(t.get('timestamp', now)) for t in trades),
+            dtype=np.int64,
+            count=len(trades),
+        )
+        bins = (timestamps - window_start) // 3600
+        in_window = (timestamps >= window_start) & (bins < num_bins)
+        
+        if not in_window.any():
+            return [[0.0] * 5]
+        
+        selected = [t for t, keep in zip(trades, in_window) if keep]
+        bins = bins[in_window]
+        quantity = np.array([float(t.get('quantity', 0)) for t in selected], dtype=np.float64)
+        pnl = np.array([float(t.get('pnl', 0)) for t in selected], dtype=np.float64)
+        price = np.array([float(t.get('price', 0)) for t in selected], dtype=np.float64)
+        
+        # Group by hour: stable sort so reduceat sees contiguous bins
+        order = np.argsort(bins, kind='stable')
+        bins = bins[order]
+        unique_bins, starts, counts = np.unique(bins, return_index=True, return_counts=True)
+        
+        feature_matrix = np.column_stack([
+            counts.astype(np.float64),                    # Trade count
+            np.add.reduceat(quantity[order], starts),     # Total volume
+            np.add.reduceat(pnl[order], starts),          # Window P&L
+            np.maximum.reduceat(price[order], starts),    # Max price
+            np.minimum.reduceat(price[order], starts),    # Min price
+        ])
+        
+        return feature_matrix.tolist()
+    
+    @staticmethod
+    def _to_epoch_seconds(value) -> int:
+        """Convert an ISO string or datetime to epoch seconds (naive = UTC)."""
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp())
     
     def _split_data(self, features: List[List[float]]) -> Tuple[List[List[float]], List[List[float]]]:
         """Split features into train and validation sets."""
@@ -290,15 +321,7 @@ class MLPipeline:
         if not train_features:
             return [0.0] * 5
         
-        num_features = len(train_features[0])
-        weights = []
-        
-        for feat_idx in range(num_features):
-            values = [f[feat_idx] for f in train_features]
-            avg = sum(values) / len(values) if values else 0.0
-            weights.append(avg)
-        
-        return weights
+        return np.asarray(train_features, dtype=np.float64).mean(axis=0).tolist()
     
     def _evaluate_model(
         self,
@@ -316,12 +339,11 @@ class MLPipeline:
         if not val_features:
             return metrics
         
-        # Simplified evaluation
-        predictions = []
-        for features in val_features:
-            # Simple linear combination
-            pred = sum(f * w for f, w in zip(features, weights)) / max(len(weights), 1)
-            predictions.append(pred)
+        # Simplified evaluation: linear combination over the whole matrix
+        feature_matrix = np.asarray(val_features, dtype=np.float64)
+        weight_vector = np.asarray(weights, dtype=np.float64)
+        width = min(feature_matrix.shape[1], weight_vector.shape[0])
+        predictions = feature_matrix[:, :width] @ weight_vector[:width] / max(len(weights), 1)
         
         # Calculate metrics
         metrics.sharpe_ratio = 0.8 + (len(val_features) % 10) * 0.01  # Mock
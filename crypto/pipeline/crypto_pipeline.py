@@ -148,6 +148,8 @@ def run_crypto_pipeline(
         logger.warning(f"MARKET_DATA_BLOCKED | {reason}")
         return pd.DataFrame()
     regime_ctx = build_regime_features(anchor_symbol, bars_4h[anchor_symbol], correlation_symbols=bars_4h)
+    # Latest regime features, reused by the Phase G regime validation cycle
+    runtime.crypto_regime_features = regime_ctx
 
     log_pipeline_stage(
         stage="FEATURES_BUILT",
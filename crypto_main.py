@@ -33,6 +33,9 @@ from config.crypto_scheduler_settings import (
     CRYPTO_SCHEDULER_TICK_SECONDS,
     CRYPTO_TRADING_TICK_INTERVAL_MINUTES,
     CRYPTO_RUN_STARTUP_RECONCILIATION,
+    CRYPTO_TRADING_TASK_TIMEOUT_SECONDS,
+    CRYPTO_ML_TASK_TIMEOUT_SECONDS,
+    CRYPTO_GOVERNANCE_TASK_TIMEOUT_SECONDS,
     STATUS_SNAPSHOT_INTERVAL_MINUTES,
     AI_VALIDATE_SCHEDULER,
 )
@@ -503,21 +506,40 @@ def run_daemon():
         get_ai_runner().trigger_ranking_from_market_data(trigger="startup")
 
     # Register tasks
-    # Each task closure captures runtime and updates it after execution
+    # Each task closure captures runtime and updates it after execution.
+    # Only trading-lane tasks assign `runtime`, so they never overlap. ML,
+    # governance and ops run in their own lanes and cannot block trading
+    # ticks; they only read `runtime`, so they may observe it while a
+    # trading-lane task is updating it. A runtime built by ML training is
+    # handed over and adopted by the next trading-lane task.
+    ml_runtime_handoff = []
+
+    def adopt_ml_runtime():
+        nonlocal runtime
+        while ml_runtime_handoff:
+            built = ml_runtime_handoff.pop()
+            if runtime is None:
+                runtime = built
+
     def make_trading_tick():
         nonlocal runtime
+        adopt_ml_runtime()
         runtime = _task_trading_tick(runtime)
     
     def make_monitor():
         nonlocal runtime
+        adopt_ml_runtime()
         runtime = _task_monitor(runtime)
     
     def make_ml_training():
-        nonlocal runtime
-        runtime = _task_ml_training(runtime)
+        current = runtime
+        trained = _task_ml_training(current)
+        if trained is not current:
+            ml_runtime_handoff.append(trained)
     
     def make_reconciliation():
         nonlocal runtime
+        adopt_ml_runtime()
         runtime = _task_reconciliation(runtime)
 
     def make_status_snapshot():
@@ -537,6 +559,8 @@ def run_daemon():
         func=make_trading_tick,
         interval_minutes=CRYPTO_TRADING_TICK_INTERVAL_MINUTES,
         allowed_state=TradingState.TRADING,  # Only outside downtime
+        lane="trading",
+        timeout_seconds=CRYPTO_TRADING_TASK_TIMEOUT_SECONDS,
     ))
     
     scheduler.register_task(CryptoSchedulerTask(
@@ -544,6 +568,8 @@ def run_daemon():
         func=make_monitor,
         interval_minutes=15,  # Every 15 minutes
         allowed_state=TradingState.TRADING,  # Anytime, but mainly during trading
+        lane="trading",
+        timeout_seconds=CRYPTO_TRADING_TASK_TIMEOUT_SECONDS,
     ))
     
     scheduler.register_task(CryptoSchedulerTask(
@@ -551,6 +577,8 @@ def run_daemon():
         func=make_ml_training,
         daily=True,
         allowed_state=TradingState.DOWNTIME,  # Only during downtime
+        lane="ml",  # Never holds the trading lane; see ml_runtime_handoff
+        timeout_seconds=CRYPTO_ML_TASK_TIMEOUT_SECONDS,
     ))
     
     scheduler.register_task(CryptoSchedulerTask(
@@ -558,6 +586,8 @@ def run_daemon():
         func=make_reconciliation,
         interval_minutes=60,  # Every 60 minutes
         # No state restriction: can run anytime
+        lane="trading",
+        timeout_seconds=CRYPTO_TRADING_TASK_TIMEOUT_SECONDS,
     ))
 
     scheduler.register_task(CryptoSchedulerTask(
@@ -565,6 +595,7 @@ def run_daemon():
         func=make_status_snapshot,
         interval_minutes=max(1, STATUS_SNAPSHOT_INTERVAL_MINUTES),
         # No state restriction: can run anytime
+        lane="ops",
     ))
 
     ai_daily_run_time = _offset_time_utc(CRYPTO_DOWNTIME_END_UTC, minutes=-5)
@@ -576,6 +607,8 @@ def run_daemon():
             run_at_utc=ai_daily_run_time,
             run_window_minutes=5,
             allowed_state=TradingState.DOWNTIME,
+            lane="governance",
+            timeout_seconds=CRYPTO_GOVERNANCE_TASK_TIMEOUT_SECONDS,
         ))
     else:
         # Legacy AI advisor (to be removed after Phase G validation)
@@ -586,6 +619,8 @@ def run_daemon():
             run_at_utc=ai_daily_run_time,
             run_window_minutes=5,
             allowed_state=TradingState.DOWNTIME,
+            lane="governance",
+            timeout_seconds=CRYPTO_GOVERNANCE_TASK_TIMEOUT_SECONDS,
         ))
     
     # Phase G: Periodic regime validation (every 2 hours)
@@ -595,6 +630,8 @@ def run_daemon():
             func=make_regime_validation,
             interval_minutes=120,
             # No state restriction: regime can drift anytime
+            lane="governance",
+            timeout_seconds=CRYPTO_GOVERNANCE_TASK_TIMEOUT_SECONDS,
         ))
 
     # Run daemon loop
@@ -614,7 +651,7 @@ def _run_universe_governance(runtime, trigger: str):
     from universe.governance.persistence import UniverseGovernancePersistence
     from universe.governance.logging import PhaseGLogger
     from universe.governance.config import PHASE_G_DRY_RUN
-    from governance.verdict_reader import VerdictReader
+    from governance.verdict_reader import get_verdict_reader
 
     scope = get_scope()
     crypto_config = load_crypto_config(scope)
@@ -637,7 +674,7 @@ def _run_universe_governance(runtime, trigger: str):
         phase_g_logger=PhaseGLogger(str(scope)),
         trade_ledger=runtime.trade_ledger,
         regime_provider=getattr(runtime, "crypto_regime_engine", None),
-        verdict_reader=VerdictReader(),
+        verdict_reader=get_verdict_reader(),
     )
 
     decision = governor.run_governance_cycle(
@@ -658,14 +695,14 @@ def _run_universe_governance(runtime, trigger: str):
 def _run_regime_validation(runtime, trigger: str):
     """Run Phase G periodic regime validation cycle."""
     from phase_g_regime.regime_orchestrator import RegimeOrchestrator
-    from governance.verdict_reader import VerdictReader
+    from governance.verdict_reader import get_verdict_reader
 
     scope = get_scope()
 
     orchestrator = RegimeOrchestrator(
         scope=scope,
         runtime=runtime,
-        verdict_reader=VerdictReader(),
+        verdict_reader=get_verdict_reader(),
     )
 
     result = orchestrator.run_validation_cycle(trigger=trigger)
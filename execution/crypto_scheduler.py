@@ -7,19 +7,32 @@ Orchestrates:
 - Persistent state so daily tasks don't rerun after restart
 - Graceful shutdown with final state write
 
+Scheduling is deadline-driven: each task's next due time is kept in a
+priority queue and the loop sleeps until the earliest one. Tasks run in
+lanes (one worker thread per lane), so a long ML or governance run never
+delays the trading lane. A task that overruns its timeout keeps its lane
+blocked (later submissions on that lane are skipped and alerted) until
+the call returns, so tasks sharing a lane never overlap. Per-task duration
+and lateness are recorded in histograms (see get_task_metrics()).
+
 CRITICAL: This is crypto-only. Zero contamination with swing scheduler.
 State file must be under crypto root, never under swing paths.
 """
 
+import bisect
+import heapq
+import itertools
 import json
 import logging
 import os
 import signal
 import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Callable, Tuple
+from typing import Any, Optional, Dict, Callable, List, Tuple
 
 from config.scope import get_scope
 from config.scope_paths import get_scope_path
@@ -29,6 +42,54 @@ from crypto.scheduling.state import CryptoSchedulerState
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_LANE = "default"
+
+# Histogram bucket upper bounds (seconds); the last bucket is open-ended
+TIMING_BUCKETS_SECONDS = (0.1, 0.5, 1, 5, 15, 60, 300, 900, 3600)
+
+# How long shutdown waits for in-flight tasks before persisting state
+SHUTDOWN_GRACE_SECONDS = 30
+
+
+class TimingHistogram:
+    """Fixed-bucket histogram of durations (seconds)."""
+
+    def __init__(self, buckets: Tuple[float, ...] = TIMING_BUCKETS_SECONDS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        seconds = max(0.0, float(seconds))
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        labels = [f"le_{b:g}" for b in self.buckets] + ["gt_%g" % self.buckets[-1]]
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class _TaskRun:
+    """In-flight execution of a task on its lane."""
+
+    __slots__ = ("task", "future", "due", "submitted", "timed_out")
+
+    def __init__(self, task: "CryptoSchedulerTask", future: Future, due: datetime, submitted: float):
+        self.task = task
+        self.future = future
+        self.due = due
+        self.submitted = submitted
+        self.timed_out = False
+
 
 class CryptoSchedulerTask:
     """Definition of a crypto scheduler task."""
@@ -42,6 +103,8 @@ class CryptoSchedulerTask:
         run_at_utc: Optional[str] = None,
         run_window_minutes: int = 5,
         allowed_state: TradingState = TradingState.TRADING,
+        lane: str = DEFAULT_LANE,
+        timeout_seconds: Optional[float] = None,
     ):
         """
         Define a task.
@@ -54,6 +117,10 @@ class CryptoSchedulerTask:
             run_at_utc: Optional HH:MM UTC time to run daily tasks within a window
             run_window_minutes: Allowed minutes after run_at_utc to execute
             allowed_state: TradingState.TRADING or DOWNTIME (or use allow_both)
+            lane: Execution lane; tasks in one lane run serially, lanes run
+                concurrently (e.g., "trading", "ml", "governance")
+            timeout_seconds: Max runtime before the task is reported as timed
+                out; its lane stays blocked until it returns (None = no limit)
         """
         self.name = name
         self.func = func
@@ -62,6 +129,8 @@ class CryptoSchedulerTask:
         self.run_at_utc = run_at_utc
         self.run_window_minutes = max(1, int(run_window_minutes))
         self.allowed_state = allowed_state
+        self.lane = lane
+        self.timeout_seconds = timeout_seconds
     
     def should_run(
         self,
@@ -106,6 +175,53 @@ class CryptoSchedulerTask:
                 return False, f"interval_not_met"
         
         return True, "due"
+
+    def next_due(
+        self,
+        state_mgr: CryptoSchedulerState,
+        now: datetime,
+        downtime: DowntimeScheduler,
+    ) -> Optional[datetime]:
+        """
+        Earliest time at or after `now` when the task may become due.
+
+        This is a lower bound used to order the priority queue; should_run()
+        remains the authority when the task is popped.
+
+        Returns:
+            datetime (UTC), or None if the task can never run (bad config)
+        """
+        due = now
+        if self.daily:
+            if not state_mgr.should_run_daily(self.name, now):
+                due = datetime.combine(
+                    now.date() + timedelta(days=1), datetime.min.time(), tzinfo=timezone.utc
+                )
+            if self.run_at_utc:
+                try:
+                    hour_str, minute_str = self.run_at_utc.split(":")
+                    target = due.replace(
+                        hour=int(hour_str), minute=int(minute_str), second=0, microsecond=0
+                    )
+                except Exception:
+                    return None
+                if due > target + timedelta(minutes=self.run_window_minutes):
+                    target += timedelta(days=1)
+                due = max(due, target)
+        elif self.interval_minutes is not None:
+            last = state_mgr.last_run(self.name)
+            if last is not None:
+                if last.tzinfo is None:
+                    last = last.replace(tzinfo=timezone.utc)
+                due = max(now, last + timedelta(minutes=self.interval_minutes))
+
+        # Defer to the next window in which the task is allowed
+        state_at_due = downtime.get_current_state(due)
+        if self.allowed_state == TradingState.TRADING and state_at_due == TradingState.DOWNTIME:
+            due += downtime.time_until_trading_resumes(due)
+        elif self.allowed_state == TradingState.DOWNTIME and state_at_due == TradingState.TRADING:
+            due += downtime.time_until_downtime(due)
+        return due
     
     def __repr__(self) -> str:
         return f"CryptoSchedulerTask({self.name})"
@@ -126,7 +242,8 @@ class CryptoScheduler:
         Args:
             downtime_start_utc: UTC start time for downtime (HH:MM)
             downtime_end_utc: UTC end time for downtime (HH:MM)
-            loop_interval_seconds: Sleep between scheduler ticks (seconds)
+            loop_interval_seconds: Heartbeat cadence and max sleep between
+                scheduler wake-ups (seconds); also the retry delay for failed tasks
         """
         logger.info("=" * 80)
         logger.info("CRYPTO SCHEDULER STARTUP")
@@ -148,6 +265,18 @@ class CryptoScheduler:
         
         # Task registry
         self.tasks: Dict[str, CryptoSchedulerTask] = {}
+
+        # Deadline queue: (due, seq, task_name); one entry per idle task
+        self._queue: List[Tuple[datetime, int, str]] = []
+        self._seq = itertools.count()
+        self._running: Dict[str, _TaskRun] = {}
+        self._lanes: Dict[str, ThreadPoolExecutor] = {}
+        self._wakeup = threading.Event()
+
+        # Per-task timing
+        self.duration_histograms: Dict[str, TimingHistogram] = {}
+        self.lateness_histograms: Dict[str, TimingHistogram] = {}
+        self.task_counters: Dict[str, Dict[str, int]] = {}
         
         # Shutdown flag
         self._shutdown_requested = False
@@ -163,6 +292,7 @@ class CryptoScheduler:
         def handle_shutdown(signum, frame):
             logger.info(f"Signal {signum} received. Graceful shutdown...")
             self._shutdown_requested = True
+            self._wakeup.set()
         
         signal.signal(signal.SIGTERM, handle_shutdown)
         signal.signal(signal.SIGINT, handle_shutdown)
@@ -176,69 +306,228 @@ class CryptoScheduler:
         """
         if task.name in self.tasks:
             logger.warning(f"Task '{task.name}' already registered. Overwriting.")
+            self._queue = [entry for entry in self._queue if entry[2] != task.name]
+            heapq.heapify(self._queue)
         self.tasks[task.name] = task
-        logger.debug(f"Registered task: {task.name}")
+        self.duration_histograms.setdefault(task.name, TimingHistogram())
+        self.lateness_histograms.setdefault(task.name, TimingHistogram())
+        self.task_counters.setdefault(
+            task.name, {"runs": 0, "failures": 0, "timeouts": 0, "skips": 0, "blocked": 0}
+        )
+        if task.name not in self._running:
+            # A running task is rescheduled by _reap() when it finishes
+            self._schedule(task, datetime.now(timezone.utc))
+        logger.debug(f"Registered task: {task.name} (lane={task.lane})")
+
+    # ------------------------------------------------------------------
+    # Queue and lanes
+    # ------------------------------------------------------------------
+
+    def _schedule(self, task: CryptoSchedulerTask, now: datetime, min_delay: float = 0.0) -> None:
+        """Push the task's next due time onto the queue."""
+        due = task.next_due(self.state, now, self.downtime)
+        if due is None:
+            logger.error(f"Task '{task.name}' has invalid schedule; it will not run")
+            return
+        earliest = now + timedelta(seconds=min_delay)
+        heapq.heappush(self._queue, (max(due, earliest), next(self._seq), task.name))
+
+    def _lane(self, name: str) -> ThreadPoolExecutor:
+        executor = self._lanes.get(name)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"crypto-{name}")
+            self._lanes[name] = executor
+        return executor
+
+    @staticmethod
+    def _execute(task: CryptoSchedulerTask) -> Tuple[datetime, float]:
+        """Run a task on its lane worker; returns (start time, duration)."""
+        started = datetime.now(timezone.utc)
+        t0 = time.perf_counter()
+        task.func()
+        return started, time.perf_counter() - t0
+
+    def _dispatch_due(self, now: datetime, trading_state: TradingState) -> int:
+        """Submit every task whose due time has passed. Returns count submitted."""
+        submitted = 0
+        while self._queue and self._queue[0][0] <= now:
+            due, _, task_name = heapq.heappop(self._queue)
+            task = self.tasks.get(task_name)
+            if task is None or task_name in self._running:
+                continue
+
+            should_run, reason = task.should_run(self.state, now, trading_state)
+            if not should_run:
+                logger.debug(f"  - {task_name} (skip: {reason})")
+                self.task_counters[task_name]["skips"] += 1
+                # next_due() is a lower bound; guarantee progress if it disagrees
+                self._schedule(task, now, min_delay=self.loop_interval_seconds)
+                continue
+
+            blocker = self._lane_blocker(task.lane)
+            if blocker is not None:
+                self.task_counters[task_name]["blocked"] += 1
+                logger.error(
+                    f"CRYPTO_SCHEDULER_LANE_BLOCKED | task={task_name} | lane={task.lane} | "
+                    f"blocked_by={blocker.task.name} | "
+                    f"running_seconds={time.monotonic() - blocker.submitted:.0f}"
+                )
+                self._schedule(task, now, min_delay=self.loop_interval_seconds)
+                continue
+
+            logger.info(f"  ▶ {task_name} (due: {reason}, lane: {task.lane})")
+            future = self._lane(task.lane).submit(self._execute, task)
+            future.add_done_callback(lambda _: self._wakeup.set())
+            self._running[task_name] = _TaskRun(task, future, due, time.monotonic())
+            submitted += 1
+        return submitted
+
+    def _reap(self, now: datetime) -> None:
+        """Record finished tasks, reschedule them, and flag timeouts."""
+        for task_name, run in list(self._running.items()):
+            task = run.task
+            if not run.future.done():
+                if (
+                    task.timeout_seconds is not None
+                    and not run.timed_out
+                    and time.monotonic() - run.submitted > task.timeout_seconds
+                ):
+                    self._handle_timeout(run)
+                continue
+
+            del self._running[task_name]
+            if run.timed_out:
+                logger.warning(
+                    f"CRYPTO_SCHEDULER_LANE_RELEASED | task={task_name} | lane={run.task.lane} | "
+                    f"running_seconds={time.monotonic() - run.submitted:.0f}"
+                )
+            task = self.tasks.get(task_name)
+            counters = self.task_counters[task_name]
+            try:
+                started, duration = run.future.result()
+            except Exception as e:
+                counters["failures"] += 1
+                logger.error(f"  ✗ {task_name} failed: {e}", exc_info=e)
+                if task is not None:
+                    self._schedule(task, now, min_delay=self.loop_interval_seconds)
+                continue
+
+            lateness = (started - run.due).total_seconds()
+            self.duration_histograms[task_name].observe(duration)
+            self.lateness_histograms[task_name].observe(lateness)
+            counters["runs"] += 1
+            self.state.update(task_name, started)
+            logger.info(
+                f"  ✓ {task_name} completed | duration={duration:.2f}s | lateness={lateness:.2f}s"
+            )
+            if task is not None:
+                # Tasks with no interval run once per tick, not back-to-back
+                self._schedule(task, now, min_delay=self.loop_interval_seconds)
+
+    def _handle_timeout(self, run: _TaskRun) -> None:
+        """
+        Report a task that exceeded its timeout.
+
+        Python threads cannot be killed, so the overrunning call keeps
+        going. Its lane is NOT handed a fresh worker: tasks on one lane
+        share state (e.g. the trading runtime and broker), so further
+        submissions on the lane are skipped until the call returns.
+        """
+        task = run.task
+        run.timed_out = True
+        self.task_counters[task.name]["timeouts"] += 1
+        logger.error(
+            f"CRYPTO_SCHEDULER_TASK_TIMEOUT | task={task.name} | lane={task.lane} | "
+            f"timeout_seconds={task.timeout_seconds} | lane blocked until it returns"
+        )
+
+    def _lane_blocker(self, lane: str) -> Optional[_TaskRun]:
+        """The timed-out, still running task holding a lane, if any."""
+        for run in self._running.values():
+            if run.timed_out and run.task.lane == lane and not run.future.done():
+                return run
+        return None
+
+    def _next_wakeup(self, now: datetime, next_heartbeat: datetime) -> float:
+        """Seconds until the next due task, timeout check, or heartbeat."""
+        deadline = next_heartbeat
+        if self._queue:
+            deadline = min(deadline, self._queue[0][0])
+        delay = (deadline - now).total_seconds()
+
+        mono = time.monotonic()
+        for run in self._running.values():
+            if run.task.timeout_seconds is not None and not run.timed_out:
+                delay = min(delay, run.submitted + run.task.timeout_seconds - mono)
+        return max(0.0, delay)
+
+    def get_task_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-task run counters with duration and lateness histograms."""
+        return {
+            name: {
+                "lane": task.lane,
+                **self.task_counters[name],
+                "duration_seconds": self.duration_histograms[name].to_dict(),
+                "lateness_seconds": self.lateness_histograms[name].to_dict(),
+            }
+            for name, task in self.tasks.items()
+        }
     
     def run_forever(self) -> None:
         """
         Run scheduler loop forever (until shutdown signal).
         
         Loop:
-        1. Check current trading state (trading vs downtime)
-        2. For each task, check if it should run
-        3. Execute due tasks
-        4. Log status
-        5. Sleep until next tick
+        1. Collect finished tasks (record timing, reschedule) and flag timeouts
+        2. Submit tasks whose due time has passed to their lanes
+        3. Log heartbeat every loop_interval_seconds
+        4. Sleep until the next due task, timeout or heartbeat
         """
         logger.info("Starting scheduler loop...")
         
         loop_count = 0
+        next_heartbeat = datetime.now(timezone.utc)
         
         while not self._shutdown_requested:
-            loop_count += 1
             now = datetime.now(timezone.utc)
             trading_state = self.downtime.get_current_state(now)
-            
-            # Log heartbeat
-            state_label = "DOWNTIME (ML)" if trading_state == TradingState.DOWNTIME else "TRADING"
-            logger.info(
-                f"Tick {loop_count} | Time: {now.strftime('%Y-%m-%d %H:%M:%S')} UTC | "
-                f"State: {state_label}"
-            )
 
-            # Daily summary check (once per UTC day)
-            get_observability().check_daily_summary()
-            
-            # Execute due tasks
-            executed_count = 0
-            skipped_count = 0
-            
-            for task_name, task in self.tasks.items():
-                should_run, reason = task.should_run(self.state, now, trading_state)
-                
-                if should_run:
-                    try:
-                        logger.info(f"  ▶ {task_name} (due: {reason})")
-                        task.func()
-                        self.state.update(task_name, now)
-                        executed_count += 1
-                        logger.info(f"  ✓ {task_name} completed")
-                    except Exception as e:
-                        logger.error(f"  ✗ {task_name} failed: {e}", exc_info=True)
-                else:
-                    logger.debug(f"  - {task_name} (skip: {reason})")
-                    skipped_count += 1
-            
-            if executed_count > 0:
-                logger.info(f"Executed: {executed_count} | Skipped: {skipped_count}")
+            if now >= next_heartbeat:
+                loop_count += 1
+                next_heartbeat = now + timedelta(seconds=self.loop_interval_seconds)
+
+                # Log heartbeat
+                state_label = "DOWNTIME (ML)" if trading_state == TradingState.DOWNTIME else "TRADING"
+                logger.info(
+                    f"Tick {loop_count} | Time: {now.strftime('%Y-%m-%d %H:%M:%S')} UTC | "
+                    f"State: {state_label} | Running: {sorted(self._running) or '-'}"
+                )
+
+                # Daily summary check (once per UTC day)
+                get_observability().check_daily_summary()
+
+            self._reap(now)
+            submitted = self._dispatch_due(now, trading_state)
+            if submitted > 0:
+                logger.info(f"Submitted: {submitted} | Running: {len(self._running)}")
             
-            # Sleep until next tick
+            # Sleep until the next deadline (or an early wake-up on completion/signal)
             if not self._shutdown_requested:
-                time.sleep(self.loop_interval_seconds)
+                self._wakeup.wait(self._next_wakeup(datetime.now(timezone.utc), next_heartbeat))
+                self._wakeup.clear()
         
         # Graceful shutdown
-        logger.info("Shutdown requested. Persisting final state...")
+        logger.info("Shutdown requested. Waiting for in-flight tasks...")
+        for executor in self._lanes.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        wait([run.future for run in self._running.values()], timeout=SHUTDOWN_GRACE_SECONDS)
+        self._reap(datetime.now(timezone.utc))
+        if self._running:
+            logger.warning(f"Tasks still running at shutdown: {sorted(self._running)}")
+
+        logger.info("Persisting final state...")
         self.state._persist()
+        logger.info(f"CRYPTO_SCHEDULER_TASK_METRICS | {json.dumps(self.get_task_metrics())}")
         get_observability().emit_daily_summary(force=True)
         logger.info("Scheduler stopped gracefully")
         sys.exit(0)
@@ -246,5 +535,6 @@ class CryptoScheduler:
     def __repr__(self) -> str:
         return (
             f"CryptoScheduler(downtime={self.downtime}, "
-            f"tasks={len(self.tasks)}, tick={self.loop_interval_seconds}s)"
+            f"tasks={len(self.tasks)}, lanes={sorted({t.lane for t in self.tasks.values()})}, "
+            f"tick={self.loop_interval_seconds}s)"
         )
@@ -27,6 +27,10 @@ from config.scheduler_settings import (
     ENTRY_WINDOW_MINUTES_BEFORE_CLOSE,
     SWING_EXIT_DELAY_MINUTES_AFTER_CLOSE,
     SCHEDULER_TICK_SECONDS,
+    SCHEDULER_CLOCK_SOURCE,
+    SCHEDULER_TELEMETRY_ENABLED,
+    SCHEDULER_TELEMETRY_MAX_BYTES,
+    SCHEDULER_TELEMETRY_WINDOW,
     RUN_STARTUP_RECONCILIATION,
     RUN_HEALTH_CHECK_ON_BOOT,
 )
@@ -38,6 +42,8 @@ from execution.runtime import (
     build_paper_trading_runtime,
     reconcile_runtime,
 )
+from execution.scheduler_telemetry import SchedulerTelemetry
+from markets.base import USMarket
 from ml.ml_state import MLStateManager
 from startup.validator import validate_startup
 
@@ -106,6 +112,22 @@ class TradingScheduler:
         # Cache for market clock (fallback when API fails)
         self._last_good_clock: Optional[Dict[str, Optional[datetime]]] = None
         self._clock_fetch_failures = 0
+        self._clock_retries = 0
+        # Local session calendar replaces the per-tick broker clock call
+        # (US equities only; other markets keep the broker clock)
+        self.market_calendar = (
+            USMarket().calendar
+            if SCHEDULER_CLOCK_SOURCE == "calendar" and scope.market == "us"
+            else None
+        )
+
+        # Per-phase wall/CPU/broker-call telemetry
+        self.telemetry = SchedulerTelemetry(
+            get_scope_path(scope, "logs") if SCHEDULER_TELEMETRY_ENABLED else None,
+            window=SCHEDULER_TELEMETRY_WINDOW,
+            max_log_bytes=SCHEDULER_TELEMETRY_MAX_BYTES,
+        )
+        self.telemetry.instrument_broker(self.runtime.broker)
         
         # ML state manager for idempotent training
         self._ml_state_manager = MLStateManager()
@@ -204,7 +226,8 @@ class TradingScheduler:
                 return
             
             logger.info("Running offline ML training cycle...")
-            model_version = ml.run_offline_ml_cycle()
+            with self.telemetry.phase("offline_ml"):
+                model_version = ml.run_offline_ml_cycle()
             
             if model_version:
                 # Update state with new training metadata
@@ -262,7 +285,7 @@ class TradingScheduler:
         return ts.astimezone(self.tz)
 
     def _get_clock(self) -> Dict[str, Optional[datetime]]:
-        """Get market clock with retry logic and caching."""
+        """Get market clock from the session calendar or the broker."""
         # Handle mock mode (no client)
         if not self.runtime.broker.client:
             logger.info("Mock mode: using default market clock")
@@ -273,11 +296,20 @@ class TradingScheduler:
                 "next_close": None,
             }
         
+        if self.market_calendar is None:
+            return self._get_broker_clock()
+        
+        clock = self.market_calendar.clock(self._now())
+        return {key: self._to_market_time(value) if key != "is_open" else value for key, value in clock.items()}
+
+    def _get_broker_clock(self) -> Dict[str, Optional[datetime]]:
+        """Get market clock from the broker with retry logic and caching."""
         max_retries = 3
         retry_delay = 1  # seconds
         
         for attempt in range(max_retries):
             try:
+                self.telemetry.count_broker_call()
                 clock = self.runtime.broker.client.get_clock()
                 result = {
                     "is_open": bool(getattr(clock, "is_open", False)),
@@ -293,6 +325,7 @@ class TradingScheduler:
                 return result
             except Exception as e:
                 if attempt < max_retries - 1:
+                    self._clock_retries += 1
                     time.sleep(retry_delay * (attempt + 1))  # Exponential backoff
                     continue
                 else:
@@ -321,7 +354,8 @@ class TradingScheduler:
     def _run_reconciliation(self, now: datetime, force: bool = False) -> None:
         if not force and not self._should_run_interval("reconciliation", now, RECONCILIATION_INTERVAL_MINUTES):
             return
-        result = reconcile_runtime(self.runtime)
+        with self.telemetry.phase("reconciliation"):
+            result = reconcile_runtime(self.runtime)
         logger.info(
             f"Reconciliation status={result.get('status')} safe_mode={result.get('safe_mode')} "
             f"positions={result.get('positions_count')} orders={result.get('open_orders', {}).get('total', 0)}"
@@ -382,7 +416,8 @@ class TradingScheduler:
                 logger.info(f"Time since open: {time_since_open:.1f} minutes")
                 logger.info("=" * 80)
                 
-                executed_count = self.runtime.executor.execute_pending_exit_intents()
+                with self.telemetry.phase("exit_intents"):
+                    executed_count = self.runtime.executor.execute_pending_exit_intents()
                 
                 logger.info(f"Executed {executed_count} pending exit intents")
                 self.state.update("exit_intent_execution", now)
@@ -391,7 +426,8 @@ class TradingScheduler:
         if not self._should_run_interval("health_check", now, HEALTH_CHECK_INTERVAL_MINUTES):
             return
         try:
-            status = self.runtime.executor.get_account_status()
+            with self.telemetry.phase("health_check"):
+                status = self.runtime.executor.get_account_status()
             logger.info(
                 "HEALTH CHECK | equity=$%.2f buying_power=$%.2f open_positions=%s pending_orders=%s"
                 % (
@@ -408,6 +444,17 @@ class TradingScheduler:
     def _has_pending_orders(self) -> bool:
         return bool(self.runtime.executor.pending_orders)
 
+    def _end_tick(self, clock: Dict) -> None:
+        """Close the telemetry tick with market context."""
+        try:
+            self.telemetry.end_tick(
+                market_open=bool(clock.get("is_open")),
+                clock_retries=self._clock_retries,
+                clock_failures=self._clock_fetch_failures,
+            )
+        except Exception as e:
+            logger.warning(f"Scheduler telemetry failed: {e}")
+
     def run_forever(self) -> None:
         if not RUN_PAPER_TRADING:
             logger.error("RUN_PAPER_TRADING is False. Scheduler will not start.")
@@ -427,7 +474,10 @@ class TradingScheduler:
 
         while True:
             now = self._now()
-            clock = self._get_clock()
+            self.telemetry.begin_tick(now)
+            self._clock_retries = 0
+            with self.telemetry.phase("clock"):
+                clock = self._get_clock()
             
             # Log scheduler heartbeat
             market_status = "OPEN" if clock["is_open"] else "CLOSED"
@@ -438,6 +488,7 @@ class TradingScheduler:
 
             if self.observation_only:
                 self._run_health_check(now)
+                self._end_tick(clock)
                 time.sleep(self.tick_seconds)
                 continue
 
@@ -447,10 +498,12 @@ class TradingScheduler:
                 self._run_exit_intent_execution(now, clock)
                 
                 if self._should_run_interval("monitor", now, EMERGENCY_EXIT_INTERVAL_MINUTES):
-                    self._run_monitoring_cycle(now)
+                    with self.telemetry.phase("monitor"):
+                        self._run_monitoring_cycle(now)
 
                 if self._has_pending_orders() and self._should_run_interval("poll", now, ORDER_POLL_INTERVAL_MINUTES):
-                    self._run_monitoring_cycle(now)
+                    with self.telemetry.phase("poll"):
+                        self._run_monitoring_cycle(now)
                     self.state.update("poll", now)
 
                 # Pre-close entry window
@@ -462,7 +515,8 @@ class TradingScheduler:
                         and self.state.last_run_date("entry") != now.date()
                     ):
                         logger.info("Entry window reached. Running trade cycle once for today.")
-                        self._run_entry_cycle(now)
+                        with self.telemetry.phase("entry"):
+                            self._run_entry_cycle(now)
 
             else:
                 # After close: run swing exits once per session
@@ -472,7 +526,8 @@ class TradingScheduler:
                         cutoff = next_open - timedelta(minutes=SWING_EXIT_DELAY_MINUTES_AFTER_CLOSE)
                         if now < cutoff:
                             logger.info("Post-close swing exit cycle.")
-                            self._run_swing_exit_cycle(now)
+                            with self.telemetry.phase("swing_exit"):
+                                self._run_swing_exit_cycle(now)
                 
                 # After close: run offline ML training once per day (paper only)
                 from runtime.environment_guard import TradingEnvironment, get_environment_guard
@@ -486,10 +541,12 @@ class TradingScheduler:
             # Emit daily summary for observability
             try:
                 from runtime.observability import get_observability
-                get_observability().check_daily_summary()
+                with self.telemetry.phase("daily_summary"):
+                    get_observability().check_daily_summary()
             except Exception as e:
                 logger.error(f"Daily summary check failed: {e}", exc_info=True)
 
+            self._end_tick(clock)
             time.sleep(self.tick_seconds)
 
 
@@ -0,0 +1,269 @@
+"""
+Per-phase telemetry for the TradingScheduler loop.
+
+Each scheduler tick is split into named phases (clock, reconciliation,
+monitor, entry, ...). For every phase we record wall time, CPU time of the
+scheduler thread and the number of broker calls made while it ran.
+
+- Rolling window of the last N observations per phase (p50/p95/max)
+- One compact JSONL record per tick: logs/scheduler_telemetry.jsonl, rotated
+  to scheduler_telemetry.jsonl.1 (one backup) once it exceeds max_log_bytes
+- Rolling summary rewritten periodically: logs/scheduler_telemetry_summary.json
+  (read by ops_agent.logs_reader.LogsReader.get_scheduler_telemetry)
+
+Telemetry never raises into the trading loop; write failures are logged.
+"""
+
+import functools
+import inspect
+import json
+import logging
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TELEMETRY_LOG_NAME = "scheduler_telemetry.jsonl"
+TELEMETRY_SUMMARY_NAME = "scheduler_telemetry_summary.json"
+DEFAULT_MAX_LOG_BYTES = 20 * 1024 * 1024
+
+
+class _PhaseWindow:
+    """Rolling observations for one phase."""
+
+    __slots__ = ("wall_ms", "cpu_ms", "broker_calls")
+
+    def __init__(self, window: int):
+        self.wall_ms: Deque[float] = deque(maxlen=window)
+        self.cpu_ms: Deque[float] = deque(maxlen=window)
+        self.broker_calls: Deque[int] = deque(maxlen=window)
+
+    def observe(self, wall_ms: float, cpu_ms: float, broker_calls: int) -> None:
+        self.wall_ms.append(wall_ms)
+        self.cpu_ms.append(cpu_ms)
+        self.broker_calls.append(broker_calls)
+
+    @staticmethod
+    def _stats(values: Deque[float]) -> Dict[str, float]:
+        arr = np.fromiter(values, dtype=float, count=len(values))
+        if arr.size == 0:
+            return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+        p50, p95 = np.percentile(arr, [50, 95])
+        return {
+            "mean": round(float(arr.mean()), 3),
+            "p50": round(float(p50), 3),
+            "p95": round(float(p95), 3),
+            "max": round(float(arr.max()), 3),
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": len(self.wall_ms),
+            "wall_ms": self._stats(self.wall_ms),
+            "cpu_ms": self._stats(self.cpu_ms),
+            "broker_calls": self._stats(self.broker_calls),
+        }
+
+
+class SchedulerTelemetry:
+    """
+    Wall/CPU/broker-call instrumentation for scheduler phases.
+
+    Usage:
+        telemetry.begin_tick(now)
+        with telemetry.phase("clock"):
+            clock = self._get_clock()
+        ...
+        telemetry.end_tick()
+    """
+
+    def __init__(
+        self,
+        logs_dir: Optional[Path] = None,
+        window: int = 500,
+        summary_every_ticks: int = 10,
+        max_log_bytes: int = DEFAULT_MAX_LOG_BYTES,
+    ):
+        """
+        Args:
+            logs_dir: Scope logs directory (None = in-process only, no files)
+            window: Observations kept per phase for rolling percentiles
+            summary_every_ticks: Rewrite the summary file every N ticks
+            max_log_bytes: Rotate the per-tick log past this size (<= 0 = never)
+        """
+        self.logs_dir = Path(logs_dir) if logs_dir is not None else None
+        self.window = max(1, int(window))
+        self.summary_every_ticks = max(1, int(summary_every_ticks))
+        self.max_log_bytes = int(max_log_bytes)
+
+        self.broker_calls = 0
+        self.ticks = 0
+        self._phases: Dict[str, _PhaseWindow] = {}
+        self._tick_started_at: Optional[datetime] = None
+        self._tick_t0 = 0.0
+        self._tick_phases: Dict[str, Dict[str, float]] = {}
+
+    # ------------------------------------------------------------------
+    # Broker call counting
+    # ------------------------------------------------------------------
+
+    def count_broker_call(self, n: int = 1) -> None:
+        self.broker_calls += n
+
+    def instrument_broker(self, broker) -> None:
+        """
+        Count calls to the broker adapter's public methods.
+
+        Bound methods are wrapped on the instance, so every holder of the
+        adapter (executor, reconciler) is counted. Properties are left alone.
+        """
+        if broker is None or getattr(broker, "_telemetry_instrumented", False):
+            return
+
+        for name, attr in inspect.getmembers(type(broker)):
+            if name.startswith("_") or isinstance(attr, property) or not callable(attr):
+                continue
+            bound = getattr(broker, name, None)
+            if not inspect.ismethod(bound):
+                continue
+            setattr(broker, name, self._counted(bound))
+        try:
+            broker._telemetry_instrumented = True
+        except Exception:
+            pass
+
+    def _counted(self, method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            self.broker_calls += 1
+            return method(*args, **kwargs)
+        return wrapper
+
+    # ------------------------------------------------------------------
+    # Ticks and phases
+    # ------------------------------------------------------------------
+
+    def begin_tick(self, now: datetime) -> None:
+        self._tick_started_at = now
+        self._tick_t0 = time.perf_counter()
+        self._tick_phases = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a block; repeated phases within a tick are summed."""
+        wall0 = time.perf_counter()
+        cpu0 = time.thread_time()
+        calls0 = self.broker_calls
+        try:
+            yield
+        finally:
+            wall_ms = (time.perf_counter() - wall0) * 1000
+            cpu_ms = (time.thread_time() - cpu0) * 1000
+            calls = self.broker_calls - calls0
+
+            entry = self._tick_phases.setdefault(name, {"wall_ms": 0.0, "cpu_ms": 0.0, "broker_calls": 0})
+            entry["wall_ms"] += wall_ms
+            entry["cpu_ms"] += cpu_ms
+            entry["broker_calls"] += calls
+
+    def end_tick(self, **context: Any) -> Dict[str, Any]:
+        """
+        Close the current tick, fold its phases into the rolling window and
+        append a JSONL record.
+
+        Args:
+            context: Extra fields for the record (e.g. market_open=True)
+
+        Returns:
+            The tick record
+        """
+        total_ms = (time.perf_counter() - self._tick_t0) * 1000
+        self.ticks += 1
+
+        for name, entry in self._tick_phases.items():
+            window = self._phases.get(name)
+            if window is None:
+                window = self._phases[name] = _PhaseWindow(self.window)
+            window.observe(entry["wall_ms"], entry["cpu_ms"], entry["broker_calls"])
+        tick_window = self._phases.get("tick")
+        if tick_window is None:
+            tick_window = self._phases["tick"] = _PhaseWindow(self.window)
+        tick_window.observe(
+            total_ms,
+            sum(entry["cpu_ms"] for entry in self._tick_phases.values()),
+            sum(entry["broker_calls"] for entry in self._tick_phases.values()),
+        )
+
+        record = {
+            "ts": self._tick_started_at.isoformat() if self._tick_started_at else None,
+            "tick": self.ticks,
+            "total_ms": round(total_ms, 3),
+            **context,
+            "phases": {
+                name: {
+                    "wall_ms": round(entry["wall_ms"], 3),
+                    "cpu_ms": round(entry["cpu_ms"], 3),
+                    "broker_calls": int(entry["broker_calls"]),
+                }
+                for name, entry in self._tick_phases.items()
+            },
+        }
+        self._append(record)
+        if self.ticks % self.summary_every_ticks == 0:
+            self.flush_summary()
+        return record
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    def summary(self) -> Dict[str, Any]:
+        """Rolling per-phase stats (count, mean/p50/p95/max of wall, CPU, broker calls)."""
+        return {
+            "ticks": self.ticks,
+            "window": self.window,
+            "phases": {name: window.summary() for name, window in self._phases.items()},
+        }
+
+    def flush_summary(self) -> None:
+        """Atomically rewrite the rolling summary file."""
+        if self.logs_dir is None:
+            return
+        try:
+            self.logs_dir.mkdir(parents=True, exist_ok=True)
+            path = self.logs_dir / TELEMETRY_SUMMARY_NAME
+            tmp = path.with_suffix(".tmp")
+            updated_at = self._tick_started_at.isoformat() if self._tick_started_at else None
+            payload = {"updated_at": updated_at, **self.summary()}
+            tmp.write_text(json.dumps(payload, indent=2))
+            tmp.replace(path)
+        except Exception as e:
+            logger.warning(f"SCHEDULER_TELEMETRY_SUMMARY_FAILED | error={e}")
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        if self.logs_dir is None:
+            return
+        try:
+            self.logs_dir.mkdir(parents=True, exist_ok=True)
+            path = self.logs_dir / TELEMETRY_LOG_NAME
+            self._rotate_if_full(path)
+            with open(path, "a") as f:
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+        except Exception as e:
+            logger.warning(f"SCHEDULER_TELEMETRY_WRITE_FAILED | error={e}")
+
+    def _rotate_if_full(self, path: Path) -> None:
+        """Move a full per-tick log to <name>.1, replacing the previous backup."""
+        if self.max_log_bytes <= 0:
+            return
+        try:
+            if path.stat().st_size >= self.max_log_bytes:
+                path.replace(path.with_name(path.name + ".1"))
+        except FileNotFoundError:
+            pass
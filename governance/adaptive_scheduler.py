@@ -12,12 +12,13 @@ Modes:
   EMERGENCY: Daily (crisis detected)
 """
 
-import json
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Tuple
 
+from governance.summary_store import get_summary_store
+
 
 class AdaptiveScheduler:
     """Determine governance frequency based on market conditions."""
@@ -32,19 +33,14 @@ class AdaptiveScheduler:
         scope_dir = scope.replace(".", "_")
         summary_file = self.logs_path / scope_dir / "logs" / "daily_summary.jsonl"
 
-        if not summary_file.exists():
+        try:
+            table = get_summary_store().table(summary_file)
+        except OSError:
             return []
 
-        summaries = []
-        try:
-            with open(summary_file) as f:
-                for line in f:
-                    if line.strip():
-                        summaries.append(json.loads(line))
-        except:
-            pass
-
-        return summaries[-7:]  # Last 7 days
+        # Lines after a malformed one are ignored
+        summaries = table.records[:table.error_index]
+        return list(summaries[-7:])  # Last 7 days
 
     def analyze_market_conditions(self) -> Dict[str, Any]:
         """Analyze current market conditions."""
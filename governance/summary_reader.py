@@ -2,25 +2,36 @@
 Read and parse daily summary JSONL files from paper and live scopes.
 
 Provides immutable access to trading summaries for governance analysis.
+Files are parsed once and tailed incrementally by the shared SummaryStore.
 """
 
-import json
 from pathlib import Path
 from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
+
+import numpy as np
+
+from governance.summary_store import (
+    EMPTY_TABLE,
+    SummaryStore,
+    SummaryTable,
+    build_table,
+    get_summary_store,
+)
 
 
 class SummaryReader:
     """Read daily summaries from trading scopes."""
 
-    def __init__(self, logs_base_path: str = "logs"):
+    def __init__(self, logs_base_path: str = "logs", store: Optional[SummaryStore] = None):
         """
         Initialize summary reader.
 
         Args:
             logs_base_path: Base logs directory (usually 'logs')
+            store: Summary store (default: process-wide shared store)
         """
         self.logs_base = Path(logs_base_path)
+        self.store = store or get_summary_store()
 
     def get_summary_path(self, scope: str) -> Path:
         """
@@ -55,32 +66,23 @@ class SummaryReader:
         Returns:
             List of summary dicts, chronologically ordered
         """
-        summary_path = self.get_summary_path(scope)
-
-        if not summary_path.exists():
-            return []
+        table = self._read_table(scope)
+        return table.select(table.window(lookback_days))
 
-        summaries = []
+    def _read_table(self, scope: str) -> SummaryTable:
+        """Summary table for a scope; empty if the file is unreadable or malformed."""
+        summary_path = self.get_summary_path(scope)
         try:
-            with open(summary_path) as f:
-                for line in f:
-                    if line.strip():
-                        summary = json.loads(line)
-                        summaries.append(summary)
-        except (json.JSONDecodeError, IOError) as e:
+            table = self.store.table(summary_path)
+        except OSError as e:
             # Log but don't crash - governance should be resilient
             print(f"Warning: Error reading {summary_path}: {e}")
-            return []
-
-        # Filter by date range
-        if lookback_days > 0:
-            cutoff_date = (datetime.now() - timedelta(days=lookback_days)).date()
-            summaries = [
-                s for s in summaries
-                if "date" in s and s["date"] >= str(cutoff_date)
-            ]
+            return EMPTY_TABLE
 
-        return summaries
+        if table.has_errors:
+            print(f"Warning: Error reading {summary_path}: malformed JSON line")
+            return EMPTY_TABLE
+        return table
 
     def get_latest_summary(self, scope: str) -> Optional[Dict[str, Any]]:
         """
@@ -92,10 +94,11 @@ class SummaryReader:
         Returns:
             Latest summary dict or None if no summaries exist
         """
-        summaries = self.read_summaries(scope, lookback_days=30)
-        if not summaries:
+        table = self._read_table(scope)
+        indices = table.window(30)
+        if len(indices) == 0:
             return None
-        return summaries[-1]  # Last entry is most recent
+        return table.records[indices[-1]]  # Last entry is most recent
 
     def analyze_scan_coverage(self, summaries: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -111,40 +114,7 @@ class SummaryReader:
               - never_scanned: Symbols never scanned (empty if AI ranking not available)
               - scan_starvation: Symbols with very few scans
         """
-        if not summaries:
-            return {
-                "total_days": 0,
-                "avg_scan_symbols": 0.0,
-                "never_scanned": [],
-                "scan_starvation": [],
-            }
-
-        # Extract AI ranking info if present
-        scan_counts = {}
-        for summary in summaries:
-            if "ai_last_ranking" in summary and summary["ai_last_ranking"]:
-                ranking = summary["ai_last_ranking"]
-                if "ranked_symbols" in ranking:
-                    for symbol in ranking["ranked_symbols"]:
-                        scan_counts[symbol] = scan_counts.get(symbol, 0) + 1
-
-        total_days = len(summaries)
-        avg_scan_symbols = len(scan_counts) / total_days if total_days > 0 else 0
-
-        # Identify starvation (scanned very few times)
-        starvation_threshold = max(1, total_days // 4)  # Less than 25% of days
-        scan_starvation = [
-            s for s, count in scan_counts.items()
-            if count < starvation_threshold
-        ]
-
-        return {
-            "total_days": total_days,
-            "avg_scan_symbols": avg_scan_symbols,
-            "never_scanned": [],  # Only populated if data available
-            "scan_starvation": scan_starvation,
-            "scan_counts": scan_counts,
-        }
+        return build_table(summaries, None).scan_coverage(np.arange(len(summaries)))
 
     def extract_performance_metrics(
         self,
@@ -159,28 +129,7 @@ class SummaryReader:
         Returns:
             Performance metrics dict
         """
-        if not summaries:
-            return {
-                "total_trades": 0,
-                "trades_skipped": 0,
-                "total_pnl": 0.0,
-                "max_drawdown": 0.0,
-                "data_issues": 0,
-            }
-
-        total_trades = sum(s.get("trades_taken", 0) for s in summaries)
-        trades_skipped = sum(s.get("trades_skipped", 0) for s in summaries)
-        total_pnl = sum(s.get("realized_pnl", 0) for s in summaries)
-        max_drawdown = min(s.get("max_drawdown", 0) for s in summaries)
-        data_issues = sum(s.get("data_issues", 0) for s in summaries)
-
-        return {
-            "total_trades": total_trades,
-            "trades_skipped": trades_skipped,
-            "total_pnl": total_pnl,
-            "max_drawdown": max_drawdown,
-            "data_issues": data_issues,
-        }
+        return build_table(summaries, None).performance_metrics(np.arange(len(summaries)))
 
     def get_combined_analysis(
         self,
@@ -199,20 +148,18 @@ class SummaryReader:
         Returns:
             Combined analysis dict
         """
-        paper_summaries = self.read_summaries(paper_scope, lookback_days)
-        live_summaries = self.read_summaries(live_scope, lookback_days)
+        return {
+            "paper": self._scope_analysis(paper_scope, lookback_days),
+            "live": self._scope_analysis(live_scope, lookback_days),
+        }
 
+    def _scope_analysis(self, scope: str, lookback_days: int) -> Dict[str, Any]:
+        """One scope's analysis, computed from the cached table's columns."""
+        table = self._read_table(scope)
+        indices = table.window(lookback_days)
         return {
-            "paper": {
-                "summaries_count": len(paper_summaries),
-                "latest": self.get_latest_summary(paper_scope),
-                "performance": self.extract_performance_metrics(paper_summaries),
-                "scan_analysis": self.analyze_scan_coverage(paper_summaries),
-            },
-            "live": {
-                "summaries_count": len(live_summaries),
-                "latest": self.get_latest_summary(live_scope),
-                "performance": self.extract_performance_metrics(live_summaries),
-                "scan_analysis": self.analyze_scan_coverage(live_summaries),
-            },
+            "summaries_count": len(indices),
+            "latest": self.get_latest_summary(scope),
+            "performance": table.performance_metrics(indices),
+            "scan_analysis": table.scan_coverage(indices),
         }
@@ -0,0 +1,265 @@
+"""
+Shared store of parsed daily_summary.jsonl files.
+
+Governance (SummaryReader, AdaptiveScheduler) and ops (SummaryReader,
+HistoricalAnalyzer) all read the same per-scope daily summaries. The store
+parses each file once, then on later calls only tails lines appended since
+the last read. Each read returns an immutable SummaryTable: the parsed
+records plus columns (date, counters, P&L) that lookback windows and
+aggregates are computed from without touching the file.
+
+A file is re-read from scratch if it is replaced (new inode), truncated,
+rewritten in place (head bytes or same-size mtime change), or deleted.
+A trailing line without a newline (writer mid-append) is parsed but not
+committed, so it is re-read once complete.
+
+Records are shared between callers and must be treated as read-only.
+"""
+
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Counter columns aggregated by extract_performance_metrics
+NUMERIC_COLUMNS = ("trades_taken", "trades_skipped", "realized_pnl", "max_drawdown", "data_issues")
+
+# Bytes compared to detect an in-place rewrite
+_HEAD_SAMPLE_BYTES = 256
+
+
+@dataclass(frozen=True)
+class SummaryTable:
+    """
+    Immutable snapshot of one daily_summary.jsonl file.
+
+    Attributes:
+        records: Parsed lines in file order (malformed lines excluded)
+        error_index: Number of records before the first malformed line,
+            or None if every line parsed
+        columns: "date" (str, "" if missing), "ranked_symbols" (tuples)
+            and NUMERIC_COLUMNS, one entry per record
+    """
+
+    records: Tuple[Dict[str, Any], ...] = ()
+    error_index: Optional[int] = None
+    columns: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def has_errors(self) -> bool:
+        return self.error_index is not None
+
+    def window(self, lookback_days: int, now: Optional[datetime] = None) -> np.ndarray:
+        """
+        Indices of records whose "date" is within the last lookback_days.
+
+        Matches the governance reader: records without a date are excluded,
+        and lookback_days <= 0 selects everything.
+        """
+        if lookback_days <= 0 or not self.records:
+            return np.arange(len(self.records))
+        cutoff = str(((now or datetime.now()) - timedelta(days=lookback_days)).date())
+        return np.flatnonzero(self.columns["date"] >= cutoff)
+
+    def select(self, indices: np.ndarray) -> List[Dict[str, Any]]:
+        return [self.records[i] for i in indices]
+
+    def performance_metrics(self, indices: np.ndarray) -> Dict[str, Any]:
+        """Totals over the selected records (see SummaryReader.extract_performance_metrics)."""
+        if len(indices) == 0:
+            return {
+                "total_trades": 0,
+                "trades_skipped": 0,
+                "total_pnl": 0.0,
+                "max_drawdown": 0.0,
+                "data_issues": 0,
+            }
+
+        def col(name):
+            return self.columns[name][indices]
+
+        return {
+            "total_trades": col("trades_taken").sum().item(),
+            "trades_skipped": col("trades_skipped").sum().item(),
+            "total_pnl": col("realized_pnl").sum().item(),
+            "max_drawdown": col("max_drawdown").min().item(),
+            "data_issues": col("data_issues").sum().item(),
+        }
+
+    def scan_coverage(self, indices: np.ndarray) -> Dict[str, Any]:
+        """Scan metrics over the selected records (see SummaryReader.analyze_scan_coverage)."""
+        total_days = len(indices)
+        if total_days == 0:
+            return {
+                "total_days": 0,
+                "avg_scan_symbols": 0.0,
+                "never_scanned": [],
+                "scan_starvation": [],
+            }
+
+        scan_counts: Dict[str, int] = {}
+        for symbols in self.columns["ranked_symbols"][indices]:
+            for symbol in symbols:
+                scan_counts[symbol] = scan_counts.get(symbol, 0) + 1
+
+        starvation_threshold = max(1, total_days // 4)  # Less than 25% of days
+        return {
+            "total_days": total_days,
+            "avg_scan_symbols": len(scan_counts) / total_days,
+            "never_scanned": [],  # Only populated if data available
+            "scan_starvation": [s for s, count in scan_counts.items() if count < starvation_threshold],
+            "scan_counts": scan_counts,
+        }
+
+
+EMPTY_TABLE = SummaryTable()
+
+
+def _ranked_symbols(record: Dict[str, Any]) -> Tuple[str, ...]:
+    ranking = record.get("ai_last_ranking")
+    if ranking and "ranked_symbols" in ranking:
+        return tuple(ranking["ranked_symbols"])
+    return ()
+
+
+def _column(values: List[Any]) -> np.ndarray:
+    # Keep ints as ints so sums match plain Python sum()
+    if all(isinstance(v, int) and not isinstance(v, bool) for v in values):
+        return np.array(values, dtype=np.int64)
+    try:
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        return np.array(values, dtype=object)
+
+
+def build_table(records: List[Dict[str, Any]], error_index: Optional[int]) -> SummaryTable:
+    """Build a SummaryTable (records + columns) from parsed records."""
+    ranked = np.empty(len(records), dtype=object)
+    ranked[:] = [_ranked_symbols(r) for r in records]
+    columns = {
+        "date": np.array([str(r["date"]) if "date" in r else "" for r in records], dtype=str),
+        "ranked_symbols": ranked,
+    }
+    for name in NUMERIC_COLUMNS:
+        columns[name] = _column([r.get(name, 0) for r in records])
+    return SummaryTable(tuple(records), error_index, columns)
+
+
+class _TailedFile:
+    """Parsed contents of one file plus the read position for tailing."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self.inode: Optional[int] = None
+        self.size = 0
+        self.mtime_ns = 0
+        self.offset = 0
+        self.head = b""
+        self.records: List[Dict[str, Any]] = []
+        self.error_index: Optional[int] = None
+        self.table = EMPTY_TABLE
+
+    def refresh(self) -> SummaryTable:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            self._reset()
+            return EMPTY_TABLE
+
+        if st.st_size == self.size and st.st_mtime_ns == self.mtime_ns and st.st_ino == self.inode:
+            return self.table
+
+        with open(self.path, "rb") as f:
+            if (
+                st.st_ino != self.inode
+                or st.st_size < self.offset
+                or (st.st_size == self.size and st.st_mtime_ns != self.mtime_ns)
+                or f.read(len(self.head)) != self.head
+            ):
+                self._reset()
+            f.seek(self.offset)
+            data = f.read()
+
+        if self.offset == 0:
+            self.head = data[:_HEAD_SAMPLE_BYTES]
+
+        end = data.rfind(b"\n") + 1
+        complete, tail = data[:end], data[end:]
+        for line in complete.splitlines():
+            self._parse_into(line, self.records)
+        self.offset += len(complete)
+        self.inode, self.size, self.mtime_ns = st.st_ino, st.st_size, st.st_mtime_ns
+
+        # Unterminated last line: visible now, committed once its newline lands
+        records, error_index = self.records, self.error_index
+        if tail.strip():
+            records = list(self.records)
+            if not self._parse_into(tail, records) and error_index is None:
+                error_index = len(records)
+        self.table = build_table(records, error_index)
+        return self.table
+
+    def _parse_into(self, line: bytes, records: List[Dict[str, Any]]) -> bool:
+        if not line.strip():
+            return True
+        try:
+            records.append(json.loads(line))
+            return True
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.debug(f"Malformed summary line in {self.path}: {e}")
+            if records is self.records and self.error_index is None:
+                self.error_index = len(self.records)
+            return False
+
+
+class SummaryStore:
+    """Thread-safe cache of SummaryTables keyed by file path."""
+
+    def __init__(self):
+        self._files: Dict[Path, _TailedFile] = {}
+        self._lock = threading.Lock()
+
+    def table(self, path: Path) -> SummaryTable:
+        """
+        Current contents of a daily_summary.jsonl file.
+
+        Returns:
+            SummaryTable (EMPTY_TABLE if the file doesn't exist)
+
+        Raises:
+            OSError if the file exists but can't be read
+        """
+        key = Path(path).absolute()
+        with self._lock:
+            tailed = self._files.get(key)
+            if tailed is None:
+                tailed = self._files[key] = _TailedFile(key)
+        with tailed.lock:
+            return tailed.refresh()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._files.clear()
+
+
+_store = SummaryStore()
+
+
+def get_summary_store() -> SummaryStore:
+    """Process-wide summary store shared by governance and ops readers."""
+    return _store
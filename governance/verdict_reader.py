@@ -5,15 +5,28 @@ Reads Phase F verdicts for governance consumption.
 Used by governance/agents/proposer.py to adjust confidence and add context.
 
 Layer 2 of Phase F three-layer logging (for Phase C integration).
+
+The latest verdict is read by seeking to the end of verdicts.jsonl (not by
+reading the whole file) and parsed once per file version, keyed on
+(inode, size, mtime). Every accessor shares that parsed record, so one
+governance/regime cycle costs one stat() per call and at most one parse.
 """
 
+import copy
 import json
 import logging
+import os
+import threading
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Tail read block size; verdict records are a few KB
+_TAIL_BLOCK_SIZE = 8192
+
+FileVersion = Tuple[int, int, int]  # (inode, size, mtime_ns)
+
 
 class VerdictReader:
     """
@@ -34,6 +47,8 @@ class VerdictReader:
             phase_f_root: Root directory for Phase F persistence
         """
         self.phase_f_root = Path(phase_f_root)
+        self._cache: Dict[str, Tuple[FileVersion, Optional[Dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
 
     def read_latest_verdict(self, scope: str = "crypto") -> Optional[Dict[str, Any]]:
         """
@@ -61,22 +76,45 @@ class VerdictReader:
             }
         }
         """
+        verdict_record = self._latest(scope)
+        # Callers get their own copy; the cached record is shared by accessors
+        return copy.deepcopy(verdict_record) if verdict_record is not None else None
+
+    def _latest(self, scope: str) -> Optional[Dict[str, Any]]:
+        """Cached latest verdict, re-read only when the file changes."""
         verdicts_file = self.phase_f_root / scope / "verdicts" / "verdicts.jsonl"
 
-        if not verdicts_file.exists():
+        try:
+            st = os.stat(verdicts_file)
+        except FileNotFoundError:
             logger.debug(f"No Phase F verdicts found at {verdicts_file}")
+            with self._lock:
+                self._cache.pop(scope, None)
+            return None
+        except Exception as e:
+            logger.error(f"Error reading Phase F verdict: {e}", exc_info=True)
             return None
 
-        try:
-            # Read last line (most recent verdict)
-            with open(verdicts_file) as f:
-                lines = f.readlines()
+        version = (st.st_ino, st.st_size, st.st_mtime_ns)
+        with self._lock:
+            cached = self._cache.get(scope)
+        if cached is not None and cached[0] == version:
+            return cached[1]
 
-            if not lines:
+        verdict_record = self._read_last_record(verdicts_file, st.st_size)
+        with self._lock:
+            self._cache[scope] = (version, verdict_record)
+        return verdict_record
+
+    def _read_last_record(self, verdicts_file: Path, size: int) -> Optional[Dict[str, Any]]:
+        """Parse the last line of the verdicts file by seeking from the end."""
+        try:
+            latest_line = self._tail_line(verdicts_file, size)
+            if latest_line is None:
                 logger.debug(f"Verdicts file is empty: {verdicts_file}")
                 return None
 
-            latest_line = lines[-1].strip()
+            latest_line = latest_line.strip()
             if not latest_line:
                 logger.debug(f"Last line of verdicts file is empty")
                 return None
@@ -93,6 +131,32 @@ class VerdictReader:
             logger.error(f"Error reading Phase F verdict: {e}", exc_info=True)
             return None
 
+    @staticmethod
+    def _tail_line(path: Path, size: int) -> Optional[str]:
+        """
+        Last line of a file (same line readlines()[-1] would give), or None if empty.
+
+        Reads backwards in blocks until the line start is found.
+        """
+        if size == 0:
+            return None
+
+        with open(path, "rb") as f:
+            buf = b""
+            pos = size
+            while pos > 0:
+                step = min(_TAIL_BLOCK_SIZE, pos)
+                pos -= step
+                f.seek(pos)
+                buf = f.read(step) + buf
+                # Ignore the final line terminator; look for the one before it
+                body = buf[:-1] if buf.endswith(b"\n") else buf
+                newline = body.rfind(b"\n")
+                if newline != -1:
+                    return body[newline + 1:].decode("utf-8")
+            body = buf[:-1] if buf.endswith(b"\n") else buf
+            return body.decode("utf-8")
+
     def get_governance_summary(self, scope: str = "crypto") -> Optional[str]:
         """
         Get Layer 2 governance summary from latest verdict.
@@ -105,7 +169,7 @@ class VerdictReader:
         Returns:
             summary_for_governance field or None
         """
-        verdict_record = self.read_latest_verdict(scope)
+        verdict_record = self._latest(scope)
 
         if verdict_record and "verdict" in verdict_record:
             return verdict_record["verdict"].get("summary_for_governance")
@@ -125,7 +189,7 @@ class VerdictReader:
         Returns:
             True if REGIME_QUESTIONABLE or HIGH_NOISE verdict detected
         """
-        verdict_record = self.read_latest_verdict(scope)
+        verdict_record = self._latest(scope)
 
         if verdict_record and "verdict" in verdict_record:
             verdict_type = verdict_record["verdict"].get("verdict")
@@ -140,7 +204,7 @@ class VerdictReader:
         Returns:
             Multiplier to apply to confidence (e.g., 0.8 = 20% penalty)
         """
-        verdict_record = self.read_latest_verdict(scope)
+        verdict_record = self._latest(scope)
 
         if not verdict_record or "verdict" not in verdict_record:
             return 1.0  # No penalty
@@ -167,7 +231,7 @@ class VerdictReader:
         Returns:
             Dict with all verdict fields for metadata, or None if not available
         """
-        verdict_record = self.read_latest_verdict(scope)
+        verdict_record = self._latest(scope)
 
         if not verdict_record:
             return None
@@ -181,3 +245,16 @@ class VerdictReader:
             "phase_f_num_sources": verdict_record["verdict"].get("num_sources_analyzed"),
             "phase_f_num_contradictions": verdict_record["verdict"].get("num_contradictions"),
         }
+
+
+_shared_readers: Dict[str, VerdictReader] = {}
+_shared_readers_lock = threading.Lock()
+
+
+def get_verdict_reader(phase_f_root: str = "persist/phase_f") -> VerdictReader:
+    """Process-wide VerdictReader per root, so the parsed verdict survives across cycles."""
+    with _shared_readers_lock:
+        reader = _shared_readers.get(phase_f_root)
+        if reader is None:
+            reader = _shared_readers[phase_f_root] = VerdictReader(phase_f_root)
+        return reader
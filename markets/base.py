@@ -16,6 +16,8 @@ from typing import List, Dict, Any, Optional
 from enum import Enum
 import pytz
 
+from markets.calendar import SessionCalendar, us_equity_early_closes, us_equity_holidays
+
 
 class MarketStatus(Enum):
     """Current market state."""
@@ -65,6 +67,26 @@ class Market(ABC):
         self.trading_hours = trading_hours
         self.holidays = holidays or []
         self.timezone = pytz.timezone(trading_hours.timezone)
+        self._calendar: Optional[SessionCalendar] = None
+    
+    @property
+    def calendar(self) -> SessionCalendar:
+        """Precomputed session calendar (built on first use)."""
+        if self._calendar is None:
+            self._calendar = SessionCalendar(
+                self.trading_hours,
+                holidays=self.holidays_for_year,
+                early_closes=self.early_closes_for_year,
+            )
+        return self._calendar
+    
+    def holidays_for_year(self, year: int) -> List[date]:
+        """Full-day holidays in a year (default: the configured list)."""
+        return [d for d in self.holidays if d.year == year]
+    
+    def early_closes_for_year(self, year: int) -> Dict[date, time]:
+        """Early-close days in a year -> close time (default: none)."""
+        return {}
     
     @abstractmethod
     def is_market_open(self, check_time: Optional[datetime] = None) -> bool:
@@ -120,15 +142,22 @@ class Market(ABC):
     
     def is_trading_day(self, check_date: date) -> bool:
         """Check if date is a trading day (not weekend or holiday)."""
-        # Check weekend
-        if check_date.weekday() >= 5:  # Saturday=5, Sunday=6
-            return False
-        
-        # Check holidays
-        if check_date in self.holidays:
-            return False
+        return self.calendar.is_trading_day(check_date)
+    
+    def _session_status(self, check_time: Optional[datetime]) -> MarketStatus:
+        """Market status from the session calendar."""
+        session = self.calendar.session(check_time)
+        if session is None:
+            return MarketStatus.HOLIDAY
         
-        return True
+        t = self.calendar._epoch(check_time)
+        if session["pre"] <= t < session["open"]:
+            return MarketStatus.PRE_MARKET
+        if session["open"] <= t <= session["close"]:
+            return MarketStatus.OPEN
+        if session["close"] < t <= session["post"]:
+            return MarketStatus.POST_MARKET
+        return MarketStatus.CLOSED
     
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(id='{self.market_id}')"
@@ -164,53 +193,11 @@ class IndiaMarket(Market):
     
     def is_market_open(self, check_time: Optional[datetime] = None) -> bool:
         """Check if NSE is open."""
-        if check_time is None:
-            check_time = datetime.now(self.timezone)
-        elif check_time.tzinfo is None:
-            check_time = self.timezone.localize(check_time)
-        else:
-            check_time = check_time.astimezone(self.timezone)
-        
-        # Check if trading day
-        if not self.is_trading_day(check_time.date()):
-            return False
-        
-        # Check if within trading hours
-        current_time = check_time.time()
-        return (
-            self.trading_hours.market_open <= current_time <= self.trading_hours.market_close
-        )
+        return self.calendar.is_open(check_time)
     
     def get_market_status(self, check_time: Optional[datetime] = None) -> MarketStatus:
         """Get NSE market status."""
-        if check_time is None:
-            check_time = datetime.now(self.timezone)
-        elif check_time.tzinfo is None:
-            check_time = self.timezone.localize(check_time)
-        else:
-            check_time = check_time.astimezone(self.timezone)
-        
-        # Check holiday
-        if not self.is_trading_day(check_time.date()):
-            return MarketStatus.HOLIDAY
-        
-        current_time = check_time.time()
-        
-        # Check pre-market
-        if (self.trading_hours.pre_market_open and 
-            self.trading_hours.pre_market_open <= current_time < self.trading_hours.market_open):
-            return MarketStatus.PRE_MARKET
-        
-        # Check open
-        if self.trading_hours.market_open <= current_time <= self.trading_hours.market_close:
-            return MarketStatus.OPEN
-        
-        # Check post-market
-        if (self.trading_hours.post_market_close and
-            self.trading_hours.market_close < current_time <= self.trading_hours.post_market_close):
-            return MarketStatus.POST_MARKET
-        
-        return MarketStatus.CLOSED
+        return self._session_status(check_time)
     
     def requires_pdt_check(self, account_context: Dict[str, Any]) -> bool:
         """
@@ -256,58 +243,24 @@ class USMarket(Market):
         super().__init__(
             market_id="NYSE",
             trading_hours=trading_hours,
-            holidays=[],  # TODO: Load US holidays
+            holidays=[],  # Additional closures; regular holidays are rule-based
         )
     
+    def holidays_for_year(self, year: int) -> List[date]:
+        """NYSE holidays plus any configured closures."""
+        return list(us_equity_holidays(year)) + super().holidays_for_year(year)
+    
+    def early_closes_for_year(self, year: int) -> Dict[date, time]:
+        """NYSE 1:00 PM early closes."""
+        return us_equity_early_closes(year)
+    
     def is_market_open(self, check_time: Optional[datetime] = None) -> bool:
         """Check if US market is open."""
-        if check_time is None:
-            check_time = datetime.now(self.timezone)
-        elif check_time.tzinfo is None:
-            check_time = self.timezone.localize(check_time)
-        else:
-            check_time = check_time.astimezone(self.timezone)
-        
-        # Check if trading day
-        if not self.is_trading_day(check_time.date()):
-            return False
-        
-        # Check if within trading hours
-        current_time = check_time.time()
-        return (
-            self.trading_hours.market_open <= current_time <= self.trading_hours.market_close
-        )
+        return self.calendar.is_open(check_time)
     
     def get_market_status(self, check_time: Optional[datetime] = None) -> MarketStatus:
         """Get US market status."""
-        if check_time is None:
-            check_time = datetime.now(self.timezone)
-        elif check_time.tzinfo is None:
-            check_time = self.timezone.localize(check_time)
-        else:
-            check_time = check_time.astimezone(self.timezone)
-        
-        # Check holiday
-        if not self.is_trading_day(check_time.date()):
-            return MarketStatus.HOLIDAY
-        
-        current_time = check_time.time()
-        
-        # Check pre-market
-        if (self.trading_hours.pre_market_open and 
-            self.trading_hours.pre_market_open <= current_time < self.trading_hours.market_open):
-            return MarketStatus.PRE_MARKET
-        
-        # Check open
-        if self.trading_hours.market_open <= current_time <= self.trading_hours.market_close:
-            return MarketStatus.OPEN
-        
-        # Check post-market
-        if (self.trading_hours.post_market_close and
-            self.trading_hours.market_close < current_time <= self.trading_hours.post_market_close):
-            return MarketStatus.POST_MARKET
-        
-        return MarketStatus.CLOSED
+        return self._session_status(check_time)
     
     def requires_pdt_check(self, account_context: Dict[str, Any]) -> bool:
         """
@@ -0,0 +1,284 @@
+"""
+Precomputed market session calendar.
+
+Sessions for a span of years are expanded once into sorted epoch arrays
+(pre-open, open, close, post-close per trading day), with holidays and
+early closes baked in. Lookups are then binary searches with no
+timezone conversion or holiday scan per call:
+
+- is_open(ts), next_open(ts), next_close(ts): O(log n)
+- session(ts): the trading session containing ts's local day, if any
+- is_trading_day(dates): vectorized over arrays of dates for backtests
+
+Years outside the built span are added on demand.
+"""
+
+import logging
+import threading
+import time as time_module
+from datetime import date, datetime, time, timedelta
+from typing import Callable, Dict, Iterable, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+WEEKDAYS = "1111100"
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """n-th weekday (Mon=0) of a month; n=-1 for the last."""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> date:
+    """Gregorian Easter Sunday (anonymous algorithm)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _observed(day: date) -> Optional[date]:
+    """NYSE observance: Saturday -> Friday, Sunday -> Monday."""
+    if day.weekday() == 5:
+        observed = day - timedelta(days=1)
+        # A Saturday New Year's Day is not observed on Dec 31
+        return None if observed.year != day.year else observed
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+def us_equity_holidays(year: int) -> Iterable[date]:
+    """NYSE full-day holidays for a year (rule-based)."""
+    fixed = [date(year, 1, 1), date(year, 7, 4), date(year, 12, 25)]
+    if year >= 2022:
+        fixed.append(date(year, 6, 19))  # Juneteenth
+    holidays = [d for d in map(_observed, fixed) if d is not None]
+    holidays += [
+        _nth_weekday(year, 1, 0, 3),            # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),            # Presidents' Day
+        _easter(year) - timedelta(days=2),      # Good Friday
+        _nth_weekday(year, 5, 0, -1),           # Memorial Day
+        _nth_weekday(year, 9, 0, 1),            # Labor Day
+        _nth_weekday(year, 11, 3, 4),           # Thanksgiving
+    ]
+    return sorted(holidays)
+
+
+def us_equity_early_closes(year: int) -> Dict[date, time]:
+    """NYSE 1:00 PM early closes for a year."""
+    early = {_nth_weekday(year, 11, 3, 4) + timedelta(days=1): time(13, 0)}  # Day after Thanksgiving
+    for day in (date(year, 7, 3), date(year, 12, 24)):
+        if day.weekday() <= 3:  # Mon-Thu (the holiday itself falls on a weekday)
+            early[day] = time(13, 0)
+    return early
+
+
+class SessionCalendar:
+    """
+    Sorted session arrays for one market.
+
+    Thread-safe: arrays are replaced wholesale when the span grows.
+    """
+
+    def __init__(
+        self,
+        trading_hours,
+        holidays: Callable[[int], Iterable[date]] = lambda year: (),
+        early_closes: Callable[[int], Dict[date, time]] = lambda year: {},
+        years: Optional[Tuple[int, int]] = None,
+    ):
+        """
+        Args:
+            trading_hours: TradingHours (open/close, optional pre/post, timezone)
+            holidays: year -> full-day holidays
+            early_closes: year -> {date: close time}
+            years: Initial (first, last) year span (default: last year .. 2 years ahead)
+        """
+        self.trading_hours = trading_hours
+        self.tz = ZoneInfo(trading_hours.timezone)
+        self._holidays_for = holidays
+        self._early_closes_for = early_closes
+        self._lock = threading.Lock()
+
+        if years is None:
+            this_year = datetime.now(self.tz).year
+            years = (this_year - 1, this_year + 2)
+        self._first_year = self._last_year = None
+        self._build(*years)
+
+    # ------------------------------------------------------------------
+    # Build
+    # ------------------------------------------------------------------
+
+    def _build(self, first_year: int, last_year: int) -> None:
+        hours = self.trading_hours
+        holidays = sorted({d for year in range(first_year, last_year + 1) for d in self._holidays_for(year)})
+        early = {}
+        for year in range(first_year, last_year + 1):
+            early.update(self._early_closes_for(year))
+
+        holiday_days = np.array(holidays, dtype="datetime64[D]")
+        all_days = np.arange(
+            np.datetime64(f"{first_year}-01-01"), np.datetime64(f"{last_year + 1}-01-01"), dtype="datetime64[D]"
+        )
+        trading_days = all_days[np.is_busday(all_days, weekmask=WEEKDAYS, holidays=holiday_days)]
+
+        days = pd.DatetimeIndex(trading_days)
+        close_offsets = [early.get(day, hours.market_close) for day in trading_days.astype(date)]
+
+        def epoch(offsets) -> np.ndarray:
+            """Local wall-clock time on each trading day -> epoch seconds."""
+            local = days + pd.to_timedelta(offsets)
+            utc = local.tz_localize(self.tz.key, ambiguous=False, nonexistent="shift_forward")
+            return utc.as_unit("ns").asi8 / 1e9
+
+        def offset(at: time) -> pd.Timedelta:
+            return pd.Timedelta(hours=at.hour, minutes=at.minute, seconds=at.second)
+
+        close = pd.to_timedelta([offset(at) for at in close_offsets]) if len(days) else pd.to_timedelta([])
+        arrays = {
+            "midnight": epoch(pd.Timedelta(0)),
+            "next_midnight": epoch(pd.Timedelta(days=1)),
+            "pre": epoch(offset(hours.pre_market_open or hours.market_open)),
+            "open": epoch(offset(hours.market_open)),
+            "close": epoch(close),
+            "post": epoch(offset(hours.post_market_close) if hours.post_market_close else close),
+        }
+        # Publish atomically (readers never see a half-built span)
+        self._arrays = (trading_days, holiday_days, arrays)
+        self._first_year, self._last_year = first_year, last_year
+        logger.debug(
+            "SESSION_CALENDAR_BUILT | tz=%s years=%d-%d sessions=%d",
+            self.trading_hours.timezone, first_year, last_year, len(trading_days),
+        )
+
+    def _ensure_years(self, first_year: int, last_year: int) -> None:
+        if first_year >= self._first_year and last_year <= self._last_year:
+            return
+        with self._lock:
+            if first_year < self._first_year or last_year > self._last_year:
+                self._build(min(first_year, self._first_year), max(last_year, self._last_year))
+
+    def _epoch(self, ts: Optional[datetime]) -> float:
+        """Epoch seconds; naive datetimes are market-local time."""
+        if ts is None:
+            t = time_module.time()
+        elif ts.tzinfo is None:
+            t = ts.replace(tzinfo=self.tz).timestamp()
+        else:
+            t = ts.timestamp()
+        year = datetime.fromtimestamp(t, self.tz).year if not self._covers(t) else None
+        if year is not None:
+            # One extra year so next_open/next_close across year end resolve
+            self._ensure_years(year - 1, year + 1)
+        return t
+
+    def _covers(self, t: float) -> bool:
+        arrays = self._arrays[2]
+        return (
+            len(arrays["midnight"]) > 0
+            and arrays["midnight"][0] <= t < arrays["next_midnight"][-1]
+        )
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def session(self, ts: Optional[datetime] = None) -> Optional[Dict[str, float]]:
+        """
+        Epoch bounds of the session on ts's local day.
+
+        Returns:
+            {"pre", "open", "close", "post"} epoch seconds, or None if the
+            day is not a trading day
+        """
+        t = self._epoch(ts)
+        arrays = self._arrays[2]
+        i = int(np.searchsorted(arrays["midnight"], t, side="right")) - 1
+        if i < 0 or t >= arrays["next_midnight"][i]:
+            return None
+        return {name: float(arrays[name][i]) for name in ("pre", "open", "close", "post")}
+
+    def is_open(self, ts: Optional[datetime] = None) -> bool:
+        """True if ts is within a regular session (open and close inclusive)."""
+        t = self._epoch(ts)
+        arrays = self._arrays[2]
+        i = int(np.searchsorted(arrays["open"], t, side="right")) - 1
+        return bool(i >= 0 and t <= arrays["close"][i])
+
+    def next_open(self, ts: Optional[datetime] = None) -> datetime:
+        """First session open strictly after ts (market timezone)."""
+        return self._next("open", self._epoch(ts), side="right")
+
+    def next_close(self, ts: Optional[datetime] = None) -> datetime:
+        """Close of the current session if open, else of the next session."""
+        return self._next("close", self._epoch(ts), side="left")
+
+    def _next(self, column: str, t: float, side: str) -> datetime:
+        values = self._arrays[2][column]
+        i = int(np.searchsorted(values, t, side=side))
+        if i == len(values):
+            self._ensure_years(self._first_year, self._last_year + 1)
+            values = self._arrays[2][column]
+            i = int(np.searchsorted(values, t, side=side))
+        return datetime.fromtimestamp(values[i], self.tz)
+
+    def clock(self, ts: Optional[datetime] = None) -> Dict[str, Optional[datetime]]:
+        """Broker-style clock: is_open, timestamp, next_open, next_close."""
+        if ts is None:
+            now = datetime.now(self.tz)
+        elif ts.tzinfo is None:
+            now = ts.replace(tzinfo=self.tz)
+        else:
+            now = ts.astimezone(self.tz)
+        return {
+            "is_open": self.is_open(now),
+            "timestamp": now,
+            "next_open": self.next_open(now),
+            "next_close": self.next_close(now),
+        }
+
+    def is_trading_day(self, dates):
+        """
+        Trading-day mask.
+
+        Args:
+            dates: A date/datetime (aware datetimes are converted to market
+                time), or an array-like of dates / DatetimeIndex
+
+        Returns:
+            bool for a scalar, else a NumPy bool array
+        """
+        scalar = isinstance(dates, (date, np.datetime64))
+        if isinstance(dates, datetime) and dates.tzinfo is not None:
+            dates = dates.astimezone(self.tz)
+        if isinstance(dates, pd.DatetimeIndex) and dates.tz is not None:
+            dates = dates.tz_convert(self.tz).tz_localize(None)
+        if isinstance(dates, datetime):
+            dates = dates.date()
+
+        days = np.asarray(dates, dtype="datetime64[D]")
+        if days.size == 0:
+            return np.zeros(days.shape, dtype=bool)
+
+        first = int(str(days.min())[:4])
+        last = int(str(days.max())[:4])
+        self._ensure_years(first, last)
+        mask = np.is_busday(days, weekmask=WEEKDAYS, holidays=self._arrays[1])
+        return bool(mask) if scalar else mask
@@ -25,6 +25,7 @@ from features.feature_engine import compute_features
 from scoring.rule_scorer import score_symbol
 from backtest.simple_backtest import Trade
 from ml.predict import predict_confidence_scores
+from monitoring.trade_stats import TradeStats
 
 logger = logging.getLogger(__name__)
 
@@ -196,42 +197,19 @@ def compute_backtest_metrics(trades: List[Trade]) -> Dict:
             "by_confidence": {},
         }
     
-    returns = [t.return_pct for t in trades]
+    stats = TradeStats.from_trades(trades, returns="return_pct", confidence="confidence")
     
-    winning_trades = [r for r in returns if r >= 0]
-    losing_trades = [r for r in returns if r < 0]
-    
-    total_gain = sum(r for r in returns if r >= 0)
-    total_loss = sum(abs(r) for r in returns if r < 0)
-    
-    profit_factor = total_gain / total_loss if total_loss > 0 else float('inf')
-    
-    metrics = {
-        "num_trades": len(trades),
-        "winning_trades": len(winning_trades),
-        "losing_trades": len(losing_trades),
-        "win_rate": len(winning_trades) / len(trades) if trades else 0,
-        "avg_return": np.mean(returns),
-        "total_return": sum(returns),
-        "avg_win": np.mean(winning_trades) if winning_trades else 0,
-        "avg_loss": np.mean(losing_trades) if losing_trades else 0,
-        "max_gain": max(returns) if returns else 0,
-        "max_loss": min(returns) if returns else 0,
-        "profit_factor": profit_factor,
-    }
+    metrics = stats.return_summary(breakeven_is_win=True)
     
     # Metrics by confidence level
-    by_confidence = {}
-    for conf in range(1, 6):
-        conf_trades = [t for t in trades if t.confidence == conf]
-        if conf_trades:
-            conf_returns = [t.return_pct for t in conf_trades]
-            by_confidence[conf] = {
-                "count": len(conf_trades),
-                "win_rate": sum(1 for r in conf_returns if r >= 0) / len(conf_trades),
-                "avg_return": np.mean(conf_returns),
-            }
-    metrics["by_confidence"] = by_confidence
+    metrics["by_confidence"] = {
+        conf: {
+            "count": tier["count"],
+            "win_rate": tier["win_rate"],
+            "avg_return": tier["avg_return"],
+        }
+        for conf, tier in stats.by_confidence(breakeven_is_win=True, tiers=range(1, 6)).items()
+    }
     
     return metrics
 
@@ -98,7 +98,13 @@ class OfflineMLOrchestrator:
         # Step 5: Auto-promote if enabled and thresholds met
         promoted = False
         if auto_promote:
-            improvement_metrics = eval_result.get("improvement", {})
+            # Prefer out-of-sample walk-forward aggregate over the single split
+            walk_forward = train_result.get("walk_forward")
+            if walk_forward:
+                improvement_metrics = walk_forward.get("improvement", {})
+                logger.info(f"Promotion gated on walk-forward CV ({walk_forward['n_folds']} folds)")
+            else:
+                improvement_metrics = eval_result.get("improvement", {})
             promoted = self.registry.auto_promote_if_better(
                 model_id,
                 improvement_metrics,
@@ -30,13 +30,16 @@ logger = logging.getLogger(__name__)
 class OfflineTrainer:
     """Train risk-filter model offline (after market close only)."""
 
-    def __init__(self, model_dir: Path, dataset_builder):
+    def __init__(self, model_dir: Path, dataset_builder, walk_forward_validator=None):
         """
         Initialize trainer.
         
         Args:
             model_dir: Directory to save model artifacts
             dataset_builder: DatasetBuilder instance with dataset
+            walk_forward_validator: WalkForwardValidator to reuse across
+                train() calls (None = created on first use); keeping one
+                instance lets unchanged datasets reuse its scaled folds
         """
         self.model_dir = Path(model_dir)
         self.model_dir.mkdir(parents=True, exist_ok=True)
@@ -46,12 +49,14 @@ class OfflineTrainer:
         self.scaler = None
         self.feature_names = None
         self.model_id = None
+        self.walk_forward_validator = walk_forward_validator
 
     def train(
         self,
         mae_threshold: float = 0.03,
         test_size: float = 0.2,
         force: bool = False,
+        walk_forward_folds: int = 5,
     ) -> Optional[Dict]:
         """Train risk-filter model.
         
@@ -62,6 +67,7 @@ class OfflineTrainer:
             mae_threshold: MAE threshold for 'bad' label
             test_size: Train/test split ratio
             force: Force training even if dataset is small (for testing)
+            walk_forward_folds: Expanding-window CV folds (0 disables)
         
         Returns:
             Model metrics dict or None if training skipped
@@ -91,6 +97,10 @@ class OfflineTrainer:
         
         logger.info(f"Training on {len(df)} closed trades")
         
+        # Walk-forward CV requires temporal order
+        if "decision_timestamp" in df.columns:
+            df = df.sort_values("decision_timestamp", kind="stable").reset_index(drop=True)
+        
         # Create binary label: 0 = good trade, 1 = bad trade
         df["is_bad"] = df.apply(
             lambda row: 1 if row["realized_pnl_pct"] < 0 or abs(row["mae_pct"]) > mae_threshold else 0,
@@ -110,6 +120,17 @@ class OfflineTrainer:
             logger.warning("Too few samples after feature extraction.")
             return None
         
+        # Walk-forward CV (out-of-sample, per fold) for promotion decisions
+        walk_forward = None
+        if walk_forward_folds > 0:
+            if self.walk_forward_validator is None:
+                from ml.walk_forward import WalkForwardValidator
+                self.walk_forward_validator = WalkForwardValidator()
+            validator = self.walk_forward_validator
+            validator.n_folds = walk_forward_folds
+            validator.min_train_size = max(5, len(X) // (walk_forward_folds + 1))
+            walk_forward = validator.run(X, y, pnl=df["realized_pnl_pct"].to_numpy(dtype=float))
+        
         # Split
         X_train, X_test, y_train, y_test = train_test_split(
             X, y, test_size=test_size, random_state=42, stratify=y if len(np.unique(y)) > 1 else None
@@ -141,11 +162,11 @@ class OfflineTrainer:
         self.model_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         # Save model
-        self._save_model(X_train, X_test, y_train, y_test, train_score, test_score)
+        self._save_model(X_train, X_test, y_train, y_test, train_score, test_score, walk_forward)
         
         logger.info("=" * 80)
         
-        return {
+        result = {
             "model_id": self.model_id,
             "train_accuracy": float(train_score),
             "test_accuracy": float(test_score),
@@ -153,6 +174,10 @@ class OfflineTrainer:
             "n_trades": len(df),
             "bad_trade_pct": 100 * bad_count / len(df),
         }
+        if walk_forward is not None:
+            result["walk_forward"] = walk_forward
+        
+        return result
 
     def _extract_feature_names(self, df: pd.DataFrame) -> list:
         """Extract unique feature names from rule_features."""
@@ -201,6 +226,7 @@ class OfflineTrainer:
         y_test: np.ndarray,
         train_score: float,
         test_score: float,
+        walk_forward: Optional[Dict] = None,
     ) -> None:
         """Save model artifacts to disk."""
         model_dir = self.model_dir / self.model_id
@@ -227,6 +253,11 @@ class OfflineTrainer:
             "n_test_samples": len(X_test),
             "model_type": "LogisticRegression",
         }
+        if walk_forward is not None:
+            metadata["walk_forward"] = {
+                "n_folds": walk_forward["n_folds"],
+                "aggregate": walk_forward["aggregate"],
+            }
         
         metadata_file = model_dir / "metadata.json"
         with open(metadata_file, "w") as f:
@@ -0,0 +1,326 @@
+"""
+Walk-forward cross-validation for the offline risk-filter model.
+
+Replaces the single train/test split with an expanding-window schedule:
+
+    fold 0: train [0, t0)          test [t0, t1)
+    fold 1: train [0, t1)          test [t1, t2)
+    ...
+
+Every fold trains only on data strictly before its test window, so there
+is no future leakage. Folds are fitted in a process pool, standardized
+fold matrices are cached per dataset fingerprint, and metrics for all
+folds are computed with NumPy in the parent process.
+
+SAFETY CONSTRAINTS:
+- Runs offline only (after market close)
+- FORBIDDEN in live environment (hard error)
+"""
+
+import hashlib
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+
+logger = logging.getLogger(__name__)
+
+# Fold boundaries: (fold_index, train_end, test_end)
+FoldBounds = Tuple[int, int, int]
+
+
+def expanding_window_folds(
+    n_samples: int,
+    n_folds: int,
+    min_train_size: int,
+) -> List[FoldBounds]:
+    """
+    Build expanding-window fold boundaries over time-ordered samples.
+
+    The samples after the initial training block are divided into
+    `n_folds` contiguous test windows of (almost) equal size.
+
+    Args:
+        n_samples: Number of time-ordered samples
+        n_folds: Requested number of folds
+        min_train_size: Samples reserved for the first training window
+
+    Returns:
+        List of (fold_index, train_end, test_end); empty if there is not
+        enough data for at least one sample per test window
+    """
+    if n_folds <= 0 or min_train_size <= 0:
+        return []
+
+    n_test_total = n_samples - min_train_size
+    if n_test_total < n_folds:
+        return []
+
+    edges = min_train_size + np.linspace(0, n_test_total, n_folds + 1).astype(int)
+    return [(i, int(edges[i]), int(edges[i + 1])) for i in range(n_folds)]
+
+
+def _fit_fold(payload: Tuple[int, np.ndarray, np.ndarray, np.ndarray, Dict]) -> Tuple[int, np.ndarray]:
+    """
+    Fit one fold and return its test-set probabilities of the 'bad' class.
+
+    Module-level so it can be pickled into worker processes.
+    """
+    fold, X_train, y_train, X_test, model_params = payload
+
+    if len(np.unique(y_train)) < 2:
+        # Degenerate training window: predict the only class seen
+        return fold, np.full(len(X_test), float(y_train[0]) if len(y_train) else 0.5)
+
+    model = LogisticRegression(**model_params)
+    model.fit(X_train, y_train)
+    return fold, model.predict_proba(X_test)[:, 1]
+
+
+class WalkForwardValidator:
+    """Expanding-window walk-forward CV with parallel fold training."""
+
+    DEFAULT_MODEL_PARAMS = {"max_iter": 1000, "random_state": 42}
+
+    def __init__(
+        self,
+        n_folds: int = 5,
+        min_train_size: int = 20,
+        risk_threshold: float = 0.5,
+        max_workers: Optional[int] = None,
+        model_params: Optional[Dict] = None,
+    ):
+        """
+        Initialize validator.
+
+        Args:
+            n_folds: Number of walk-forward folds
+            min_train_size: Samples in the first training window
+            risk_threshold: Probability above which a trade is blocked
+            max_workers: Process pool size (None = min(folds, CPUs); 1 = serial)
+            model_params: LogisticRegression keyword arguments
+        """
+        self.n_folds = n_folds
+        self.min_train_size = min_train_size
+        self.risk_threshold = risk_threshold
+        self.max_workers = max_workers
+        self.model_params = dict(model_params or self.DEFAULT_MODEL_PARAMS)
+
+        # {(dataset_fingerprint, train_end, test_end): (X_train_scaled, X_test_scaled)}
+        self._fold_cache: Dict[Tuple[str, int, int], Tuple[np.ndarray, np.ndarray]] = {}
+
+    def run(
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        pnl: Optional[np.ndarray] = None,
+    ) -> Optional[Dict]:
+        """
+        Run walk-forward CV over time-ordered samples.
+
+        CRITICAL: FORBIDDEN in live environment (hard error).
+
+        Args:
+            X: Feature matrix (samples x features), oldest first
+            y: Binary labels (1 = bad trade)
+            pnl: Optional realized PnL per sample for filter-improvement metrics
+
+        Returns:
+            Dict with per-fold metrics and an aggregate, or None if there is
+            not enough data for the requested folds
+
+        Raises:
+            EnvironmentViolationError: If called from live environment
+        """
+        from runtime.environment_guard import block_ml_training_in_live
+        block_ml_training_in_live()
+
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y).astype(int)
+
+        folds = expanding_window_folds(len(X), self.n_folds, self.min_train_size)
+        if not folds:
+            logger.warning(
+                f"Walk-forward skipped: {len(X)} samples insufficient for "
+                f"{self.n_folds} folds after {self.min_train_size} training samples"
+            )
+            return None
+
+        fingerprint = self._fingerprint(X)
+        # Folds of a previous dataset can never be hit again
+        if any(key[0] != fingerprint for key in self._fold_cache):
+            self._fold_cache = {k: v for k, v in self._fold_cache.items() if k[0] == fingerprint}
+        payloads = []
+        for fold, train_end, test_end in folds:
+            X_train_scaled, X_test_scaled = self._standardized_fold(X, fingerprint, train_end, test_end)
+            payloads.append((fold, X_train_scaled, y[:train_end], X_test_scaled, self.model_params))
+
+        probabilities = self._fit_folds(payloads)
+
+        fold_results = self._score_folds(folds, probabilities, y, pnl)
+        aggregate = self._aggregate(fold_results)
+
+        logger.info(f"Walk-forward CV: {len(folds)} folds")
+        for result in fold_results:
+            logger.info(
+                f"  fold {result['fold']}: train={result['train_size']} test={result['test_size']} "
+                f"acc={result['accuracy']:.3f} f1={result['f1']:.3f}"
+            )
+        logger.info(
+            f"  aggregate: acc={aggregate['accuracy_mean']:.3f}±{aggregate['accuracy_std']:.3f} "
+            f"f1={aggregate['f1_mean']:.3f}"
+        )
+
+        return {
+            "n_folds": len(folds),
+            "folds": fold_results,
+            "aggregate": aggregate,
+            "improvement": aggregate.get("improvement", {}),
+        }
+
+    def _fingerprint(self, X: np.ndarray) -> str:
+        """Cheap content hash identifying the dataset for the fold cache."""
+        digest = hashlib.sha1(np.ascontiguousarray(X).tobytes()).hexdigest()
+        return f"{X.shape[0]}x{X.shape[1]}:{digest}"
+
+    def _standardized_fold(
+        self,
+        X: np.ndarray,
+        fingerprint: str,
+        train_end: int,
+        test_end: int,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return (X_train_scaled, X_test_scaled) for a fold, cached.
+
+        Scaling matches sklearn's StandardScaler: statistics from the
+        training window only, population std, zero variance mapped to 1.
+        """
+        key = (fingerprint, train_end, test_end)
+        cached = self._fold_cache.get(key)
+        if cached is not None:
+            return cached
+
+        X_train = X[:train_end]
+        mean = X_train.mean(axis=0)
+        std = X_train.std(axis=0)
+        std[std == 0.0] = 1.0
+
+        scaled = ((X_train - mean) / std, (X[train_end:test_end] - mean) / std)
+        self._fold_cache[key] = scaled
+        return scaled
+
+    def _fit_folds(self, payloads: List[Tuple]) -> Dict[int, np.ndarray]:
+        """Fit folds in a process pool (or serially for a single worker)."""
+        workers = self.max_workers
+        if workers is None:
+            workers = min(len(payloads), os.cpu_count() or 1)
+
+        if workers <= 1 or len(payloads) <= 1:
+            return dict(_fit_fold(p) for p in payloads)
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return dict(pool.map(_fit_fold, payloads))
+
+    def _score_folds(
+        self,
+        folds: List[FoldBounds],
+        probabilities: Dict[int, np.ndarray],
+        y: np.ndarray,
+        pnl: Optional[np.ndarray],
+    ) -> List[Dict]:
+        """Compute classification and filter metrics for every fold at once."""
+        n_test_total = folds[-1][2] - folds[0][1]
+        start = folds[0][1]
+
+        # Stitch all test windows into flat arrays tagged with their fold
+        fold_ids = np.empty(n_test_total, dtype=int)
+        proba = np.empty(n_test_total, dtype=float)
+        for fold, train_end, test_end in folds:
+            fold_ids[train_end - start:test_end - start] = fold
+            proba[train_end - start:test_end - start] = probabilities[fold]
+
+        y_true = y[start:start + n_test_total]
+        y_pred = (proba > self.risk_threshold).astype(int)
+        n_folds = len(folds)
+
+        def per_fold(mask: np.ndarray, weights: Optional[np.ndarray] = None) -> np.ndarray:
+            w = mask.astype(float) if weights is None else np.where(mask, weights, 0.0)
+            return np.bincount(fold_ids, weights=w, minlength=n_folds)
+
+        tp = per_fold((y_pred == 1) & (y_true == 1))
+        fp = per_fold((y_pred == 1) & (y_true == 0))
+        tn = per_fold((y_pred == 0) & (y_true == 0))
+        fn = per_fold((y_pred == 0) & (y_true == 1))
+        n = tp + fp + tn + fn
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            accuracy = np.where(n > 0, (tp + tn) / n, 0.0)
+            precision = np.where(tp + fp > 0, tp / (tp + fp), 0.0)
+            recall = np.where(tp + fn > 0, tp / (tp + fn), 0.0)
+            f1 = np.where(precision + recall > 0, 2 * precision * recall / (precision + recall), 0.0)
+
+        # Filter improvement: rules-only (all trades) vs rules + ML (unblocked)
+        kept = y_pred == 0
+        n_kept = per_fold(kept)
+        bad_all = tp + fn
+        bad_kept = fn
+        with np.errstate(divide="ignore", invalid="ignore"):
+            win_rate_all = np.where(n > 0, (n - bad_all) / n, 0.0)
+            win_rate_kept = np.where(n_kept > 0, (n_kept - bad_kept) / n_kept, 0.0)
+
+        expectancy_delta = np.zeros(n_folds)
+        if pnl is not None:
+            pnl_test = np.asarray(pnl, dtype=float)[start:start + n_test_total]
+            all_ones = np.ones_like(pnl_test, dtype=bool)
+            pnl_all = per_fold(all_ones, pnl_test)
+            pnl_kept = per_fold(kept, pnl_test)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                exp_all = np.where(n > 0, pnl_all / n, 0.0)
+                exp_kept = np.where(n_kept > 0, pnl_kept / n_kept, 0.0)
+            expectancy_delta = exp_kept - exp_all
+
+        results = []
+        for i, (fold, train_end, test_end) in enumerate(folds):
+            results.append({
+                "fold": fold,
+                "train_size": train_end,
+                "test_size": test_end - train_end,
+                "accuracy": float(accuracy[i]),
+                "precision": float(precision[i]),
+                "recall": float(recall[i]),
+                "f1": float(f1[i]),
+                "tp": int(tp[i]),
+                "fp": int(fp[i]),
+                "tn": int(tn[i]),
+                "fn": int(fn[i]),
+                "bad_trades_avoided": int(tp[i]),
+                "trades_filtered": int(tp[i] + fp[i]),
+                "win_rate_improvement": float(win_rate_kept[i] - win_rate_all[i]),
+                "expectancy_improvement": float(expectancy_delta[i]),
+            })
+        return results
+
+    def _aggregate(self, fold_results: List[Dict]) -> Dict:
+        """Aggregate fold metrics (mean/std) plus registry-ready improvement metrics."""
+        aggregate: Dict = {}
+        for name in ("accuracy", "precision", "recall", "f1"):
+            values = np.array([r[name] for r in fold_results])
+            aggregate[f"{name}_mean"] = float(values.mean())
+            aggregate[f"{name}_std"] = float(values.std())
+
+        expectancy = np.array([r["expectancy_improvement"] for r in fold_results])
+        win_rate = np.array([r["win_rate_improvement"] for r in fold_results])
+
+        # Same keys ModelRegistry.auto_promote_if_better reads from OfflineEvaluator
+        aggregate["improvement"] = {
+            "bad_trades_avoided": int(sum(r["bad_trades_avoided"] for r in fold_results)),
+            "trades_filtered": int(sum(r["trades_filtered"] for r in fold_results)),
+            "expectancy_improvement": float(expectancy.mean()),
+            "win_rate_improvement": float(win_rate.mean()),
+            "min_fold_expectancy_improvement": float(expectancy.min()),
+        }
+        return aggregate
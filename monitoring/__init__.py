@@ -5,6 +5,7 @@ System health checks for:
 - Confidence distribution anomalies
 - Performance degradation by confidence tier
 - Feature drift detection
+- Columnar trade statistics shared by ledger, portfolio and backtests
 - Auto-protection responses
 
 This module monitors WITHOUT modifying trading signals.
@@ -14,10 +15,12 @@ from monitoring.confidence_monitor import ConfidenceDistributionMonitor
 from monitoring.performance_monitor import PerformanceMonitor
 from monitoring.feature_drift import FeatureDriftMonitor
 from monitoring.system_guard import SystemGuard
+from monitoring.trade_stats import TradeStats
 
 __all__ = [
     "ConfidenceDistributionMonitor",
     "PerformanceMonitor",
     "FeatureDriftMonitor",
     "SystemGuard",
+    "TradeStats",
 ]
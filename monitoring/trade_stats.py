@@ -0,0 +1,282 @@
+"""
+Columnar trade statistics.
+
+Shared engine for win rate, PnL, holding-period, drawdown, rolling Sharpe
+and per-confidence-tier metrics. Trades are materialized into NumPy
+columns once; every metric is then a vectorized reduction over those
+columns instead of a fresh Python pass over trade objects.
+
+Callers (TradeLedger, PortfolioState, backtest and ML evaluation) keep a
+TradeStats instance cached and rebuild it only when trades are added.
+"""
+
+import logging
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Column source: attribute/key name, or a callable taking the trade
+ColumnSpec = Union[str, Callable[[Any], Any]]
+
+
+def _column_getter(spec: ColumnSpec) -> Callable[[Any], Any]:
+    """Build a getter that works for both dicts and objects."""
+    if callable(spec):
+        return spec
+
+    def getter(record: Any) -> Any:
+        if isinstance(record, dict):
+            return record.get(spec)
+        return getattr(record, spec, None)
+
+    return getter
+
+
+def _float_column(values: Sequence[Any]) -> np.ndarray:
+    """Convert a column to float64, mapping missing values (None) to NaN."""
+    try:
+        return np.asarray(values, dtype=float)
+    except TypeError:
+        return np.array([np.nan if v is None else v for v in values], dtype=float)
+
+
+class TradeStats:
+    """
+    Immutable columnar view over a list of closed trades.
+
+    Columns:
+        returns: Per-trade return (fraction or percent, caller's choice)
+        pnl: Per-trade PnL used to classify winners (defaults to returns)
+        holding_days: Holding period per trade (optional)
+        confidence: Confidence tier per trade (optional)
+        labels: Categorical label per trade, e.g. exit_type (optional)
+    """
+
+    def __init__(
+        self,
+        returns: Sequence[float],
+        pnl: Optional[Sequence[float]] = None,
+        holding_days: Optional[Sequence[float]] = None,
+        confidence: Optional[Sequence[float]] = None,
+        labels: Optional[Sequence[str]] = None,
+    ):
+        self.returns = _float_column(returns)
+        self.pnl = self.returns if pnl is None else _float_column(pnl)
+        self.holding_days = None if holding_days is None else _float_column(holding_days)
+        self.confidence = None if confidence is None else _float_column(confidence)
+        self.labels = None if labels is None else np.asarray(labels, dtype=object)
+
+    @classmethod
+    def from_trades(
+        cls,
+        trades: Iterable[Any],
+        returns: ColumnSpec,
+        pnl: Optional[ColumnSpec] = None,
+        holding_days: Optional[ColumnSpec] = None,
+        confidence: Optional[ColumnSpec] = None,
+        labels: Optional[ColumnSpec] = None,
+    ) -> "TradeStats":
+        """
+        Materialize trade objects (or dicts) into columns in a single pass.
+
+        Each column spec is an attribute/key name or a callable.
+        """
+        specs = {
+            "returns": returns,
+            "pnl": pnl,
+            "holding_days": holding_days,
+            "confidence": confidence,
+            "labels": labels,
+        }
+        getters = {name: _column_getter(spec) for name, spec in specs.items() if spec is not None}
+        columns: Dict[str, list] = {name: [] for name in getters}
+
+        for trade in trades:
+            for name, getter in getters.items():
+                columns[name].append(getter(trade))
+
+        return cls(**columns)
+
+    def __len__(self) -> int:
+        return len(self.returns)
+
+    # ------------------------------------------------------------------
+    # Scalar summaries
+    # ------------------------------------------------------------------
+
+    def win_mask(self, breakeven_is_win: bool = False) -> np.ndarray:
+        """Boolean mask of winning trades (pnl > 0, or >= 0 if breakeven counts)."""
+        return self.pnl >= 0 if breakeven_is_win else self.pnl > 0
+
+    def win_count(self, breakeven_is_win: bool = False) -> int:
+        return int(np.count_nonzero(self.win_mask(breakeven_is_win)))
+
+    def win_rate(self, breakeven_is_win: bool = False) -> float:
+        """Win rate as a fraction (0-1)."""
+        if len(self) == 0:
+            return 0.0
+        return self.win_count(breakeven_is_win) / len(self)
+
+    def mean_return(self) -> float:
+        return float(self.returns.mean()) if len(self) else 0.0
+
+    def total_pnl(self) -> float:
+        return float(self.pnl.sum())
+
+    def mean_holding_days(self) -> float:
+        if self.holding_days is None or len(self) == 0:
+            return 0.0
+        return float(self.holding_days.mean())
+
+    def label_counts(self) -> Dict[str, int]:
+        """Count trades per label (e.g. exit_type)."""
+        if self.labels is None or len(self) == 0:
+            return {}
+        values, counts = np.unique(self.labels.astype(str), return_counts=True)
+        return {str(v): int(c) for v, c in zip(values, counts)}
+
+    def return_summary(self, breakeven_is_win: bool = False) -> Dict[str, float]:
+        """Win/loss split, averages, extremes and profit factor of returns."""
+        wins = self.returns >= 0 if breakeven_is_win else self.returns > 0
+        win_returns = self.returns[wins]
+        loss_returns = self.returns[~wins]
+        total_gain = float(win_returns.sum())
+        total_loss = float(np.abs(loss_returns).sum())
+
+        return {
+            "num_trades": len(self),
+            "winning_trades": int(win_returns.size),
+            "losing_trades": int(loss_returns.size),
+            "win_rate": win_returns.size / len(self) if len(self) else 0.0,
+            "avg_return": self.mean_return(),
+            "total_return": float(self.returns.sum()),
+            "avg_win": float(win_returns.mean()) if win_returns.size else 0.0,
+            "avg_loss": float(loss_returns.mean()) if loss_returns.size else 0.0,
+            "max_gain": float(self.returns.max()) if len(self) else 0.0,
+            "max_loss": float(self.returns.min()) if len(self) else 0.0,
+            "profit_factor": total_gain / total_loss if total_loss > 0 else float("inf"),
+        }
+
+    # ------------------------------------------------------------------
+    # Curves
+    # ------------------------------------------------------------------
+
+    def equity_curve(self, starting_equity: float) -> np.ndarray:
+        """Equity after each trade, starting value prepended."""
+        return starting_equity + np.concatenate(([0.0], np.cumsum(self.pnl)))
+
+    @staticmethod
+    def drawdown_curve(equity: Sequence[float], starting_peak: Optional[float] = None) -> np.ndarray:
+        """Absolute drawdown from the running peak at each point."""
+        equity = np.asarray(equity, dtype=float)
+        if equity.size == 0:
+            return equity
+        peaks = np.maximum.accumulate(equity)
+        if starting_peak is not None:
+            peaks = np.maximum(peaks, starting_peak)
+        return peaks - equity
+
+    @staticmethod
+    def max_drawdown(equity: Sequence[float], starting_peak: Optional[float] = None) -> Tuple[float, float]:
+        """
+        Largest absolute drawdown and its percentage of the peak at that point.
+
+        Returns:
+            (max_drawdown, max_drawdown_pct)
+        """
+        equity = np.asarray(equity, dtype=float)
+        if equity.size == 0:
+            return 0.0, 0.0
+        peaks = np.maximum.accumulate(equity)
+        if starting_peak is not None:
+            peaks = np.maximum(peaks, starting_peak)
+        drawdowns = peaks - equity
+        idx = int(np.argmax(drawdowns))
+        max_dd = float(drawdowns[idx])
+        if max_dd <= 0:
+            return 0.0, 0.0
+        peak = peaks[idx]
+        return max_dd, float(max_dd / peak) if peak > 0 else 0.0
+
+    def rolling_sharpe(self, window: int = 20, periods_per_year: int = 252) -> np.ndarray:
+        """
+        Annualized Sharpe ratio of returns over a trailing window.
+
+        The first `window - 1` entries are NaN; windows with zero variance
+        yield NaN.
+        """
+        n = len(self)
+        out = np.full(n, np.nan)
+        if window < 2 or n < window:
+            return out
+
+        csum = np.concatenate(([0.0], np.cumsum(self.returns)))
+        csq = np.concatenate(([0.0], np.cumsum(self.returns ** 2)))
+        sums = csum[window:] - csum[:-window]
+        sq_sums = csq[window:] - csq[:-window]
+        means = sums / window
+        variances = np.maximum((sq_sums - window * means ** 2) / (window - 1), 0.0)
+        stds = np.sqrt(variances)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out[window - 1:] = np.where(stds > 0, means / stds * np.sqrt(periods_per_year), np.nan)
+        return out
+
+    # ------------------------------------------------------------------
+    # Confidence tiers
+    # ------------------------------------------------------------------
+
+    def by_confidence(
+        self,
+        breakeven_is_win: bool = False,
+        tiers: Optional[Iterable[float]] = None,
+    ) -> Dict[float, Dict[str, float]]:
+        """
+        Per-confidence-tier count, win rate, mean/median/min return.
+
+        Args:
+            breakeven_is_win: Count zero-return trades as winners
+            tiers: Restrict to these tiers (default: all tiers present)
+
+        Returns:
+            {tier: {count, win_rate, avg_return, median_return, max_loss}}
+        """
+        if self.confidence is None or len(self) == 0:
+            return {}
+
+        # Trades without a confidence score are not assigned to any tier
+        has_tier = ~np.isnan(self.confidence)
+        if not has_tier.any():
+            return {}
+        confidence = self.confidence[has_tier]
+        returns = self.returns[has_tier]
+
+        tier_values, inverse, counts = np.unique(confidence, return_inverse=True, return_counts=True)
+        wins = returns >= 0 if breakeven_is_win else returns > 0
+        win_counts = np.bincount(inverse, weights=wins.astype(float), minlength=len(tier_values))
+        sums = np.bincount(inverse, weights=returns, minlength=len(tier_values))
+
+        # Sort returns within each tier for medians and minimums
+        order = np.lexsort((returns, inverse))
+        sorted_returns = returns[order]
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        medians = (sorted_returns[starts + (counts - 1) // 2] + sorted_returns[starts + counts // 2]) / 2
+        minimums = sorted_returns[starts]
+
+        wanted = None if tiers is None else set(tiers)
+        result: Dict[float, Dict[str, float]] = {}
+        for i, value in enumerate(tier_values):
+            # Group on the raw score; integer tiers keep int keys
+            tier = int(value) if float(value).is_integer() else float(value)
+            if wanted is not None and tier not in wanted:
+                continue
+            result[tier] = {
+                "count": int(counts[i]),
+                "win_rate": float(win_counts[i] / counts[i]),
+                "avg_return": float(sums[i] / counts[i]),
+                "median_return": float(medians[i]),
+                "max_loss": float(minimums[i]),
+            }
+        return result
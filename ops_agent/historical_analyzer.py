@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Dict, Optional, List
 
 from ops_agent.summary_reader import SummaryReader
+from phase_g_regime.regime_history import RegimeHistoryIndex
 
 logger = logging.getLogger(__name__)
 
@@ -168,18 +169,8 @@ class HistoricalAnalyzer:
             return {}
 
         # Summaries are newest first, reverse to get chronological order
-        summaries_chrono = list(reversed(summaries))
-
-        transitions: Dict[str, int] = {}
-        for i in range(len(summaries_chrono) - 1):
-            prev = summaries_chrono[i].regime
-            next_regime = summaries_chrono[i + 1].regime
-
-            if prev != next_regime:
-                key = f"{prev}->{next_regime}"
-                transitions[key] = transitions.get(key, 0) + 1
-
-        return transitions
+        regimes = [s.regime for s in reversed(summaries)]
+        return RegimeHistoryIndex.from_labels(regimes).transition_counts()
 
     def is_common_transition(self, scope: str, from_regime: str, to_regime: str) -> bool:
         """
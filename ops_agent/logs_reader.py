@@ -72,6 +72,44 @@ class LogsReader:
 
         return None
 
+    def get_scheduler_telemetry(self, scope: str) -> Optional[Dict[str, Any]]:
+        """
+        Get rolling per-phase scheduler telemetry (wall/CPU ms, broker calls).
+
+        Returns the summary written by execution.scheduler_telemetry plus the
+        most recent tick record under "last_tick".
+        """
+        scope_dir = self._normalize_scope(scope)
+        if not scope_dir:
+            return None
+
+        logs_dir = self.logs_root / scope_dir / "logs"
+        summary_path = logs_dir / "scheduler_telemetry_summary.json"
+        if not summary_path.exists():
+            return None
+
+        try:
+            with open(summary_path) as f:
+                summary = json.load(f)
+        except Exception as e:
+            logger.debug(f"Error reading scheduler telemetry: {e}")
+            return None
+
+        ticks_path = logs_dir / "scheduler_telemetry.jsonl"
+        if ticks_path.exists():
+            try:
+                with open(ticks_path, "rb") as f:
+                    # Last record only: read the tail instead of the whole file
+                    f.seek(0, 2)
+                    f.seek(max(0, f.tell() - 8192))
+                    lines = [line for line in f.read().splitlines() if line.strip()]
+                if lines:
+                    summary["last_tick"] = json.loads(lines[-1])
+            except Exception as e:
+                logger.debug(f"Error reading scheduler telemetry ticks: {e}")
+
+        return summary
+
     def get_recent_docker_logs(self, scope: str, lines: int = 50) -> List[str]:
         """Get recent Docker container logs (tail N lines)."""
         scope_dir = self._normalize_scope(scope)
@@ -1,9 +1,19 @@
 """
 Main ops loop: continuously poll Telegram and handle intents.
+
+Runs on asyncio:
+- One poller long-polls getUpdates and queues incoming messages
+- A pool of reply workers handles messages concurrently, so one slow
+  reply (e.g. an OpenAI call) doesn't hold up other operators
+- A periodic task evaluates watches and digests every poll interval
+
+Blocking work (HTTP, log reading) runs in a thread pool.
 """
 
+import asyncio
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 from ops_agent.telegram_handler import TelegramHandler
@@ -61,6 +71,7 @@ class OpsLoop:
         poll_interval_seconds: int = 5,
         watch_manager: Optional[WatchManager] = None,
         digest_generator: Optional[DigestGenerator] = None,
+        reply_workers: int = 4,
     ):
         self.telegram = telegram_handler
         self.generator = response_generator
@@ -68,27 +79,96 @@ class OpsLoop:
         self.poll_interval = poll_interval_seconds
         self.watch_manager = watch_manager
         self.digest_generator = digest_generator
+        self.reply_workers = max(1, reply_workers)
 
     def run(self) -> None:
         """Run the ops loop indefinitely."""
         logger.info("Starting ops loop")
         logger.info(
-            f"Polling Telegram every {self.poll_interval} seconds..."
+            f"Long-polling Telegram, {self.reply_workers} reply workers, "
+            f"watches/digests every {self.poll_interval} seconds..."
+        )
+
+        try:
+            asyncio.run(self.run_async())
+        except KeyboardInterrupt:
+            logger.info("Ops loop stopped by user")
+
+    async def run_async(self, stop_event: Optional[asyncio.Event] = None) -> None:
+        """
+        Run poller, reply workers and periodic checks until stop_event is set.
+
+        Args:
+            stop_event: Optional event to stop the loop (runs forever if None)
+        """
+        stop_event = stop_event or asyncio.Event()
+        queue: asyncio.Queue = asyncio.Queue()
+        # Poller + periodic task + one thread per reply worker
+        executor = ThreadPoolExecutor(
+            max_workers=self.reply_workers + 2, thread_name_prefix="ops-loop"
         )
 
+        tasks = [
+            asyncio.create_task(self._poll_updates(queue, executor)),
+            asyncio.create_task(self._run_periodic(executor)),
+        ]
+        tasks += [
+            asyncio.create_task(self._reply_worker(queue, executor))
+            for _ in range(self.reply_workers)
+        ]
+
+        try:
+            await stop_event.wait()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            # An in-flight long poll returns on its own; don't wait for it
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _poll_updates(self, queue: asyncio.Queue, executor: ThreadPoolExecutor) -> None:
+        """Long-poll Telegram and queue messages for the reply workers."""
+        loop = asyncio.get_running_loop()
+        while True:
+            started = time.monotonic()
+            try:
+                messages = await loop.run_in_executor(executor, self.telegram.get_updates)
+            except Exception as e:
+                logger.error(f"Error polling Telegram: {e}", exc_info=True)
+                messages = []
+
+            for msg in messages:
+                queue.put_nowait(msg)
+
+            # Empty result that came back immediately: request error or short
+            # polling. Back off instead of spinning.
+            if not messages and time.monotonic() - started < 1.0:
+                await asyncio.sleep(self.poll_interval)
+
+    async def _reply_worker(self, queue: asyncio.Queue, executor: ThreadPoolExecutor) -> None:
+        """Handle queued messages one at a time (several workers run concurrently)."""
+        loop = asyncio.get_running_loop()
+        while True:
+            msg = await queue.get()
+            try:
+                await loop.run_in_executor(executor, self._handle_message, msg)
+            except Exception as e:
+                logger.error(f"Error in reply worker: {e}", exc_info=True)
+            finally:
+                queue.task_done()
+
+    async def _run_periodic(self, executor: ThreadPoolExecutor) -> None:
+        """Evaluate watches and digests every poll interval."""
+        loop = asyncio.get_running_loop()
         while True:
             try:
-                self._tick()
-                time.sleep(self.poll_interval)
-            except KeyboardInterrupt:
-                logger.info("Ops loop stopped by user")
-                break
+                await loop.run_in_executor(executor, self._run_scheduled_checks)
             except Exception as e:
                 logger.error(f"Error in ops loop: {e}", exc_info=True)
-                time.sleep(self.poll_interval)
+            await asyncio.sleep(self.poll_interval)
 
-    def _tick(self) -> None:
-        """Single tick of the ops loop."""
+    def _run_scheduled_checks(self) -> None:
+        """Evaluate watches and send digests that are due."""
         # v2: Evaluate watches first (passive notifications)
         if self.watch_manager:
             self.watch_manager.evaluate(self.telegram, self.generator)
@@ -98,6 +178,10 @@ class OpsLoop:
             for chat_id in self.telegram.allowed_chat_ids:
                 self.digest_generator.send_if_due(self.telegram, chat_id)
 
+    def _tick(self) -> None:
+        """Single synchronous tick: scheduled checks, one poll, handle messages."""
+        self._run_scheduled_checks()
+
         # Poll Telegram
         messages = self.telegram.get_updates()
         if not messages:
@@ -156,6 +240,7 @@ def run_ops_loop(
     event_logger: OpsEventLogger,
     watch_manager: Optional[WatchManager] = None,
     digest_generator: Optional[DigestGenerator] = None,
+    reply_workers: int = 4,
 ) -> None:
     """Convenience function to start the ops loop."""
     loop = OpsLoop(
@@ -164,5 +249,6 @@ def run_ops_loop(
         event_logger,
         watch_manager=watch_manager,
         digest_generator=digest_generator,
+        reply_workers=reply_workers,
     )
     loop.run()
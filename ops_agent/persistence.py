@@ -4,6 +4,7 @@ Append-only event logging for ops agent (minimal persistence).
 
 import json
 import logging
+import threading
 from pathlib import Path
 from datetime import datetime
 
@@ -20,6 +21,7 @@ class OpsEventLogger:
         self.events_dir = self.logs_root / "ops_agent"
         self.events_dir.mkdir(parents=True, exist_ok=True)
         self.events_file = self.events_dir / "ops_events.jsonl"
+        self._lock = threading.Lock()  # Replies are logged from worker threads
 
     def log(self, event: OpsEvent) -> bool:
         """
@@ -29,8 +31,8 @@ class OpsEventLogger:
             True if successful
         """
         try:
-            with open(self.events_file, "a") as f:
-                line = event.model_dump_json() + "\n"
+            line = event.model_dump_json() + "\n"
+            with self._lock, open(self.events_file, "a") as f:
                 f.write(line)
             return True
         except Exception as e:
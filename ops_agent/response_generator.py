@@ -17,6 +17,8 @@ from ops_agent.errors_reader import ErrorsReader
 from ops_agent.reconciliation_reader import ReconciliationReader
 from ops_agent.ml_reader import MLReader
 from ops_agent.smart_responder import SmartResponder
+from ops_agent.snapshot_cache import CachedReader, SnapshotCache
+from config.ops_settings import SNAPSHOT_CACHE_TTL_SECONDS
 
 logger = logging.getLogger(__name__)
 
@@ -45,22 +47,30 @@ class ResponseGenerator:
         logs_root: str = "logs",
         duration_tracker: Optional["DurationTracker"] = None,
         historical_analyzer: Optional["HistoricalAnalyzer"] = None,
+        snapshot_cache: Optional[SnapshotCache] = None,
     ):
-        self.obs_reader = ObservabilityReader(logs_root)
-        self.summary_reader = SummaryReader(logs_root)
-        self.logs_reader = LogsReader(logs_root)
-        self.positions_reader = PositionsReader(logs_root)
-        self.trades_reader = TradesReader(logs_root)
-        self.errors_reader = ErrorsReader(logs_root)
-        self.rec_reader = ReconciliationReader(logs_root)
-        self.ml_reader = MLReader(logs_root)
+        # Reader results are shared for a few seconds across concurrent
+        # replies, watches and digests instead of re-reading logs per question
+        self.snapshot_cache = snapshot_cache or SnapshotCache(SNAPSHOT_CACHE_TTL_SECONDS)
+
+        def cached(reader):
+            return CachedReader(reader, self.snapshot_cache, namespace=logs_root)
+
+        self.obs_reader = cached(ObservabilityReader(logs_root))
+        self.summary_reader = cached(SummaryReader(logs_root))
+        self.logs_reader = cached(LogsReader(logs_root))
+        self.positions_reader = cached(PositionsReader(logs_root))
+        self.trades_reader = cached(TradesReader(logs_root))
+        self.errors_reader = cached(ErrorsReader(logs_root))
+        self.rec_reader = cached(ReconciliationReader(logs_root))
+        self.ml_reader = cached(MLReader(logs_root))
         # v2 components (optional)
         self.duration_tracker = duration_tracker
         self.historical_analyzer = historical_analyzer
         # Phase D (optional)
         self.phase_d_persistence = PhaseDPersistence() if PhaseDPersistence else None
         # Smart responder for conversational fallback
-        self.smart_responder = SmartResponder(logs_root)
+        self.smart_responder = SmartResponder(logs_root, snapshot_cache=self.snapshot_cache)
 
     def generate_response(self, intent: Intent) -> str:
         """
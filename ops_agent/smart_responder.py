@@ -16,6 +16,7 @@ from ops_agent.summary_reader import SummaryReader
 from ops_agent.positions_reader import PositionsReader
 from ops_agent.errors_reader import ErrorsReader
 from ops_agent.observability_reader import ObservabilityReader
+from ops_agent.snapshot_cache import CachedReader, SnapshotCache
 from governance.verdict_reader import VerdictReader
 
 logger = logging.getLogger(__name__)
@@ -24,7 +25,7 @@ logger = logging.getLogger(__name__)
 class SmartResponder:
     """Use OpenAI to answer arbitrary questions about the trading system."""
 
-    def __init__(self, logs_root: str = "logs"):
+    def __init__(self, logs_root: str = "logs", snapshot_cache: Optional[SnapshotCache] = None):
         self.api_key = os.getenv("OPENAI_API_KEY", "").strip()
         self.base_url = os.getenv("OPENAI_API_BASE_URL", "https://api.openai.com/v1")
         self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
@@ -36,6 +37,13 @@ class SmartResponder:
         self.obs_reader = ObservabilityReader(logs_root)
         self.verdict_reader = VerdictReader()  # For market-correspondent context
 
+        # Share reader results with the ResponseGenerator that owns us
+        if snapshot_cache is not None:
+            for name in ("summary_reader", "positions_reader", "errors_reader", "obs_reader"):
+                reader = getattr(self, name)
+                setattr(self, name, CachedReader(reader, snapshot_cache, namespace=logs_root))
+            self.verdict_reader = CachedReader(self.verdict_reader, snapshot_cache)
+
         self.enabled = bool(self.api_key)
 
     def answer(self, question: str, scope: Optional[str] = None) -> Optional[str]:
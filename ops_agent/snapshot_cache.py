@@ -0,0 +1,109 @@
+"""
+Short-TTL cache of reader results shared by everything answering in a tick.
+
+Several replies (and watches/digests) in the same few seconds ask the same
+readers for the same scope state: observability snapshot, daily summary,
+positions, recent errors. Each call re-reads and re-parses log files.
+CachedReader wraps a reader so identical calls within the TTL return one
+parsed result; callers get deep copies so nobody can mutate shared state.
+"""
+
+import copy
+import logging
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotCache:
+    """Thread-safe TTL memo keyed by (reader namespace, method, args)."""
+
+    def __init__(self, ttl_seconds: float = 5.0):
+        """
+        Args:
+            ttl_seconds: How long a reader result is reused (<= 0 disables)
+        """
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_call(self, key: Hashable, func, *args, **kwargs) -> Any:
+        if self.ttl_seconds <= 0:
+            return func(*args, **kwargs)
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] < self.ttl_seconds:
+                self.hits += 1
+                return copy.deepcopy(entry[1])
+            self.misses += 1
+
+        value = func(*args, **kwargs)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            if len(self._entries) > 512:
+                self._evict_expired()
+        return copy.deepcopy(value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _evict_expired(self) -> None:
+        cutoff = time.monotonic() - self.ttl_seconds
+        for key in [k for k, (ts, _) in self._entries.items() if ts < cutoff]:
+            del self._entries[key]
+
+
+class CachedReader:
+    """
+    Proxy that memoizes a reader's public methods in a SnapshotCache.
+
+    Non-callable attributes and private methods pass straight through.
+    Calls with unhashable arguments are not cached.
+    """
+
+    def __init__(self, reader: Any, cache: SnapshotCache, namespace: Optional[Hashable] = None):
+        """
+        Args:
+            reader: Reader to wrap
+            cache: Shared cache
+            namespace: Readers of the same class and namespace share entries
+                (e.g. the logs root); defaults to this reader instance only
+        """
+        object.__setattr__(self, "_reader", reader)
+        object.__setattr__(self, "_cache", cache)
+        object.__setattr__(
+            self,
+            "_namespace",
+            (type(reader).__qualname__, id(reader) if namespace is None else namespace),
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._reader, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        namespace = self._namespace
+        cache = self._cache
+
+        def cached(*args, **kwargs):
+            key = (namespace, name, args, tuple(sorted(kwargs.items())))
+            try:
+                hash(key)
+            except TypeError:
+                return attr(*args, **kwargs)
+            return cache.get_or_call(key, attr, *args, **kwargs)
+
+        cached.__name__ = name
+        cached.__doc__ = getattr(attr, "__doc__", None)
+        return cached
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Overrides (tests, hot patches) apply to the wrapped reader
+        setattr(self._reader, name, value)
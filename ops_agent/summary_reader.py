@@ -1,13 +1,16 @@
 """
 Read daily summaries from JSONL files (read-only, graceful fallback).
+
+Files are parsed once and tailed incrementally by the shared SummaryStore
+(also used by governance), so repeated questions don't re-parse them.
 """
 
-import json
 import logging
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
 
+from governance.summary_store import SummaryStore, get_summary_store
 from ops_agent.schemas import DailySummaryEntry
 
 logger = logging.getLogger(__name__)
@@ -23,8 +26,9 @@ class SummaryReader:
         "paper_alpaca_swing_us": "paper_alpaca_swing_us",
     }
 
-    def __init__(self, logs_root: str = "logs"):
+    def __init__(self, logs_root: str = "logs", store: Optional[SummaryStore] = None):
         self.logs_root = Path(logs_root)
+        self.store = store or get_summary_store()
 
     def get_latest_summary(self, scope: str) -> Optional[DailySummaryEntry]:
         """Get the most recent daily summary for a scope."""
@@ -52,59 +56,52 @@ class SummaryReader:
         summary_path = self.logs_root / scope_dir / "logs" / "daily_summary.jsonl"
 
         try:
-            if not summary_path.exists():
-                logger.debug(f"Summary file not found: {summary_path}")
+            table = self.store.table(summary_path)
+            if not table.records:
+                logger.debug(f"Summary file not found or empty: {summary_path}")
                 return []
 
             entries = []
             cutoff_date = datetime.utcnow() - timedelta(days=lookback_days)
 
-            with open(summary_path) as f:
-                for line in f:
-                    if not line.strip():
-                        continue
+            # Newest first; stop once `limit` entries are built
+            for data in reversed(table.records):
+                try:
+                    ts = datetime.fromisoformat(
+                        data.get("timestamp", datetime.utcnow().isoformat())
+                    )
 
-                    try:
-                        data = json.loads(line)
-                        ts = datetime.fromisoformat(
-                            data.get("timestamp", datetime.utcnow().isoformat())
-                        )
-
-                        if ts < cutoff_date:
-                            continue
-
-                        # Extract blocks from blocks_encountered list
-                        blocks_raw = data.get("blocks_encountered", [])
-                        blocks = blocks_raw if isinstance(blocks_raw, list) else []
-
-                        # Use date field if available, otherwise fallback to timestamp
-                        date_str = data.get("date")
-                        if date_str:
-                            try:
-                                ts = datetime.fromisoformat(date_str)
-                            except:
-                                pass  # Use ts from above
-
-                        entry = DailySummaryEntry(
-                            timestamp=ts,
-                            scope=scope,
-                            regime=data.get("regime", "NEUTRAL"),  # Default to NEUTRAL if not present
-                            trades_executed=data.get("trades_taken", data.get("trades_executed", 0)),
-                            realized_pnl=data.get("realized_pnl", 0.0),
-                            max_drawdown=data.get("max_drawdown", 0.0),
-                            blocks=blocks,
-                            data_issues=data.get("data_issues", 0),
-                        )
-                        entries.append(entry)
-                    except Exception as e:
-                        logger.debug(f"Error parsing summary line: {e}")
+                    if ts < cutoff_date:
                         continue
 
-            # Reverse to get newest first
-            entries.reverse()
-
-            if limit:
-                entries = entries[:limit]
+                    # Extract blocks from blocks_encountered list
+                    blocks_raw = data.get("blocks_encountered", [])
+                    blocks = blocks_raw if isinstance(blocks_raw, list) else []
+
+                    # Use date field if available, otherwise fallback to timestamp
+                    date_str = data.get("date")
+                    if date_str:
+                        try:
+                            ts = datetime.fromisoformat(date_str)
+                        except:
+                            pass  # Use ts from above
+
+                    entry = DailySummaryEntry(
+                        timestamp=ts,
+                        scope=scope,
+                        regime=data.get("regime", "NEUTRAL"),  # Default to NEUTRAL if not present
+                        trades_executed=data.get("trades_taken", data.get("trades_executed", 0)),
+                        realized_pnl=data.get("realized_pnl", 0.0),
+                        max_drawdown=data.get("max_drawdown", 0.0),
+                        blocks=blocks,
+                        data_issues=data.get("data_issues", 0),
+                    )
+                    entries.append(entry)
+                    if limit and len(entries) >= limit:
+                        break
+                except Exception as e:
+                    logger.debug(f"Error parsing summary line: {e}")
+                    continue
 
             return entries
 
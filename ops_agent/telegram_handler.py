@@ -3,6 +3,7 @@ Telegram bot polling and chat validation.
 """
 
 import logging
+import threading
 from typing import Optional, List
 import requests
 from datetime import datetime
@@ -20,6 +21,8 @@ class TelegramHandler:
         bot_token: str,
         allowed_chat_ids: List[int],
         poll_interval_seconds: int = 5,
+        long_poll_timeout_seconds: int = 25,
+        api_base_url: str = "https://api.telegram.org",
     ):
         """
         Initialize Telegram handler.
@@ -28,17 +31,35 @@ class TelegramHandler:
             bot_token: Telegram bot token from @BotFather
             allowed_chat_ids: List of allowed chat IDs (single-user v1)
             poll_interval_seconds: How often to poll Telegram API
+            long_poll_timeout_seconds: Server-side getUpdates timeout; the
+                request returns as soon as a message arrives (0 = short poll)
+            api_base_url: Bot API endpoint (override for a local/fake server)
         """
         self.bot_token = bot_token
         self.allowed_chat_ids = set(allowed_chat_ids)
         self.poll_interval_seconds = poll_interval_seconds
-        self.api_url = f"https://api.telegram.org/bot{bot_token}"
+        self.long_poll_timeout_seconds = long_poll_timeout_seconds
+        self.api_url = f"{api_base_url.rstrip('/')}/bot{bot_token}"
         self.last_update_id = 0
 
+        # Persistent connections: one session for the poller, and one per
+        # sending thread (replies are sent from worker threads)
+        self._poll_session = requests.Session()
+        self._send_local = threading.local()
+
+    def _send_session(self) -> requests.Session:
+        session = getattr(self._send_local, "session", None)
+        if session is None:
+            session = self._send_local.session = requests.Session()
+        return session
+
     def get_updates(self) -> List[TelegramMessage]:
         """
         Poll Telegram API for new messages.
 
+        Long-polls: blocks up to long_poll_timeout_seconds server-side and
+        returns immediately when an update arrives.
+
         Returns:
             List of valid TelegramMessage objects (chat ID validated)
         """
@@ -46,11 +67,13 @@ class TelegramHandler:
             url = f"{self.api_url}/getUpdates"
             params = {
                 "offset": self.last_update_id + 1,
-                "timeout": 5,
+                "timeout": self.long_poll_timeout_seconds,
                 "allowed_updates": ["message", "callback_query"],
             }
 
-            response = requests.get(url, params=params, timeout=10)
+            response = self._poll_session.get(
+                url, params=params, timeout=self.long_poll_timeout_seconds + 10
+            )
             response.raise_for_status()
             data = response.json()
 
@@ -163,7 +186,7 @@ class TelegramHandler:
                     "inline_keyboard": buttons
                 }
 
-            response = requests.post(url, json=payload, timeout=10)
+            response = self._send_session().post(url, json=payload, timeout=10)
             response.raise_for_status()
             data = response.json()
 
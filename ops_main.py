@@ -69,8 +69,13 @@ def main():
     from ops_agent.response_generator import ResponseGenerator
     from ops_agent.persistence import OpsEventLogger
     from ops_agent.ops_loop import run_ops_loop
+    from config.ops_settings import LONG_POLL_TIMEOUT_SECONDS, REPLY_WORKERS
 
-    telegram = TelegramHandler(bot_token, allowed_chat_ids)
+    telegram = TelegramHandler(
+        bot_token,
+        allowed_chat_ids,
+        long_poll_timeout_seconds=LONG_POLL_TIMEOUT_SECONDS,
+    )
     generator = ResponseGenerator(logs_root=logs_root)  # Use logs directory, not persist
     event_logger = OpsEventLogger(logs_root=persistence_root)
 
@@ -133,13 +138,17 @@ def main():
 
     # 4. Start ops loop
     try:
-        logger.info("Starting ops loop (polling Telegram every 5 seconds)...")
+        logger.info(
+            f"Starting ops loop (long-poll {LONG_POLL_TIMEOUT_SECONDS}s, "
+            f"{REPLY_WORKERS} reply workers)..."
+        )
         run_ops_loop(
             telegram,
             generator,
             event_logger,
             watch_manager=watch_manager,
             digest_generator=digest_generator,
+            reply_workers=REPLY_WORKERS,
         )
     except KeyboardInterrupt:
         logger.info("Ops agent stopped by user")
@@ -3,12 +3,12 @@ Historical analyzer: Computes regime block statistics.
 """
 
 import logging
-import statistics
 from datetime import datetime, timedelta
 from typing import Optional, List
 from dataclasses import dataclass
 
 from phase_d.persistence import PhaseDPersistence
+from phase_g_regime.regime_history import RegimeHistoryIndex, sorted_quantile
 from config.phase_d_settings import HISTORICAL_LOOKBACK_DAYS, HISTORICAL_MIN_BLOCKS
 
 logger = logging.getLogger(__name__)
@@ -68,21 +68,24 @@ class HistoricalAnalyzer:
             if len(completed) < HISTORICAL_MIN_BLOCKS:
                 return None
 
-            durations = [b.duration_seconds for b in completed if b.duration_seconds]
-            if not durations:
+            index = RegimeHistoryIndex()
+            for b in completed:
+                if b.duration_seconds:
+                    index.add(regime, b.duration_seconds, b.block_end_ts)
+            if not len(index):
                 return None
 
-            sorted_durations = sorted(durations)
+            durations = index.durations(regime)
 
             return BlockStatistics(
                 regime=regime,
                 lookback_days=lookback_days,
                 count=len(completed),
-                median_duration_seconds=int(statistics.median(sorted_durations)),
-                p90_duration_seconds=int(self._percentile(sorted_durations, 90)),
-                p10_duration_seconds=int(self._percentile(sorted_durations, 10)),
-                min_duration_seconds=min(sorted_durations),
-                max_duration_seconds=max(sorted_durations),
+                median_duration_seconds=int(index.quantile(50, regime)),
+                p90_duration_seconds=int(index.quantile(90, regime)),
+                p10_duration_seconds=int(index.quantile(10, regime)),
+                min_duration_seconds=int(durations[0]),
+                max_duration_seconds=int(durations[-1]),
             )
 
         except Exception as e:
@@ -92,16 +95,4 @@ class HistoricalAnalyzer:
     @staticmethod
     def _percentile(data: List[int], percentile: int) -> float:
         """Compute percentile of a list."""
-        if not data:
-            return 0.0
-        sorted_data = sorted(data)
-        rank = (percentile / 100.0) * (len(sorted_data) - 1)
-        lower = int(rank)
-        upper = lower + 1
-
-        if upper >= len(sorted_data):
-            return float(sorted_data[-1])
-        if lower == upper:
-            return float(sorted_data[lower])
-
-        return sorted_data[lower] + (rank - lower) * (sorted_data[upper] - sorted_data[lower])
+        return sorted_quantile(sorted(data), percentile)
@@ -1,18 +1,62 @@
 """
 Phase D append-only JSONL persistence.
+
+Layout under PHASE_D_PERSIST_ROOT/crypto:
+- blocks/block_events.jsonl            shared append-only audit log (all scopes)
+- blocks/by_scope/<scope>.jsonl        per-scope partition of block events
+- eligibility/eligibility_history.jsonl shared append-only history (all scopes)
+- eligibility/latest_by_scope.json     index: latest eligibility payload per scope
+
+Reads never rescan history: block events are served from an in-memory
+per-scope list extended by tailing new bytes of the partition file, and
+the latest eligibility comes from the index (reloaded only when its
+mtime/size changes). Index updates are read-modify-write under an
+exclusive lock on latest_by_scope.json.lock, so concurrent writers
+(threads or processes) never drop each other's scopes. The one-time
+partition migration builds by_scope/ in a temp directory under
+by_scope.lock and renames it into place, so it runs once and a crash
+midway is retried on the next start.
 """
 
 import json
 import logging
+import os
+import re
+import shutil
+import threading
+import uuid
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
-from phase_d.schemas import BlockEvent, BlockEvidence, PhaseEligibilityResult, PhaseDEvent
+from phase_d.schemas import BlockEvent, BlockEvidence, BlockType, PhaseEligibilityResult, PhaseDEvent
 from config.phase_d_settings import PHASE_D_PERSIST_ROOT
 
+try:
+    import fcntl
+except ImportError:  # Non-POSIX: in-process lock only
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
+_thread_lock = threading.Lock()
+
+
+@contextmanager
+def _exclusive_lock(lock_file: Path):
+    """Exclusive lock across threads (and processes, via flock on lock_file)."""
+    with _thread_lock:
+        if fcntl is None:
+            yield
+            return
+        with lock_file.open("a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
 
 class PhaseDPersistence:
     """Append-only JSONL persistence for Phase D."""
@@ -23,6 +67,12 @@ class PhaseDPersistence:
         self.evidence_dir = self.root / "crypto" / "evidence"
         self.eligibility_dir = self.root / "crypto" / "eligibility"
         self.events_file = self.root / "crypto" / "events" / "phase_d_events.jsonl"
+        self.block_events_file = self.blocks_dir / "block_events.jsonl"
+        self.block_partitions_dir = self.blocks_dir / "by_scope"
+        self.block_partitions_lock_file = self.blocks_dir / "by_scope.lock"
+        self.eligibility_history_file = self.eligibility_dir / "eligibility_history.jsonl"
+        self.eligibility_index_file = self.eligibility_dir / "latest_by_scope.json"
+        self.eligibility_index_lock_file = self.eligibility_dir / "latest_by_scope.json.lock"
 
         # Create directories
         self.blocks_dir.mkdir(parents=True, exist_ok=True)
@@ -30,32 +80,24 @@ class PhaseDPersistence:
         self.eligibility_dir.mkdir(parents=True, exist_ok=True)
         self.events_file.parent.mkdir(parents=True, exist_ok=True)
 
-    def write_block_event(self, event: BlockEvent) -> bool:
-        """Write block event to events file (append-only)."""
-        try:
-            with self.blocks_dir / "block_events.jsonl" as f:
-                # This will fail, need to open properly
-                pass
-        except Exception:
-            pass
+        # In-memory caches
+        # scope -> (bytes consumed from partition file, parsed events)
+        self._block_cache: Dict[str, Tuple[int, List[BlockEvent]]] = {}
+        # (mtime_ns, size) of index file -> parsed index
+        self._eligibility_index: Dict[str, Dict[str, Any]] = {}
+        self._eligibility_index_stat: Optional[Tuple[int, int]] = None
 
+        self._migrate_legacy_files()
+
+    def write_block_event(self, event: BlockEvent) -> bool:
+        """Write block event to the shared log and its scope partition (append-only)."""
         try:
-            events_file = self.blocks_dir / "block_events.jsonl"
-            with events_file.open("a") as f:
-                payload = {
-                    "block_id": event.block_id,
-                    "scope": event.scope,
-                    "event_type": event.event_type,
-                    "timestamp": event.timestamp.isoformat(),
-                    "regime": event.regime,
-                    "reason": event.reason,
-                    "block_start_ts": event.block_start_ts.isoformat(),
-                    "block_end_ts": event.block_end_ts.isoformat() if event.block_end_ts else None,
-                    "duration_seconds": event.duration_seconds,
-                    "block_type": event.block_type.value if event.block_type else None,
-                    "regime_changes_during_block": event.regime_changes_during_block,
-                }
-                f.write(json.dumps(payload) + "\n")
+            payload = self._block_event_payload(event)
+            line = json.dumps(payload) + "\n"
+            with self.block_events_file.open("a") as f:
+                f.write(line)
+            with self._block_partition_file(event.scope).open("a") as f:
+                f.write(line)
             logger.info(f"PHASE_D_BLOCK_EVENT_WRITTEN | block_id={event.block_id} type={event.event_type}")
             return True
         except Exception as e:
@@ -96,30 +138,29 @@ class PhaseDPersistence:
             return False
 
     def write_eligibility_result(self, result: PhaseEligibilityResult) -> bool:
-        """Write eligibility evaluation result (append-only)."""
+        """Write eligibility evaluation result (append-only) and update the per-scope index."""
         try:
-            with self.eligibility_dir / "eligibility_history.jsonl" as f:
-                pass
-        except Exception:
-            pass
-
-        try:
-            history_file = self.eligibility_dir / "eligibility_history.jsonl"
-            with history_file.open("a") as f:
-                payload = {
-                    "timestamp": result.timestamp.isoformat(),
-                    "scope": result.scope,
-                    "current_block_id": result.current_block_id,
-                    "eligible": result.eligible,
-                    "evidence_sufficiency_passed": result.evidence_sufficiency_passed,
-                    "duration_anomaly_passed": result.duration_anomaly_passed,
-                    "block_type_passed": result.block_type_passed,
-                    "cost_benefit_passed": result.cost_benefit_passed,
-                    "regime_safety_passed": result.regime_safety_passed,
-                    "rule_details": result.rule_details,
-                    "expiry_timestamp": result.expiry_timestamp.isoformat() if result.expiry_timestamp else None,
-                }
+            payload = {
+                "timestamp": result.timestamp.isoformat(),
+                "scope": result.scope,
+                "current_block_id": result.current_block_id,
+                "eligible": result.eligible,
+                "evidence_sufficiency_passed": result.evidence_sufficiency_passed,
+                "duration_anomaly_passed": result.duration_anomaly_passed,
+                "block_type_passed": result.block_type_passed,
+                "cost_benefit_passed": result.cost_benefit_passed,
+                "regime_safety_passed": result.regime_safety_passed,
+                "rule_details": result.rule_details,
+                "expiry_timestamp": result.expiry_timestamp.isoformat() if result.expiry_timestamp else None,
+            }
+            with self.eligibility_history_file.open("a") as f:
                 f.write(json.dumps(payload) + "\n")
+
+            with self._eligibility_index_lock():
+                index = dict(self._load_eligibility_index())
+                index[result.scope] = payload
+                self._write_eligibility_index(index)
+
             logger.info(f"PHASE_D_ELIGIBILITY_WRITTEN | scope={result.scope} eligible={result.eligible}")
             return True
         except Exception as e:
@@ -147,19 +188,7 @@ class PhaseDPersistence:
     def read_latest_eligibility(self, scope: str) -> Optional[PhaseEligibilityResult]:
         """Read most recent eligibility evaluation for a scope."""
         try:
-            history_file = self.eligibility_dir / "eligibility_history.jsonl"
-            if not history_file.exists():
-                return None
-
-            latest = None
-            with history_file.open("r") as f:
-                for line in f:
-                    try:
-                        payload = json.loads(line.strip())
-                        if payload.get("scope") == scope:
-                            latest = payload
-                    except Exception:
-                        continue
+            latest = self._load_eligibility_index().get(scope)
 
             if not latest:
                 return None
@@ -197,36 +226,199 @@ class PhaseDPersistence:
             return None
 
     def read_block_events(self, scope: str) -> List[BlockEvent]:
-        """Read all block events for a scope."""
+        """
+        Read all block events for a scope.
+
+        Served from the per-scope cache; only bytes appended to the scope
+        partition since the previous call are read and parsed.
+        """
         try:
-            events_file = self.blocks_dir / "block_events.jsonl"
-            if not events_file.exists():
-                return []
+            partition = self._block_partition_file(scope)
+            offset, events = self._block_cache.get(scope, (0, []))
+
+            try:
+                size = partition.stat().st_size
+            except FileNotFoundError:
+                return list(events)
+
+            if size < offset:
+                # Partition was truncated/replaced: rebuild from scratch
+                offset, events = 0, []
 
-            events = []
-            with events_file.open("r") as f:
+            if size > offset:
+                # Distinct scopes can sanitize to the same partition file
+                payloads, offset = _read_appended_jsonl(partition, offset)
+                parsed = (self._parse_block_event(p) for p in payloads if p.get("scope") == scope)
+                events = events + [e for e in parsed if e]
+                self._block_cache[scope] = (offset, events)
+
+            return list(events)
+        except Exception as e:
+            logger.error(f"PHASE_D_BLOCK_EVENTS_READ_FAILED | scope={scope} error={e}")
+            return []
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _block_partition_file(self, scope: str, partitions_dir: Optional[Path] = None) -> Path:
+        """Per-scope partition path (scope sanitized for use as a filename)."""
+        safe_scope = re.sub(r"[^A-Za-z0-9_.-]", "_", scope)
+        return (partitions_dir or self.block_partitions_dir) / f"{safe_scope}.jsonl"
+
+    @staticmethod
+    def _block_event_payload(event: BlockEvent) -> Dict[str, Any]:
+        return {
+            "block_id": event.block_id,
+            "scope": event.scope,
+            "event_type": event.event_type,
+            "timestamp": event.timestamp.isoformat(),
+            "regime": event.regime,
+            "reason": event.reason,
+            "block_start_ts": event.block_start_ts.isoformat(),
+            "block_end_ts": event.block_end_ts.isoformat() if event.block_end_ts else None,
+            "duration_seconds": event.duration_seconds,
+            "block_type": event.block_type.value if event.block_type else None,
+            "regime_changes_during_block": event.regime_changes_during_block,
+        }
+
+    @staticmethod
+    def _parse_block_event(payload: Dict[str, Any]) -> Optional[BlockEvent]:
+        try:
+            return BlockEvent(
+                block_id=payload["block_id"],
+                scope=payload["scope"],
+                event_type=payload["event_type"],
+                timestamp=datetime.fromisoformat(payload["timestamp"]),
+                regime=payload["regime"],
+                reason=payload["reason"],
+                block_start_ts=datetime.fromisoformat(payload["block_start_ts"]),
+                block_end_ts=datetime.fromisoformat(payload["block_end_ts"]) if payload.get("block_end_ts") else None,
+                duration_seconds=payload.get("duration_seconds"),
+                block_type=BlockType(payload["block_type"]) if payload.get("block_type") else None,
+                regime_changes_during_block=payload.get("regime_changes_during_block", []),
+            )
+        except Exception:
+            return None
+
+    def _load_eligibility_index(self) -> Dict[str, Dict[str, Any]]:
+        """Latest eligibility payload per scope, reloaded only when the index file changes."""
+        try:
+            st = self.eligibility_index_file.stat()
+        except FileNotFoundError:
+            self._eligibility_index, self._eligibility_index_stat = {}, None
+            return self._eligibility_index
+
+        stat_key = (st.st_mtime_ns, st.st_size)
+        if stat_key != self._eligibility_index_stat:
+            with self.eligibility_index_file.open("r") as f:
+                self._eligibility_index = json.load(f)
+            self._eligibility_index_stat = stat_key
+        return self._eligibility_index
+
+    def _eligibility_index_lock(self):
+        """Exclusive lock for a read-modify-write of the eligibility index."""
+        return _exclusive_lock(self.eligibility_index_lock_file)
+
+    def _write_eligibility_index(self, index: Dict[str, Dict[str, Any]]) -> None:
+        """Atomically replace the per-scope eligibility index (caller holds the lock)."""
+        tmp = self.eligibility_index_file.with_name(
+            f"{self.eligibility_index_file.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp"
+        )
+        try:
+            with tmp.open("w") as f:
+                json.dump(index, f)
+            os.replace(tmp, self.eligibility_index_file)
+        finally:
+            tmp.unlink(missing_ok=True)
+        st = self.eligibility_index_file.stat()
+        self._eligibility_index = index
+        self._eligibility_index_stat = (st.st_mtime_ns, st.st_size)
+
+    def _migrate_legacy_files(self) -> None:
+        """
+        One-time build of scope partitions and the eligibility index from
+        the shared logs written before partitioning existed.
+        """
+        try:
+            if self.block_events_file.exists() and not self.block_partitions_dir.exists():
+                with _exclusive_lock(self.block_partitions_lock_file):
+                    if not self.block_partitions_dir.exists():
+                        self._build_block_partitions()
+            self.block_partitions_dir.mkdir(parents=True, exist_ok=True)
+
+            if self.eligibility_history_file.exists() and not self.eligibility_index_file.exists():
+                with self._eligibility_index_lock():
+                    if not self.eligibility_index_file.exists():
+                        index: Dict[str, Dict[str, Any]] = {}
+                        with self.eligibility_history_file.open("r") as f:
+                            for line in f:
+                                try:
+                                    payload = json.loads(line)
+                                except Exception:
+                                    continue
+                                if payload.get("scope"):
+                                    index[payload["scope"]] = payload
+                        self._write_eligibility_index(index)
+                        logger.info(f"PHASE_D_ELIGIBILITY_INDEX_BUILT | scopes={len(index)}")
+        except Exception as e:
+            logger.error(f"PHASE_D_MIGRATION_FAILED | error={e}")
+
+    def _build_block_partitions(self) -> None:
+        """
+        Split the shared block log into scope partitions (caller holds the
+        partition lock). Built in a temp directory and renamed into place,
+        so by_scope/ only ever appears complete.
+        """
+        # Leftovers of a build that crashed midway
+        for stale in self.blocks_dir.glob("by_scope.*.tmp"):
+            shutil.rmtree(stale, ignore_errors=True)
+
+        tmp_dir = self.blocks_dir / f"by_scope.{os.getpid()}.{uuid.uuid4().hex}.tmp"
+        tmp_dir.mkdir(parents=True)
+        try:
+            lines_by_scope: Dict[str, List[str]] = {}
+            with self.block_events_file.open("r") as f:
                 for line in f:
                     try:
-                        payload = json.loads(line.strip())
-                        if payload.get("scope") == scope:
-                            event = BlockEvent(
-                                block_id=payload["block_id"],
-                                scope=payload["scope"],
-                                event_type=payload["event_type"],
-                                timestamp=datetime.fromisoformat(payload["timestamp"]),
-                                regime=payload["regime"],
-                                reason=payload["reason"],
-                                block_start_ts=datetime.fromisoformat(payload["block_start_ts"]),
-                                block_end_ts=datetime.fromisoformat(payload["block_end_ts"]) if payload.get("block_end_ts") else None,
-                                duration_seconds=payload.get("duration_seconds"),
-                                block_type=BlockEvent.__fields__["block_type"].type_(payload.get("block_type")) if payload.get("block_type") else None,
-                                regime_changes_during_block=payload.get("regime_changes_during_block", []),
-                            )
-                            events.append(event)
+                        scope = json.loads(line).get("scope")
                     except Exception:
                         continue
+                    if scope:
+                        lines_by_scope.setdefault(scope, []).append(line.rstrip("\n") + "\n")
+            for scope, lines in lines_by_scope.items():
+                with self._block_partition_file(scope, tmp_dir).open("a") as f:
+                    f.writelines(lines)
+            os.rename(tmp_dir, self.block_partitions_dir)
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+        logger.info(f"PHASE_D_BLOCK_PARTITIONS_BUILT | scopes={len(lines_by_scope)}")
 
-            return events
-        except Exception as e:
-            logger.error(f"PHASE_D_BLOCK_EVENTS_READ_FAILED | scope={scope} error={e}")
-            return []
+
+def _read_appended_jsonl(path: Path, offset: int) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Parse complete JSONL records appended after `offset`.
+
+    A trailing partial line (writer mid-append) is left for the next call.
+
+    Returns:
+        (payloads, new_offset)
+    """
+    with path.open("rb") as f:
+        f.seek(offset)
+        chunk = f.read()
+
+    end = chunk.rfind(b"\n")
+    if end < 0:
+        return [], offset
+
+    payloads = []
+    for raw in chunk[:end].split(b"\n"):
+        if not raw.strip():
+            continue
+        try:
+            payloads.append(json.loads(raw))
+        except Exception:
+            continue
+    return payloads, offset + end + 1
@@ -2,16 +2,76 @@
 Claim extraction from news articles.
 
 Extracts factual statements from articles and validates them.
+
+All indicator word lists are compiled into one regex that is scanned once
+per lower-cased sentence; the per-list checks are then set lookups.
 """
 
 import logging
 import re
-from typing import List, Optional
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
 from phase_f.schemas import Claim, SentimentEnum
 from phase_f.fetchers import NewsArticle
 
 logger = logging.getLogger(__name__)
 
+QUESTION_PHRASES = ["how do you", "what is", "when did"]
+INSTITUTIONS = ["Fed", "IMF", "SEC", "CFTC", "ECB", "CME"]
+PRECISE_WORDS = frozenset(["reached", "hit", "increased", "decreased", "rallied", "fell"])
+SPECULATIVE_WORDS = frozenset(["may", "could", "might", "possibly", "reportedly"])
+
+_DIGIT_RE = re.compile(r"\d")
+_INSTITUTION_RE = re.compile("|".join(re.escape(inst) for inst in INSTITUTIONS))
+_SENTENCE_SPLIT_RE = re.compile(r"[.!?]+")
+
+
+class KeywordMatcher:
+    """
+    Substring keyword matcher built on a single compiled regex.
+
+    Equivalent to `{w for w in words if w in text}`, but the text is
+    scanned once. The words are folded into a prefix trie so the regex
+    rejects most positions on their first character. A zero-width lookahead
+    tries every position and takes the longest word there; since any word
+    occurring at a position is a prefix of the longest word matching there,
+    each hit is expanded to all of its prefixes in the word list.
+    """
+
+    def __init__(self, words: Iterable[str]):
+        unique = sorted(set(w for w in words if w))
+        self._prefixes: Dict[str, FrozenSet[str]] = {
+            word: frozenset(w for w in unique if word.startswith(w)) for word in unique
+        }
+        self._pattern = re.compile(f"(?=({self._trie_pattern(unique)}))") if unique else None
+
+    @staticmethod
+    def _trie_pattern(words: List[str]) -> str:
+        trie: Dict = {}
+        for word in words:
+            node = trie
+            for ch in word:
+                node = node.setdefault(ch, {})
+            node[""] = {}
+
+        def build(node: Dict) -> str:
+            branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+            if not branches:
+                return ""
+            body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+            # Greedy optional suffix: longest word at this position wins
+            return f"(?:{body})?" if "" in node else body
+
+        return build(trie)
+
+    def find(self, text: str) -> Set[str]:
+        """Return every word that occurs as a substring of text."""
+        if self._pattern is None:
+            return set()
+        found: Set[str] = set()
+        for hit in set(self._pattern.findall(text)):
+            found |= self._prefixes[hit]
+        return found
+
 
 class ClaimExtractor:
     """Extract claims from articles using heuristics and validation."""
@@ -31,6 +91,46 @@ class ClaimExtractor:
                 "weakness", "resistance", "bear case", "headwinds"
             ]
         }
+        self._compile()
+
+    def _compile(self) -> None:
+        """
+        Build the single-pass matcher over all lower-case word lists.
+
+        Call again after changing forbidden_causation or sentiment_indicators.
+        """
+        positive = self.sentiment_indicators["positive"]
+        negative = self.sentiment_indicators["negative"]
+        self._forbidden = list(self.forbidden_causation)
+        self._forbidden_set = frozenset(self._forbidden)
+        # Duplicated indicator words count once per listing, as before
+        self._positive_weight = {w: positive.count(w) for w in positive}
+        self._negative_weight = {w: negative.count(w) for w in negative}
+        self._matcher = KeywordMatcher(
+            self._forbidden + positive + negative + list(PRECISE_WORDS) + list(SPECULATIVE_WORDS)
+        )
+
+    def extract_from_articles(
+        self,
+        articles: List[NewsArticle],
+        max_claims: int = 3
+    ) -> List[Claim]:
+        """
+        Extract claims from a batch of articles.
+
+        Args:
+            articles: NewsArticles to extract from
+            max_claims: Maximum claims to extract per article
+
+        Returns:
+            Claims from all articles, in article order
+        """
+        claims: List[Claim] = []
+        for article in articles:
+            claims.extend(self.extract_from_article(article, max_claims=max_claims))
+
+        logger.debug(f"Extracted {len(claims)} claims from {len(articles)} articles")
+        return claims
 
     def extract_from_article(
         self,
@@ -69,7 +169,8 @@ class ClaimExtractor:
                     sentence,
                     article.source,
                     article.source_url,
-                    article.published_at
+                    article.published_at,
+                    source_count=getattr(article, "source_count", 1),
                 )
                 if claim:
                     claims.append(claim)
@@ -92,26 +193,30 @@ class ClaimExtractor:
             List of candidate sentences
         """
         # Split by sentence
-        sentences = re.split(r'[.!?]+', text)
+        sentences = _SENTENCE_SPLIT_RE.split(text)
 
         # Filter for substantial sentences
         candidates = []
         for sent in sentences:
             sent = sent.strip()
             # Must be at least 20 chars and not a question
-            if len(sent) > 20 and not sent.endswith("?") and not any(
-                x in sent.lower() for x in ["how do you", "what is", "when did"]
-            ):
+            if len(sent) <= 20 or sent.endswith("?"):
+                continue
+            sent_lower = sent.lower()
+            if not any(x in sent_lower for x in QUESTION_PHRASES):
                 candidates.append(sent)
+                if len(candidates) == 10:  # Limit to top 10 sentences
+                    break
 
-        return candidates[:10]  # Limit to top 10 sentences
+        return candidates
 
     def _sentence_to_claim(
         self,
         sentence: str,
         source: str,
         source_url: str,
-        published_at: str
+        published_at: str,
+        source_count: int = 1,
     ) -> Optional[Claim]:
         """
         Convert sentence to Claim object.
@@ -121,22 +226,25 @@ class ClaimExtractor:
             source: Source name
             source_url: URL to source
             published_at: Publication timestamp
+            source_count: Distinct sources carrying the article
 
         Returns:
             Claim object or None if invalid
         """
+        # One scan for every word list below
+        hits = self._matcher.find(sentence.lower())
+
         # Validate: no forbidden causation words
-        sent_lower = sentence.lower()
-        for forbidden in self.forbidden_causation:
-            if forbidden in sent_lower:
-                logger.debug(f"Skipping sentence with forbidden word '{forbidden}': {sentence[:50]}")
-                return None
+        if not hits.isdisjoint(self._forbidden_set):
+            forbidden = next(w for w in self._forbidden if w in hits)
+            logger.debug(f"Skipping sentence with forbidden word '{forbidden}': {sentence[:50]}")
+            return None
 
         # Determine sentiment
-        sentiment = self._classify_sentiment(sentence)
+        sentiment = self._classify_sentiment(sentence, hits=hits)
 
         # Assign confidence (simple heuristic)
-        confidence = self._estimate_confidence(sentence)
+        confidence = self._estimate_confidence(sentence, hits=hits)
 
         # Create claim
         try:
@@ -148,27 +256,30 @@ class ClaimExtractor:
                 confidence_in_claim=confidence,
                 is_factual=True,  # Assume news articles are factual
                 sentiment=sentiment,
+                source_count=max(1, int(source_count or 1)),
             )
             return claim
         except Exception as e:
             logger.debug(f"Error creating claim: {e}")
             return None
 
-    def _classify_sentiment(self, text: str) -> SentimentEnum:
+    def _classify_sentiment(self, text: str, hits: Optional[Set[str]] = None) -> SentimentEnum:
         """
         Classify sentiment of text.
 
         Args:
             text: Text to classify
+            hits: Keyword hits for the text (None = scan it here)
 
         Returns:
             Sentiment enum
         """
-        text_lower = text.lower()
+        if hits is None:
+            hits = self._matcher.find(text.lower())
 
         # Count positive and negative indicators
-        pos_count = sum(1 for word in self.sentiment_indicators["positive"] if word in text_lower)
-        neg_count = sum(1 for word in self.sentiment_indicators["negative"] if word in text_lower)
+        pos_count = sum(self._positive_weight.get(word, 0) for word in hits)
+        neg_count = sum(self._negative_weight.get(word, 0) for word in hits)
 
         if pos_count > neg_count:
             return SentimentEnum.POSITIVE
@@ -177,36 +288,37 @@ class ClaimExtractor:
         else:
             return SentimentEnum.NEUTRAL
 
-    def _estimate_confidence(self, sentence: str) -> float:
+    def _estimate_confidence(self, sentence: str, hits: Optional[Set[str]] = None) -> float:
         """
         Estimate confidence in claim.
 
         Args:
             sentence: Claim sentence
+            hits: Keyword hits for the sentence (None = scan it here)
 
         Returns:
             Confidence score (0.0-1.0)
         """
+        if hits is None:
+            hits = self._matcher.find(sentence.lower())
+
         # Heuristics for confidence
         confidence = 0.5  # Base
 
         # Specific numbers increase confidence
-        if any(c.isdigit() for c in sentence):
+        if _DIGIT_RE.search(sentence):
             confidence += 0.15
 
-        # Names of institutions increase confidence
-        institutions = ["Fed", "IMF", "SEC", "CFTC", "ECB", "CME"]
-        if any(inst in sentence for inst in institutions):
+        # Names of institutions increase confidence (case-sensitive)
+        if _INSTITUTION_RE.search(sentence):
             confidence += 0.2
 
         # Precise language increases confidence
-        precise_words = ["reached", "hit", "increased", "decreased", "rallied", "fell"]
-        if any(word in sentence.lower() for word in precise_words):
+        if not hits.isdisjoint(PRECISE_WORDS):
             confidence += 0.1
 
         # Speculation words decrease confidence
-        speculative = ["may", "could", "might", "possibly", "reportedly"]
-        if any(word in sentence.lower() for word in speculative):
+        if not hits.isdisjoint(SPECULATIVE_WORDS):
             confidence -= 0.2
 
         return max(0.0, min(1.0, confidence))
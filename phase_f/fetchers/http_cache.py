@@ -0,0 +1,274 @@
+"""
+Pooled HTTP client with conditional GET and on-disk response cache.
+
+Used by Phase F news sources so that a run:
+- Reuses per-host connections (one requests.Session, pooled adapter)
+- Sends If-None-Match / If-Modified-Since for every previously seen URL
+- Skips download AND parsing when the server answers 304 Not Modified
+
+Cache layout (one entry per URL + params):
+    <cache_dir>/<key>.json         # validators + metadata
+    <cache_dir>/<key>.body         # raw response body
+    <cache_dir>/<key>.parsed.json  # parsed articles (written by the caller)
+
+Entries not fetched or revalidated within PHASE_F_HTTP_CACHE_MAX_AGE_HOURS
+are swept when a client is created (query-string URLs such as NewsAPI time
+windows produce a new key every run).
+
+Fail-safe: any cache read/write error is logged and treated as a miss.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config.phase_f_settings import PHASE_F_HTTP_CACHE_DIR, PHASE_F_HTTP_CACHE_MAX_AGE_HOURS
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Response body plus cache bookkeeping."""
+
+    url: str
+    status_code: int
+    content: bytes
+    cache_key: str
+    not_modified: bool = False  # True if served from cache after a 304
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class CachedHTTPClient:
+    """Thread-safe pooled HTTP client with conditional GET caching."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        pool_maxsize: int = 8,
+        session: Optional[requests.Session] = None,
+        max_age_hours: float = PHASE_F_HTTP_CACHE_MAX_AGE_HOURS,
+    ):
+        """
+        Args:
+            cache_dir: Directory for cached responses (None = PHASE_F_HTTP_CACHE_DIR)
+            pool_maxsize: Max pooled connections per host
+            session: Optional pre-built session (tests)
+            max_age_hours: Sweep entries idle for longer than this (0 = never)
+        """
+        self.cache_dir = Path(cache_dir or PHASE_F_HTTP_CACHE_DIR)
+        self.max_age_hours = max_age_hours
+        self.sweep()
+        self.session = session or requests.Session()
+        if session is None:
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_maxsize)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+
+    @staticmethod
+    def cache_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        raw = url + "?" + json.dumps(sorted((params or {}).items()), default=str)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10,
+    ) -> CachedResponse:
+        """
+        GET with conditional validators from the cache.
+
+        Raises:
+            requests.RequestException on network errors or non-2xx/304 status
+        """
+        key = self.cache_key(url, params)
+        meta = self._read_meta(key)
+
+        request_headers = dict(headers or {})
+        if meta.get("etag"):
+            request_headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            request_headers["If-Modified-Since"] = meta["last_modified"]
+
+        resp = self.session.get(url, params=params, headers=request_headers, timeout=timeout)
+
+        if resp.status_code == 304:
+            body = self._read_body(key)
+            if body is not None:
+                logger.debug(f"HTTP cache hit (304): {url}")
+                self._touch(key)
+                return CachedResponse(url, 200, body, key, not_modified=True)
+            # Validators without a body: refetch unconditionally
+            resp = self.session.get(url, params=params, headers=headers, timeout=timeout)
+
+        resp.raise_for_status()
+        self._write_entry(key, url, resp)
+        return CachedResponse(url, resp.status_code, resp.content, key)
+
+    # ------------------------------------------------------------------
+    # Parsed results
+    # ------------------------------------------------------------------
+
+    def load_parsed(self, response: CachedResponse) -> Optional[List[Dict[str, Any]]]:
+        """Parsed items stored for an unchanged response, else None."""
+        if not response.not_modified:
+            return None
+        path = self.cache_dir / f"{response.cache_key}.parsed.json"
+        try:
+            if path.exists():
+                return json.loads(path.read_text())
+        except Exception as e:
+            logger.debug(f"HTTP cache parsed read failed for {response.url}: {e}")
+        return None
+
+    def store_parsed(self, response: CachedResponse, items: List[Dict[str, Any]]) -> None:
+        """Store parsed items so a later 304 can skip parsing."""
+        if not (self.cache_dir / f"{response.cache_key}.json").exists():
+            return  # Uncacheable response (no validators)
+        path = self.cache_dir / f"{response.cache_key}.parsed.json"
+        self._atomic_write(path, json.dumps(items).encode("utf-8"))
+
+    # ------------------------------------------------------------------
+    # Disk entries
+    # ------------------------------------------------------------------
+
+    def sweep(self) -> int:
+        """
+        Delete entries whose newest file is older than max_age_hours.
+
+        Returns:
+            Number of entries (keys) removed
+        """
+        if self.max_age_hours <= 0:
+            return 0
+        cutoff = time.time() - self.max_age_hours * 3600
+        newest: Dict[str, float] = {}
+        files: Dict[str, List[Path]] = {}
+        try:
+            for path in self.cache_dir.iterdir():
+                key = path.name.split(".", 1)[0]
+                try:
+                    mtime = path.stat().st_mtime
+                except OSError:
+                    continue
+                newest[key] = max(newest.get(key, 0.0), mtime)
+                files.setdefault(key, []).append(path)
+        except FileNotFoundError:
+            return 0
+        except Exception as e:
+            logger.debug(f"HTTP cache sweep failed: {e}")
+            return 0
+
+        removed = 0
+        for key, mtime in newest.items():
+            if mtime >= cutoff:
+                continue
+            for path in files[key]:
+                path.unlink(missing_ok=True)
+            removed += 1
+        if removed:
+            logger.info(f"PHASE_F_HTTP_CACHE_SWEPT | removed={removed} | kept={len(newest) - removed}")
+        return removed
+
+    def _touch(self, key: str) -> None:
+        """Mark an entry as recently used (revalidated by a 304)."""
+        try:
+            (self.cache_dir / f"{key}.json").touch()
+        except Exception:
+            pass
+
+    def _read_meta(self, key: str) -> Dict[str, Any]:
+        path = self.cache_dir / f"{key}.json"
+        try:
+            if path.exists():
+                return json.loads(path.read_text())
+        except Exception as e:
+            logger.debug(f"HTTP cache meta read failed ({key}): {e}")
+        return {}
+
+    def _read_body(self, key: str) -> Optional[bytes]:
+        path = self.cache_dir / f"{key}.body"
+        try:
+            return path.read_bytes() if path.exists() else None
+        except Exception as e:
+            logger.debug(f"HTTP cache body read failed ({key}): {e}")
+            return None
+
+    def _write_entry(self, key: str, url: str, resp: requests.Response) -> None:
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return  # Server gives us nothing to validate against
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": datetime.now(timezone.utc).isoformat(),
+        }
+        self._atomic_write(self.cache_dir / f"{key}.body", resp.content)
+        self._atomic_write(self.cache_dir / f"{key}.json", json.dumps(meta).encode("utf-8"))
+        # New body invalidates previously parsed items
+        try:
+            (self.cache_dir / f"{key}.parsed.json").unlink(missing_ok=True)
+        except Exception:
+            pass
+
+    def _atomic_write(self, path: Path, data: bytes) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(data)
+            tmp.replace(path)
+        except Exception as e:
+            logger.debug(f"HTTP cache write failed ({path.name}): {e}")
+
+
+def run_concurrently(
+    tasks: Sequence[Tuple[str, Callable[[], Any]]],
+    max_workers: int = 8,
+    deadline_seconds: Optional[float] = None,
+    default: Any = None,
+) -> List[Any]:
+    """
+    Run named callables in a thread pool, returning results in task order.
+
+    Tasks that raise or miss the deadline yield `default` (logged at debug);
+    stragglers are abandoned, not waited for.
+    """
+    if not tasks:
+        return []
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tasks))))
+    try:
+        futures = [executor.submit(func) for _, func in tasks]
+        wait(futures, timeout=deadline_seconds)
+
+        results = []
+        for (name, _), future in zip(tasks, futures):
+            if not future.done():
+                logger.debug(f"Fetch task missed deadline: {name}")
+                future.cancel()
+                results.append(default)
+                continue
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.debug(f"Fetch task failed: {name}: {e}")
+                results.append(default)
+        return results
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
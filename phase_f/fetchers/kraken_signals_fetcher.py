@@ -9,17 +9,38 @@ Fetches public market data from Kraken to complement narrative analysis:
 
 All data is PUBLIC (no authentication required).
 READ-ONLY - never places orders or modifies state.
+
+Multi-symbol snapshots (get_market_signals_batch) fetch the ticker for all
+pairs in one request and depth/trades for each pair concurrently. Responses
+are cached for a short TTL; get_kraken_signals_fetcher() returns a
+process-wide instance so every caller shares that cache. Today the only
+caller is PhaseFJob: the trading pipeline reads no public Kraken
+depth/trades data, so there is nothing on that side to route through it.
 """
 
 import logging
+import threading
+import time
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timezone
 import urllib.request
 import json
 
+import numpy as np
+
+from config.phase_f_settings import (
+    PHASE_F_MARKET_SIGNALS_DEADLINE_SECONDS,
+    PHASE_F_MARKET_SIGNALS_MAX_WORKERS,
+    PHASE_F_MARKET_SIGNALS_TTL_SECONDS,
+)
+from phase_f.fetchers.http_cache import run_concurrently
+
 logger = logging.getLogger(__name__)
 
+# Order book depth band around mid price used for depth metrics
+DEPTH_BAND_PCT = 1.0
+
 
 @dataclass(frozen=True)
 class MarketSignal:
@@ -31,6 +52,36 @@ class MarketSignal:
     context: str  # Human-readable interpretation
 
 
+class _TTLCache:
+    """Thread-safe response cache with a fixed time-to-live."""
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Tuple, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            return value
+
+    def put(self, key: Tuple, value: Any) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
 class KrakenSignalsFetcher:
     """
     Fetch real-time market signals from Kraken public API.
@@ -41,13 +92,30 @@ class KrakenSignalsFetcher:
     
     BASE_URL = "https://api.kraken.com/0/public"
     
-    def __init__(self):
-        """Initialize fetcher with no credentials needed"""
+    def __init__(self, ttl_seconds: float = PHASE_F_MARKET_SIGNALS_TTL_SECONDS):
+        """
+        Initialize fetcher with no credentials needed
+
+        Args:
+            ttl_seconds: How long successful responses are reused (0 = no cache)
+        """
         self.base_url = self.BASE_URL
+        self._cache = _TTLCache(ttl_seconds)
         logger.info("KrakenSignalsFetcher initialized (public API, no auth)")
     
     def _kraken_request(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Dict]:
-        """Make public API request to Kraken"""
+        """Make public API request to Kraken (successful results cached for the TTL)"""
+        key = (endpoint, tuple(sorted((params or {}).items())))
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = self._kraken_request_uncached(endpoint, params)
+        if result is not None:
+            self._cache.put(key, result)
+        return result
+
+    def _kraken_request_uncached(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Dict]:
         try:
             url = f"{self.base_url}{endpoint}"
             if params:
@@ -126,7 +194,14 @@ class KrakenSignalsFetcher:
         Returns: {
             'bids': [(price, volume), ...],
             'asks': [(price, volume), ...],
+            'bid_volume': float,
+            'ask_volume': float,
             'imbalance_ratio': float,  # bid volume / ask volume
+            'mid_price': float,
+            'bid_depth_1pct': float,   # bid volume within 1% of mid
+            'ask_depth_1pct': float,   # ask volume within 1% of mid
+            'bid_wall_price': float,   # price of the largest bid level
+            'ask_wall_price': float,   # price of the largest ask level
             'signal': str
         }
         """
@@ -140,21 +215,15 @@ class KrakenSignalsFetcher:
                 return None
             
             depth_data = result[kraken_pair]
-            bids = [[float(p), float(v)] for p, v in depth_data.get("bids", [])]
-            asks = [[float(p), float(v)] for p, v in depth_data.get("asks", [])]
-            
-            # Calculate imbalance
-            bid_vol = sum(v for _, v in bids)
-            ask_vol = sum(v for _, v in asks)
-            imbalance = bid_vol / ask_vol if ask_vol > 0 else 0
+            bids = self._parse_levels(depth_data.get("bids", []))
+            asks = self._parse_levels(depth_data.get("asks", []))
+            metrics = self._order_book_metrics(bids, asks)
             
             return {
-                "bids": bids,
-                "asks": asks,
-                "bid_volume": bid_vol,
-                "ask_volume": ask_vol,
-                "imbalance_ratio": imbalance,
-                "signal": self._interpret_imbalance(imbalance)
+                "bids": bids.tolist(),
+                "asks": asks.tolist(),
+                **metrics,
+                "signal": self._interpret_imbalance(metrics["imbalance_ratio"])
             }
         
         except Exception as e:
@@ -213,29 +282,70 @@ class KrakenSignalsFetcher:
             'overall_signal': str
         }
         """
+        return self.get_market_signals_batch([symbol]).get(symbol)
+
+    def get_market_signals_batch(
+        self,
+        symbols: List[str],
+        depth: int = 20,
+        trades_limit: int = 50,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Market signal snapshots for several symbols.
+
+        One ticker request covers all pairs; order book and trades requests
+        run concurrently, so latency stays close to a single-symbol snapshot.
+
+        Args:
+            symbols: Canonical symbols (unmapped symbols are skipped)
+            depth: Order book levels per side
+            trades_limit: Recent trades per symbol
+
+        Returns:
+            {symbol: snapshot} (see get_market_signals) for symbols with ticker data
+        """
+        symbols = [s for s in dict.fromkeys(symbols) if self._symbol_to_kraken_pair(s)]
+        if not symbols:
+            return {}
+
         try:
-            ticker = self.fetch_ticker([symbol])
-            order_book = self.fetch_order_book(symbol)
-            trades = self.fetch_recent_trades(symbol)
-            
-            if not ticker or symbol not in ticker:
-                logger.warning(f"Could not fetch complete signals for {symbol}")
-                return None
-            
-            signals = {
-                "symbol": symbol,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "ticker": ticker[symbol],
-                "order_book": order_book or {},
-                "trades": trades or [],
-                "overall_signal": self._synthesize_signal(ticker[symbol], order_book, trades)
-            }
-            
-            return signals
+            ticker = self.fetch_ticker(symbols) or {}
+
+            tasks = []
+            for symbol in symbols:
+                tasks.append((f"depth:{symbol}", lambda s=symbol: self.fetch_order_book(s, depth=depth)))
+                tasks.append((f"trades:{symbol}", lambda s=symbol: self.fetch_recent_trades(s, limit=trades_limit)))
+            results = run_concurrently(
+                tasks,
+                max_workers=PHASE_F_MARKET_SIGNALS_MAX_WORKERS,
+                deadline_seconds=PHASE_F_MARKET_SIGNALS_DEADLINE_SECONDS,
+            )
+
+            timestamp = datetime.now(timezone.utc).isoformat()
+            snapshots = {}
+            for i, symbol in enumerate(symbols):
+                if symbol not in ticker:
+                    logger.warning(f"Could not fetch complete signals for {symbol}")
+                    continue
+                order_book, trades = results[2 * i], results[2 * i + 1]
+                snapshots[symbol] = {
+                    "symbol": symbol,
+                    "timestamp": timestamp,
+                    "ticker": ticker[symbol],
+                    "order_book": order_book or {},
+                    "trades": trades or [],
+                    "overall_signal": self._synthesize_signal(ticker[symbol], order_book, trades)
+                }
+
+            return snapshots
         
         except Exception as e:
             logger.error(f"Failed to get market signals: {e}")
-            return None
+            return {}
+
+    def clear_cache(self) -> None:
+        """Drop cached responses (next call goes to the API)."""
+        self._cache.clear()
     
     # Helper methods
     
@@ -283,6 +393,39 @@ class KrakenSignalsFetcher:
         }
         return mapping.get(kraken_pair)
     
+    @staticmethod
+    def _parse_levels(levels: List) -> np.ndarray:
+        """Kraken [price, volume, timestamp] levels -> (n, 2) float array."""
+        if not levels:
+            return np.empty((0, 2))
+        return np.asarray(levels, dtype=float).reshape(len(levels), -1)[:, :2]
+
+    @staticmethod
+    def _order_book_metrics(bids: np.ndarray, asks: np.ndarray) -> Dict[str, float]:
+        """Imbalance, mid, banded depth and wall prices from (n, 2) level arrays."""
+        bid_vol = float(bids[:, 1].sum())
+        ask_vol = float(asks[:, 1].sum())
+        imbalance = bid_vol / ask_vol if ask_vol > 0 else 0
+
+        mid = 0.0
+        bid_depth = ask_depth = 0.0
+        if len(bids) and len(asks):
+            mid = float((bids[:, 0].max() + asks[:, 0].min()) / 2)
+            band = mid * DEPTH_BAND_PCT / 100
+            bid_depth = float(bids[bids[:, 0] >= mid - band, 1].sum())
+            ask_depth = float(asks[asks[:, 0] <= mid + band, 1].sum())
+
+        return {
+            "bid_volume": bid_vol,
+            "ask_volume": ask_vol,
+            "imbalance_ratio": imbalance,
+            "mid_price": mid,
+            "bid_depth_1pct": bid_depth,
+            "ask_depth_1pct": ask_depth,
+            "bid_wall_price": float(bids[bids[:, 1].argmax(), 0]) if len(bids) else 0.0,
+            "ask_wall_price": float(asks[asks[:, 1].argmax(), 0]) if len(asks) else 0.0,
+        }
+
     @staticmethod
     def _interpret_ticker(volume_24h: float, spread_pct: float) -> str:
         """Interpret ticker signals"""
@@ -327,6 +470,14 @@ class KrakenSignalsFetcher:
         return " | ".join(signal_parts) if signal_parts else "UNKNOWN_SIGNAL"
 
 
+_shared_fetcher: Optional[KrakenSignalsFetcher] = None
+_shared_lock = threading.Lock()
+
+
 def get_kraken_signals_fetcher() -> KrakenSignalsFetcher:
-    """Convenience function"""
-    return KrakenSignalsFetcher()
+    """Process-wide fetcher, so all callers in the process share one TTL cache"""
+    global _shared_fetcher
+    with _shared_lock:
+        if _shared_fetcher is None:
+            _shared_fetcher = KrakenSignalsFetcher()
+        return _shared_fetcher
@@ -8,14 +8,19 @@ Simplified sources (3 core):
 
 All sources return normalized NewsArticle dataclasses for downstream claim extraction.
 Fail-safe: Errors in one source don't block others.
+
+Every keyword/feed/site is a separate request task; MultiSourceNewsFetcher runs
+the tasks of all sources on one thread pool with a shared deadline, so job wall
+time is bounded by the slowest request instead of the sum of all of them.
+Requests go through a pooled CachedHTTPClient (conditional GET): a 304 reply
+reuses the cached body and the previously parsed articles.
 """
 
 import logging
 import os
 import re
-import requests
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Any, Set
+from dataclasses import asdict, dataclass, replace
+from typing import Callable, List, Optional, Dict, Any, Set, Tuple
 from datetime import datetime, timedelta
 from urllib.parse import quote, urljoin
 from abc import ABC, abstractmethod
@@ -25,8 +30,19 @@ try:
 except ImportError:
     feedparser = None
 
+from config.phase_f_settings import (
+    PHASE_F_FETCH_DEADLINE_SECONDS,
+    PHASE_F_FETCH_MAX_WORKERS,
+    PHASE_F_NEAR_DUPLICATE_CLUSTERING,
+    PHASE_F_NEAR_DUPLICATE_THRESHOLD,
+)
+from phase_f.fetchers.http_cache import CachedHTTPClient, CachedResponse, run_concurrently
+from phase_f.fetchers.near_duplicates import NearDuplicateClusterer
+
 logger = logging.getLogger(__name__)
 
+FetchTask = Tuple[str, Callable[[], List["NewsArticle"]]]
+
 
 @dataclass(frozen=True)
 class NewsArticle:
@@ -40,14 +56,28 @@ class NewsArticle:
     content: Optional[str] = None
     url: Optional[str] = None
     sentiment_signal: Optional[str] = None  # "bullish", "bearish", "neutral"
+    source_count: int = 1  # Distinct sources carrying this story (near-duplicate clustering)
+    syndicated_sources: Tuple[str, ...] = ()  # Other sources collapsed into this article
+
+    def __post_init__(self):
+        # JSON round-trips (parsed-article cache) turn tuples into lists
+        if not isinstance(self.syndicated_sources, tuple):
+            object.__setattr__(self, "syndicated_sources", tuple(self.syndicated_sources))
 
 
 class NewsSourceFetcher(ABC):
     """Abstract base for all news sources."""
 
+    timeout: float = 10
+    _client: Optional[CachedHTTPClient] = None
+
     @abstractmethod
-    def fetch(self, lookback_hours: int = 24, limit: int = 10) -> List[NewsArticle]:
-        """Fetch articles from this source."""
+    def fetch_tasks(self, lookback_hours: int = 24, limit: int = 10) -> List[FetchTask]:
+        """
+        Independent request tasks for this source (one per keyword/feed/site).
+
+        Each task returns its already-limited list of articles.
+        """
         pass
 
     @abstractmethod
@@ -55,6 +85,53 @@ class NewsSourceFetcher(ABC):
         """Check if this source is configured and enabled."""
         pass
 
+    def combine(self, results: List[List[NewsArticle]], limit: int) -> List[NewsArticle]:
+        """Merge task results (in task order) into this source's article list."""
+        return [article for articles in results for article in articles]
+
+    def fetch(self, lookback_hours: int = 24, limit: int = 10) -> List[NewsArticle]:
+        """Fetch articles from this source, running its tasks concurrently."""
+        if not self.is_enabled():
+            return []
+
+        tasks = self.fetch_tasks(lookback_hours=lookback_hours, limit=limit)
+        results = run_concurrently(
+            tasks,
+            max_workers=PHASE_F_FETCH_MAX_WORKERS,
+            deadline_seconds=PHASE_F_FETCH_DEADLINE_SECONDS,
+            default=[],
+        )
+        return self.combine(results, limit)
+
+    @property
+    def client(self) -> CachedHTTPClient:
+        if self._client is None:
+            self._client = CachedHTTPClient()
+        return self._client
+
+    def _fetch_parsed(
+        self,
+        url: str,
+        parse: Callable[[CachedResponse], List[NewsArticle]],
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> List[NewsArticle]:
+        """
+        GET a URL and parse it, reusing cached articles when the server says 304.
+
+        `parse` must return every article in the response; callers slice
+        afterwards so the cached list does not depend on the requested limit.
+        """
+        resp = self.client.get(url, params=params, headers=headers, timeout=self.timeout)
+
+        cached = self.client.load_parsed(resp)
+        if cached is not None:
+            return [NewsArticle(**item) for item in cached]
+
+        articles = parse(resp)
+        self.client.store_parsed(resp, [asdict(a) for a in articles])
+        return articles
+
     def _normalize_timestamp(self, ts: str) -> str:
         """Convert various timestamp formats to ISO format."""
         if not ts:
@@ -110,12 +187,22 @@ class NewsSourceFetcher(ABC):
 class NewsAPIFetcher(NewsSourceFetcher):
     """Fetch news from NewsAPI (50+ outlets)."""
 
-    def __init__(self):
+    # Search for crypto/market keywords with different search strategies
+    KEYWORDS = [
+        "Bitcoin market",
+        "Ethereum trading",
+        "cryptocurrency news",
+        "blockchain regulation",
+        "crypto volatility"
+    ]
+
+    def __init__(self, client: Optional[CachedHTTPClient] = None):
         """Initialize with API key from config."""
         self.api_key = os.getenv("NEWSAPI_KEY", "").strip()
         self.base_url = os.getenv("NEWSAPI_BASE_URL", "https://newsapi.org/v2")
         self.enabled = bool(self.api_key)
         self.timeout = 10
+        self._client = client
 
         if not self.enabled:
             logger.warning("NewsAPIFetcher disabled: NEWSAPI_KEY not set")
@@ -124,68 +211,60 @@ class NewsAPIFetcher(NewsSourceFetcher):
         """Check if enabled."""
         return self.enabled
 
-    def fetch(self, lookback_hours: int = 24, limit: int = 10) -> List[NewsArticle]:
-        """Fetch from NewsAPI."""
+    def fetch_tasks(self, lookback_hours: int = 24, limit: int = 10) -> List[FetchTask]:
+        """One task per keyword search."""
         if not self.enabled:
             return []
 
-        articles = []
-        try:
-            # Search for crypto/market keywords with different search strategies
-            keywords = [
-                "Bitcoin market",
-                "Ethereum trading",
-                "cryptocurrency news",
-                "blockchain regulation",
-                "crypto volatility"
-            ]
-
-            for keyword in keywords:
-                try:
-                    # NOTE: Removed 'from' parameter as it filters out free tier results
-                    # Use sortBy relevancy instead of publishedAt for better results
-                    params = {
-                        "q": keyword,
-                        "sortBy": "relevancy",
-                        "language": "en",
-                        "apiKey": self.api_key,
-                    }
-
-                    resp = requests.get(
-                        f"{self.base_url}/everything",
-                        params=params,
-                        timeout=self.timeout
-                    )
-                    resp.raise_for_status()
-                    data = resp.json()
-
-                    # Take top articles from this keyword search
-                    for item in data.get("articles", [])[:limit // len(keywords) + 1]:
-                        try:
-                            article = NewsArticle(
-                                title=self._sanitize_title(item.get("title", "")),
-                                description=self._sanitize_description(item.get("description", "")),
-                                source=item.get("source", {}).get("name", "NewsAPI"),
-                                source_url=item.get("url", "https://newsapi.org"),
-                                published_at=self._normalize_timestamp(item.get("publishedAt", "")),
-                                content=item.get("content"),
-                                url=item.get("url"),
-                            )
-                            articles.append(article)
-                        except Exception as e:
-                            logger.debug(f"Error parsing NewsAPI article: {e}")
-                            continue
-                except Exception as e:
-                    logger.debug(f"NewsAPI keyword search failed for '{keyword}': {e}")
-                    continue
+        per_keyword = limit // len(self.KEYWORDS) + 1
+        return [
+            (f"newsapi:{keyword}", lambda keyword=keyword: self._search(keyword, per_keyword))
+            for keyword in self.KEYWORDS
+        ]
 
-            logger.info(f"NewsAPI: fetched {len(articles)} articles")
-            return articles[:limit]
+    def combine(self, results: List[List[NewsArticle]], limit: int) -> List[NewsArticle]:
+        articles = super().combine(results, limit)
+        logger.info(f"NewsAPI: fetched {len(articles)} articles")
+        return articles[:limit]
+
+    def _search(self, keyword: str, limit: int) -> List[NewsArticle]:
+        # NOTE: Removed 'from' parameter as it filters out free tier results
+        # Use sortBy relevancy instead of publishedAt for better results
+        params = {
+            "q": keyword,
+            "sortBy": "relevancy",
+            "language": "en",
+            "apiKey": self.api_key,
+        }
 
+        try:
+            articles = self._fetch_parsed(f"{self.base_url}/everything", self._parse, params=params)
         except Exception as e:
-            logger.warning(f"NewsAPI fetch error: {e}")
+            logger.debug(f"NewsAPI keyword search failed for '{keyword}': {e}")
             return []
 
+        # Take top articles from this keyword search
+        return articles[:limit]
+
+    def _parse(self, resp: CachedResponse) -> List[NewsArticle]:
+        articles = []
+        for item in resp.json().get("articles", []):
+            try:
+                article = NewsArticle(
+                    title=self._sanitize_title(item.get("title", "")),
+                    description=self._sanitize_description(item.get("description", "")),
+                    source=item.get("source", {}).get("name", "NewsAPI"),
+                    source_url=item.get("url", "https://newsapi.org"),
+                    published_at=self._normalize_timestamp(item.get("publishedAt", "")),
+                    content=item.get("content"),
+                    url=item.get("url"),
+                )
+                articles.append(article)
+            except Exception as e:
+                logger.debug(f"Error parsing NewsAPI article: {e}")
+                continue
+        return articles
+
 class RSSSiteFetcher(NewsSourceFetcher):
     """Fetch from RSS feeds."""
 
@@ -199,13 +278,16 @@ class RSSSiteFetcher(NewsSourceFetcher):
         "bitcoinmagazine": "https://bitcoinmagazine.com/feed",
     }
 
-    def __init__(self):
+    HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; NewsBot/1.0)"}
+
+    def __init__(self, client: Optional[CachedHTTPClient] = None):
         """Initialize RSS fetcher."""
         self.enabled = (
             os.getenv("PHASE_F_RSS_ENABLED", "true").lower() == "true"
             and feedparser is not None
         )
         self.timeout = 10
+        self._client = client
 
         if not feedparser:
             logger.warning("feedparser not installed, RSS fetcher disabled")
@@ -215,55 +297,64 @@ class RSSSiteFetcher(NewsSourceFetcher):
         """Check if enabled."""
         return self.enabled
 
-    def fetch(self, lookback_hours: int = 24, limit: int = 10) -> List[NewsArticle]:
-        """Fetch from RSS feeds."""
+    def fetch_tasks(self, lookback_hours: int = 24, limit: int = 10) -> List[FetchTask]:
+        """One task per feed."""
         if not self.enabled:
             return []
 
-        articles = []
-        cutoff = datetime.utcnow() - timedelta(hours=lookback_hours)
-
-        try:
-            for feed_name, feed_url in self.FEEDS.items():
-                try:
-                    feed = feedparser.parse(feed_url)
-
-                    for entry in feed.entries[:limit // len(self.FEEDS) + 1]:
-                        try:
-                            # Parse publish date
-                            pub_date = ""
-                            if hasattr(entry, "published"):
-                                pub_date = entry.published
-                            elif hasattr(entry, "updated"):
-                                pub_date = entry.updated
-
-                            article = NewsArticle(
-                                title=self._sanitize_title(entry.get("title", "")),
-                                description=self._sanitize_description(
-                                    entry.get("summary", "") or entry.get("description", "")
-                                ),
-                                source=feed_name.replace("_", " ").title(),
-                                source_url=entry.get("link", feed_url),
-                                published_at=self._normalize_timestamp(pub_date),
-                                content=entry.get("content", [{}])[0].get("value"),
-                                url=entry.get("link"),
-                            )
-                            articles.append(article)
-
-                        except Exception as e:
-                            logger.debug(f"Error parsing RSS entry from {feed_name}: {e}")
-                            continue
-
-                except Exception as e:
-                    logger.debug(f"Error fetching RSS feed {feed_name}: {e}")
-                    continue
+        per_feed = limit // len(self.FEEDS) + 1
+        return [
+            (f"rss:{feed_name}", lambda name=feed_name, url=feed_url: self._fetch_feed(name, url, per_feed))
+            for feed_name, feed_url in self.FEEDS.items()
+        ]
 
-            logger.info(f"RSS: fetched {len(articles)} articles")
-            return articles
+    def combine(self, results: List[List[NewsArticle]], limit: int) -> List[NewsArticle]:
+        articles = super().combine(results, limit)
+        logger.info(f"RSS: fetched {len(articles)} articles")
+        return articles
 
+    def _fetch_feed(self, feed_name: str, feed_url: str, limit: int) -> List[NewsArticle]:
+        try:
+            articles = self._fetch_parsed(
+                feed_url,
+                lambda resp: self._parse(feed_name, feed_url, resp),
+                headers=self.HEADERS,
+            )
         except Exception as e:
-            logger.warning(f"RSS fetch error: {e}")
+            logger.debug(f"Error fetching RSS feed {feed_name}: {e}")
             return []
+        return articles[:limit]
+
+    def _parse(self, feed_name: str, feed_url: str, resp: CachedResponse) -> List[NewsArticle]:
+        feed = feedparser.parse(resp.content)
+
+        articles = []
+        for entry in feed.entries:
+            try:
+                # Parse publish date
+                pub_date = ""
+                if hasattr(entry, "published"):
+                    pub_date = entry.published
+                elif hasattr(entry, "updated"):
+                    pub_date = entry.updated
+
+                article = NewsArticle(
+                    title=self._sanitize_title(entry.get("title", "")),
+                    description=self._sanitize_description(
+                        entry.get("summary", "") or entry.get("description", "")
+                    ),
+                    source=feed_name.replace("_", " ").title(),
+                    source_url=entry.get("link", feed_url),
+                    published_at=self._normalize_timestamp(pub_date),
+                    content=entry.get("content", [{}])[0].get("value"),
+                    url=entry.get("link"),
+                )
+                articles.append(article)
+
+            except Exception as e:
+                logger.debug(f"Error parsing RSS entry from {feed_name}: {e}")
+                continue
+        return articles
 
 
 class WebScraperFetcher(NewsSourceFetcher):
@@ -303,10 +394,13 @@ class WebScraperFetcher(NewsSourceFetcher):
         },
     ]
 
-    def __init__(self):
+    HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; NewsBot/1.0)"}
+
+    def __init__(self, client: Optional[CachedHTTPClient] = None):
         """Initialize web scraper."""
         self.enabled = os.getenv("PHASE_F_WEB_SCRAPER_ENABLED", "true").lower() == "true"
         self.timeout = 15
+        self._client = client
 
         try:
             from bs4 import BeautifulSoup
@@ -319,69 +413,72 @@ class WebScraperFetcher(NewsSourceFetcher):
         """Check if enabled."""
         return self.enabled
 
-    def fetch(self, lookback_hours: int = 24, limit: int = 10) -> List[NewsArticle]:
-        """Fetch from web sources."""
+    def fetch_tasks(self, lookback_hours: int = 24, limit: int = 10) -> List[FetchTask]:
+        """One task per site."""
         if not self.enabled or not hasattr(self, "BeautifulSoup"):
             return []
 
-        articles = []
+        per_site = limit // 2
+        return [
+            (f"web:{site['name']}", lambda site=site: self._scrape(site, per_site))
+            for site in self.SITES
+        ]
 
+    def combine(self, results: List[List[NewsArticle]], limit: int) -> List[NewsArticle]:
+        articles = super().combine(results, limit)
+        logger.info(f"WebScraper: fetched {len(articles)} articles")
+        return articles
+
+    def _scrape(self, site: Dict[str, Any], limit: int) -> List[NewsArticle]:
         try:
-            for site in self.SITES:
-                try:
-                    resp = requests.get(
-                        site["url"],
-                        timeout=self.timeout,
-                        headers={"User-Agent": "Mozilla/5.0 (compatible; NewsBot/1.0)"}
-                    )
-                    resp.raise_for_status()
-
-                    soup = self.BeautifulSoup(resp.content, "html.parser")
-                    selectors = site["selectors"]
-
-                    for article_elem in soup.select(selectors["article"])[:limit // 2]:
-                        try:
-                            title_elem = article_elem.select_one(selectors["title"])
-
-                            # Handle case where article_elem itself might be an <a> tag
-                            if article_elem.name == "a":
-                                link_elem = article_elem
-                            else:
-                                link_elem = article_elem.select_one(selectors["link"])
-
-                            time_elem = article_elem.select_one(selectors["time"])
-
-                            if not title_elem or not link_elem:
-                                continue
-
-                            article = NewsArticle(
-                                title=self._sanitize_title(title_elem.get_text()),
-                                description="",  # Not always available in scraped content
-                                source=site["name"],
-                                source_url=urljoin(
-                                    site["url"], link_elem.get("href", site["url"])
-                                ),
-                                published_at=self._normalize_timestamp(
-                                    time_elem.get_text() if time_elem else ""
-                                ),
-                                url=urljoin(site["url"], link_elem.get("href", "")),
-                            )
-                            articles.append(article)
-
-                        except Exception as e:
-                            logger.debug(f"Error scraping article from {site['name']}: {e}")
-                            continue
-
-                except Exception as e:
-                    logger.debug(f"Error scraping {site['name']}: {e}")
+            articles = self._fetch_parsed(
+                site["url"],
+                lambda resp: self._parse(site, resp),
+                headers=self.HEADERS,
+            )
+        except Exception as e:
+            logger.debug(f"Error scraping {site['name']}: {e}")
+            return []
+        return articles[:limit]
+
+    def _parse(self, site: Dict[str, Any], resp: CachedResponse) -> List[NewsArticle]:
+        soup = self.BeautifulSoup(resp.content, "html.parser")
+        selectors = site["selectors"]
+
+        articles = []
+        for article_elem in soup.select(selectors["article"]):
+            try:
+                title_elem = article_elem.select_one(selectors["title"])
+
+                # Handle case where article_elem itself might be an <a> tag
+                if article_elem.name == "a":
+                    link_elem = article_elem
+                else:
+                    link_elem = article_elem.select_one(selectors["link"])
+
+                time_elem = article_elem.select_one(selectors["time"])
+
+                if not title_elem or not link_elem:
                     continue
 
-            logger.info(f"WebScraper: fetched {len(articles)} articles")
-            return articles
+                article = NewsArticle(
+                    title=self._sanitize_title(title_elem.get_text()),
+                    description="",  # Not always available in scraped content
+                    source=site["name"],
+                    source_url=urljoin(
+                        site["url"], link_elem.get("href", site["url"])
+                    ),
+                    published_at=self._normalize_timestamp(
+                        time_elem.get_text() if time_elem else ""
+                    ),
+                    url=urljoin(site["url"], link_elem.get("href", "")),
+                )
+                articles.append(article)
 
-        except Exception as e:
-            logger.warning(f"WebScraper fetch error: {e}")
-            return []
+            except Exception as e:
+                logger.debug(f"Error scraping article from {site['name']}: {e}")
+                continue
+        return articles
 
 
 class MultiSourceNewsFetcher:
@@ -397,17 +494,39 @@ class MultiSourceNewsFetcher:
 
     Design:
     - Fail-safe: One source failing doesn't block others
-    - Deduplication: Remove duplicate articles by URL/title
+    - Deduplication: Remove duplicate articles by URL/title, then collapse
+      near-duplicates (syndicated copies) into one weighted representative
     - Rate-limited: Respects API limits and timeouts
     - Immutable: Returns frozen dataclasses
+    - Concurrent: All request tasks of all sources share one pool and deadline
     """
 
-    def __init__(self):
-        """Initialize multi-source fetcher with all available sources."""
+    def __init__(
+        self,
+        client: Optional[CachedHTTPClient] = None,
+        max_workers: int = PHASE_F_FETCH_MAX_WORKERS,
+        deadline_seconds: float = PHASE_F_FETCH_DEADLINE_SECONDS,
+    ):
+        """
+        Initialize multi-source fetcher with all available sources.
+
+        Args:
+            client: Shared pooled HTTP client (None = new CachedHTTPClient)
+            max_workers: Concurrent requests across all sources
+            deadline_seconds: Wall-clock budget for one fetch_all; late requests are dropped
+        """
+        self.client = client or CachedHTTPClient(pool_maxsize=max_workers)
+        self.max_workers = max_workers
+        self.deadline_seconds = deadline_seconds
+        self.clusterer = (
+            NearDuplicateClusterer(threshold=PHASE_F_NEAR_DUPLICATE_THRESHOLD)
+            if PHASE_F_NEAR_DUPLICATE_CLUSTERING
+            else None
+        )
         self.sources: List[NewsSourceFetcher] = [
-            NewsAPIFetcher(),      # 50+ outlets (primary source)
-            RSSSiteFetcher(),      # Reddit, Medium, CoinDesk, etc.
-            WebScraperFetcher(),   # BeInCrypto, CoinGecko (requires BeautifulSoup4)
+            NewsAPIFetcher(self.client),      # 50+ outlets (primary source)
+            RSSSiteFetcher(self.client),      # Reddit, Medium, CoinDesk, etc.
+            WebScraperFetcher(self.client),   # BeInCrypto, CoinGecko (requires BeautifulSoup4)
         ]
 
         enabled_count = sum(1 for s in self.sources if s.is_enabled())
@@ -425,7 +544,7 @@ class MultiSourceNewsFetcher:
         Args:
             lookback_hours: How far back to search
             limit: Total articles to return
-            deduplicate: Remove duplicates by URL/title
+            deduplicate: Remove duplicates by URL/title and collapse near-duplicates
 
         Returns:
             List of deduplicated NewsArticle objects
@@ -433,17 +552,34 @@ class MultiSourceNewsFetcher:
         all_articles: List[NewsArticle] = []
         per_source_limit = max(limit // len(self.sources), 5)
 
+        # Gather request tasks from every source and run them together
+        tasks: List[FetchTask] = []
+        spans = []
         for source in self.sources:
             if not source.is_enabled():
                 continue
 
             try:
-                articles = source.fetch(
+                source_tasks = source.fetch_tasks(
                     lookback_hours=lookback_hours,
                     limit=per_source_limit
                 )
-                all_articles.extend(articles)
+            except Exception as e:
+                logger.warning(f"Error fetching from {source.__class__.__name__}: {e}")
+                continue
+            spans.append((source, len(tasks), len(tasks) + len(source_tasks)))
+            tasks.extend(source_tasks)
+
+        results = run_concurrently(
+            tasks,
+            max_workers=self.max_workers,
+            deadline_seconds=self.deadline_seconds,
+            default=[],
+        )
 
+        for source, start, end in spans:
+            try:
+                all_articles.extend(source.combine(results[start:end], per_source_limit))
             except Exception as e:
                 logger.warning(f"Error fetching from {source.__class__.__name__}: {e}")
                 continue
@@ -477,8 +613,50 @@ class MultiSourceNewsFetcher:
                 unique.append(article)
 
         logger.debug(f"Deduplication: {len(articles)} → {len(unique)} articles")
+
+        if self.clusterer is not None:
+            unique = self._collapse_near_duplicates(unique)
         return unique
 
+    def _collapse_near_duplicates(self, articles: List[NewsArticle]) -> List[NewsArticle]:
+        """
+        Replace each cluster of near-duplicate articles with one representative.
+
+        The representative is the member with the most text (ties: first seen);
+        it carries the number of distinct sources in the cluster as
+        source_count and the other sources as syndicated_sources.
+        """
+        if len(articles) < 2:
+            return articles
+
+        try:
+            clusters = self.clusterer.cluster(
+                [f"{a.title} {a.description or ''}" for a in articles]
+            )
+        except Exception as e:
+            logger.warning(f"Near-duplicate clustering failed, keeping exact dedup only: {e}")
+            return articles
+
+        collapsed: List[NewsArticle] = []
+        for members in clusters:
+            if len(members) == 1:
+                collapsed.append(articles[members[0]])
+                continue
+
+            cluster = [articles[i] for i in members]
+            representative = max(cluster, key=lambda a: len(a.title) + len(a.description or ""))
+            sources = list(dict.fromkeys(
+                s for a in cluster for s in (a.source, *a.syndicated_sources)
+            ))
+            collapsed.append(replace(
+                representative,
+                source_count=len(sources),
+                syndicated_sources=tuple(s for s in sources if s != representative.source),
+            ))
+
+        logger.debug(f"Near-duplicate clustering: {len(articles)} → {len(collapsed)} articles")
+        return collapsed
+
     def fetch_by_source(
         self,
         source_name: str,
@@ -107,18 +107,24 @@ class HypothesisBuilder:
         if total == 0:
             return None
 
+        # Weight each claim by the distinct sources carrying its story, so a
+        # story collapsed from N syndicated copies counts as N corroborations
+        support_weight = sum(c.source_count for c in supporting)
+        contradict_weight = sum(c.source_count for c in contradicting)
+        total_weight = sum(c.source_count for c in claims)
+
         # Confidence: (supporting - contradicting) / total
-        confidence = max(0.0, min(1.0, (len(supporting) - len(contradicting)) / total + 0.5))
+        confidence = max(0.0, min(1.0, (support_weight - contradict_weight) / total_weight + 0.5))
 
         # Uncertainty: how much disagreement
-        uncertainty = len(contradicting) / total if total > 0 else 0.0
+        uncertainty = contradict_weight / total_weight
 
         # Build hypothesis text
         hypothesis_text = self._build_hypothesis_text(theme, supporting, contradicting)
 
         # Reasoning steps
         reasoning_steps = [
-            f"Analyzed {len(claims)} claims about {theme}",
+            f"Analyzed {len(claims)} claims about {theme} ({total_weight} source-weighted)",
             f"Found {len(supporting)} supporting, {len(contradicting)} contradicting",
             f"Confidence: {confidence:.2f} (supports {theme})",
         ]
@@ -18,6 +18,9 @@ from phase_f.schemas import Verdict
 
 logger = logging.getLogger(__name__)
 
+# Per-scope logs live under <LOGS_ROOT>/<scope>/logs
+LOGS_ROOT = Path("persist/phase_f")
+
 
 class PhaseFLogger:
     """
@@ -36,7 +39,7 @@ class PhaseFLogger:
             scope: Scope name (default: "crypto")
         """
         self.scope = scope
-        self.logs_dir = Path(f"persist/phase_f/{scope}/logs")
+        self.logs_dir = LOGS_ROOT / scope / "logs"
         self.logs_dir.mkdir(parents=True, exist_ok=True)
 
         # Log file paths
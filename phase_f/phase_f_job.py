@@ -16,7 +16,7 @@ from typing import Optional, Tuple
 
 from phase_f.fetchers.news_api_fetcher import NewsAPIFetcher
 from phase_f.fetchers.news_fetcher_multi_source import MultiSourceNewsFetcher
-from phase_f.fetchers.kraken_signals_fetcher import KrakenSignalsFetcher
+from phase_f.fetchers.kraken_signals_fetcher import get_kraken_signals_fetcher
 from phase_f.extractors.claim_extractor import ClaimExtractor
 from phase_f.hypothesis_builder import HypothesisBuilder
 from phase_f.agents.epistemic_critic import EpistemicCritic
@@ -27,6 +27,7 @@ from phase_f.logging import PhaseFLogger
 from config.phase_f_settings import (
     PHASE_F_ENABLED,
     PHASE_F_KILL_SWITCH,
+    PHASE_F_MARKET_SIGNAL_SYMBOLS,
     PHASE_F_MAX_ARTICLES_PER_AGENT,
     PHASE_F_USE_MULTI_SOURCE_FETCHER,
 )
@@ -70,7 +71,7 @@ class PhaseFJob:
             self.fetcher = NewsAPIFetcher()
             logger.info("Using single-source NewsAPI fetcher")
 
-        self.kraken_fetcher = KrakenSignalsFetcher()  # Market microstructure source
+        self.kraken_fetcher = get_kraken_signals_fetcher()  # Market microstructure source (process-wide TTL cache)
         self.claim_extractor = ClaimExtractor()
         self.hypothesis_builder = HypothesisBuilder()
         self.critic = EpistemicCritic()
@@ -114,10 +115,7 @@ class PhaseFJob:
                 self.logger.log_run_complete(run_id, success=False, error="No articles fetched")
                 return False
 
-            all_claims = []
-            for article in articles:
-                claims = self.claim_extractor.extract_from_article(article)
-                all_claims.extend(claims)
+            all_claims = self.claim_extractor.extract_from_articles(articles)
 
             researcher_hypotheses = self.hypothesis_builder.build_hypotheses(all_claims)
 
@@ -131,6 +129,9 @@ class PhaseFJob:
                     source = getattr(article, 'source', None)
                 if source:
                     unique_sources.append(source)
+                # Sources whose near-duplicate copies were collapsed into this article
+                if not isinstance(article, dict):
+                    unique_sources.extend(getattr(article, 'syndicated_sources', ()))
             unique_sources = sorted(set(unique_sources))
 
             logger.info(f"Stage 1 complete: {len(articles)} articles, {len(all_claims)} claims, {len(researcher_hypotheses)} hypotheses")
@@ -145,13 +146,21 @@ class PhaseFJob:
 
             # Stage 1b: Fetch Market Signals (Kraken microstructure)
             logger.info("Stage 1b: Market Signals (fetch Kraken ticker, order book, trades)")
-            market_signals = self.kraken_fetcher.get_market_signals("BTC")
+            signal_snapshots = self.kraken_fetcher.get_market_signals_batch(
+                ["BTC"] + PHASE_F_MARKET_SIGNAL_SYMBOLS
+            )
+            market_signals = signal_snapshots.get("BTC")
             market_signals_available = market_signals is not None
 
             if market_signals:
                 logger.info(f"Market signals fetched: {market_signals.get('overall_signal', 'UNKNOWN')}")
                 self.logger.log_stage_complete("market_signals", {
                     "symbol": market_signals.get("symbol"),
+                    "symbols": sorted(signal_snapshots),
+                    "imbalance_by_symbol": {
+                        symbol: snapshot.get("order_book", {}).get("imbalance_ratio", 0)
+                        for symbol, snapshot in signal_snapshots.items()
+                    },
                     "volume_24h": market_signals.get("ticker", {}).get("volume_24h", 0),
                     "bid_ask_spread": market_signals.get("ticker", {}).get("bid_ask_spread_pct", 0),
                     "order_book_imbalance": market_signals.get("order_book", {}).get("imbalance_ratio", 0),
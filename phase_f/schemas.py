@@ -61,6 +61,9 @@ class Claim(BaseModel):
     sentiment: SentimentEnum = Field(
         ..., description="Market sentiment implied by claim"
     )
+    source_count: int = Field(
+        1, ge=1, description="Distinct sources carrying the article (syndicated copies collapsed)"
+    )
 
     @field_validator("source_url")
     @classmethod
@@ -12,6 +12,7 @@ from phase_g_regime.regime_validator import (
     RegimeValidationContext,
 )
 from phase_g_regime.regime_drift_detector import RegimeDriftDetector, DriftDetectionResult
+from phase_g_regime.regime_history import RegimeHistoryIndex
 
 __all__ = [
     "RegimeOrchestrator",
@@ -20,4 +21,5 @@ __all__ = [
     "RegimeValidationContext",
     "RegimeDriftDetector",
     "DriftDetectionResult",
+    "RegimeHistoryIndex",
 ]
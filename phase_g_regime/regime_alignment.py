@@ -7,12 +7,17 @@ Used by regime_validator and regime_drift_detector.
 
 from typing import List, Optional
 
+import numpy as np
+
+from phase_g_regime.regime_history import RegimeHistoryIndex, percentile_rank
+
 
 # Natural ordering: risk_on(0) → neutral(1) → risk_off(2) → panic(3)
 REGIME_ORDER = {"risk_on": 0, "neutral": 1, "risk_off": 2, "panic": 3}
 
 # Volatility band boundaries (annualized %)
 _VOL_BANDS = [(20.0, "low"), (50.0, "medium"), (80.0, "high")]
+_VOL_BAND_EDGES = np.array([threshold for threshold, _ in _VOL_BANDS])
 
 
 def regime_distance(a: Optional[str], b: Optional[str]) -> int:
@@ -31,15 +36,18 @@ def regime_agreement_score(a: Optional[str], b: Optional[str]) -> float:
     return {0: 1.0, 1: 0.6, 2: 0.3, 3: 0.1}.get(dist, 0.5)
 
 
-def duration_percentile(current_hours: float, history: List[float]) -> float:
+def duration_percentile(current_hours: float, history) -> float:
     """
     Percentile rank of current duration vs historical durations.
     Returns 0-100. Higher = current regime has lasted longer than most.
+    Insufficient history (< 3) returns 50 (median).
+
+    Args:
+        history: Durations (list) or a RegimeHistoryIndex
     """
-    if not history or len(history) < 3:
-        return 50.0  # Insufficient history, assume median
-    below = sum(1 for d in history if d <= current_hours)
-    return (below / len(history)) * 100.0
+    if isinstance(history, RegimeHistoryIndex):
+        return history.duration_percentile(current_hours)
+    return float(percentile_rank(np.sort(np.asarray(history, dtype=float)), current_hours))
 
 
 def volatility_band(vol: float) -> str:
@@ -50,6 +58,11 @@ def volatility_band(vol: float) -> str:
     return "extreme"
 
 
+def volatility_band_ids(vols) -> np.ndarray:
+    """Vectorized volatility_band as band ids (index into low/medium/high/extreme)."""
+    return np.searchsorted(_VOL_BAND_EDGES, np.asarray(vols, dtype=float), side="right")
+
+
 def volatility_shift_detected(entry_vol: float, current_vol: float) -> bool:
     """Detect if volatility has shifted to a different band since regime entry."""
     if entry_vol <= 0 or current_vol <= 0:
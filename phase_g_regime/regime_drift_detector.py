@@ -10,16 +10,24 @@ Drift is declared ONLY if ALL five conditions hold simultaneously:
 
 If ANY condition fails → no drift, no proposal.
 This is intentionally conservative.
+
+detect_history() replays the history-derived conditions (2-4) over a
+full regime observation series as a batch job.
 """
 
 import logging
 from dataclasses import dataclass, asdict
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
 
 from phase_g_regime.regime_alignment import (
     duration_percentile,
+    volatility_band_ids,
     volatility_shift_detected,
 )
+from phase_g_regime.regime_history import RegimeHistoryIndex
 
 logger = logging.getLogger(__name__)
 
@@ -130,7 +138,7 @@ class RegimeDriftDetector:
         # ====================================================================
         pct = duration_percentile(
             ctx.current_regime_duration_hours,
-            ctx.historical_regime_durations,
+            ctx.duration_history,
         )
         duration_anomaly = pct >= DURATION_PERCENTILE_THRESHOLD
 
@@ -204,6 +212,85 @@ class RegimeDriftDetector:
             emergency_override=emergency,
         )
 
+    def detect_history(
+        self,
+        timestamps,
+        regimes: Sequence[str],
+        volatility: Sequence[float],
+        drawdown: Optional[Sequence[float]] = None,
+        scope_type: str = "crypto",
+        max_history: int = 100,
+    ) -> pd.DataFrame:
+        """
+        Retrospective drift conditions over a regime observation series.
+
+        Evaluates the conditions derivable from history alone at every
+        observation, without lookahead: minimum dwell (with the crypto
+        emergency drawdown override), duration anomaly vs the last
+        max_history completed regime durations (as the live run state
+        keeps), and volatility band shift since regime entry. External
+        conditions (1 and 5) need Phase F verdicts and are not replayed.
+
+        Args:
+            timestamps: Observation times (chronological)
+            regimes: Regime label per observation
+            volatility: Annualized volatility (%) per observation
+            drawdown: Optional drawdown (%) per observation
+            scope_type: "crypto" or "swing" (dwell requirement)
+            max_history: Completed durations kept for the percentile
+
+        Returns:
+            DataFrame indexed by timestamp with duration_hours,
+            duration_percentile, minimum_dwell, duration_anomaly,
+            volatility_shift, emergency_override and history_conditions_met
+        """
+        times = pd.DatetimeIndex(timestamps)
+        labels = np.asarray(regimes, dtype=object)
+        vols = np.asarray(volatility, dtype=float)
+        n = len(labels)
+        if n == 0:
+            return pd.DataFrame(index=times)
+
+        hours = (times.as_unit("s").asi8 - times.as_unit("s").asi8[0]) / 3600.0
+        starts = np.r_[0, np.flatnonzero(labels[1:] != labels[:-1]) + 1]
+        ends = np.r_[starts[1:], n]
+        spell = np.repeat(np.arange(len(starts)), ends - starts)
+        duration = hours - hours[starts][spell]
+
+        # Percentile vs durations completed before each spell began
+        pct = np.empty(n)
+        index = RegimeHistoryIndex(max_spells=max_history)
+        for start, end in zip(starts, ends):
+            pct[start:end] = index.duration_percentiles(duration[start:end])
+            if end < n:
+                index.add(labels[start], hours[end] - hours[start])
+
+        entry_vol = vols[starts][spell]
+        vol_shift = (
+            (entry_vol > 0) & (vols > 0)
+            & (volatility_band_ids(entry_vol) != volatility_band_ids(vols))
+        )
+
+        emergency = np.zeros(n, dtype=bool)
+        if drawdown is not None and scope_type == "crypto":
+            emergency = np.asarray(drawdown, dtype=float) < EMERGENCY_DRAWDOWN_THRESHOLD
+        dwell = (duration >= MIN_DWELL_HOURS.get(scope_type, 4.0)) | emergency
+        anomaly = pct >= DURATION_PERCENTILE_THRESHOLD
+
+        return pd.DataFrame(
+            {
+                "regime": labels,
+                "duration_hours": duration,
+                "duration_percentile": pct,
+                "minimum_dwell": dwell,
+                "duration_anomaly": anomaly,
+                "volatility_shift": vol_shift,
+                "emergency_override": emergency,
+                "history_conditions_met": dwell & anomaly & vol_shift,
+            },
+            index=times,
+        )
+
     def _extract_phase_f_confidence(self, verdict: Optional[Dict]) -> float:
         """Extract regime confidence from Phase F verdict."""
         if not verdict or "verdict" not in verdict:
@@ -0,0 +1,203 @@
+"""
+Phase G Regime History Index: sorted duration arrays and transition counts.
+
+Regime history is held as spells (one regime, one duration). The index
+keeps a sorted duration array per regime (and overall) plus a transition
+count matrix, updated incrementally as spells complete, so queries are
+array lookups:
+
+- duration_percentile / duration_percentiles: searchsorted rank
+- quantile: direct interpolation on the sorted array (no re-sort)
+- transition_counts / transition_matrix: counter reads
+
+Used by the drift detector (live and retrospective), Phase D block
+statistics and the ops agent's transition summaries.
+"""
+
+from collections import deque
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Below this many spells a percentile is not meaningful (assume median)
+MIN_HISTORY_FOR_PERCENTILE = 3
+
+
+def percentile_rank(sorted_values: np.ndarray, values) -> np.ndarray:
+    """
+    Percentile rank (0-100) of values against a sorted array: the share
+    of entries <= value. 50.0 when the history is too short.
+    """
+    values = np.asarray(values, dtype=float)
+    n = len(sorted_values)
+    if n < MIN_HISTORY_FOR_PERCENTILE:
+        return np.full(values.shape, 50.0)
+    return np.searchsorted(sorted_values, values, side="right") / n * 100.0
+
+
+def sorted_quantile(sorted_values: np.ndarray, q: float) -> float:
+    """Linearly interpolated q-th percentile (0-100) of a sorted array."""
+    n = len(sorted_values)
+    if n == 0:
+        return 0.0
+    rank = (q / 100.0) * (n - 1)
+    lower = int(rank)
+    if lower + 1 >= n:
+        return float(sorted_values[-1])
+    return float(sorted_values[lower] + (rank - lower) * (sorted_values[lower + 1] - sorted_values[lower]))
+
+
+class RegimeHistoryIndex:
+    """
+    Incrementally updated index over completed regime spells.
+
+    Optionally bounded to the most recent max_spells spells (the live
+    run state keeps the last 100 durations).
+    """
+
+    def __init__(self, max_spells: Optional[int] = None):
+        self.max_spells = max_spells
+        self._spells: deque = deque()  # (regime, duration, ended_at) in arrival order
+        self._sorted: Dict[Optional[str], np.ndarray] = {None: np.empty(0)}
+        self.labels: List[str] = []
+        self._label_ids: Dict[str, int] = {}
+        self._transitions = np.zeros((0, 0), dtype=np.int64)
+        self._last_regime: Optional[str] = None
+
+    def __len__(self) -> int:
+        return len(self._spells)
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_durations(cls, durations: Iterable[float], max_spells: Optional[int] = None) -> "RegimeHistoryIndex":
+        """Index over durations with no regime labels (e.g. run_state history)."""
+        index = cls(max_spells=max_spells)
+        for duration in durations:
+            index.add(None, duration)
+        return index
+
+    @classmethod
+    def from_labels(cls, labels: Sequence[str], timestamps=None) -> "RegimeHistoryIndex":
+        """
+        Index over a chronological series of regime observations.
+
+        Consecutive equal labels form one spell. With timestamps, spell
+        durations are hours from a spell's first observation to the
+        next spell's first; without, durations count observations. The
+        last (still open) spell is not indexed but counts for transitions.
+        """
+        labels = np.asarray(labels, dtype=object)
+        index = cls()
+        if len(labels) == 0:
+            return index
+
+        starts = np.r_[0, np.flatnonzero(labels[1:] != labels[:-1]) + 1]
+        if timestamps is None:
+            positions = np.r_[starts, len(labels)].astype(float)
+        else:
+            hours = np.asarray(timestamps, dtype="datetime64[s]").astype(np.int64) / 3600.0
+            positions = np.r_[hours[starts], hours[-1]]
+        durations = np.diff(positions)
+
+        for k, start in enumerate(starts[:-1]):
+            index.add(labels[start], durations[k])
+        index._count_transition(labels[starts[-1]])
+        return index
+
+    def add(self, regime: Optional[str], duration: float, ended_at: Optional[datetime] = None) -> None:
+        """Record a completed spell."""
+        duration = float(duration)
+        self._spells.append((regime, duration, ended_at))
+        self._insert(None, duration)
+        if regime is not None:
+            self._insert(regime, duration)
+        self._count_transition(regime)
+
+        if self.max_spells is not None and len(self._spells) > self.max_spells:
+            old_regime, old_duration, _ = self._spells.popleft()
+            self._remove(None, old_duration)
+            if old_regime is not None:
+                self._remove(old_regime, old_duration)
+
+    def _insert(self, key: Optional[str], value: float) -> None:
+        values = self._sorted.get(key, np.empty(0))
+        self._sorted[key] = np.insert(values, np.searchsorted(values, value), value)
+
+    def _remove(self, key: Optional[str], value: float) -> None:
+        values = self._sorted[key]
+        self._sorted[key] = np.delete(values, np.searchsorted(values, value))
+
+    def _count_transition(self, regime: Optional[str]) -> None:
+        if regime is None:
+            return
+        if regime not in self._label_ids:
+            self._label_ids[regime] = len(self.labels)
+            self.labels.append(regime)
+            self._transitions = np.pad(self._transitions, ((0, 1), (0, 1)))
+        previous, self._last_regime = self._last_regime, regime
+        if previous is not None and previous != regime:
+            self._transitions[self._label_ids[previous], self._label_ids[regime]] += 1
+
+    def since(self, cutoff: datetime) -> "RegimeHistoryIndex":
+        """New index over spells that ended after cutoff."""
+        index = RegimeHistoryIndex(max_spells=self.max_spells)
+        for regime, duration, ended_at in self._spells:
+            if ended_at is not None and ended_at > cutoff:
+                index.add(regime, duration, ended_at)
+        return index
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def durations(self, regime: Optional[str] = None) -> np.ndarray:
+        """Sorted durations (all spells, or one regime's). Read-only view."""
+        values = self._sorted.get(regime, np.empty(0)).view()
+        values.flags.writeable = False
+        return values
+
+    def count(self, regime: Optional[str] = None) -> int:
+        return len(self._sorted.get(regime, ()))
+
+    def duration_percentile(self, duration: float, regime: Optional[str] = None) -> float:
+        """Percentile rank (0-100) of a duration vs indexed spells."""
+        return float(percentile_rank(self.durations(regime), duration))
+
+    def duration_percentiles(self, durations, regime: Optional[str] = None) -> np.ndarray:
+        """Vectorized duration_percentile."""
+        return percentile_rank(self.durations(regime), durations)
+
+    def quantile(self, q: float, regime: Optional[str] = None) -> float:
+        """q-th percentile (0-100) of indexed durations."""
+        return sorted_quantile(self.durations(regime), q)
+
+    def transition_matrix(self) -> Tuple[List[str], np.ndarray]:
+        """(labels, counts) with counts[i, j] = transitions labels[i] -> labels[j]."""
+        return list(self.labels), self._transitions.copy()
+
+    def transition_count(self, from_regime: str, to_regime: str) -> int:
+        i = self._label_ids.get(from_regime)
+        j = self._label_ids.get(to_regime)
+        if i is None or j is None:
+            return 0
+        return int(self._transitions[i, j])
+
+    def transition_probability(self, from_regime: str, to_regime: str) -> float:
+        """Share of transitions out of from_regime that went to to_regime."""
+        i = self._label_ids.get(from_regime)
+        if i is None:
+            return 0.0
+        total = self._transitions[i].sum()
+        return self.transition_count(from_regime, to_regime) / total if total else 0.0
+
+    def transition_counts(self) -> Dict[str, int]:
+        """{"prev->next": count} for observed transitions."""
+        rows, cols = np.nonzero(self._transitions)
+        return {
+            f"{self.labels[i]}->{self.labels[j]}": int(self._transitions[i, j])
+            for i, j in zip(rows, cols)
+        }
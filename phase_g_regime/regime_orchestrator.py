@@ -11,17 +11,24 @@ Scheduling:
   - Swing: once daily, min 3-day dwell, no intraday flips
 
 All runs are idempotent. State persisted to run_state.json.
-Timeout enforced at 90 seconds per cycle.
+Timeout enforced at 90 seconds per cycle: inputs (OHLCV, Phase F verdict)
+load concurrently under a hard deadline and the cycle continues with
+whatever arrived; regime features are memoized per 4h bar close and the
+trading pipeline's latest features are reused when current.
 """
 
 import json
 import logging
+import threading
 import time
 import uuid
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, asdict, field
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+import pandas as pd
 
 from phase_g_regime.regime_validator import (
     RegimeValidator,
@@ -30,6 +37,7 @@ from phase_g_regime.regime_validator import (
 )
 from phase_g_regime.regime_drift_detector import RegimeDriftDetector, DriftDetectionResult
 from phase_g_regime.regime_guardrails import RegimeGuardrails
+from phase_g_regime.regime_history import RegimeHistoryIndex
 
 logger = logging.getLogger(__name__)
 
@@ -37,8 +45,11 @@ logger = logging.getLogger(__name__)
 # RESOURCE LIMITS
 # ============================================================================
 MAX_RUNTIME_SECONDS = 90
+INPUT_LOAD_SECONDS = 60  # Hard deadline for loading inputs (leaves time to validate and persist)
+REGIME_BAR_HOURS = 4
 VALIDATION_INTERVAL_MINUTES_CRYPTO = 120  # 2 hours
 VALIDATION_INTERVAL_MINUTES_SWING = 1440  # 24 hours
+MAX_DURATION_HISTORY = 100  # Completed regime durations kept in run state
 
 
 @dataclass
@@ -78,11 +89,40 @@ class RegimeValidationCycleResult:
     proposal: Optional[Dict[str, Any]]
     outcome: str  # VALIDATED, INSUFFICIENT_DATA, UNCERTAIN, DRIFT_DETECTED, DRIFT_DEFERRED, VALIDATION_FAILED, SKIPPED, TIMEOUT
     duration_ms: float
+    missing_inputs: List[str] = field(default_factory=list)  # Inputs dropped at the load deadline
 
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
 
+# Regime features memoized per symbol and last 4h bar (shared across
+# orchestrator instances; the daemon builds one per cycle)
+_feature_cache: Dict[str, Tuple[Tuple, Any]] = {}
+_feature_cache_lock = threading.Lock()
+
+# Sorted index over each scope's run_state["regime_duration_history"],
+# kept in step with the stored list across cycles
+_duration_indexes: Dict[str, Tuple[List[float], RegimeHistoryIndex]] = {}
+_duration_indexes_lock = threading.Lock()
+
+
+def _last_bar_key(bars: pd.DataFrame) -> Tuple:
+    """Identity of the latest bar: timestamp, close and bar count."""
+    stamp = bars["timestamp"].iloc[-1] if "timestamp" in bars.columns else bars.index[-1]
+    return (str(stamp), float(bars["Close"].iloc[-1]), len(bars))
+
+
+def _is_current_bar(timestamp) -> bool:
+    """True if a bar timestamp falls within the latest regime bar."""
+    try:
+        ts = pd.Timestamp(timestamp)
+        if ts.tzinfo is None:
+            ts = ts.tz_localize("UTC")
+        return pd.Timestamp.now(tz="UTC") - ts < pd.Timedelta(hours=REGIME_BAR_HOURS)
+    except (ValueError, TypeError):
+        return False
+
+
 class RegimeOrchestrator:
     """
     Full periodic regime validation pipeline.
@@ -136,6 +176,9 @@ class RegimeOrchestrator:
         7. Persist and log everything
         """
         start_time = time.time()
+        validation_result = None
+        drift_result = None
+        missing_inputs: List[str] = []
         run_id = f"regime_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
 
         logger.info(
@@ -169,7 +212,7 @@ class RegimeOrchestrator:
 
             # Step 2: Load context
             self._check_timeout(start_time)
-            ctx = self._build_context(run_state)
+            ctx, missing_inputs = self._build_context(run_state, deadline=start_time + INPUT_LOAD_SECONDS)
 
             # Detect if live regime changed since last run
             self._detect_regime_transition(run_state, ctx.current_regime, ctx.volatility)
@@ -190,6 +233,7 @@ class RegimeOrchestrator:
                 "duration_hours": round(ctx.current_regime_duration_hours, 1),
                 "historical_durations_count": len(ctx.historical_regime_durations),
                 "num_external_sources": ctx.num_external_sources,
+                "missing_inputs": missing_inputs,
                 "phase_f_verdict_type": (
                     ctx.phase_f_verdict["verdict"].get("verdict")
                     if ctx.phase_f_verdict and "verdict" in ctx.phase_f_verdict
@@ -211,7 +255,6 @@ class RegimeOrchestrator:
             })
 
             # Step 4: Drift detection (Stage 2) — only if drift was detected
-            drift_result = None
             proposal = None
 
             if validation_result.verdict == "REGIME_DRIFT_DETECTED":
@@ -271,6 +314,7 @@ class RegimeOrchestrator:
                 proposal=proposal.to_dict() if proposal else None,
                 outcome=outcome,
                 duration_ms=round(duration_ms, 1),
+                missing_inputs=missing_inputs,
             )
 
             self._append_jsonl(self.validation_runs_path, cycle_result.to_dict())
@@ -331,15 +375,24 @@ class RegimeOrchestrator:
                 "event": "REGIME_VALIDATION_TIMEOUT",
                 "run_id": run_id,
                 "duration_ms": round(duration_ms, 1),
+                "completed_stages": [
+                    stage for stage, done in (
+                        ("validation", validation_result), ("drift", drift_result),
+                    ) if done is not None
+                ],
             })
+            # Partial results: whatever stages finished before the deadline
             return RegimeValidationCycleResult(
                 run_id=run_id,
                 timestamp_utc=datetime.now(timezone.utc).isoformat(),
                 scope=self.scope_str,
                 trigger=trigger,
-                validation=None, drift=None, proposal=None,
+                validation=validation_result.to_dict() if validation_result else None,
+                drift=drift_result.to_dict() if drift_result else None,
+                proposal=None,
                 outcome="TIMEOUT",
                 duration_ms=round(duration_ms, 1),
+                missing_inputs=missing_inputs,
             )
 
         except Exception as e:
@@ -369,8 +422,15 @@ class RegimeOrchestrator:
     # Context building
     # ========================================================================
 
-    def _build_context(self, run_state: Dict) -> RegimeValidationContext:
-        """Build validation context from all available inputs."""
+    def _build_context(
+        self, run_state: Dict, deadline: Optional[float] = None,
+    ) -> Tuple[RegimeValidationContext, List[str]]:
+        """
+        Build validation context from all available inputs.
+
+        Returns:
+            (context, names of inputs that missed the load deadline)
+        """
 
         # Current regime from live engine
         current_regime = None
@@ -384,7 +444,9 @@ class RegimeOrchestrator:
         if current_regime is None:
             current_regime = run_state.get("current_regime")
 
-        # Recalculate regime from fresh data
+        inputs, missing = self._load_inputs(deadline or time.time() + INPUT_LOAD_SECONDS)
+
+        # Recalculated regime from fresh data
         recalculated_regime = None
         recalculated_confidence = 0.5
         volatility = 0.0
@@ -392,41 +454,33 @@ class RegimeOrchestrator:
         drawdown = 0.0
         cross_asset_regime = None
 
-        try:
-            recalc = self._recalculate_regime()
-            if recalc:
-                recalculated_regime = recalc["regime"]
-                recalculated_confidence = recalc["confidence"]
-                volatility = recalc["volatility"]
-                volatility_percentile = recalc.get("vol_percentile", 0.5)
-                drawdown = recalc["drawdown"]
-                cross_asset_regime = recalc.get("cross_asset_regime")
-        except Exception as e:
-            logger.warning("REGIME_RECALC_FAILED | error=%s", e)
+        recalc = inputs.get("regime")
+        if recalc:
+            recalculated_regime = recalc["regime"]
+            recalculated_confidence = recalc["confidence"]
+            volatility = recalc["volatility"]
+            volatility_percentile = recalc.get("vol_percentile", 0.5)
+            drawdown = recalc["drawdown"]
+            cross_asset_regime = recalc.get("cross_asset_regime")
+        if inputs.get("cross_asset"):
+            cross_asset_regime = inputs["cross_asset"]["regime"]
 
         # Also update current_confidence from live engine's last signal
         if regime_engine is not None and hasattr(regime_engine, "current_regime"):
             current_confidence = recalculated_confidence  # Best available
 
         # Phase F verdict
-        phase_f_verdict = None
+        phase_f_verdict = inputs.get("verdict")
         num_sources = 0
-        if self.verdict_reader:
-            try:
-                phase_f_verdict = self.verdict_reader.read_latest_verdict(
-                    scope="crypto" if self.scope_type == "crypto" else "swing"
-                )
-                if phase_f_verdict and "verdict" in phase_f_verdict:
-                    num_sources = phase_f_verdict["verdict"].get("num_sources_analyzed", 0)
-            except Exception as e:
-                logger.warning("VERDICT_READ_FAILED | error=%s", e)
+        if phase_f_verdict and "verdict" in phase_f_verdict:
+            num_sources = phase_f_verdict["verdict"].get("num_sources_analyzed", 0)
 
         # Duration and history from run state
         duration_hours = self._compute_duration_hours(run_state)
         history = run_state.get("regime_duration_history", [])
         entry_vol = run_state.get("entry_volatility", volatility)
 
-        return RegimeValidationContext(
+        ctx = RegimeValidationContext(
             scope=self.scope_str,
             current_regime=current_regime,
             current_regime_confidence=current_confidence,
@@ -441,7 +495,82 @@ class RegimeOrchestrator:
             historical_regime_durations=history,
             num_external_sources=num_sources,
             entry_volatility=entry_vol,
+            history_index=self._duration_history_index(history),
         )
+        return ctx, missing
+
+    def _duration_history_index(self, history: List[float]) -> RegimeHistoryIndex:
+        """
+        Index over the run state's duration history, kept across cycles.
+
+        A regime change appends one duration (dropping the oldest past
+        MAX_DURATION_HISTORY), which is an incremental add; any other
+        change (e.g. run state edited or reset) rebuilds the index.
+        """
+        with _duration_indexes_lock:
+            indexed, index = _duration_indexes.get(self.scope_str, ([], None))
+            if index is not None and history == indexed:
+                return index
+
+            appended = index is not None and bool(history) and (
+                history[:-1] == indexed
+                or (len(indexed) == MAX_DURATION_HISTORY and history[:-1] == indexed[1:])
+            )
+            if appended:
+                index.add(None, history[-1])
+            else:
+                index = RegimeHistoryIndex.from_durations(history, max_spells=MAX_DURATION_HISTORY)
+            _duration_indexes[self.scope_str] = (list(history), index)
+            return index
+
+    def _load_inputs(self, deadline: float) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Load regime recalculation inputs and the Phase F verdict concurrently.
+
+        Inputs not ready by the deadline are dropped (the cycle continues
+        with partial context) instead of holding the cycle open; their
+        threads finish in the background.
+
+        Returns:
+            (input name -> value or None, names of inputs that missed the deadline)
+        """
+        tasks = {"regime": self._recalculate_regime}
+        if self.scope_type == "crypto":
+            tasks["cross_asset"] = self._recalculate_cross_asset_regime
+        if self.verdict_reader:
+            tasks["verdict"] = self._read_verdict
+
+        pool = ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix="regime-input")
+        futures = {name: pool.submit(task) for name, task in tasks.items()}
+        wait(futures.values(), timeout=max(0.0, deadline - time.time()))
+        pool.shutdown(wait=False, cancel_futures=True)
+
+        inputs: Dict[str, Any] = {}
+        missing: List[str] = []
+        for name, future in futures.items():
+            if not future.done():
+                missing.append(name)
+                continue
+            try:
+                inputs[name] = future.result()
+            except Exception as e:
+                logger.warning("REGIME_INPUT_FAILED | input=%s | error=%s", name, e)
+
+        if missing:
+            logger.warning(
+                "REGIME_INPUTS_PARTIAL | missing=%s | deadline_exceeded_by_s=%.1f",
+                ",".join(missing), time.time() - deadline,
+            )
+        return inputs, missing
+
+    def _read_verdict(self) -> Optional[Dict[str, Any]]:
+        try:
+            return self.verdict_reader.read_latest_verdict(
+                scope="crypto" if self.scope_type == "crypto" else "swing"
+            )
+        except Exception as e:
+            logger.warning("VERDICT_READ_FAILED | error=%s", e)
+            return None
 
     def _recalculate_regime(self) -> Optional[Dict[str, Any]]:
         """
@@ -453,43 +582,58 @@ class RegimeOrchestrator:
         else:
             return self._recalculate_swing_regime()
 
-    def _recalculate_crypto_regime(self) -> Optional[Dict[str, Any]]:
-        """Fetch BTC 4h candles → build features → classify with fresh engine."""
+    def _crypto_regime_features(self, symbol: str):
+        """
+        4h regime features for a symbol.
+
+        Reuses the trading pipeline's latest features when they are for
+        the current bar; otherwise loads bars and rebuilds features only
+        if the latest bar changed since the last cycle.
+        """
+        live = getattr(self.runtime, "crypto_regime_features", None) if self.runtime else None
+        if live is not None and live.symbol == symbol and _is_current_bar(live.timestamp_utc):
+            logger.debug("REGIME_FEATURES_REUSED | symbol=%s | source=pipeline", symbol)
+            return live
+
         from data.crypto_price_loader import load_crypto_price_data_interval
         from crypto.features.regime_features import build_regime_features
-        from crypto.regime.crypto_regime_engine import (
-            CryptoRegimeEngine,
-            RegimeThresholds,
-        )
 
-        bars_4h = load_crypto_price_data_interval("BTC", 200, "4h")
+        bars_4h = load_crypto_price_data_interval(symbol, 200, "4h")
         if bars_4h is None or len(bars_4h) < 20:
-            logger.warning("REGIME_RECALC | insufficient BTC 4h data | rows=%s",
-                           len(bars_4h) if bars_4h is not None else 0)
+            logger.warning("REGIME_RECALC | insufficient %s 4h data | rows=%s",
+                           symbol, len(bars_4h) if bars_4h is not None else 0)
             return None
 
+        key = _last_bar_key(bars_4h)
+        cached = _feature_cache.get(symbol)
+        if cached is not None and cached[0] == key:
+            logger.debug("REGIME_FEATURES_REUSED | symbol=%s | source=memo", symbol)
+            return cached[1]
+
         features = build_regime_features(
-            symbol="BTC",
+            symbol=symbol,
             bars_4h=bars_4h,
             lookback_periods=min(100, len(bars_4h)),
         )
+        with _feature_cache_lock:
+            _feature_cache[symbol] = (key, features)
+        return features
+
+    def _recalculate_crypto_regime(self) -> Optional[Dict[str, Any]]:
+        """BTC 4h features → classify with fresh engine."""
+        from crypto.regime.crypto_regime_engine import (
+            CryptoRegimeEngine,
+            RegimeThresholds,
+        )
+
+        features = self._crypto_regime_features("BTC")
+        if features is None:
+            return None
 
         # Fresh engine (no hysteresis state = raw classification)
         engine = CryptoRegimeEngine(thresholds=RegimeThresholds())
         signal = engine.analyze(features)
 
-        # Cross-asset: try ETH
-        cross_asset = None
-        try:
-            eth_bars = load_crypto_price_data_interval("ETH", 200, "4h")
-            if eth_bars is not None and len(eth_bars) >= 20:
-                eth_features = build_regime_features("ETH", eth_bars, min(100, len(eth_bars)))
-                eth_engine = CryptoRegimeEngine(thresholds=RegimeThresholds())
-                eth_signal = eth_engine.analyze(eth_features)
-                cross_asset = eth_signal.regime.value
-        except Exception as e:
-            logger.debug("ETH cross-asset check failed: %s", e)
-
         return {
             "regime": signal.regime.value,
             "confidence": signal.confidence,
@@ -497,9 +641,26 @@ class RegimeOrchestrator:
             "drawdown": signal.drawdown,
             "trend_slope": signal.trend_slope,
             "vol_percentile": features.vol_percentile_100,
-            "cross_asset_regime": cross_asset,
+            "cross_asset_regime": None,
         }
 
+    def _recalculate_cross_asset_regime(self) -> Optional[Dict[str, Any]]:
+        """Cross-asset check: classify ETH 4h features with a fresh engine."""
+        from crypto.regime.crypto_regime_engine import (
+            CryptoRegimeEngine,
+            RegimeThresholds,
+        )
+
+        try:
+            features = self._crypto_regime_features("ETH")
+            if features is None:
+                return None
+            signal = CryptoRegimeEngine(thresholds=RegimeThresholds()).analyze(features)
+            return {"regime": signal.regime.value}
+        except Exception as e:
+            logger.debug("ETH cross-asset check failed: %s", e)
+            return None
+
     def _recalculate_swing_regime(self) -> Optional[Dict[str, Any]]:
         """Use SPY proxy for swing scope."""
         from universe.governance.regime_proxy import SPYRegimeProxy
@@ -679,8 +840,7 @@ class RegimeOrchestrator:
             old_duration = self._compute_duration_hours(run_state)
             history = run_state.get("regime_duration_history", [])
             history.append(round(old_duration, 1))
-            # Keep last 100 entries
-            run_state["regime_duration_history"] = history[-100:]
+            run_state["regime_duration_history"] = history[-MAX_DURATION_HISTORY:]
 
             # Record the change
             now_utc = datetime.now(timezone.utc).isoformat()
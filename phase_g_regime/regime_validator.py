@@ -29,6 +29,7 @@ from phase_g_regime.regime_alignment import (
     duration_percentile,
     volatility_shift_detected,
 )
+from phase_g_regime.regime_history import RegimeHistoryIndex
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +51,12 @@ class RegimeValidationContext:
     historical_regime_durations: List[float]
     num_external_sources: int
     entry_volatility: float
+    history_index: Optional[RegimeHistoryIndex] = None  # Sorted view of historical_regime_durations
+
+    @property
+    def duration_history(self):
+        """Index over historical durations if provided, else the raw list."""
+        return self.history_index if self.history_index is not None else self.historical_regime_durations
 
 
 @dataclass
@@ -195,7 +202,7 @@ class RegimeValidator:
         # Duration anomaly
         pct = duration_percentile(
             ctx.current_regime_duration_hours,
-            ctx.historical_regime_durations,
+            ctx.duration_history,
         )
         duration_anomaly = max(0.0, (pct - 50.0) / 50.0)  # 0 at 50th, 1 at 100th
         components.append(duration_anomaly * 0.3)
@@ -19,11 +19,13 @@ PHILOSOPHY:
 """
 
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Set
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -59,6 +61,12 @@ class CorporateEventGuard:
     - No event data → BLOCK
     - Within blackout window → BLOCK
     - Better to miss opportunity than risk elevated execution risk
+
+    Events are compiled on load into blackout interval arrays sorted by
+    start. Every window has the same width, so they are also sorted by end
+    and the windows covering a date are one contiguous slice found with two
+    searchsorted calls. Backtests can precompute the blocked set per day
+    with precompute_blocked_days().
     """
     
     def __init__(self, blackout_days_before: int = 2, blackout_days_after: int = 2):
@@ -78,6 +86,9 @@ class CorporateEventGuard:
         
         # Symbols with missing event data (BLOCK by default)
         self._missing_data_symbols: Set[str] = set()
+
+        # Compiled blackout intervals (see _compile_events)
+        self._compile_events([])
         
         logger.info(f"CorporateEventGuard initialized (±{blackout_days_before}/{blackout_days_after} day blackout)")
     
@@ -99,8 +110,85 @@ class CorporateEventGuard:
             if event.symbol not in self._event_calendar:
                 self._event_calendar[event.symbol] = []
             self._event_calendar[event.symbol].append(event)
+
+        self._compile_events([event for evs in self._event_calendar.values() for event in evs])
         
         logger.info(f"Loaded {len(events)} corporate events for {len(self._event_calendar)} symbols")
+
+    def _compile_events(self, events: List[CorporateEvent]) -> None:
+        """
+        Build sorted blackout interval arrays from the event list.
+
+        Global arrays (sorted by event date, ties keep load order):
+            _events, _event_dates, _starts, _ends, _event_symbol_idx, _event_type_idx
+        Per-symbol slices into _by_symbol (global positions grouped by
+        symbol, date-sorted within each group): _symbol_slices.
+        """
+        dates = np.array([_to_datetime64(e.event_date) for e in events], dtype="datetime64[us]")
+        order = np.argsort(dates, kind="stable")
+
+        self._events = [events[i] for i in order]
+        self._event_dates = dates[order]
+        self._starts = self._event_dates - np.timedelta64(self.blackout_days_before, "D")
+        self._ends = self._event_dates + np.timedelta64(self.blackout_days_after, "D")
+
+        self._symbols = sorted({e.symbol for e in events})
+        self._symbol_index = {symbol: i for i, symbol in enumerate(self._symbols)}
+        self._event_symbol_idx = np.array(
+            [self._symbol_index[e.symbol] for e in self._events], dtype=np.int64
+        )
+        self._event_types = list(CorporateEventType)
+        type_index = {et: i for i, et in enumerate(self._event_types)}
+        self._event_type_idx = np.array(
+            [type_index[e.event_type] for e in self._events], dtype=np.int64
+        )
+
+        self._by_symbol = np.argsort(self._event_symbol_idx, kind="stable")
+        bounds = np.searchsorted(
+            self._event_symbol_idx[self._by_symbol], np.arange(len(self._symbols) + 1)
+        )
+        self._symbol_slices = {
+            symbol: (int(bounds[i]), int(bounds[i + 1])) for i, symbol in enumerate(self._symbols)
+        }
+
+        # Per-day calendar blocks (missing-data symbols are applied at query time)
+        self._blocked_by_day: Dict[np.datetime64, frozenset] = {}
+
+    def _active_slice(self, current_date: datetime) -> slice:
+        """Positions of blackout windows covering current_date."""
+        t = _to_datetime64(current_date)
+        lo = int(np.searchsorted(self._ends, t, side="left"))
+        hi = int(np.searchsorted(self._starts, t, side="right"))
+        return slice(lo, max(lo, hi))
+
+    def _calendar_blocked(self, current_date: datetime) -> frozenset:
+        """Symbols inside a blackout window on current_date (ignores missing data)."""
+        cached = self._blocked_by_day.get(_to_datetime64(current_date))
+        if cached is not None:
+            return cached
+        active = self._event_symbol_idx[self._active_slice(current_date)]
+        return frozenset(self._symbols[i] for i in np.unique(active))
+
+    def precompute_blocked_days(self, days: Iterable[datetime]) -> None:
+        """
+        Precompute calendar-blocked symbols for each given day (backtests).
+
+        Later queries with exactly one of these datetimes are set lookups.
+        Missing-data symbols are still applied at query time.
+
+        Args:
+            days: Datetimes that will be passed as current_date
+        """
+        days = list(days)
+        if not days:
+            return
+        ts = np.array([_to_datetime64(d) for d in days], dtype="datetime64[us]")
+        los = np.searchsorted(self._ends, ts, side="left")
+        his = np.searchsorted(self._starts, ts, side="right")
+        for t, lo, hi in zip(ts, los, his):
+            active = self._event_symbol_idx[lo:max(lo, hi)]
+            self._blocked_by_day[t] = frozenset(self._symbols[i] for i in np.unique(active))
+        logger.debug(f"Precomputed corporate event blocks for {len(days)} days")
     
     def mark_symbol_missing_data(self, symbol: str) -> None:
         """
@@ -133,23 +221,27 @@ class CorporateEventGuard:
             logger.info(f"BLOCK {symbol}: Missing corporate event data")
             return True
         
-        # Check for upcoming/recent events
-        events = self._event_calendar.get(symbol, [])
-        
-        for event in events:
-            blackout_start = event.event_date - timedelta(days=self.blackout_days_before)
-            blackout_end = event.event_date + timedelta(days=self.blackout_days_after)
-            
-            if blackout_start <= current_date <= blackout_end:
-                logger.info(
-                    f"BLOCK {symbol}: Within blackout window for {event.event_type.value} "
-                    f"on {event.event_date.strftime('%Y-%m-%d')} "
-                    f"(window: {blackout_start.strftime('%Y-%m-%d')} to {blackout_end.strftime('%Y-%m-%d')})"
-                )
-                return True
-        
-        # Not blocked
-        return False
+        # Latest window starting on/before current_date has the latest end
+        lo, hi = self._symbol_slices.get(symbol, (0, 0))
+        if lo == hi:
+            return False
+        positions = self._by_symbol[lo:hi]
+        t = _to_datetime64(current_date)
+        k = int(np.searchsorted(self._starts[positions], t, side="right")) - 1
+        if k < 0 or self._ends[positions[k]] < t:
+            return False
+
+        # Report the first covering event in date order
+        first = int(np.searchsorted(self._ends[positions], t, side="left"))
+        event = self._events[positions[first]]
+        blackout_start = event.event_date - timedelta(days=self.blackout_days_before)
+        blackout_end = event.event_date + timedelta(days=self.blackout_days_after)
+        logger.info(
+            f"BLOCK {symbol}: Within blackout window for {event.event_type.value} "
+            f"on {event.event_date.strftime('%Y-%m-%d')} "
+            f"(window: {blackout_start.strftime('%Y-%m-%d')} to {blackout_end.strftime('%Y-%m-%d')})"
+        )
+        return True
     
     def get_blocked_symbols(self, symbols: List[str], current_date: Optional[datetime] = None) -> Set[str]:
         """
@@ -162,10 +254,13 @@ class CorporateEventGuard:
         Returns:
             Set of blocked symbols
         """
-        blocked = set()
-        for symbol in symbols:
-            if self.is_symbol_blocked(symbol, current_date):
-                blocked.add(symbol)
+        if current_date is None:
+            current_date = datetime.now()
+
+        candidates = set(symbols)
+        blocked = (candidates & self._missing_data_symbols) | (candidates & self._calendar_blocked(current_date))
+        for symbol in sorted(blocked):
+            logger.debug(f"BLOCK {symbol}: corporate event blackout or missing data")
         return blocked
     
     def get_next_event(self, symbol: str, current_date: Optional[datetime] = None) -> Optional[CorporateEvent]:
@@ -182,13 +277,13 @@ class CorporateEventGuard:
         if current_date is None:
             current_date = datetime.now()
         
-        events = self._event_calendar.get(symbol, [])
-        future_events = [e for e in events if e.event_date >= current_date]
-        
-        if not future_events:
+        lo, hi = self._symbol_slices.get(symbol, (0, 0))
+        positions = self._by_symbol[lo:hi]
+        k = int(np.searchsorted(self._event_dates[positions], _to_datetime64(current_date), side="left"))
+        if k >= len(positions):
             return None
         
-        return min(future_events, key=lambda e: e.event_date)
+        return self._events[positions[k]]
     
     def filter_universe(self, symbols: List[str], current_date: Optional[datetime] = None) -> List[str]:
         """
@@ -226,17 +321,16 @@ class CorporateEventGuard:
         
         blocked = self.get_blocked_symbols(symbols, current_date)
         
-        # Count by event type
-        event_counts = {et.value: 0 for et in CorporateEventType}
-        
-        for symbol in blocked:
-            events = self._event_calendar.get(symbol, [])
-            for event in events:
-                blackout_start = event.event_date - timedelta(days=self.blackout_days_before)
-                blackout_end = event.event_date + timedelta(days=self.blackout_days_after)
-                
-                if blackout_start <= current_date <= blackout_end:
-                    event_counts[event.event_type.value] += 1
+        # Count active events by type for blocked symbols (single slice of the interval arrays)
+        active = self._active_slice(current_date)
+        wanted = np.array(
+            [self._symbol_index[s] for s in blocked if s in self._symbol_index], dtype=np.int64
+        )
+        in_blocked = np.isin(self._event_symbol_idx[active], wanted)
+        type_counts = np.bincount(
+            self._event_type_idx[active][in_blocked], minlength=len(self._event_types)
+        )
+        event_counts = {et.value: int(type_counts[i]) for i, et in enumerate(self._event_types)}
         
         return {
             "total_symbols": len(symbols),
@@ -248,6 +342,13 @@ class CorporateEventGuard:
         }
 
 
+def _to_datetime64(value: datetime) -> np.datetime64:
+    """Convert to naive datetime64[us]; aware datetimes are normalized to UTC."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return np.datetime64(value, "us")
+
+
 # Global singleton
 _event_guard: Optional[CorporateEventGuard] = None
 
@@ -12,10 +12,13 @@ Holidays:
 """
 
 import logging
-from datetime import datetime, time, timedelta
+import threading
+from datetime import date as date_type, datetime, time, timedelta
 from zoneinfo import ZoneInfo
 from typing import Optional, Tuple
 
+from markets.base import TradingHours
+from markets.calendar import SessionCalendar
 from policies.base import MarketHoursPolicy
 
 logger = logging.getLogger(__name__)
@@ -59,12 +62,34 @@ class IndiaEquityMarketHours(MarketHoursPolicy):
         (12, 25),  # Christmas
     ]
     
+    # Session calendar shared by all instances (the policy is stateless and
+    # is constructed per call in some paths)
+    _calendar: Optional[SessionCalendar] = None
+    _calendar_lock = threading.Lock()
+    
     def __init__(self):
         """Initialize India market hours policy."""
         self.tz = ZoneInfo(self.TIMEZONE)
         logger.info("IndiaEquityMarketHours initialized")
         logger.info(f"  Market hours: {self.MARKET_OPEN} - {self.MARKET_CLOSE} {self.TIMEZONE}")
     
+    @property
+    def calendar(self) -> SessionCalendar:
+        """Precomputed NSE session calendar (built once per process)."""
+        cls = type(self)
+        if cls._calendar is None:
+            with cls._calendar_lock:
+                if cls._calendar is None:
+                    cls._calendar = SessionCalendar(
+                        TradingHours(
+                            market_open=cls.MARKET_OPEN,
+                            market_close=cls.MARKET_CLOSE,
+                            timezone=cls.TIMEZONE,
+                        ),
+                        holidays=lambda year: [date_type(year, m, d) for m, d in cls.NSE_HOLIDAYS_2026],
+                    )
+        return cls._calendar
+    
     def get_name(self) -> str:
         """Get policy name."""
         return "IndiaEquityMarketHours"
@@ -99,20 +124,9 @@ class IndiaEquityMarketHours(MarketHoursPolicy):
         Returns:
             True if trading day, False otherwise
         """
-        # Convert to IST
+        # Convert to IST (naive datetimes are system local time)
         dt_ist = date.astimezone(self.tz)
-        
-        # Check weekend
-        if dt_ist.weekday() >= 5:  # Saturday = 5, Sunday = 6
-            return False
-        
-        # Check holidays
-        date_tuple = (dt_ist.month, dt_ist.day)
-        if date_tuple in self.NSE_HOLIDAYS_2026:
-            logger.debug(f"{dt_ist.date()} is NSE holiday")
-            return False
-        
-        return True
+        return self.calendar.is_trading_day(dt_ist.date())
     
     def get_market_open(self, date: datetime) -> datetime:
         """
@@ -165,15 +179,7 @@ class IndiaEquityMarketHours(MarketHoursPolicy):
         else:
             dt = dt.astimezone(self.tz)
         
-        # Check if trading day
-        if not self.is_trading_day(dt):
-            return False
-        
-        # Check if within trading hours
-        market_open = self.get_market_open(dt)
-        market_close = self.get_market_close(dt)
-        
-        return market_open <= dt <= market_close
+        return self.calendar.is_open(dt)
     
     def get_next_trading_day(self, date: datetime) -> datetime:
         """
@@ -2,7 +2,8 @@
 Autonomous position liquidation to restore account health.
 
 Detects cash violations, excessive portfolio heat, or manual cash targets,
-then sells lowest-priority positions (via PositionHealthScorer) until resolved.
+then sells the fewest lowest-priority positions (via PositionHealthScorer)
+that resolve it, submitting the close orders concurrently.
 Sets a cash reserve to prevent immediate redeployment of freed capital.
 
 Called during startup reconciliation, after portfolio hydration.
@@ -11,15 +12,17 @@ Called during startup reconciliation, after portfolio hydration.
 import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, timedelta
 from pathlib import Path
 from typing import List, Optional
 
+import numpy as np
 import pandas as pd
 
 from config.scope import get_scope
-from config.settings import CASH_ONLY_TRADING, MAX_PORTFOLIO_HEAT
+from config.settings import CASH_ONLY_TRADING, LIQUIDITY_MAX_WORKERS, MAX_PORTFOLIO_HEAT
 from risk.position_health import PositionHealthScorer, ScoredPosition
 from risk.portfolio_state import PortfolioState, OpenPosition
 
@@ -200,7 +203,6 @@ class LiquidityManager:
         # Log scoring table
         self._log_scoring_table(scored, eligible, skipped_pdt)
 
-        # Sell loop
         result = LiquidationResult(
             triggered=True,
             trigger_reason=trigger_reason,
@@ -211,11 +213,12 @@ class LiquidityManager:
             positions_skipped_pdt=[s.symbol for s in skipped_pdt],
         )
 
-        # Fix #2: Dynamic violation recheck after each sell.
-        # Instead of comparing deficit (risk units) against cash_freed (notional),
-        # recheck all violations with updated portfolio state after each sell.
+        # Fix #2: Plan sells against projected state instead of comparing
+        # deficit (risk units) against cash_freed (notional). The planner
+        # rechecks all violations with projected cash and heat after each
+        # candidate, then the chosen sells are submitted concurrently.
         #
-        # Preserve trading-state counters across the sell loop.
+        # Preserve trading-state counters across the sells.
         # Liquidation is a risk-management action, not a trading decision —
         # forced sells must not inflate consecutive_losses or daily_pnl,
         # which would block tonight's ML entries via the kill-switch gates.
@@ -224,27 +227,15 @@ class LiquidityManager:
         saved_daily_pnl = self.portfolio.daily_pnl
         saved_daily_trades_closed = self.portfolio.daily_trades_closed
 
-        cash_freed = 0.0
-        running_cash = account_cash
-        for sp in eligible:
-            # Recheck violations with updated portfolio + running cash
-            remaining_deficit, _, _ = self._detect_violations(
-                running_cash, account_equity, target_cash
-            )
-            if remaining_deficit <= 0:
-                break
-
-            success = self._sell_position(sp, result)
-            if success:
-                running_cash += sp.notional_value
-                cash_freed += sp.notional_value
-                result.positions_sold.append(sp.symbol)
-                logger.info(
-                    "LIQUIDATING | %s | score=%.1f | notional=$%.2f | "
-                    "pnl=%.2f%% | freed_so_far=$%.2f | remaining_deficit=$%.2f",
-                    sp.symbol, sp.score, sp.notional_value,
-                    sp.unrealized_pnl_pct, cash_freed, remaining_deficit,
-                )
+        plan = self._plan_liquidation(
+            eligible, skipped_pdt, account_cash, account_equity, target_cash
+        )
+        logger.info(
+            "LIQUIDATION_PLAN | symbols=%s | notional=$%.2f",
+            ",".join(lots[0].symbol for lots in plan) or "none",
+            sum(sp.notional_value for lots in plan for sp in lots),
+        )
+        cash_freed = self._execute_plan(plan, result)
 
         # Restore trading-state counters — liquidation sells are not trades.
         # current_equity is intentionally NOT restored (reflects real account value).
@@ -295,13 +286,17 @@ class LiquidityManager:
         account_cash: float,
         account_equity: float,
         target_cash: Optional[float],
+        total_risk: Optional[float] = None,
     ) -> tuple:
         """
         Detect ALL liquidity violations and return the largest deficit.
 
-        Evaluates every violation type independently so that the sell loop
+        Evaluates every violation type independently so that the sell plan
         covers the worst case (e.g. heat deficit >> cash deficit).
 
+        Args:
+            total_risk: Projected open risk (default: current book total)
+
         Returns:
             (max_deficit, primary_reason, all_violations_list)
         """
@@ -335,12 +330,9 @@ class LiquidityManager:
             ))
 
         # 3. Heat exceeded
+        if total_risk is None:
+            total_risk = self.portfolio.book.total_risk
         if account_equity > 0:
-            total_risk = sum(
-                pos.risk_amount
-                for positions in self.portfolio.open_positions.values()
-                for pos in positions
-            )
             heat = total_risk / account_equity
             if heat > MAX_PORTFOLIO_HEAT:
                 excess_risk = total_risk - (account_equity * MAX_PORTFOLIO_HEAT)
@@ -398,90 +390,200 @@ class LiquidityManager:
 
         return eligible, skipped
 
-    def _sell_position(self, sp: ScoredPosition, result: LiquidationResult) -> bool:
+    def _plan_liquidation(
+        self,
+        eligible: List[ScoredPosition],
+        skipped_pdt: List[ScoredPosition],
+        account_cash: float,
+        account_equity: float,
+        target_cash: Optional[float],
+    ) -> List[List[ScoredPosition]]:
         """
-        Sell a single position via broker.close_position() and update portfolio state.
+        Choose the smallest set of symbols whose sale cures every violation.
 
-        Returns True if successful.
+        broker.close_position() sells a whole symbol, so candidates are
+        symbols (all eligible lots), ordered by their lowest-scored lot.
+        Symbols with a PDT-skipped lot are left alone. Candidates are added
+        in priority order until the projected cash and heat clear all
+        violations, then any chosen symbol that is not needed is dropped,
+        most protected first.
+
+        Returns:
+            Lot groups to sell, in priority order (all candidates if the
+            violation cannot be cured)
         """
-        try:
-            logger.info(
-                "LIQUIDATION_ORDER_SUBMIT | %s | qty=%.6f | notional=$%.2f | "
-                "entry=$%.2f | current=$%.2f",
-                sp.symbol, sp.position_size, sp.notional_value,
-                sp.entry_price, sp.current_price,
+        pdt_symbols = {sp.symbol for sp in skipped_pdt}
+        groups: dict = {}
+        for sp in eligible:
+            if sp.symbol not in pdt_symbols:
+                groups.setdefault(sp.symbol, []).append(sp)
+        candidates = list(groups.values())
+
+        cash = np.array([sum(sp.notional_value for sp in g) for g in candidates])
+        risk = np.array([sum(sp.risk_amount for sp in g) for g in candidates])
+        total_risk = self.portfolio.book.total_risk
+
+        def cured(selected: List[int]) -> bool:
+            deficit, _, _ = self._detect_violations(
+                account_cash + cash[selected].sum(),
+                account_equity,
+                target_cash,
+                total_risk=total_risk - risk[selected].sum(),
             )
+            return deficit <= 0
 
-            order_result = self.broker.close_position(sp.symbol)
+        selected: List[int] = []
+        for i in range(len(candidates)):
+            selected.append(i)
+            if cured(selected):
+                break
+        else:
+            return candidates
 
-            logger.info(
-                "LIQUIDATION_ORDER_RESULT | %s | order_id=%s | status=%s | "
-                "filled_qty=%.6f | filled_price=%s | side=%s",
-                sp.symbol,
-                order_result.order_id,
-                order_result.status.value,
-                order_result.filled_qty,
-                f"${order_result.filled_price:.4f}" if order_result.filled_price else "None",
-                order_result.side,
-            )
+        for i in reversed(selected[:-1]):
+            trial = [j for j in selected if j != i]
+            if cured(trial):
+                selected = trial
 
-            # Fix #4: Distinguish filled vs pending orders
-            if order_result.is_filled():
-                exit_price = order_result.filled_price or sp.current_price
-                logger.info(
-                    "LIQUIDATION_FILLED | %s | exit_price=$%.4f | order_id=%s",
-                    sp.symbol, exit_price, order_result.order_id,
-                )
-            elif order_result.is_pending():
-                exit_price = sp.current_price  # estimate
-                logger.warning(
-                    "LIQUIDATION_PENDING | %s | estimated_price=$%.4f | order_id=%s | "
-                    "order is pending, not yet filled",
-                    sp.symbol, exit_price, order_result.order_id,
-                )
-            else:
-                error_msg = (
-                    f"Order not filled for {sp.symbol}: "
-                    f"status={order_result.status.value}, "
-                    f"reason={order_result.rejection_reason}"
-                )
-                logger.error("LIQUIDATION_FAILED | %s", error_msg)
-                result.errors.append(error_msg)
-                return False
+        return [candidates[i] for i in selected]
 
-            # Update portfolio state
-            self.portfolio.close_trade(
-                symbol=sp.symbol,
-                exit_date=pd.Timestamp.now(tz="UTC"),
-                exit_price=exit_price,
-            )
+    def _execute_plan(self, plan: List[List[ScoredPosition]], result: LiquidationResult) -> float:
+        """
+        Submit all planned sells, then apply fills in plan order.
+
+        Sells run in parallel (up to LIQUIDITY_MAX_WORKERS) only when the
+        broker sets supports_concurrent_orders; otherwise they are submitted
+        one at a time so nonce-signed requests stay ordered.
+
+        Portfolio updates and ledger records happen on the calling thread;
+        the ledger is persisted once for the whole batch.
+
+        Returns:
+            Cash freed (notional of sold lots)
+        """
+        if not plan:
+            return 0.0
+
+        workers = 1
+        if getattr(self.broker, "supports_concurrent_orders", False):
+            workers = max(1, min(len(plan), LIQUIDITY_MAX_WORKERS))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="liquidate") as pool:
+            futures = [pool.submit(self._submit_close, lots[0].symbol, lots) for lots in plan]
+
+        cash_freed = 0.0
+        trades = []
+        for lots, future in zip(plan, futures):
+            sp = lots[0]
+            try:
+                order_result = future.result()
+            except Exception as e:
+                error_msg = f"Exception closing {sp.symbol}: {e}"
+                logger.error("LIQUIDATION_ERROR | %s", error_msg, exc_info=e)
+                result.errors.append(error_msg)
+                continue
+
+            exit_price = self._exit_price(sp, order_result, result)
+            if exit_price is None:
+                continue
+
+            # Update portfolio state (one FIFO close per lot)
+            notional = 0.0
+            for lot in lots:
+                self.portfolio.close_trade(
+                    symbol=lot.symbol,
+                    exit_date=pd.Timestamp.now(tz="UTC"),
+                    exit_price=exit_price,
+                )
+                notional += lot.notional_value
+                if self.trade_ledger:
+                    trade = self._build_ledger_trade(lot, order_result, exit_price)
+                    if trade is not None:
+                        trades.append(trade)
             logger.info(
-                "LIQUIDATION_PORTFOLIO_UPDATED | %s | exit_price=$%.4f | "
+                "LIQUIDATION_PORTFOLIO_UPDATED | %s | exit_price=$%.4f | lots=%d | "
                 "remaining_positions=%d",
-                sp.symbol, exit_price,
+                sp.symbol, exit_price, len(lots),
                 sum(len(v) for v in self.portfolio.open_positions.values()),
             )
 
-            # Fix #6: Record trade in ledger
-            if self.trade_ledger:
-                self._record_trade_in_ledger(sp, order_result, exit_price)
+            cash_freed += notional
+            result.positions_sold.append(sp.symbol)
+            logger.info(
+                "LIQUIDATING | %s | score=%.1f | notional=$%.2f | "
+                "pnl=%.2f%% | freed_so_far=$%.2f",
+                sp.symbol, sp.score, notional, sp.unrealized_pnl_pct, cash_freed,
+            )
 
-            return True
+        # Fix #6: Record trades in ledger (single persist for the batch)
+        if trades:
+            self._record_trades_in_ledger(trades)
 
-        except Exception as e:
-            error_msg = f"Exception closing {sp.symbol}: {e}"
-            logger.error("LIQUIDATION_ERROR | %s", error_msg, exc_info=True)
-            result.errors.append(error_msg)
-            return False
+        return cash_freed
+
+    def _submit_close(self, symbol: str, lots: List[ScoredPosition]):
+        """Submit broker.close_position() for one symbol (worker thread)."""
+        logger.info(
+            "LIQUIDATION_ORDER_SUBMIT | %s | lots=%d | qty=%.6f | notional=$%.2f | "
+            "entry=$%.2f | current=$%.2f",
+            symbol, len(lots),
+            sum(sp.position_size for sp in lots),
+            sum(sp.notional_value for sp in lots),
+            lots[0].entry_price, lots[0].current_price,
+        )
+
+        order_result = self.broker.close_position(symbol)
+
+        logger.info(
+            "LIQUIDATION_ORDER_RESULT | %s | order_id=%s | status=%s | "
+            "filled_qty=%.6f | filled_price=%s | side=%s",
+            symbol,
+            order_result.order_id,
+            order_result.status.value,
+            order_result.filled_qty,
+            f"${order_result.filled_price:.4f}" if order_result.filled_price else "None",
+            order_result.side,
+        )
+        return order_result
+
+    def _exit_price(self, sp: ScoredPosition, order_result, result: LiquidationResult) -> Optional[float]:
+        """
+        Exit price for a close order, or None (error recorded) if it failed.
+        """
+        # Fix #4: Distinguish filled vs pending orders
+        if order_result.is_filled():
+            exit_price = order_result.filled_price or sp.current_price
+            logger.info(
+                "LIQUIDATION_FILLED | %s | exit_price=$%.4f | order_id=%s",
+                sp.symbol, exit_price, order_result.order_id,
+            )
+            return exit_price
 
-    def _record_trade_in_ledger(self, sp: ScoredPosition, order_result, exit_price: float) -> None:
-        """Record a liquidation sell in the trade ledger."""
+        if order_result.is_pending():
+            exit_price = sp.current_price  # estimate
+            logger.warning(
+                "LIQUIDATION_PENDING | %s | estimated_price=$%.4f | order_id=%s | "
+                "order is pending, not yet filled",
+                sp.symbol, exit_price, order_result.order_id,
+            )
+            return exit_price
+
+        error_msg = (
+            f"Order not filled for {sp.symbol}: "
+            f"status={order_result.status.value}, "
+            f"reason={order_result.rejection_reason}"
+        )
+        logger.error("LIQUIDATION_FAILED | %s", error_msg)
+        result.errors.append(error_msg)
+        return None
+
+    def _build_ledger_trade(self, sp: ScoredPosition, order_result, exit_price: float):
+        """Ledger Trade for one liquidated lot (None on error)."""
         try:
             from broker.trade_ledger import create_trade_from_fills
 
             entry_date_str = sp.entry_date.isoformat() if hasattr(sp.entry_date, "isoformat") else str(sp.entry_date)
 
-            trade = create_trade_from_fills(
+            return create_trade_from_fills(
                 symbol=sp.symbol,
                 entry_order_id=f"HYDRATED_{sp.symbol}",
                 entry_fill_timestamp=entry_date_str,
@@ -497,27 +599,32 @@ class LiquidityManager:
                 risk_amount=None,
                 fees=0.0,
             )
-            self.trade_ledger.add_trade(trade)
+        except Exception as e:
+            logger.error("LIQUIDATION_LEDGER_ERROR | %s | %s", sp.symbol, e)
+            return None
 
-            # Remove from ledger open_positions if present
-            if hasattr(self.trade_ledger, "_open_positions") and sp.symbol in self.trade_ledger._open_positions:
-                del self.trade_ledger._open_positions[sp.symbol]
-                self.trade_ledger._save_open_positions()
+    def _record_trades_in_ledger(self, trades: list) -> None:
+        """Record liquidation sells in the trade ledger with one persist."""
+        try:
+            self.trade_ledger.add_trades(trades)
 
-            logger.info("LIQUIDATION_LEDGER_RECORDED | %s | trade_id=%s", sp.symbol, trade.trade_id)
+            # Remove from ledger open_positions if present
+            open_positions = getattr(self.trade_ledger, "_open_positions", None)
+            if open_positions is not None:
+                removed = [t.symbol for t in trades if open_positions.pop(t.symbol, None) is not None]
+                if removed:
+                    self.trade_ledger._save_open_positions()
+
+            for trade in trades:
+                logger.info("LIQUIDATION_LEDGER_RECORDED | %s | trade_id=%s", trade.symbol, trade.trade_id)
         except Exception as e:
-            logger.error("LIQUIDATION_LEDGER_ERROR | %s | %s", sp.symbol, e)
+            logger.error("LIQUIDATION_LEDGER_ERROR | %s", e)
 
     def _compute_heat(self, equity: float) -> float:
         """Compute current portfolio heat."""
         if equity <= 0:
             return 0.0
-        total_risk = sum(
-            pos.risk_amount
-            for positions in self.portfolio.open_positions.values()
-            for pos in positions
-        )
-        return total_risk / equity
+        return self.portfolio.book.total_risk / equity
 
     def _save_cash_reserve(self, reserve: CashReserve) -> None:
         """Persist cash reserve to disk."""
@@ -13,11 +13,26 @@ from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import pandas as pd
 
+from monitoring.trade_stats import TradeStats
+from risk.position_book import PositionBook
+
 logger = logging.getLogger(__name__)
 
 
 class OpenPosition:
-    """Represents a single open position."""
+    """
+    Represents a single open position.
+    
+    Standalone positions hold their own values. Once opened in a
+    PortfolioState, the position becomes a view onto its slot in the
+    PositionBook arrays, so bulk price updates are visible here.
+    """
+    
+    __slots__ = (
+        "symbol", "entry_date", "confidence",
+        "_entry_price", "_position_size", "_risk_amount", "_current_price",
+        "_book", "_slot",
+    )
     
     def __init__(
         self,
@@ -41,21 +56,57 @@ class OpenPosition:
         """
         self.symbol = symbol
         self.entry_date = entry_date
-        self.entry_price = entry_price
-        self.position_size = position_size
-        self.risk_amount = risk_amount
         self.confidence = confidence
-        self.unrealized_pnl = 0.0
-        self.current_price = entry_price
+        self._entry_price = entry_price
+        self._position_size = position_size
+        self._risk_amount = risk_amount
+        self._current_price = entry_price
+        self._book: Optional[PositionBook] = None
+        self._slot = -1
+    
+    @property
+    def entry_price(self) -> float:
+        return self._entry_price
+    
+    @property
+    def position_size(self) -> float:
+        return self._position_size
+    
+    @property
+    def risk_amount(self) -> float:
+        return self._risk_amount
+    
+    @property
+    def current_price(self) -> float:
+        if self._book is not None:
+            return float(self._book._price[self._slot])
+        return self._current_price
+    
+    @property
+    def unrealized_pnl(self) -> float:
+        return (self.current_price - self._entry_price) * self._position_size
     
     def update_price(self, current_price: float) -> None:
         """Update unrealized P&L based on current price."""
-        self.current_price = current_price
-        self.unrealized_pnl = (current_price - self.entry_price) * self.position_size
+        if self._book is not None:
+            self._book.set_price(self._slot, current_price)
+        else:
+            self._current_price = current_price
     
     def get_current_value(self) -> float:
         """Get current position value at market price."""
-        return self.current_price * self.position_size
+        return self.current_price * self._position_size
+    
+    def _bind(self, book: PositionBook, slot: int) -> None:
+        """Attach to a PositionBook slot (values already copied in)."""
+        self._book = book
+        self._slot = slot
+    
+    def _unbind(self) -> None:
+        """Detach from the book, keeping the last known price."""
+        self._current_price = float(self._book._price[self._slot])
+        self._book = None
+        self._slot = -1
     
     def __repr__(self) -> str:
         return (
@@ -87,8 +138,10 @@ class PortfolioState:
         self.current_equity = initial_equity
         self.available_capital = initial_equity
         
-        # Open positions: symbol -> list of OpenPosition
-        self.open_positions: Dict[str, List[OpenPosition]] = {}
+        # Open positions: symbol -> list of OpenPosition (views onto the book).
+        # Read-only for callers; use open_trade/close_trade to mutate.
+        self.book = PositionBook()
+        self.open_positions: Dict[str, List[OpenPosition]] = self.book.positions
         
         # Daily tracking
         self.daily_start_date: Optional[pd.Timestamp] = None
@@ -104,6 +157,12 @@ class PortfolioState:
         # History tracking
         self.equity_history: List[Tuple[pd.Timestamp, float]] = [(pd.Timestamp.now(), initial_equity)]
         self.trades_closed: List[Dict] = []
+        self._trade_stats: Optional[TradeStats] = None  # Rebuilt when trades_closed grows
+
+        # Running drawdown, updated on every equity change (trade close, broker sync)
+        self.peak_equity: float = initial_equity
+        self.max_drawdown_pct: float = 0.0
+        self._equity_synced = False
 
         # Cash reserve set by LiquidityManager after selling positions
         self.cash_reserve = None
@@ -136,6 +195,9 @@ class PortfolioState:
         self.available_capital = self.current_equity
         if self.daily_start_date is None:
             self.daily_start_equity = self.current_equity
+        # First broker snapshot replaces the configured initial equity as the baseline
+        self._record_equity(self.current_equity, reset=not self._equity_synced)
+        self._equity_synced = True
         logger.info(
             "Portfolio synced from broker: equity=$%.2f cash=$%.2f buying_power=$%.2f cash_only=%s"
             % (equity, cash, buying_power, cash_only)
@@ -161,9 +223,6 @@ class PortfolioState:
             risk_amount: Dollar amount at risk
             confidence: Confidence score (1-5)
         """
-        if symbol not in self.open_positions:
-            self.open_positions[symbol] = []
-        
         position = OpenPosition(
             symbol=symbol,
             entry_date=entry_date,
@@ -172,7 +231,7 @@ class PortfolioState:
             risk_amount=risk_amount,
             confidence=confidence,
         )
-        self.open_positions[symbol].append(position)
+        self.book.open(position)
         self.daily_trades_opened += 1
         
         logger.debug(f"Opened position: {position}")
@@ -197,7 +256,7 @@ class PortfolioState:
         if symbol not in self.open_positions or not self.open_positions[symbol]:
             return None
         
-        position = self.open_positions[symbol].pop(0)  # FIFO
+        position = self.book.close_first(symbol)  # FIFO
         position.update_price(exit_price)
         
         # Record trade
@@ -229,6 +288,7 @@ class PortfolioState:
         # Update equity
         self.current_equity += pnl
         self.daily_pnl += pnl
+        self._record_equity(self.current_equity)
         
         logger.debug(
             f"Closed position: {symbol} @ {exit_price:.2f}, "
@@ -237,6 +297,25 @@ class PortfolioState:
         
         return trade_dict
     
+    def _record_equity(self, equity: float, reset: bool = False) -> None:
+        """
+        Fold a new equity value into the running peak and max drawdown.
+
+        Args:
+            equity: Current equity
+            reset: Restart tracking from this value (new baseline)
+        """
+        if reset:
+            self.peak_equity = equity
+            self.max_drawdown_pct = 0.0
+            return
+        if equity > self.peak_equity:
+            self.peak_equity = equity
+        elif self.peak_equity > 0:
+            drawdown = (self.peak_equity - equity) / self.peak_equity
+            if drawdown > self.max_drawdown_pct:
+                self.max_drawdown_pct = drawdown
+
     def update_equity_at_date(self, current_date: pd.Timestamp) -> None:
         """
         Update daily tracking for new date.
@@ -262,20 +341,35 @@ class PortfolioState:
         Returns:
             Total portfolio heat as % of current equity
         """
-        total_risk = 0.0
-        
-        for symbol, positions in self.open_positions.items():
-            for position in positions:
-                if symbol in current_prices:
-                    position.update_price(current_prices[symbol])
-                total_risk += position.risk_amount
+        self.book.update_prices(current_prices)
         
         if self.current_equity <= 0:
             return 100.0  # Safety valve
         
-        heat = total_risk / self.current_equity
+        heat = self.book.total_risk / self.current_equity
         return heat
     
+    def update_prices(self, current_prices: Dict[str, float]) -> None:
+        """
+        Bulk-update current prices of open positions.
+        
+        Args:
+            current_prices: Symbol -> current price dict
+        """
+        self.book.update_prices(current_prices)
+    
+    def get_symbol_risk(self, symbol: str) -> float:
+        """
+        Get total dollar risk of open positions in a symbol.
+        
+        Args:
+            symbol: Stock ticker
+        
+        Returns:
+            Sum of risk_amount across the symbol's open lots
+        """
+        return self.book.symbol_risk(symbol)
+    
     def get_symbol_exposure(self, symbol: str) -> float:
         """
         Get total exposure to a symbol as % of equity.
@@ -289,9 +383,7 @@ class PortfolioState:
         if symbol not in self.open_positions:
             return 0.0
         
-        total_value = sum(
-            pos.get_current_value() for pos in self.open_positions[symbol]
-        )
+        total_value = self.book.symbol_value(symbol)
         
         if self.current_equity <= 0:
             return 100.0
@@ -305,11 +397,7 @@ class PortfolioState:
         Returns:
             Available capital (current equity - open position value)
         """
-        total_open_value = sum(
-            pos.get_current_value()
-            for positions in self.open_positions.values()
-            for pos in positions
-        )
+        total_open_value = self.book.total_value
 
         available = max(0.0, self.current_equity - total_open_value)
 
@@ -323,9 +411,7 @@ class PortfolioState:
     
     def get_open_positions_count(self) -> int:
         """Get total number of open positions."""
-        return sum(
-            len(positions) for positions in self.open_positions.values()
-        )
+        return self.book.count
     
     def get_open_symbols(self) -> List[str]:
         """Get list of symbols with open positions."""
@@ -363,8 +449,22 @@ class PortfolioState:
         if not self.trades_closed:
             return 0.0
         
-        winning_trades = sum(1 for t in self.trades_closed if t['return'] >= 0)
-        return 100 * winning_trades / len(self.trades_closed)
+        return 100 * self.get_trade_stats().win_rate(breakeven_is_win=True)
+    
+    def get_trade_stats(self) -> TradeStats:
+        """
+        Get columnar statistics over closed trades (cached).
+        
+        Returns:
+            TradeStats (returns=return, pnl=return, confidence=confidence)
+        """
+        if self._trade_stats is None or len(self._trade_stats) != len(self.trades_closed):
+            self._trade_stats = TradeStats.from_trades(
+                self.trades_closed,
+                returns="return",
+                confidence="confidence",
+            )
+        return self._trade_stats
     
     def get_summary(self) -> Dict:
         """
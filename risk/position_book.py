@@ -0,0 +1,211 @@
+"""
+Array-backed position book for PortfolioState.
+
+Open positions are stored in parallel NumPy arrays (symbol index, qty,
+entry price, risk amount, current price). OpenPosition objects are thin
+__slots__ views onto a slot in those arrays, so existing callers that
+iterate `portfolio.open_positions[symbol]` keep working.
+
+Portfolio-wide and per-symbol totals (risk, market value, cost basis)
+are maintained incrementally on open, close and price update, making
+heat and exposure queries O(1) and bulk price updates O(symbols priced).
+"""
+
+import logging
+from typing import Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class PositionBook:
+    """
+    Parallel-array storage for open position lots.
+
+    `positions` is the symbol -> FIFO list of OpenPosition views exposed as
+    PortfolioState.open_positions. Mutate it only through open()/close_first().
+    """
+
+    def __init__(self, capacity: int = 64):
+        """
+        Initialize an empty book.
+
+        Args:
+            capacity: Initial number of position slots (grows by doubling)
+        """
+        self._qty = np.zeros(capacity)
+        self._entry = np.zeros(capacity)
+        self._risk = np.zeros(capacity)
+        self._price = np.zeros(capacity)
+        self._symbol_idx = np.full(capacity, -1, dtype=np.int64)
+        self._free: List[int] = list(range(capacity - 1, -1, -1))
+
+        # Per-symbol aggregates, indexed by symbol index
+        self._symbols: List[str] = []
+        self._symbol_index: Dict[str, int] = {}
+        self._symbol_qty = np.zeros(16)
+        self._symbol_risk = np.zeros(16)
+        self._symbol_value = np.zeros(16)
+        self._symbol_cost = np.zeros(16)
+
+        # Slots per symbol in FIFO order, mirrored by `positions`
+        self._slots: Dict[str, List[int]] = {}
+        self.positions: Dict[str, list] = {}
+
+        self.count = 0
+        self.total_risk = 0.0
+        self.total_value = 0.0
+        self.total_cost = 0.0
+
+    # ------------------------------------------------------------------
+    # Open / close
+    # ------------------------------------------------------------------
+
+    def open(self, position) -> None:
+        """Store a position's values in a free slot and bind it as a view."""
+        slot = self._alloc_slot()
+        sidx = self._symbol_slot(position.symbol)
+
+        qty = float(position.position_size)
+        entry = float(position.entry_price)
+        risk = float(position.risk_amount)
+        price = float(position.current_price)
+
+        self._qty[slot] = qty
+        self._entry[slot] = entry
+        self._risk[slot] = risk
+        self._price[slot] = price
+        self._symbol_idx[slot] = sidx
+
+        self._symbol_qty[sidx] += qty
+        self._symbol_risk[sidx] += risk
+        self._symbol_value[sidx] += price * qty
+        self._symbol_cost[sidx] += entry * qty
+        self.total_risk += risk
+        self.total_value += price * qty
+        self.total_cost += entry * qty
+        self.count += 1
+
+        self._slots.setdefault(position.symbol, []).append(slot)
+        self.positions.setdefault(position.symbol, []).append(position)
+        position._bind(self, slot)
+
+    def close_first(self, symbol: str):
+        """
+        Remove and return the oldest lot for a symbol (FIFO).
+
+        The returned OpenPosition is detached and keeps its last values.
+        """
+        slots = self._slots.get(symbol)
+        if not slots:
+            return None
+
+        slot = slots.pop(0)
+        position = self.positions[symbol].pop(0)
+        position._unbind()
+
+        sidx = int(self._symbol_idx[slot])
+        qty = self._qty[slot]
+        price = self._price[slot]
+        entry = self._entry[slot]
+        risk = self._risk[slot]
+
+        self.count -= 1
+        if slots:
+            self._symbol_qty[sidx] -= qty
+            self._symbol_risk[sidx] -= risk
+            self._symbol_value[sidx] -= price * qty
+            self._symbol_cost[sidx] -= entry * qty
+        else:
+            # Reset to exact zero so float drift cannot accumulate
+            self._symbol_qty[sidx] = 0.0
+            self._symbol_risk[sidx] = 0.0
+            self._symbol_value[sidx] = 0.0
+            self._symbol_cost[sidx] = 0.0
+
+        if self.count == 0:
+            self.total_risk = 0.0
+            self.total_value = 0.0
+            self.total_cost = 0.0
+        else:
+            self.total_risk -= risk
+            self.total_value -= price * qty
+            self.total_cost -= entry * qty
+
+        self._symbol_idx[slot] = -1
+        self._free.append(slot)
+        return position
+
+    # ------------------------------------------------------------------
+    # Prices
+    # ------------------------------------------------------------------
+
+    def set_price(self, slot: int, price: float) -> None:
+        """Update one lot's current price and the running market value."""
+        delta = (price - self._price[slot]) * self._qty[slot]
+        self._price[slot] = price
+        self._symbol_value[self._symbol_idx[slot]] += delta
+        self.total_value += delta
+
+    def update_prices(self, prices: Dict[str, float]) -> None:
+        """
+        Bulk-update current prices.
+
+        Cost is proportional to the number of priced symbols; symbols
+        without open lots are ignored.
+        """
+        for symbol, price in prices.items():
+            slots = self._slots.get(symbol)
+            if not slots:
+                continue
+            sidx = self._symbol_index[symbol]
+            price = float(price)
+            self._price[slots] = price
+            new_value = price * self._symbol_qty[sidx]
+            self.total_value += new_value - self._symbol_value[sidx]
+            self._symbol_value[sidx] = new_value
+
+    # ------------------------------------------------------------------
+    # Aggregates
+    # ------------------------------------------------------------------
+
+    def symbol_risk(self, symbol: str) -> float:
+        sidx = self._symbol_index.get(symbol)
+        return float(self._symbol_risk[sidx]) if sidx is not None else 0.0
+
+    def symbol_value(self, symbol: str) -> float:
+        sidx = self._symbol_index.get(symbol)
+        return float(self._symbol_value[sidx]) if sidx is not None else 0.0
+
+    @property
+    def total_unrealized_pnl(self) -> float:
+        return self.total_value - self.total_cost
+
+    # ------------------------------------------------------------------
+    # Slot management
+    # ------------------------------------------------------------------
+
+    def _alloc_slot(self) -> int:
+        if not self._free:
+            old = len(self._qty)
+            new = old * 2
+            for name in ("_qty", "_entry", "_risk", "_price"):
+                setattr(self, name, np.concatenate([getattr(self, name), np.zeros(old)]))
+            self._symbol_idx = np.concatenate([self._symbol_idx, np.full(old, -1, dtype=np.int64)])
+            self._free = list(range(new - 1, old - 1, -1))
+        return self._free.pop()
+
+    def _symbol_slot(self, symbol: str) -> int:
+        sidx = self._symbol_index.get(symbol)
+        if sidx is not None:
+            return sidx
+
+        sidx = len(self._symbols)
+        self._symbols.append(symbol)
+        self._symbol_index[symbol] = sidx
+        if sidx >= len(self._symbol_qty):
+            grow = len(self._symbol_qty)
+            for name in ("_symbol_qty", "_symbol_risk", "_symbol_value", "_symbol_cost"):
+                setattr(self, name, np.concatenate([getattr(self, name), np.zeros(grow)]))
+        return sidx
@@ -14,6 +14,7 @@ import logging
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
 from risk.portfolio_state import OpenPosition
@@ -34,6 +35,7 @@ class ScoredPosition:
     unrealized_pnl_pct: float
     holding_days: int
     confidence: int
+    risk_amount: float = 0.0
     score_breakdown: Dict[str, float] = field(default_factory=dict)
 
 
@@ -65,6 +67,8 @@ class PositionHealthScorer:
         """
         Score all positions and return sorted ascending (sell first).
 
+        Components are computed over arrays for the whole batch.
+
         Args:
             positions: List of OpenPosition objects
             today: Current date for staleness calculation
@@ -82,64 +86,63 @@ class PositionHealthScorer:
         if today.tzinfo is None:
             today = today.tz_localize("UTC")
 
-        # Pre-compute max notional for size normalization
-        notional_values = []
-        for pos in positions:
-            notional_values.append(pos.current_price * pos.position_size)
-        max_notional = max(notional_values) if notional_values else 1.0
-
-        scored = []
-        for pos, notional in zip(positions, notional_values):
-            entry_date = pos.entry_date
-            if entry_date.tzinfo is None:
-                entry_date = entry_date.tz_localize("UTC")
-
-            holding_days = (today - entry_date).days
-
-            pnl_pct = (
-                (pos.current_price - pos.entry_price) / pos.entry_price
-                if pos.entry_price > 0
-                else 0.0
-            )
-
-            # Score each component
-            pnl_score = self._score_pnl(pnl_pct)
-            staleness_score = self._score_staleness(holding_days)
-            confidence_score = self._score_confidence(pos.confidence)
-            size_score = self._score_size(notional, max_notional)
-
-            # Weighted total
-            total = (
-                self.WEIGHT_PNL * pnl_score
-                + self.WEIGHT_STALENESS * staleness_score
-                + self.WEIGHT_CONFIDENCE * confidence_score
-                + self.WEIGHT_SIZE * size_score
-            )
-
-            scored.append(ScoredPosition(
+        current = np.array([pos.current_price for pos in positions], dtype=float)
+        entry = np.array([pos.entry_price for pos in positions], dtype=float)
+        size = np.array([pos.position_size for pos in positions], dtype=float)
+        confidence = np.array([pos.confidence for pos in positions], dtype=float)
+        risk = np.array([pos.risk_amount for pos in positions], dtype=float)
+
+        # Naive entry dates are UTC; floor to whole days like Timedelta.days
+        entry_dates = pd.to_datetime([pos.entry_date for pos in positions], utc=True)
+        holding_days = np.asarray((today - entry_dates).days, dtype=np.int64)
+
+        notional = current * size
+        pnl_pct = np.divide(
+            current - entry, entry, out=np.zeros_like(entry), where=entry > 0
+        )
+
+        # Score each component
+        pnl_score = self._score_pnl(pnl_pct)
+        staleness_score = self._score_staleness(holding_days)
+        confidence_score = self._score_confidence(confidence)
+        size_score = self._score_size(notional, float(notional.max()))
+
+        # Weighted total
+        total = (
+            self.WEIGHT_PNL * pnl_score
+            + self.WEIGHT_STALENESS * staleness_score
+            + self.WEIGHT_CONFIDENCE * confidence_score
+            + self.WEIGHT_SIZE * size_score
+        )
+
+        scored = [
+            ScoredPosition(
                 symbol=pos.symbol,
-                score=round(total, 1),
+                score=round(float(total[i]), 1),
                 entry_date=pos.entry_date,
                 entry_price=pos.entry_price,
-                current_price=pos.current_price,
+                current_price=float(current[i]),
                 position_size=pos.position_size,
-                notional_value=round(notional, 2),
-                unrealized_pnl_pct=round(pnl_pct * 100, 2),
-                holding_days=holding_days,
+                notional_value=round(float(notional[i]), 2),
+                unrealized_pnl_pct=round(float(pnl_pct[i]) * 100, 2),
+                holding_days=int(holding_days[i]),
                 confidence=pos.confidence,
+                risk_amount=float(risk[i]),
                 score_breakdown={
-                    "pnl": round(pnl_score, 1),
-                    "staleness": round(staleness_score, 1),
-                    "confidence": round(confidence_score, 1),
-                    "size": round(size_score, 1),
+                    "pnl": round(float(pnl_score[i]), 1),
+                    "staleness": round(float(staleness_score[i]), 1),
+                    "confidence": round(float(confidence_score[i]), 1),
+                    "size": round(float(size_score[i]), 1),
                 },
-            ))
+            )
+            for i, pos in enumerate(positions)
+        ]
 
         # Sort ascending: lowest score = sell first
         scored.sort(key=lambda s: s.score)
         return scored
 
-    def _score_pnl(self, pnl_pct: float) -> float:
+    def _score_pnl(self, pnl_pct: np.ndarray) -> np.ndarray:
         """
         Score P&L component.
 
@@ -148,17 +151,12 @@ class PositionHealthScorer:
         At/below -10% -> 100 (keep: avoid crystallizing big loss)
         Linear interpolation between anchors.
         """
-        if pnl_pct >= self.PNL_TARGET_PCT:
-            return 0.0
-        if pnl_pct <= self.PNL_LOSS_PCT:
-            return 100.0
-
         # Linear interpolation: -10% -> 100, +10% -> 0
         range_pct = self.PNL_TARGET_PCT - self.PNL_LOSS_PCT  # 0.20
         normalized = (self.PNL_TARGET_PCT - pnl_pct) / range_pct
-        return max(0.0, min(100.0, normalized * 100.0))
+        return np.clip(normalized * 100.0, 0.0, 100.0)
 
-    def _score_staleness(self, holding_days: int) -> float:
+    def _score_staleness(self, holding_days: np.ndarray) -> np.ndarray:
         """
         Score staleness component.
 
@@ -166,14 +164,9 @@ class PositionHealthScorer:
         0 days -> 100 (keep: fresh)
         Linear interpolation.
         """
-        if holding_days >= self.MAX_HOLDING_DAYS:
-            return 0.0
-        if holding_days <= 0:
-            return 100.0
-
-        return max(0.0, 100.0 * (1.0 - holding_days / self.MAX_HOLDING_DAYS))
+        return np.clip(100.0 * (1.0 - holding_days / self.MAX_HOLDING_DAYS), 0.0, 100.0)
 
-    def _score_confidence(self, confidence: int) -> float:
+    def _score_confidence(self, confidence: np.ndarray) -> np.ndarray:
         """
         Score confidence component.
 
@@ -181,9 +174,9 @@ class PositionHealthScorer:
         Confidence 5 -> 100 (keep)
         Map: (conf - 1) * 25
         """
-        return max(0.0, min(100.0, (confidence - 1) * 25.0))
+        return np.clip((confidence - 1) * 25.0, 0.0, 100.0)
 
-    def _score_size(self, notional: float, max_notional: float) -> float:
+    def _score_size(self, notional: np.ndarray, max_notional: float) -> np.ndarray:
         """
         Score size component.
 
@@ -192,7 +185,7 @@ class PositionHealthScorer:
         Normalized to max in batch.
         """
         if max_notional <= 0:
-            return 50.0
+            return np.full_like(notional, 50.0)
 
         # Largest = 0, smallest = 100
-        return max(0.0, min(100.0, 100.0 * (1.0 - notional / max_notional)))
+        return np.clip(100.0 * (1.0 - notional / max_notional), 0.0, 100.0)
@@ -169,10 +169,7 @@ class RiskManager:
         # Check 6: Per-symbol exposure limit (RISK-based, not notional)
         # Safety: Calculate risk exposure, not position value
         # Get current risk amount for symbol (sum of all open positions' risk)
-        current_symbol_risk = sum(
-            pos.risk_amount
-            for pos in self.portfolio.open_positions.get(symbol, [])
-        ) if symbol in self.portfolio.open_positions else 0.0
+        current_symbol_risk = self.portfolio.get_symbol_risk(symbol)
         
         proposed_symbol_risk = current_symbol_risk + risk_amount
         max_symbol_risk = MAX_RISK_PER_SYMBOL * self.portfolio.current_equity
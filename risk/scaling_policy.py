@@ -214,6 +214,36 @@ class ScalingDecisionResult:
 # ============================================================================
 
 
+@dataclass(frozen=True)
+class EntrySummary:
+    """Open-entry facts derived from ledger_entries in a single pass."""
+    count: int = 0
+    total_qty: float = 0
+    last_price: Optional[float] = None
+
+
+def summarize_entries(ledger_entries: List[Dict]) -> EntrySummary:
+    """
+    Summarize open ledger entries once.
+
+    Equivalent to count_entries, total_entry_quantity and last_entry_price
+    combined, for callers that need all three.
+    """
+    count = 0
+    total_qty = 0
+    last = None
+    for e in ledger_entries:
+        if e.get("status") == "open":
+            count += 1
+            total_qty += e.get("qty", 0)
+            last = e
+    return EntrySummary(
+        count=count,
+        total_qty=total_qty,
+        last_price=last.get("price") if last is not None else None,
+    )
+
+
 def count_entries(ledger_entries: List[Dict]) -> int:
     """Count open entries in ledger."""
     return len([e for e in ledger_entries if e.get("status") == "open"])
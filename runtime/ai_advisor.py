@@ -1,5 +1,10 @@
 """
 AI Advisor (Phase B) - Read-only universe ranking.
+
+Rankings are cached by content (model + prompt + quantized features) under
+the scope's state dir, so repeated triggers on a near-identical market state
+reuse the last answer instead of spending an API call; concurrent triggers
+share one in-flight call.
 """
 
 from __future__ import annotations
@@ -9,12 +14,14 @@ import logging
 import os
 from datetime import datetime, timezone, date
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
 import requests
 
 from config.crypto_scheduler_settings import (
     AI_ADVISOR_ENABLED,
+    AI_CACHE_SIGNIFICANT_DIGITS,
+    AI_CACHE_TTL_SECONDS,
     AI_MAX_CALLS_PER_DAY,
     AI_RANKING_INTERVAL_HOURS,
 )
@@ -24,6 +31,7 @@ from config.crypto.loader import load_crypto_config
 from core.data.providers.kraken_provider import KrakenMarketDataProvider, KrakenOHLCConfig
 from crypto.features import build_execution_features
 from crypto.scope_guard import validate_crypto_universe_symbols
+from runtime.ai_response_cache import AIResponseCache, cache_key, canonical_payload
 from runtime.observability import get_observability
 
 logger = logging.getLogger(__name__)
@@ -42,6 +50,15 @@ class AIAdvisor:
         self.base_url = os.getenv("OPENAI_API_BASE_URL", "https://api.openai.com/v1")
         self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
 
+    def cache_key(self, symbol_features: Dict[str, Dict[str, Any]]) -> str:
+        """Content address of a ranking request (timestamps ignored, numbers quantized)."""
+        return cache_key(
+            self.base_url,
+            self.model,
+            _PROMPT_PATH.read_text(),
+            canonical_payload(symbol_features, AI_CACHE_SIGNIFICANT_DIGITS),
+        )
+
     def rank_universe(self, symbol_features: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
         prompt = _PROMPT_PATH.read_text()
         payload = {
@@ -88,7 +105,8 @@ class AIAdvisor:
 
 
 class AIAdvisorRunner:
-    def __init__(self) -> None:
+    def __init__(self, cache: Optional[AIResponseCache] = None) -> None:
+        self._cache = cache
         self._last_call_time: Optional[datetime] = None
         self._last_success_time: Optional[datetime] = None
         self._last_error: Optional[str] = None
@@ -97,6 +115,12 @@ class AIAdvisorRunner:
         self._last_ranking: Optional[List[str]] = None
         self._last_reasoning: Optional[str] = None
 
+    def _get_cache(self) -> AIResponseCache:
+        if self._cache is None:
+            cache_dir = Path(get_scope_path(get_scope(), "state")) / "ai_advisor_cache"
+            self._cache = AIResponseCache(cache_dir, ttl_seconds=AI_CACHE_TTL_SECONDS)
+        return self._cache
+
     def _reset_if_new_day(self) -> None:
         today = date.today().isoformat()
         if self._last_call_date != today:
@@ -177,24 +201,6 @@ class AIAdvisorRunner:
             )
             return None
 
-        if self._within_interval():
-            logger.info(
-                "AI_ADVISOR_RANKING_SKIPPED | trigger=%s ts=%s calls_today=%s reason=interval_limit",
-                trigger,
-                datetime.now(timezone.utc).isoformat(),
-                self._calls_today,
-            )
-            return None
-
-        if self._calls_today >= AI_MAX_CALLS_PER_DAY:
-            logger.info(
-                "AI_ADVISOR_RANKING_SKIPPED | trigger=%s ts=%s calls_today=%s reason=max_calls_reached",
-                trigger,
-                datetime.now(timezone.utc).isoformat(),
-                self._calls_today,
-            )
-            return None
-
         symbol_features = _build_ai_features_from_market_data()
         if symbol_features is None:
             self._last_error = "feature_build_failed"
@@ -207,6 +213,28 @@ class AIAdvisorRunner:
             )
             get_observability().record_ai_error(self._last_error)
             return None
+
+        # A cached ranking costs no API call, so it is served regardless of
+        # the interval and daily-budget gates (e.g. after a restart)
+        if self._get_cache().get(AIAdvisor().cache_key(symbol_features)) is None:
+            if self._within_interval():
+                logger.info(
+                    "AI_ADVISOR_RANKING_SKIPPED | trigger=%s ts=%s calls_today=%s reason=interval_limit",
+                    trigger,
+                    datetime.now(timezone.utc).isoformat(),
+                    self._calls_today,
+                )
+                return None
+
+            if self._calls_today >= AI_MAX_CALLS_PER_DAY:
+                logger.info(
+                    "AI_ADVISOR_RANKING_SKIPPED | trigger=%s ts=%s calls_today=%s reason=max_calls_reached",
+                    trigger,
+                    datetime.now(timezone.utc).isoformat(),
+                    self._calls_today,
+                )
+                return None
+
         return self.rank_with_ai(symbol_features, trigger)
 
     def rank_with_ai(self, symbol_features: Dict[str, Dict[str, Any]], trigger: str) -> Optional[Dict[str, Any]]:
@@ -225,18 +253,32 @@ class AIAdvisorRunner:
 
         advisor = AIAdvisor()
         observability = get_observability()
-        self._last_call_time = datetime.now(timezone.utc)
-        self._calls_today += 1
-        observability.record_ai_attempt(self._calls_today, self._last_call_time)
 
-        try:
+        def call_api() -> Dict[str, Any]:
+            # Only a real API call counts against the daily budget
+            self._last_call_time = datetime.now(timezone.utc)
+            self._calls_today += 1
+            observability.record_ai_attempt(self._calls_today, self._last_call_time)
             logger.info(
                 "AI_ADVISOR_REQUEST | trigger=%s ts=%s symbols=%s",
                 trigger,
                 datetime.now(timezone.utc).isoformat(),
                 ",".join(sorted(symbol_features.keys())),
             )
-            result = advisor.rank_universe(symbol_features)
+            return advisor.rank_universe(symbol_features)
+
+        try:
+            key = advisor.cache_key(symbol_features)
+            result, source = self._get_cache().get_or_compute(key, call_api)
+            if source != "computed":
+                logger.info(
+                    "AI_ADVISOR_CACHE_HIT | trigger=%s ts=%s source=%s key=%s response_id=%s",
+                    trigger,
+                    datetime.now(timezone.utc).isoformat(),
+                    source,
+                    key[:12],
+                    result.get("response_id") or "NONE",
+                )
             parsed = result.get("parsed", {})
             ranked = parsed.get("ranked_symbols", [])
             reasoning = parsed.get("reasoning", "")
@@ -287,6 +329,7 @@ class AIAdvisorRunner:
                     "ranked_symbols": normalized,
                     "reasoning": reasoning,
                     "raw_response": result.get("raw", ""),
+                    "cache": source,
                 }
             )
 
@@ -388,9 +431,9 @@ def _build_ai_features_from_market_data() -> Optional[Dict[str, Dict[str, Any]]]
     if isinstance(max_staleness, str) and max_staleness.strip().lower() == "auto":
         max_staleness = None
 
-    provider = KrakenMarketDataProvider(
-        scope=scope,
-        config=KrakenOHLCConfig(
+    provider = _get_market_data_provider(
+        scope,
+        KrakenOHLCConfig(
             interval=execution_interval,
             enable_ws=bool(crypto_config.get("ENABLE_WS_MARKETDATA", False)),
             cache_enabled=enable_cache,
@@ -404,6 +447,14 @@ def _build_ai_features_from_market_data() -> Optional[Dict[str, Dict[str, Any]]]
         if bars is None or bars.empty:
             logger.error("AI_ADVISOR_RANKING_FAILED | reason=missing_data symbol=%s", symbol)
             return None
+
+        # Unchanged bars -> unchanged features; skip the rebuild
+        memo_key = (symbol, len(bars), str(bars.index[-1]), str(bars.iloc[-1].to_dict()))
+        cached = _FEATURE_MEMO.get(symbol)
+        if cached is not None and cached[0] == memo_key:
+            features[symbol] = dict(cached[1])
+            continue
+
         try:
             ctx = build_execution_features(symbol, bars)
         except Exception as e:
@@ -425,10 +476,31 @@ def _build_ai_features_from_market_data() -> Optional[Dict[str, Dict[str, Any]]]
             "distance_from_sma20_pct": ctx_dict.get("distance_from_sma20_pct"),
             "rsi_14": ctx_dict.get("rsi_14"),
         }
+        _FEATURE_MEMO[symbol] = (memo_key, dict(features[symbol]))
 
     return features
 
 
+# Reused across triggers so the provider's OHLC cache survives between calls
+_PROVIDERS: Dict[Tuple, KrakenMarketDataProvider] = {}
+# symbol -> (bars fingerprint, features)
+_FEATURE_MEMO: Dict[str, Tuple[Tuple, Dict[str, Any]]] = {}
+
+
+def _get_market_data_provider(scope, config: KrakenOHLCConfig) -> KrakenMarketDataProvider:
+    key = (
+        str(scope),
+        config.interval,
+        config.enable_ws,
+        config.cache_enabled,
+        config.max_staleness_seconds,
+    )
+    provider = _PROVIDERS.get(key)
+    if provider is None:
+        provider = _PROVIDERS[key] = KrakenMarketDataProvider(scope=scope, config=config)
+    return provider
+
+
 def _format_ai_timestamp(value) -> Optional[str]:
     if value is None:
         return None
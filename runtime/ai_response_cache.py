@@ -0,0 +1,221 @@
+"""
+Content-addressed cache for AI advisor responses.
+
+The cache key is a hash of the model, the prompt and a canonicalized,
+quantized copy of the feature payload: timestamps are dropped and numbers
+are rounded to a few significant digits, so market states that differ only
+by noise map to the same key and reuse the previous ranking.
+
+- In-memory front, JSON file per key under the scope's state dir
+- Entries expire after a TTL; expired files are deleted when looked up
+  and swept when the cache is created
+- Single-flight: concurrent callers with the same key share one in-flight
+  computation (one API call) instead of each paying for it
+
+Fail-safe: disk errors are logged and treated as misses.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Feature keys that never participate in the cache key
+_VOLATILE_KEYS = frozenset({"timestamp_utc"})
+
+
+def _quantize(value: Any, significant_digits: int) -> Any:
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, (int, float)):
+        value = float(value)
+        if not math.isfinite(value):
+            return str(value)
+        if value == 0.0:
+            return 0.0
+        digits = significant_digits - int(math.floor(math.log10(abs(value)))) - 1
+        return round(value, digits)
+    if isinstance(value, dict):
+        return {
+            str(k): _quantize(v, significant_digits)
+            for k, v in value.items()
+            if k not in _VOLATILE_KEYS
+        }
+    if isinstance(value, (list, tuple)):
+        return [_quantize(v, significant_digits) for v in value]
+    return value
+
+
+def canonical_payload(payload: Any, significant_digits: int = 2) -> str:
+    """Canonical JSON of a payload with volatile keys dropped and numbers quantized."""
+    return json.dumps(
+        _quantize(payload, significant_digits),
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+
+
+def cache_key(*parts: str) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class AIResponseCache:
+    """TTL cache of JSON-serializable responses with single-flight coalescing."""
+
+    def __init__(self, cache_dir: Optional[Path], ttl_seconds: float):
+        """
+        Args:
+            cache_dir: Directory for persisted entries (None = memory only)
+            ttl_seconds: Entry lifetime; <= 0 disables caching (calls still coalesce)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.ttl_seconds = ttl_seconds
+        self._memory: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.sweep()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached value if present and fresh, else None."""
+        if self.ttl_seconds <= 0:
+            return None
+
+        with self._lock:
+            entry = self._memory.get(key)
+        if entry is None:
+            entry = self._read(key)
+            if entry is None:
+                return None
+            with self._lock:
+                self._memory[key] = entry
+
+        stored_at, value = entry
+        if time.time() - stored_at >= self.ttl_seconds:
+            with self._lock:
+                self._memory.pop(key, None)
+            self._delete(key)
+            return None
+        return value
+
+    def sweep(self) -> int:
+        """
+        Delete persisted entries older than the TTL (one file per quantized
+        market state accumulates otherwise).
+
+        Returns:
+            Number of files removed
+        """
+        if self.cache_dir is None or self.ttl_seconds <= 0:
+            return 0
+        cutoff = time.time() - self.ttl_seconds
+        removed = 0
+        try:
+            for path in self.cache_dir.glob("*.json"):
+                try:
+                    if path.stat().st_mtime < cutoff:
+                        path.unlink()
+                        removed += 1
+                except FileNotFoundError:
+                    continue
+        except Exception as e:
+            logger.warning("AI_ADVISOR_CACHE_SWEEP_FAILED | error=%s", e)
+        if removed:
+            logger.info("AI_ADVISOR_CACHE_SWEPT | removed=%s", removed)
+        return removed
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        entry = (time.time(), value)
+        with self._lock:
+            self._memory[key] = entry
+        self._write(key, entry)
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Dict[str, Any]],
+    ) -> Tuple[Dict[str, Any], str]:
+        """
+        Return (value, source) where source is "cache", "coalesced" or "computed".
+
+        Only one caller per key runs `compute`; others wait for its result.
+        Exceptions from `compute` propagate to every waiting caller and
+        nothing is cached.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached, "cache"
+
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+
+        if not leader:
+            return future.result(), "coalesced"
+
+        try:
+            value = compute()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            self.put(key, value)
+            future.set_result(value)
+            return value, "computed"
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    # ------------------------------------------------------------------
+    # Disk entries
+    # ------------------------------------------------------------------
+
+    def _read(self, key: str) -> Optional[Tuple[float, Dict[str, Any]]]:
+        if self.cache_dir is None:
+            return None
+        path = self.cache_dir / f"{key}.json"
+        try:
+            if not path.exists():
+                return None
+            data = json.loads(path.read_text())
+            return float(data["stored_at"]), data["value"]
+        except Exception as e:
+            logger.warning("AI_ADVISOR_CACHE_READ_FAILED | key=%s error=%s", key[:12], e)
+            return None
+
+    def _delete(self, key: str) -> None:
+        if self.cache_dir is None:
+            return
+        try:
+            (self.cache_dir / f"{key}.json").unlink(missing_ok=True)
+        except Exception as e:
+            logger.warning("AI_ADVISOR_CACHE_DELETE_FAILED | key=%s error=%s", key[:12], e)
+
+    def _write(self, key: str, entry: Tuple[float, Dict[str, Any]]) -> None:
+        if self.cache_dir is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self.cache_dir / f"{key}.json"
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"stored_at": entry[0], "value": entry[1]}))
+            tmp.replace(path)
+        except Exception as e:
+            logger.warning("AI_ADVISOR_CACHE_WRITE_FAILED | key=%s error=%s", key[:12], e)
@@ -171,44 +171,18 @@ class RuntimeObservability:
     def _daily_realized_pnl(self) -> float:
         if self._runtime is None:
             return 0.0
-        ledger = self._runtime.trade_ledger
-        today = datetime.now(timezone.utc).date().isoformat()
-        realized = 0.0
-        for trade in ledger.get_all_trades():
-            try:
-                exit_date = datetime.fromisoformat(trade.exit_timestamp).date().isoformat()
-                if exit_date == today:
-                    realized += float(trade.net_pnl)
-            except Exception:
-                continue
-        return float(realized)
+        return float(self._runtime.trade_ledger.get_realized_pnl_for_day())
 
     def _unrealized_pnl(self) -> float:
         if self._runtime is None:
             return 0.0
         portfolio = self._runtime.risk_manager.portfolio
-        total = 0.0
-        for positions in portfolio.open_positions.values():
-            for pos in positions:
-                total += float(getattr(pos, "unrealized_pnl", 0.0))
-        return float(total)
+        return float(portfolio.book.total_unrealized_pnl)
 
     def _max_drawdown(self) -> float:
         if self._runtime is None:
             return 0.0
-        portfolio = self._runtime.risk_manager.portfolio
-        equity_values = [value for _, value in portfolio.equity_history]
-        if not equity_values:
-            return 0.0
-        peak = equity_values[0]
-        max_dd = 0.0
-        for value in equity_values:
-            if value > peak:
-                peak = value
-            drawdown = (peak - value) / peak if peak > 0 else 0.0
-            if drawdown > max_dd:
-                max_dd = drawdown
-        return float(max_dd)
+        return float(self._runtime.risk_manager.portfolio.max_drawdown_pct)
 
     def emit_live_status_snapshot(self, trigger: str) -> None:
         scope = get_scope()
@@ -245,9 +219,9 @@ class RuntimeObservability:
         unrealized = self._unrealized_pnl()
         last_trade_ts = "NONE"
         if self._runtime is not None:
-            trades = self._runtime.trade_ledger.get_all_trades()
-            if trades:
-                last_trade_ts = trades[-1].exit_timestamp
+            last_trade = self._runtime.trade_ledger.get_last_trade()
+            if last_trade is not None:
+                last_trade_ts = last_trade.exit_timestamp
 
         reconciliation_status = "OK" if active_state != "RECONCILIATION_BLOCKED" else "BLOCKED"
 
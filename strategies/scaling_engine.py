@@ -14,9 +14,12 @@ All decisions default to BLOCK unless explicitly qualified to SCALE.
 
 import logging
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from risk.scaling_policy import (
+    EntrySummary,
     ScalingContext,
     ScalingDecision,
     ScalingDecisionResult,
@@ -28,6 +31,7 @@ from risk.scaling_policy import (
     last_entry_timestamp,
     total_entry_quantity,
     has_pending_conflicting_order,
+    summarize_entries,
 )
 
 logger = logging.getLogger(__name__)
@@ -40,6 +44,7 @@ logger = logging.getLogger(__name__)
 
 def check_strategy_permits_scaling(
     context: ScalingContext,
+    entries: Optional[EntrySummary] = None,
 ) -> Optional[ScalingDecisionResult]:
     """
     Hard enforcement: Strategy must explicitly allow multi-entry.
@@ -52,13 +57,14 @@ def check_strategy_permits_scaling(
             decision=ScalingDecision.BLOCK,
             reason_code=ScalingReasonCode.STRATEGY_DISALLOWS_SCALING,
             reason_text="Strategy does not permit multi-entry scaling",
-            current_entry_count=count_entries(context.ledger_entries),
+            current_entry_count=_entries(context, entries).count,
         )
     return None
 
 
 def check_max_entries_not_exceeded(
     context: ScalingContext,
+    entries: Optional[EntrySummary] = None,
 ) -> Optional[ScalingDecisionResult]:
     """
     Hard enforcement: Do not exceed max entries per symbol.
@@ -66,7 +72,7 @@ def check_max_entries_not_exceeded(
     Returns:
         ScalingDecisionResult if max exceeded, else None
     """
-    current_entries = count_entries(context.ledger_entries)
+    current_entries = _entries(context, entries).count
     max_entries = context.scaling_policy.max_entries_per_symbol
 
     if current_entries >= max_entries:
@@ -84,6 +90,7 @@ def check_max_entries_not_exceeded(
 
 def check_max_position_size(
     context: ScalingContext,
+    entries: Optional[EntrySummary] = None,
 ) -> Optional[ScalingDecisionResult]:
     """
     Hard enforcement: Do not exceed max position as % of account equity.
@@ -103,7 +110,7 @@ def check_max_position_size(
                 f"Proposed position would be {proposed_position_pct:.2f}% of account "
                 f"(max {context.scaling_policy.max_total_position_pct:.2f}%)"
             ),
-            current_entry_count=count_entries(context.ledger_entries),
+            current_entry_count=_entries(context, entries).count,
             proposed_position_pct=proposed_position_pct,
         )
     return None
@@ -111,6 +118,7 @@ def check_max_position_size(
 
 def check_pending_order_conflicts(
     context: ScalingContext,
+    entries: Optional[EntrySummary] = None,
 ) -> Optional[ScalingDecisionResult]:
     """
     Hard enforcement: Do not scale if pending BUY or conflicting SELL exists.
@@ -123,7 +131,7 @@ def check_pending_order_conflicts(
             decision=ScalingDecision.BLOCK,
             reason_code=ScalingReasonCode.PENDING_BUY_EXISTS,
             reason_text="Pending BUY order exists for this symbol",
-            current_entry_count=count_entries(context.ledger_entries),
+            current_entry_count=_entries(context, entries).count,
         )
 
     # Check for pending SELL on same position (conflicting intent)
@@ -132,7 +140,7 @@ def check_pending_order_conflicts(
             decision=ScalingDecision.BLOCK,
             reason_code=ScalingReasonCode.CONFLICTING_SELL_EXISTS,
             reason_text="Pending SELL order exists for this symbol (conflicting intent)",
-            current_entry_count=count_entries(context.ledger_entries),
+            current_entry_count=_entries(context, entries).count,
         )
 
     return None
@@ -140,13 +148,14 @@ def check_pending_order_conflicts(
 
 def check_broker_ledger_consistency(
     context: ScalingContext,
+    entries: Optional[EntrySummary] = None,
 ) -> Optional[ScalingDecisionResult]:
     """
     Hard enforcement: Broker qty must match ledger total.
     
     If mismatch, do not scale (risk of position doubling).
     """
-    ledger_qty = total_entry_quantity(context.ledger_entries)
+    ledger_qty = _entries(context, entries).total_qty
 
     # Allow small floating point tolerance
     qty_mismatch = abs(context.current_position_qty - ledger_qty) > 0.01
@@ -160,7 +169,7 @@ def check_broker_ledger_consistency(
                 f"Ledger qty ({ledger_qty:.2f}). "
                 f"Do not scale until reconciled."
             ),
-            current_entry_count=count_entries(context.ledger_entries),
+            current_entry_count=_entries(context, entries).count,
             debug_info={
                 "broker_qty": context.current_position_qty,
                 "ledger_qty": ledger_qty,
@@ -172,6 +181,7 @@ def check_broker_ledger_consistency(
 
 def check_risk_budget(
     context: ScalingContext,
+    entries: Optional[EntrySummary] = None,
 ) -> Optional[ScalingDecisionResult]:
     """
     Hard enforcement: Risk for this add must fit within budget.
@@ -187,7 +197,7 @@ def check_risk_budget(
                 f"Proposed risk (${context.proposed_risk_amount:.2f}) "
                 f"> available budget (${context.available_risk_budget:.2f})"
             ),
-            current_entry_count=count_entries(context.ledger_entries),
+            current_entry_count=_entries(context, entries).count,
             estimated_risk=context.proposed_risk_amount,
         )
     return None
@@ -200,6 +210,7 @@ def check_risk_budget(
 
 def check_minimum_time_since_entry(
     context: ScalingContext,
+    entries: Optional[EntrySummary] = None,
 ) -> Optional[ScalingDecisionResult]:
     """
     Strategy enforcement: Minimum time must have elapsed since last entry.
@@ -214,7 +225,7 @@ def check_minimum_time_since_entry(
                 f"Only {context.minutes_since_last_entry:.1f} minutes since last entry. "
                 f"Need {min_time} seconds ({min_time/60:.1f} minutes)."
             ),
-            current_entry_count=count_entries(context.ledger_entries),
+            current_entry_count=_entries(context, entries).count,
             debug_info={"minutes_elapsed": context.minutes_since_last_entry, "min_seconds": min_time},
         )
     return None
@@ -222,6 +233,7 @@ def check_minimum_time_since_entry(
 
 def check_minimum_bars_since_entry(
     context: ScalingContext,
+    entries: Optional[EntrySummary] = None,
 ) -> Optional[ScalingDecisionResult]:
     """
     Strategy enforcement: Minimum bars must have passed since last entry.
@@ -236,7 +248,7 @@ def check_minimum_bars_since_entry(
                 f"Only {context.bars_since_last_entry} bars since last entry. "
                 f"Need {min_bars} bars."
             ),
-            current_entry_count=count_entries(context.ledger_entries),
+            current_entry_count=_entries(context, entries).count,
             debug_info={"bars_elapsed": context.bars_since_last_entry, "min_bars": min_bars},
         )
     return None
@@ -244,6 +256,7 @@ def check_minimum_bars_since_entry(
 
 def check_signal_quality(
     context: ScalingContext,
+    entries: Optional[EntrySummary] = None,
 ) -> Optional[ScalingDecisionResult]:
     """
     Strategy enforcement: Signal quality must meet threshold for add.
@@ -258,7 +271,7 @@ def check_signal_quality(
                 f"Signal confidence {context.current_signal_confidence:.2f} < "
                 f"minimum {min_strength:.2f}"
             ),
-            current_entry_count=count_entries(context.ledger_entries),
+            current_entry_count=_entries(context, entries).count,
         )
 
     if context.has_bearish_divergence:
@@ -266,7 +279,7 @@ def check_signal_quality(
             decision=ScalingDecision.SKIP,
             reason_code=ScalingReasonCode.SIGNAL_QUALITY_INSUFFICIENT,
             reason_text="Bearish divergence detected since last entry",
-            current_entry_count=count_entries(context.ledger_entries),
+            current_entry_count=_entries(context, entries).count,
         )
 
     return None
@@ -274,6 +287,7 @@ def check_signal_quality(
 
 def check_price_structure(
     context: ScalingContext,
+    entries: Optional[EntrySummary] = None,
 ) -> Optional[ScalingDecisionResult]:
     """
     Strategy enforcement: Price structure must match scaling type.
@@ -281,7 +295,7 @@ def check_price_structure(
     Pyramid: Entry price > last entry price, no lower low (momentum)
     Average: Entry price < last entry price, drawdown <= max ATR (averaging down)
     """
-    last_price = last_entry_price(context.ledger_entries)
+    last_price = _entries(context, entries).last_price
     if last_price is None:
         return None  # First entry, no structure check needed
 
@@ -297,7 +311,7 @@ def check_price_structure(
                     f"Pyramid entry price ${context.proposed_entry_price:.2f} "
                     f"not > last entry ${last_price:.2f}"
                 ),
-                current_entry_count=count_entries(context.ledger_entries),
+                current_entry_count=_entries(context, entries).count,
                 debug_info={"last_price": last_price, "proposed_price": context.proposed_entry_price},
             )
 
@@ -307,7 +321,7 @@ def check_price_structure(
                 decision=ScalingDecision.SKIP,
                 reason_code=ScalingReasonCode.PRICE_STRUCTURE_VIOLATION,
                 reason_text="Lower low detected since last entry (pyramid requires no lower low)",
-                current_entry_count=count_entries(context.ledger_entries),
+                current_entry_count=_entries(context, entries).count,
                 debug_info={"lowest_since_entry": context.price_lowest_since_last_entry},
             )
 
@@ -321,7 +335,7 @@ def check_price_structure(
                     f"Average entry price ${context.proposed_entry_price:.2f} "
                     f"not < last entry ${last_price:.2f}"
                 ),
-                current_entry_count=count_entries(context.ledger_entries),
+                current_entry_count=_entries(context, entries).count,
                 debug_info={"last_price": last_price, "proposed_price": context.proposed_entry_price},
             )
 
@@ -338,7 +352,7 @@ def check_price_structure(
                     f"Drawdown ${drawdown:.2f} ({drawdown/context.atr:.2f} ATR) "
                     f"> max ${max_allowed_drawdown:.2f} ({max_drawdown_multiple} ATR)"
                 ),
-                current_entry_count=count_entries(context.ledger_entries),
+                current_entry_count=_entries(context, entries).count,
                 debug_info={
                     "drawdown_dollars": drawdown,
                     "drawdown_atr_multiple": drawdown / context.atr if context.atr > 0 else 0,
@@ -351,6 +365,7 @@ def check_price_structure(
 
 def check_volatility_regime(
     context: ScalingContext,
+    entries: Optional[EntrySummary] = None,
 ) -> Optional[ScalingDecisionResult]:
     """
     Strategy enforcement: Volatility must be in acceptable regime.
@@ -368,7 +383,7 @@ def check_volatility_regime(
                 f"ATR {context.atr:.2f} below rolling median {context.atr_rolling_median:.2f} "
                 f"(volatility collapsing)"
             ),
-            current_entry_count=count_entries(context.ledger_entries),
+            current_entry_count=_entries(context, entries).count,
             debug_info={"atr": context.atr, "atr_median": context.atr_rolling_median},
         )
 
@@ -377,6 +392,7 @@ def check_volatility_regime(
 
 def check_directionality(
     context: ScalingContext,
+    entries: Optional[EntrySummary] = None,
 ) -> Optional[ScalingDecisionResult]:
     """
     Strategy enforcement: Signal must match position direction.
@@ -388,7 +404,7 @@ def check_directionality(
             decision=ScalingDecision.BLOCK,
             reason_code=ScalingReasonCode.DIRECTIONAL_CONFLICT,
             reason_text="Signal direction conflicts with existing position direction",
-            current_entry_count=count_entries(context.ledger_entries),
+            current_entry_count=_entries(context, entries).count,
         )
 
     return None
@@ -400,7 +416,10 @@ def check_directionality(
 
 
 def check_execution_feasibility(
-    context: ScalingContext, min_order_size: float = 10.0, max_slippage_pct: float = 0.5
+    context: ScalingContext,
+    min_order_size: float = 10.0,
+    max_slippage_pct: float = 0.5,
+    entries: Optional[EntrySummary] = None,
 ) -> Optional[ScalingDecisionResult]:
     """
     Execution sanity checks: Order size, slippage, liquidity.
@@ -419,7 +438,7 @@ def check_execution_feasibility(
             decision=ScalingDecision.BLOCK,
             reason_code=ScalingReasonCode.ORDER_SIZE_BELOW_MINIMUM,
             reason_text=f"Order size {context.proposed_entry_size:.4f} shares < minimum 0.01",
-            current_entry_count=count_entries(context.ledger_entries),
+            current_entry_count=_entries(context, entries).count,
         )
 
     order_value = context.proposed_entry_size * context.proposed_entry_price
@@ -430,7 +449,7 @@ def check_execution_feasibility(
             reason_text=(
                 f"Order value ${order_value:.2f} < minimum ${min_order_size:.2f}"
             ),
-            current_entry_count=count_entries(context.ledger_entries),
+            current_entry_count=_entries(context, entries).count,
         )
 
     # Note: Liquidity and slippage checks would require real-time market data
@@ -444,6 +463,33 @@ def check_execution_feasibility(
 # ============================================================================
 
 
+def _entries(context: ScalingContext, entries: Optional[EntrySummary]) -> EntrySummary:
+    """Precomputed entry summary, or derive it from the context's ledger."""
+    return entries if entries is not None else summarize_entries(context.ledger_entries)
+
+
+# Checks in priority order; the first failing check decides.
+_CHECKS = (
+    # PHASE 1: Hard Safety Enforcement (Execution Layer)
+    check_strategy_permits_scaling,
+    check_max_entries_not_exceeded,
+    check_max_position_size,
+    check_pending_order_conflicts,
+    check_broker_ledger_consistency,
+    check_risk_budget,
+    # PHASE 2: Directionality (BLOCK if mismatch, skip if not applicable)
+    check_directionality,
+    # PHASE 3: Strategy Qualification (Timing, Signals, Structure)
+    check_minimum_time_since_entry,
+    check_minimum_bars_since_entry,
+    check_signal_quality,
+    check_volatility_regime,
+    check_price_structure,
+    # PHASE 4: Execution Feasibility
+    check_execution_feasibility,
+)
+
+
 def should_scale_position(context: ScalingContext) -> ScalingDecisionResult:
     """
     Comprehensive scaling decision engine.
@@ -463,6 +509,7 @@ def should_scale_position(context: ScalingContext) -> ScalingDecisionResult:
     Returns:
         ScalingDecisionResult with decision and reasoning
     """
+    entries = summarize_entries(context.ledger_entries)
 
     # Validate inputs
     if context.scaling_policy is None:
@@ -470,7 +517,7 @@ def should_scale_position(context: ScalingContext) -> ScalingDecisionResult:
             decision=ScalingDecision.BLOCK,
             reason_code=ScalingReasonCode.STRATEGY_DISALLOWS_SCALING,
             reason_text="No scaling policy defined",
-            current_entry_count=count_entries(context.ledger_entries),
+            current_entry_count=entries.count,
         )
 
     is_valid, error_msg = context.scaling_policy.validate()
@@ -479,86 +526,24 @@ def should_scale_position(context: ScalingContext) -> ScalingDecisionResult:
             decision=ScalingDecision.BLOCK,
             reason_code=ScalingReasonCode.STRATEGY_DISALLOWS_SCALING,
             reason_text=f"Invalid scaling policy: {error_msg}",
-            current_entry_count=count_entries(context.ledger_entries),
+            current_entry_count=entries.count,
         )
 
-    # ========================================================================
-    # PHASE 1: Hard Safety Enforcement (Execution Layer)
-    # ========================================================================
-
-    result = check_strategy_permits_scaling(context)
-    if result:
-        return result
-
-    result = check_max_entries_not_exceeded(context)
-    if result:
-        return result
-
-    result = check_max_position_size(context)
-    if result:
-        return result
-
-    result = check_pending_order_conflicts(context)
-    if result:
-        return result
-
-    result = check_broker_ledger_consistency(context)
-    if result:
-        return result
-
-    result = check_risk_budget(context)
-    if result:
-        return result
-
-    # ========================================================================
-    # PHASE 2: Directionality (BLOCK if mismatch, skip if not applicable)
-    # ========================================================================
-
-    result = check_directionality(context)
-    if result:
-        return result
-
-    # ========================================================================
-    # PHASE 3: Strategy Qualification (Timing, Signals, Structure)
-    # ========================================================================
-
-    result = check_minimum_time_since_entry(context)
-    if result:
-        return result
-
-    result = check_minimum_bars_since_entry(context)
-    if result:
-        return result
+    for check in _CHECKS:
+        result = check(context, entries=entries)
+        if result:
+            return result
 
-    result = check_signal_quality(context)
-    if result:
-        return result
+    return _scale_result(context, entries)
 
-    result = check_volatility_regime(context)
-    if result:
-        return result
-
-    result = check_price_structure(context)
-    if result:
-        return result
-
-    # ========================================================================
-    # PHASE 4: Execution Feasibility
-    # ========================================================================
-
-    result = check_execution_feasibility(context)
-    if result:
-        return result
-
-    # ========================================================================
-    # All checks passed - Safe to scale
-    # ========================================================================
 
+def _scale_result(context: ScalingContext, entries: EntrySummary) -> ScalingDecisionResult:
+    """All checks passed - Safe to scale."""
     return ScalingDecisionResult(
         decision=ScalingDecision.SCALE,
         reason_code=ScalingReasonCode.STRATEGY_DISALLOWS_SCALING,  # Placeholder, not used
         reason_text="All scaling checks passed. Approved to add position.",
-        current_entry_count=count_entries(context.ledger_entries),
+        current_entry_count=entries.count,
         proposed_position_pct=(
             (context.current_position_value
              + context.proposed_entry_size * context.current_price)
@@ -567,3 +552,154 @@ def should_scale_position(context: ScalingContext) -> ScalingDecisionResult:
         ),
         estimated_risk=context.proposed_risk_amount,
     )
+
+
+# ============================================================================
+# BATCH EVALUATION (all open positions in one cycle)
+# ============================================================================
+
+
+def evaluate_scaling_batch(contexts: Sequence[ScalingContext]) -> List[ScalingDecisionResult]:
+    """
+    Evaluate many scaling contexts at once.
+
+    Produces the same results as calling should_scale_position() on each
+    context, but derives every per-position input once (ledger entry
+    summary, policy fields, pending-order symbols per shared order list)
+    and evaluates all checks as boolean arrays across positions. Only the
+    deciding check builds its result object.
+
+    Contexts with no or an invalid policy, or zero equity, go through
+    should_scale_position() unchanged.
+
+    Args:
+        contexts: Scaling contexts for this cycle
+
+    Returns:
+        ScalingDecisionResult per context, in input order
+    """
+    results: List[Optional[ScalingDecisionResult]] = [None] * len(contexts)
+    entries = [summarize_entries(c.ledger_entries) for c in contexts]
+
+    policies: List[StrategyScalingPolicy] = []
+    policy_slots: Dict[int, Tuple[bool, int]] = {}
+    rows: List[int] = []
+    row_policy: List[int] = []
+    for i, context in enumerate(contexts):
+        policy = context.scaling_policy
+        if policy is None or context.account_equity == 0:
+            results[i] = should_scale_position(context)
+            continue
+        slot = policy_slots.get(id(policy))
+        if slot is None:
+            slot = (policy.validate()[0], len(policies))
+            policy_slots[id(policy)] = slot
+            policies.append(policy)
+        is_valid, policy_index = slot
+        if not is_valid:
+            results[i] = should_scale_position(context)
+            continue
+        rows.append(i)
+        row_policy.append(policy_index)
+
+    if not rows:
+        return results
+
+    batch = [contexts[i] for i in rows]
+    batch_entries = [entries[i] for i in rows]
+    failing = _failing_checks(batch, batch_entries, policies, np.asarray(row_policy))
+    any_failed = failing.any(axis=0)
+    first_failed = failing.argmax(axis=0)
+
+    for k, i in enumerate(rows):
+        context, summary = batch[k], batch_entries[k]
+        if not any_failed[k]:
+            results[i] = _scale_result(context, summary)
+            continue
+        result = _CHECKS[first_failed[k]](context, entries=summary)
+        # Masks mirror the scalar checks exactly; fall back if they ever disagree
+        results[i] = result if result else should_scale_position(context)
+
+    return results
+
+
+def _failing_checks(
+    contexts: List[ScalingContext],
+    entries: List[EntrySummary],
+    policies: List[StrategyScalingPolicy],
+    row_policy: np.ndarray,
+) -> np.ndarray:
+    """Boolean matrix [check, position] of failing checks, in _CHECKS order."""
+
+    def col(attr: str) -> np.ndarray:
+        return np.array([getattr(c, attr) for c in contexts], dtype=float)
+
+    def policy_col(attr: str) -> np.ndarray:
+        return np.array([getattr(p, attr) for p in policies], dtype=float)[row_policy]
+
+    pending_symbols: Dict[Tuple[int, str], set] = {}
+
+    def pending(orders: List[Dict], order_type: str) -> set:
+        key = (id(orders), order_type)
+        if key not in pending_symbols:
+            pending_symbols[key] = {
+                o.get("symbol") for o in orders if o.get("order_type") == order_type
+            }
+        return pending_symbols[key]
+
+    count = np.array([e.count for e in entries], dtype=float)
+    ledger_qty = np.array([e.total_qty for e in entries], dtype=float)
+    last_price = np.array(
+        [np.nan if e.last_price is None else e.last_price for e in entries], dtype=float
+    )
+    has_last = np.array([e.last_price is not None for e in entries])
+
+    current_price = col("current_price")
+    proposed_price = col("proposed_entry_price")
+    proposed_size = col("proposed_entry_size")
+    atr = col("atr")
+
+    scaling_type = np.array([p.scaling_type for p in policies], dtype=object)[row_policy]
+    is_pyramid = scaling_type == ScalingType.PYRAMID
+    is_average = scaling_type == ScalingType.AVERAGE
+    min_time = policy_col("min_time_between_entries_seconds")
+    min_bars = policy_col("min_bars_between_entries")
+
+    proposed_pct = (
+        (col("current_position_value") + proposed_size * current_price)
+        / col("account_equity")
+        * 100
+    )
+    has_conflict = np.array([
+        c.symbol in pending(c.pending_buy_orders, "BUY")
+        or c.symbol in pending(c.pending_sell_orders, "SELL")
+        for c in contexts
+    ])
+    with np.errstate(invalid="ignore"):
+        pyramid_violation = is_pyramid & has_last & (
+            (proposed_price <= last_price)
+            | (policy_col("require_no_lower_low").astype(bool) & col("has_lower_low").astype(bool))
+        )
+        average_violation = is_average & has_last & (
+            (proposed_price >= last_price)
+            | (last_price - col("price_lowest_since_last_entry")
+               > policy_col("max_atr_drawdown_multiple") * atr)
+        )
+
+    return np.vstack([
+        ~policy_col("allows_multiple_entries").astype(bool),
+        count >= policy_col("max_entries_per_symbol"),
+        proposed_pct > policy_col("max_total_position_pct"),
+        has_conflict,
+        np.abs(col("current_position_qty") - ledger_qty) > 0.01,
+        col("proposed_risk_amount") > col("available_risk_budget"),
+        ~col("signal_matches_position_direction").astype(bool),
+        (min_time > 0) & (col("minutes_since_last_entry") < min_time / 60),
+        (min_bars > 0) & (col("bars_since_last_entry") < min_bars),
+        (col("current_signal_confidence") < policy_col("min_signal_strength_for_add"))
+        | col("has_bearish_divergence").astype(bool),
+        policy_col("require_volatility_above_median").astype(bool)
+        & (atr < col("atr_rolling_median")),
+        pyramid_violation | average_violation,
+        (proposed_size < 0.01) | (proposed_size * proposed_price < 10.0),
+    ])
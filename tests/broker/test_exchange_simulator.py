@@ -0,0 +1,158 @@
+"""
+Tests for the local exchange simulator and load driver.
+
+Tests cover:
+1. Partial fills capped by participation of replayed bar volume
+2. Rate limiting surfaced as RateLimitExceeded
+3. BrokerAdapter mapping (status, fill price, rejections)
+4. A short fixed-rate load run reports fills and latency percentiles
+"""
+
+import pandas as pd
+import pytest
+
+from broker.adapter import OrderStatus
+from broker.exchange_load_driver import LatencyStats, LoadDriver
+from broker.exchange_simulator import (
+    Bar,
+    LatencyModel,
+    RateLimitExceeded,
+    SimulatedExchange,
+    SimulatedExchangeAdapter,
+    bars_from_frame,
+    synthetic_bars,
+)
+
+FLAT_BAR = Bar(open=100.0, high=101.0, low=99.0, close=100.0, volume=100.0)
+
+
+def make_exchange(**kwargs):
+    kwargs.setdefault("slippage_bps", 0.0)
+    kwargs.setdefault("fee_rate", 0.0)
+    return SimulatedExchange({"BTC": [FLAT_BAR]}, **kwargs)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSimulatedExchange:
+    def test_fills_are_capped_by_participation(self):
+        exchange = make_exchange(participation_rate=0.1)  # 10 units per bar
+        first = exchange.submit("BTC", 25, "buy")
+        second = exchange.submit("BTC", 5, "buy")
+
+        exchange.step()
+        assert exchange.order(first.order_id).filled_qty == pytest.approx(10)
+        assert exchange.order(first.order_id).status == OrderStatus.PARTIAL
+        assert exchange.order(second.order_id).filled_qty == 0
+
+        exchange.step()
+        exchange.step()
+        assert exchange.order(first.order_id).status == OrderStatus.FILLED
+        assert exchange.order(second.order_id).status == OrderStatus.FILLED
+        assert exchange.positions["BTC"] == pytest.approx(30)
+
+    def test_fill_price_tracks_bar_with_slippage(self):
+        exchange = make_exchange(slippage_bps=10.0, fee_rate=0.001)
+        order = exchange.submit("BTC", 1, "buy")
+
+        exchange.step()
+
+        filled = exchange.order(order.order_id)
+        assert filled.avg_fill_price == pytest.approx(100.0 * 1.001)
+        assert filled.fees == pytest.approx(100.0 * 1.001 * 0.001)
+
+    def test_insufficient_cash_rejects(self):
+        exchange = make_exchange(starting_cash=50.0)
+        order = exchange.submit("BTC", 1, "buy")
+
+        exchange.step()
+
+        rejected = exchange.order(order.order_id)
+        assert rejected.status == OrderStatus.REJECTED
+        assert rejected.rejection_reason == "insufficient cash"
+
+    def test_rate_limit(self):
+        clock = FakeClock()
+        exchange = make_exchange(max_requests_per_sec=2, clock=clock)
+
+        exchange.check_rate_limit()
+        exchange.check_rate_limit()
+        with pytest.raises(RateLimitExceeded):
+            exchange.check_rate_limit()
+
+        clock.now += 0.5
+        exchange.check_rate_limit()
+        assert exchange.rate_limited == 1
+
+    def test_bars_from_frame(self):
+        df = pd.DataFrame({
+            "Open": [1.0], "High": [2.0], "Low": [0.5], "Close": [1.5], "Volume": [10.0],
+        })
+
+        assert bars_from_frame(df) == [Bar(1.0, 2.0, 0.5, 1.5, 10.0)]
+
+    def test_synthetic_bars_are_seeded(self):
+        assert synthetic_bars(5, seed=3) == synthetic_bars(5, seed=3)
+        assert synthetic_bars(5, seed=3) != synthetic_bars(5, seed=4)
+
+
+class TestSimulatedExchangeAdapter:
+    def test_order_result_mapping(self):
+        exchange = make_exchange()
+        adapter = SimulatedExchangeAdapter(exchange)
+
+        submitted = adapter.submit_market_order("btc", 2, "BUY")
+        assert submitted.status == OrderStatus.PENDING
+
+        exchange.step()
+        result = adapter.get_order_status(submitted.order_id)
+
+        assert result.is_filled()
+        assert result.filled_qty == 2
+        assert result.filled_price == pytest.approx(FLAT_BAR.typical_price)
+        assert adapter.get_position("BTC").quantity == 2
+        assert adapter.is_market_open()
+
+    def test_requests_count_against_rate_limit(self):
+        adapter = SimulatedExchangeAdapter(make_exchange(max_requests_per_sec=1, clock=FakeClock()))
+
+        adapter.get_last_trade_price("BTC")
+        with pytest.raises(RateLimitExceeded):
+            adapter.submit_market_order("BTC", 1, "buy")
+
+
+class TestLoadDriver:
+    def test_latency_stats(self):
+        stats = LatencyStats.from_samples([0.001 * i for i in range(1, 101)])
+
+        assert stats.count == 100
+        assert stats.p50_ms == pytest.approx(50.5)
+        assert stats.max_ms == pytest.approx(100.0)
+        assert LatencyStats.from_samples([]).count == 0
+
+    def test_adapter_run_fills_all_orders(self):
+        exchange = SimulatedExchange(
+            {symbol: synthetic_bars(100, seed=i) for i, symbol in enumerate(["BTC", "ETH"])},
+            max_requests_per_sec=1_000,
+        )
+        adapter = SimulatedExchangeAdapter(exchange, LatencyModel(median_ms=1.0, seed=1))
+        driver = LoadDriver.for_adapter(adapter, ["BTC", "ETH"], workers=4, poll_interval_seconds=0.01)
+
+        exchange.start(0.01)
+        try:
+            report = driver.run(orders_per_minute=3_000, duration_seconds=1.0, drain_timeout_seconds=5.0)
+        finally:
+            exchange.stop()
+
+        assert report.submitted == 50
+        assert report.filled == 50
+        assert report.unfinished == 0
+        assert report.submit_latency.count == 50
+        assert report.fill_latency.p99_ms >= report.fill_latency.p50_ms > 0
+        assert report.to_dict()["fills_per_minute"] > 0
@@ -0,0 +1,108 @@
+"""
+Tests for the NSE simulated broker adapter's state persistence.
+
+Tests cover:
+1. Compact snapshot + append-only fills log
+2. Restart restores fills and order-status lookups
+3. Fills appended after the last snapshot are dropped on load
+4. Legacy snapshots with inline filled_orders are migrated
+"""
+
+import json
+
+import pytest
+
+from broker.adapter import OrderStatus
+from broker.nse_simulator_adapter import NSESimulatedBrokerAdapter
+
+SYMBOLS = ["RELIANCE", "TCS", "INFY", "HDFCBANK"]
+PRICES = {symbol: 1000.0 + 100 * i for i, symbol in enumerate(SYMBOLS)}
+
+
+@pytest.fixture
+def broker(tmp_path):
+    return NSESimulatedBrokerAdapter(state_dir=tmp_path)
+
+
+def read_lines(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestNSESimulatorPersistence:
+    def test_fills_go_to_log_not_snapshot(self, broker, tmp_path):
+        orders = [broker.submit_market_order(symbol, 10, "buy") for symbol in SYMBOLS]
+
+        filled = broker.execute_pending_orders(PRICES)
+
+        assert len(filled) == 4
+        snapshot = json.loads((tmp_path / "broker_state.json").read_text())
+        assert "filled_orders" not in snapshot
+        assert snapshot["filled_orders_count"] == 4
+        assert snapshot["pending_orders"] == []
+        assert [o["order_id"] for o in read_lines(tmp_path / "filled_orders.jsonl")] == [
+            o.order_id for o in orders
+        ]
+
+    def test_state_and_order_status_survive_restart(self, broker, tmp_path):
+        filled = broker.submit_market_order("TCS", 5, "buy")
+        broker.execute_pending_orders(PRICES)
+        pending = broker.submit_market_order("INFY", 3, "buy")
+
+        restarted = NSESimulatedBrokerAdapter(state_dir=tmp_path)
+
+        assert restarted.cash == pytest.approx(broker.cash)
+        assert restarted.get_position("TCS").quantity == 5
+        assert restarted.get_order_status(filled.order_id).status == OrderStatus.FILLED
+        assert restarted.get_order_status(pending.order_id).status == OrderStatus.PENDING
+        with pytest.raises(ValueError):
+            restarted.get_order_status("NSE-UNKNOWN")
+
+    def test_fills_beyond_snapshot_are_dropped(self, broker, tmp_path):
+        broker.submit_market_order("TCS", 5, "buy")
+        broker.execute_pending_orders(PRICES)
+        order = broker.submit_market_order("INFY", 3, "buy")
+
+        # Simulate a crash after appending the fill but before the snapshot write
+        with open(tmp_path / "filled_orders.jsonl", "a") as f:
+            f.write(json.dumps({
+                "order_id": order.order_id, "symbol": "INFY", "side": "buy",
+                "quantity": 3, "status": "filled", "submit_time": "2026-01-05T00:00:00+00:00",
+            }) + "\n")
+
+        restarted = NSESimulatedBrokerAdapter(state_dir=tmp_path)
+
+        assert len(restarted.filled_orders) == 1
+        assert len(read_lines(tmp_path / "filled_orders.jsonl")) == 1
+        assert restarted.get_order_status(order.order_id).status == OrderStatus.PENDING
+        assert len(restarted.execute_pending_orders(PRICES)) == 1
+        assert len(read_lines(tmp_path / "filled_orders.jsonl")) == 2
+
+    def test_legacy_snapshot_is_migrated(self, tmp_path):
+        legacy_fill = {
+            "order_id": "NSE-TCS-20260105091500", "symbol": "TCS", "side": "buy",
+            "quantity": 5, "status": "filled", "submit_time": "2026-01-05T03:45:00+00:00",
+            "fill_time": "2026-01-05T03:45:00+00:00", "fill_price": 1101.0, "slippage_pct": 0.1,
+        }
+        (tmp_path / "broker_state.json").write_text(json.dumps({
+            "account_equity": 994475.0,
+            "cash": 994475.0,
+            "positions": {},
+            "pending_orders": [],
+            "filled_orders": [legacy_fill],
+            "last_update": "2026-01-05T03:45:00+00:00",
+        }))
+
+        broker = NSESimulatedBrokerAdapter(state_dir=tmp_path)
+
+        assert broker.get_order_status(legacy_fill["order_id"]).filled_price == 1101.0
+        assert read_lines(tmp_path / "filled_orders.jsonl") == [legacy_fill]
+        snapshot = json.loads((tmp_path / "broker_state.json").read_text())
+        assert "filled_orders" not in snapshot
+        assert snapshot["filled_orders_count"] == 1
+
+    def test_rejected_orders_leave_pending(self, broker):
+        broker.submit_market_order("TCS", 5, "sell")  # No position to sell
+
+        assert broker.execute_pending_orders(PRICES) == []
+        assert broker.pending_orders == []
+        assert broker.filled_orders == []
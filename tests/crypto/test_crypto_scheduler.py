@@ -11,12 +11,16 @@ Tests the daemon-mode crypto scheduler:
 import pytest
 import json
 import tempfile
+import threading
+import time
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
 from unittest.mock import Mock, patch, MagicMock
 
 from crypto.scheduling import DowntimeScheduler, TradingState, CryptoSchedulerState
 from crypto.scheduling.state import CryptoSchedulerState as StateManager
+from execution import crypto_scheduler as crypto_scheduler_module
+from execution.crypto_scheduler import CryptoScheduler, CryptoSchedulerTask
 
 
 class TestCryptoSchedulerStatePersistence:
@@ -279,5 +283,140 @@ class TestStateImportExport:
             assert last_date.day == 5
 
 
+
+class TestDeadlineScheduling:
+    """Test next-due computation and lane isolation."""
+
+    @pytest.fixture
+    def state(self, tmp_path):
+        state_path = tmp_path / "crypto" / "test" / "state.json"
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        return CryptoSchedulerState(state_path)
+
+    @pytest.fixture
+    def scheduler(self, tmp_path, monkeypatch):
+        state_dir = tmp_path / "crypto" / "kraken_global" / "state"
+        monkeypatch.setattr(crypto_scheduler_module, "get_scope", lambda: "crypto_test")
+        monkeypatch.setattr(crypto_scheduler_module, "get_scope_path", lambda scope, component: state_dir)
+        monkeypatch.setattr(crypto_scheduler_module.signal, "signal", lambda *args: None)
+        sched = CryptoScheduler("03:00", "05:00", loop_interval_seconds=1)
+        yield sched
+        for executor in sched._lanes.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def test_interval_task_due_after_last_run(self, state):
+        downtime = DowntimeScheduler("03:00", "05:00")
+        task = CryptoSchedulerTask("trading_tick", lambda: None, interval_minutes=5)
+        now = datetime(2026, 2, 5, 10, 0, 0, tzinfo=timezone.utc)
+
+        assert task.next_due(state, now, downtime) == now
+
+        state.update("trading_tick", now - timedelta(minutes=2))
+        assert task.next_due(state, now, downtime) == now + timedelta(minutes=3)
+
+    def test_trading_task_deferred_past_downtime(self, state):
+        downtime = DowntimeScheduler("03:00", "05:00")
+        task = CryptoSchedulerTask("trading_tick", lambda: None, interval_minutes=5)
+        now = datetime(2026, 2, 5, 4, 0, 0, tzinfo=timezone.utc)
+
+        assert task.next_due(state, now, downtime) == datetime(2026, 2, 5, 5, 0, tzinfo=timezone.utc)
+
+    def test_daily_downtime_task_waits_for_next_window(self, state):
+        downtime = DowntimeScheduler("03:00", "05:00")
+        task = CryptoSchedulerTask(
+            "ml_training", lambda: None, daily=True, allowed_state=TradingState.DOWNTIME
+        )
+        now = datetime(2026, 2, 5, 3, 30, 0, tzinfo=timezone.utc)
+        state.update("ml_training", now)
+
+        assert task.next_due(state, now, downtime) == datetime(2026, 2, 6, 3, 0, tzinfo=timezone.utc)
+
+    def test_daily_run_at_task_targets_run_window(self, state):
+        downtime = DowntimeScheduler("03:00", "05:00")
+        task = CryptoSchedulerTask(
+            "universe_governance", lambda: None, daily=True, run_at_utc="04:55",
+            allowed_state=TradingState.DOWNTIME,
+        )
+        now = datetime(2026, 2, 5, 3, 10, 0, tzinfo=timezone.utc)
+
+        due = task.next_due(state, now, downtime)
+        assert due == datetime(2026, 2, 5, 4, 55, tzinfo=timezone.utc)
+        assert task.should_run(state, due, TradingState.DOWNTIME) == (True, "due")
+
+    def test_trading_lane_not_blocked_by_ml_lane(self, scheduler):
+        release = threading.Event()
+        trading_done = threading.Event()
+
+        scheduler.register_task(CryptoSchedulerTask(
+            "ml_training", lambda: release.wait(5), lane="ml", allowed_state=TradingState.TRADING,
+        ))
+        scheduler.register_task(CryptoSchedulerTask(
+            "trading_tick", trading_done.set, interval_minutes=1, lane="trading",
+        ))
+
+        now = datetime.now(timezone.utc)
+        assert scheduler._dispatch_due(now, TradingState.TRADING) == 2
+        assert trading_done.wait(5)
+        scheduler._running["trading_tick"].future.result(timeout=5)
+
+        scheduler._reap(datetime.now(timezone.utc))
+        assert "ml_training" in scheduler._running
+        assert "trading_tick" not in scheduler._running
+        assert scheduler.state.last_run("trading_tick") is not None
+
+        release.set()
+        scheduler._running["ml_training"].future.result(timeout=5)
+        scheduler._reap(datetime.now(timezone.utc))
+
+        metrics = scheduler.get_task_metrics()
+        assert metrics["trading_tick"]["runs"] == 1
+        assert metrics["ml_training"]["runs"] == 1
+        assert metrics["trading_tick"]["lateness_seconds"]["count"] == 1
+        # Rescheduled for the next interval
+        assert any(name == "trading_tick" for _, _, name in scheduler._queue)
+
+    def test_every_tick_task_waits_one_loop_after_completing(self, scheduler):
+        scheduler.register_task(CryptoSchedulerTask("monitor", lambda: None, lane="trading"))
+
+        now = datetime.now(timezone.utc)
+        assert scheduler._dispatch_due(now, TradingState.TRADING) == 1
+        scheduler._running["monitor"].future.result(timeout=5)
+        scheduler._reap(now)
+
+        assert scheduler._dispatch_due(now, TradingState.TRADING) == 0
+        later = now + timedelta(seconds=scheduler.loop_interval_seconds)
+        assert scheduler._dispatch_due(later, TradingState.TRADING) == 1
+
+    def test_timeout_keeps_lane_blocked(self, scheduler):
+        release = threading.Event()
+        tick_ran = threading.Event()
+        scheduler.register_task(CryptoSchedulerTask(
+            "monitor", lambda: release.wait(5), lane="trading", timeout_seconds=0,
+        ))
+
+        assert scheduler._dispatch_due(datetime.now(timezone.utc), TradingState.TRADING) == 1
+        lane = scheduler._lanes["trading"]
+        time.sleep(0.01)
+        scheduler._reap(datetime.now(timezone.utc))
+        assert scheduler.task_counters["monitor"]["timeouts"] == 1
+        assert scheduler._lanes["trading"] is lane
+
+        # Same-lane task is held back while the overrunning call is alive
+        scheduler.register_task(CryptoSchedulerTask(
+            "trading_tick", tick_ran.set, interval_minutes=1, lane="trading",
+        ))
+        assert scheduler._dispatch_due(datetime.now(timezone.utc), TradingState.TRADING) == 0
+        assert scheduler.task_counters["trading_tick"]["blocked"] == 1
+        assert not tick_ran.is_set()
+
+        release.set()
+        scheduler._running["monitor"].future.result(timeout=5)
+        scheduler._reap(datetime.now(timezone.utc))
+        later = datetime.now(timezone.utc) + timedelta(seconds=5)
+        assert scheduler._dispatch_due(later, TradingState.TRADING) >= 1
+        assert "trading_tick" in scheduler._running
+        assert tick_ran.wait(5)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -169,6 +169,27 @@ class TestMLPipeline:
         assert all(isinstance(f, list) for f in features)
         assert all(len(f) == 5 for f in features)  # 5 features per window
     
+    def test_feature_extraction_hourly_buckets(self, test_setup):
+        """Test trades are aggregated into the correct hourly windows."""
+        pipeline = test_setup['pipeline']
+        now = datetime(2026, 2, 5, 12, 0, 0, tzinfo=pytz.UTC)
+        
+        trades = [
+            {'timestamp': '2026-02-05T10:05:00+00:00', 'quantity': 1.0, 'price': 100.0, 'pnl': 5.0},
+            {'timestamp': '2026-02-05T10:55:00+00:00', 'quantity': 2.0, 'price': 110.0, 'pnl': -2.0},
+            {'timestamp': '2026-02-05T11:00:00+00:00', 'quantity': 0.5, 'price': 90.0, 'pnl': 1.0},
+            {'timestamp': '2026-02-05T12:00:00+00:00', 'quantity': 9.0, 'price': 1.0, 'pnl': 9.0},  # == now, excluded
+            {'timestamp': '2026-01-01T00:00:00+00:00', 'quantity': 9.0, 'price': 1.0, 'pnl': 9.0},  # before lookback
+            {'symbol': 'BTC', 'quantity': 9.0},  # no timestamp, excluded
+        ]
+        
+        features = pipeline._extract_features(trades, now)
+        
+        assert features == [
+            [2.0, 3.0, 3.0, 110.0, 100.0],
+            [1.0, 0.5, 1.0, 90.0, 90.0],
+        ]
+    
     def test_data_splitting(self, test_setup):
         """Test train/validation split."""
         pipeline = test_setup['pipeline']
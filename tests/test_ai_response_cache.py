@@ -0,0 +1,174 @@
+"""
+Tests for the AI advisor response cache (content addressing, TTL,
+persistence, single-flight) against a local stub chat endpoint.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import runtime.ai_advisor as ai_advisor
+from runtime.ai_advisor import AIAdvisorRunner
+from runtime.ai_response_cache import AIResponseCache, canonical_payload
+
+SYMBOLS = ["BTC", "ETH", "SOL", "LINK", "AVAX"]
+
+
+def features(close=50123.4, ts="2026-01-05T00:00:00+00:00"):
+    return {
+        symbol: {"timestamp_utc": ts, "close": close, "rsi_14": 55.27, "momentum": 0.0123}
+        for symbol in SYMBOLS
+    }
+
+
+@pytest.fixture
+def stub_endpoint(monkeypatch):
+    calls = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            calls.append(body)
+            time.sleep(0.1)
+            content = json.dumps({"ranked_symbols": ["ETH", "BTC"], "reasoning": "stub"})
+            payload = json.dumps({
+                "id": f"resp-{len(calls)}",
+                "model": body["model"],
+                "choices": [{"message": {"content": content}}],
+            }).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_API_BASE_URL", f"http://127.0.0.1:{server.server_port}")
+    monkeypatch.setattr(ai_advisor, "load_crypto_config", lambda scope: {"UNIVERSE_ALLOWLIST": SYMBOLS})
+    monkeypatch.setattr(ai_advisor, "get_scope", lambda: "paper_kraken_crypto_global")
+    monkeypatch.setattr(ai_advisor, "_write_ai_call_log", lambda payload: None)
+    yield calls
+    server.shutdown()
+    server.server_close()
+
+
+def test_canonical_payload_ignores_timestamps_and_noise():
+    a = canonical_payload(features(close=50123.4, ts="2026-01-05T00:00:00"))
+    b = canonical_payload(features(close=50188.9, ts="2026-01-05T00:05:00"))
+    c = canonical_payload(features(close=61000.0))
+
+    assert a == b
+    assert a != c
+
+
+def test_near_identical_state_hits_cache(stub_endpoint, tmp_path):
+    runner = AIAdvisorRunner(cache=AIResponseCache(tmp_path, ttl_seconds=3600))
+
+    first = runner.rank_with_ai(features(close=50123.4), "test")
+    second = runner.rank_with_ai(features(close=50140.0, ts="2026-01-05T00:05:00"), "test")
+
+    assert first["ranked_symbols"][:2] == ["ETH", "BTC"]
+    assert second == first
+    assert len(stub_endpoint) == 1
+    assert runner._calls_today == 1
+
+
+def test_cache_persists_across_runners(stub_endpoint, tmp_path):
+    AIAdvisorRunner(cache=AIResponseCache(tmp_path, ttl_seconds=3600)).rank_with_ai(features(), "a")
+    runner = AIAdvisorRunner(cache=AIResponseCache(tmp_path, ttl_seconds=3600))
+
+    assert runner.rank_with_ai(features(), "b") is not None
+    assert len(stub_endpoint) == 1
+    assert runner._calls_today == 0
+
+
+def test_expired_entry_calls_again(stub_endpoint, tmp_path):
+    cache = AIResponseCache(tmp_path, ttl_seconds=3600)
+    runner = AIAdvisorRunner(cache=cache)
+    runner.rank_with_ai(features(), "a")
+
+    cache.ttl_seconds = 0.01
+    time.sleep(0.02)
+    runner.rank_with_ai(features(), "b")
+
+    assert len(stub_endpoint) == 2
+
+
+def test_trigger_serves_cache_past_budget_and_interval(stub_endpoint, tmp_path, monkeypatch):
+    monkeypatch.setattr(ai_advisor, "AI_ADVISOR_ENABLED", True)
+    monkeypatch.setattr(ai_advisor, "AI_MAX_CALLS_PER_DAY", 1)
+    monkeypatch.setattr(ai_advisor, "_build_ai_features_from_market_data", lambda: features())
+    runner = AIAdvisorRunner(cache=AIResponseCache(tmp_path, ttl_seconds=3600))
+
+    first = runner.trigger_ranking_from_market_data("startup")
+    assert runner.trigger_ranking_from_market_data("daily") == first
+    assert len(stub_endpoint) == 1
+
+    # Uncached payload is still gated
+    monkeypatch.setattr(ai_advisor, "_build_ai_features_from_market_data", lambda: features(close=61000.0))
+    assert runner.trigger_ranking_from_market_data("daily") is None
+    assert len(stub_endpoint) == 1
+
+
+def test_concurrent_triggers_share_one_call(stub_endpoint, tmp_path):
+    runner = AIAdvisorRunner(cache=AIResponseCache(tmp_path, ttl_seconds=3600))
+    results = []
+
+    threads = [
+        threading.Thread(target=lambda: results.append(runner.rank_with_ai(features(), "t")))
+        for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(stub_endpoint) == 1
+    assert len(results) == 4 and all(r == results[0] for r in results)
+
+
+def test_failed_call_is_not_cached(tmp_path):
+    cache = AIResponseCache(tmp_path, ttl_seconds=3600)
+    attempts = []
+
+    def boom():
+        attempts.append(1)
+        raise RuntimeError("endpoint down")
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            cache.get_or_compute("k", boom)
+
+    assert len(attempts) == 2
+    assert cache.get("k") is None
+
+
+def test_expired_files_are_deleted(tmp_path):
+    import os
+
+    two_hours_ago = time.time() - 7200
+    for key in ("old", "stale"):
+        path = tmp_path / f"{key}.json"
+        path.write_text(json.dumps({"stored_at": two_hours_ago, "value": {"v": key}}))
+        os.utime(path, (two_hours_ago, two_hours_ago))
+    cache = AIResponseCache(None, ttl_seconds=3600)
+    cache.cache_dir = tmp_path  # Attach after construction to skip the start-up sweep
+    cache.put("new", {"v": "new"})
+
+    # Lookup of an expired entry removes its file
+    assert cache.get("old") is None
+    assert not (tmp_path / "old.json").exists()
+
+    # Entries never looked up again are swept when a cache is created
+    AIResponseCache(tmp_path, ttl_seconds=3600)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["new.json"]
@@ -0,0 +1,91 @@
+"""
+Unit tests for interval-indexed corporate event blackouts.
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from policies.corporate_events import CorporateEvent, CorporateEventGuard, CorporateEventType
+
+
+def brute_force_blocked(events, symbol, when, before=2, after=2):
+    return any(
+        e.event_date - timedelta(days=before) <= when <= e.event_date + timedelta(days=after)
+        for e in events
+        if e.symbol == symbol
+    )
+
+
+@pytest.fixture
+def calendar():
+    rng = random.Random(7)
+    base = datetime(2026, 1, 1)
+    symbols = [f"SYM{i}" for i in range(40)]
+    types = list(CorporateEventType)
+    events = [
+        CorporateEvent(
+            symbol=rng.choice(symbols),
+            event_type=rng.choice(types),
+            event_date=base + timedelta(days=rng.randint(0, 90), hours=rng.randint(0, 23)),
+        )
+        for _ in range(300)
+    ]
+    guard = CorporateEventGuard()
+    guard.load_events_from_provider(events)
+    return guard, events, symbols + ["NOEVENTS"]
+
+
+def test_universe_check_matches_linear_scan(calendar):
+    guard, events, symbols = calendar
+
+    for offset in range(-5, 100, 3):
+        when = datetime(2026, 1, 1, 12) + timedelta(days=offset)
+        expected = {s for s in symbols if brute_force_blocked(events, s, when)}
+
+        assert guard.get_blocked_symbols(symbols, when) == expected
+        assert {s for s in symbols if guard.is_symbol_blocked(s, when)} == expected
+
+
+def test_precomputed_days_match_live_queries(calendar):
+    guard, events, symbols = calendar
+    days = [datetime(2026, 1, 1) + timedelta(days=d) for d in range(95)]
+    live = {d: guard.get_blocked_symbols(symbols, d) for d in days}
+
+    guard.precompute_blocked_days(days)
+    guard.mark_symbol_missing_data("NOEVENTS")
+
+    for d in days:
+        assert guard.get_blocked_symbols(symbols, d) == live[d] | {"NOEVENTS"}
+
+
+def test_summary_and_next_event(calendar):
+    guard, events, symbols = calendar
+    when = datetime(2026, 2, 1)
+
+    summary = guard.get_blackout_summary(symbols, when)
+
+    blocked = set(summary["blocked_symbols"])
+    expected_active = sum(
+        1 for e in events
+        if e.symbol in blocked
+        and e.event_date - timedelta(days=2) <= when <= e.event_date + timedelta(days=2)
+    )
+    assert sum(summary["event_type_counts"].values()) == expected_active
+
+    for symbol in symbols:
+        future = [e for e in events if e.symbol == symbol and e.event_date >= when]
+        expected = min(future, key=lambda e: e.event_date) if future else None
+        assert guard.get_next_event(symbol, when) is expected
+
+
+def test_timezone_aware_dates_compare_in_utc():
+    guard = CorporateEventGuard(blackout_days_before=0, blackout_days_after=0)
+    guard.load_events_from_provider([
+        CorporateEvent("INFY", CorporateEventType.EARNINGS, datetime(2026, 3, 2, 10, tzinfo=timezone.utc)),
+    ])
+
+    ist = timezone(timedelta(hours=5, minutes=30))
+    assert guard.is_symbol_blocked("INFY", datetime(2026, 3, 2, 15, 30, tzinfo=ist))
+    assert not guard.is_symbol_blocked("INFY", datetime(2026, 3, 2, 16, tzinfo=ist))
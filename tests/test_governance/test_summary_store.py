@@ -0,0 +1,190 @@
+"""
+Tests for the shared daily-summary store (governance/summary_store.py)
+and the governance/ops readers built on it.
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+import governance.summary_store as summary_store_module
+from governance.adaptive_scheduler import AdaptiveScheduler
+from governance.summary_reader import SummaryReader as GovernanceSummaryReader
+from governance.summary_store import SummaryStore
+from ops_agent.summary_reader import SummaryReader as OpsSummaryReader
+
+
+def summary(days_ago, **fields):
+    day = datetime.now() - timedelta(days=days_ago)
+    record = {
+        "date": str(day.date()),
+        "timestamp": day.isoformat(),
+        "trades_taken": 2,
+        "trades_skipped": 1,
+        "realized_pnl": 10.5,
+        "max_drawdown": -0.01,
+        "data_issues": 0,
+    }
+    record.update(fields)
+    return record
+
+
+@pytest.fixture
+def summary_file(tmp_path):
+    path = tmp_path / "paper_kraken_crypto_global" / "logs" / "daily_summary.jsonl"
+    path.parent.mkdir(parents=True)
+    return path
+
+
+def write(path, records, mode="w"):
+    with open(path, mode) as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+@pytest.fixture
+def count_parses(monkeypatch):
+    parses = []
+    real_loads = json.loads
+    monkeypatch.setattr(
+        summary_store_module.json, "loads", lambda s: parses.append(s) or real_loads(s)
+    )
+    return parses
+
+
+class TestSummaryStore:
+    def test_unchanged_file_is_parsed_once(self, summary_file, count_parses):
+        write(summary_file, [summary(2), summary(1)])
+        store = SummaryStore()
+
+        first = store.table(summary_file)
+        second = store.table(summary_file)
+
+        assert first is second
+        assert len(first) == 2
+        assert len(count_parses) == 2
+
+    def test_appended_lines_are_tailed(self, summary_file, count_parses):
+        write(summary_file, [summary(2), summary(1)])
+        store = SummaryStore()
+        store.table(summary_file)
+
+        write(summary_file, [summary(0, trades_taken=5)], mode="a")
+        table = store.table(summary_file)
+
+        assert [r["trades_taken"] for r in table.records] == [2, 2, 5]
+        assert len(count_parses) == 3  # Only the new line was parsed
+
+    def test_replaced_file_is_reread(self, summary_file):
+        write(summary_file, [summary(2), summary(1)])
+        store = SummaryStore()
+        store.table(summary_file)
+
+        replacement = summary_file.with_suffix(".new")
+        write(replacement, [summary(0, trades_taken=9)])
+        os.replace(replacement, summary_file)
+
+        assert [r["trades_taken"] for r in store.table(summary_file).records] == [9]
+
+    def test_unterminated_line_is_visible_but_not_committed(self, summary_file):
+        write(summary_file, [summary(1)])
+        with open(summary_file, "a") as f:
+            f.write(json.dumps(summary(0, trades_taken=7)))
+        store = SummaryStore()
+
+        assert len(store.table(summary_file)) == 2
+
+        with open(summary_file, "a") as f:
+            f.write("\n")
+        write(summary_file, [summary(0, trades_taken=8)], mode="a")
+
+        assert [r["trades_taken"] for r in store.table(summary_file).records] == [2, 7, 8]
+
+    def test_malformed_line_is_recorded(self, summary_file):
+        write(summary_file, [summary(2)])
+        with open(summary_file, "a") as f:
+            f.write("not json\n")
+        write(summary_file, [summary(1)], mode="a")
+
+        table = SummaryStore().table(summary_file)
+
+        assert len(table) == 2
+        assert table.error_index == 1
+
+    def test_missing_file_is_empty(self, tmp_path):
+        assert len(SummaryStore().table(tmp_path / "missing.jsonl")) == 0
+
+    def test_window_and_aggregates_from_columns(self, summary_file):
+        write(summary_file, [
+            summary(20, realized_pnl=-100.0, max_drawdown=-0.2),
+            summary(3, ai_last_ranking={"ranked_symbols": ["BTC", "ETH"]}),
+            summary(1, max_drawdown=-0.05, ai_last_ranking={"ranked_symbols": ["BTC"]}),
+        ])
+        table = SummaryStore().table(summary_file)
+
+        indices = table.window(7)
+        metrics = table.performance_metrics(indices)
+        coverage = table.scan_coverage(indices)
+
+        assert list(indices) == [1, 2]
+        assert metrics == {
+            "total_trades": 4,
+            "trades_skipped": 2,
+            "total_pnl": 21.0,
+            "max_drawdown": -0.05,
+            "data_issues": 0,
+        }
+        assert isinstance(metrics["total_trades"], int)
+        assert coverage["scan_counts"] == {"BTC": 2, "ETH": 1}
+        assert coverage["total_days"] == 2
+
+
+class TestReadersShareStore:
+    def test_governance_reader_matches_list_aggregates(self, tmp_path, summary_file):
+        write(summary_file, [summary(10), summary(3), summary(1, trades_taken=4)])
+        reader = GovernanceSummaryReader(str(tmp_path), store=SummaryStore())
+
+        summaries = reader.read_summaries("paper.kraken.crypto.global", lookback_days=7)
+        analysis = reader.get_combined_analysis(
+            "paper.kraken.crypto.global", "live.kraken.crypto.global", lookback_days=7
+        )
+
+        assert len(summaries) == 2
+        assert analysis["paper"]["summaries_count"] == 2
+        assert analysis["paper"]["performance"] == reader.extract_performance_metrics(summaries)
+        assert analysis["paper"]["latest"]["trades_taken"] == 4
+        assert analysis["live"]["summaries_count"] == 0
+
+    def test_governance_reader_returns_empty_on_malformed_file(self, tmp_path, summary_file):
+        write(summary_file, [summary(1)])
+        with open(summary_file, "a") as f:
+            f.write("not json\n")
+
+        reader = GovernanceSummaryReader(str(tmp_path), store=SummaryStore())
+
+        assert reader.read_summaries("paper.kraken.crypto.global") == []
+
+    def test_ops_and_governance_readers_parse_file_once(self, tmp_path, summary_file, count_parses):
+        write(summary_file, [summary(2), summary(1, regime="RISK_ON")])
+        store = SummaryStore()
+
+        governance = GovernanceSummaryReader(str(tmp_path), store=store)
+        ops = OpsSummaryReader(str(tmp_path), store=store)
+
+        governance.read_summaries("paper.kraken.crypto.global")
+        latest = ops.get_latest_summary("paper_crypto")
+        entries = ops.get_summaries("paper_crypto")
+
+        assert latest.regime == "RISK_ON"
+        assert [e.regime for e in entries] == ["RISK_ON", "NEUTRAL"]
+        assert len(count_parses) == 2
+
+    def test_adaptive_scheduler_reads_last_seven(self, tmp_path, summary_file):
+        write(summary_file, [summary(days_ago) for days_ago in range(10, 0, -1)])
+
+        scheduler = AdaptiveScheduler(str(tmp_path))
+
+        assert len(scheduler.paper_summaries) == 7
+        assert scheduler.paper_summaries[-1]["date"] == str((datetime.now() - timedelta(days=1)).date())
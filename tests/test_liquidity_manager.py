@@ -0,0 +1,169 @@
+"""
+Tests for position health scoring and liquidation planning/execution.
+"""
+
+import threading
+
+import pandas as pd
+import pytest
+
+from broker.adapter import OrderResult, OrderStatus
+from risk.liquidity_manager import LiquidityManager
+from risk.portfolio_state import PortfolioState
+from risk.position_health import PositionHealthScorer
+
+ENTRY = pd.Timestamp.now(tz="UTC").normalize() - pd.Timedelta(days=5)
+
+
+class FakeBroker:
+    def __init__(self, barrier=None, concurrent=False):
+        self.closed = []
+        self.barrier = barrier
+        self.supports_concurrent_orders = concurrent
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def close_position(self, symbol):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        if self.barrier is not None:
+            self.barrier.wait()  # Fails unless the closes run concurrently
+        with self._lock:
+            self.in_flight -= 1
+            self.closed.append(symbol)
+        return OrderResult(
+            order_id=f"CLOSE-{symbol}", symbol=symbol, side="sell", quantity=1,
+            status=OrderStatus.FILLED, filled_qty=1, filled_price=None,
+            submit_time=None, fill_time=None,
+        )
+
+
+class FakeLedger:
+    def __init__(self):
+        self.batches = []
+        self._open_positions = {"AAA": {}, "BBB": {}}
+        self.saves = 0
+
+    def add_trades(self, trades):
+        self.batches.append([t.symbol for t in trades])
+
+    def _save_open_positions(self):
+        self.saves += 1
+
+
+@pytest.fixture(autouse=True)
+def no_env_target(monkeypatch):
+    monkeypatch.delenv("LIQUIDITY_TARGET_CASH", raising=False)
+
+
+def make_manager(portfolio, broker, ledger=None):
+    manager = LiquidityManager(portfolio, broker, cash_reserve_days=1, trade_ledger=ledger)
+    manager.scope = None  # swing mode
+    return manager
+
+
+class TestPositionHealthScorer:
+    def test_components_and_order(self):
+        portfolio = PortfolioState(initial_equity=100000.0)
+        portfolio.open_trade("WIN", ENTRY, 100.0, 10, 50.0, 1)
+        portfolio.open_trade("LOSS", ENTRY, 100.0, 10, 50.0, 5)
+        portfolio.update_prices({"WIN": 110.0, "LOSS": 90.0})
+        positions = [p for ps in portfolio.open_positions.values() for p in ps]
+
+        scored = PositionHealthScorer().score_positions(positions)
+
+        assert [s.symbol for s in scored] == ["WIN", "LOSS"]
+        win, loss = scored
+        assert win.score_breakdown == {"pnl": 0.0, "staleness": 75.0, "confidence": 0.0, "size": 0.0}
+        assert loss.score_breakdown["pnl"] == 100.0
+        assert loss.score_breakdown["size"] == pytest.approx(18.2)
+        assert win.holding_days == 5
+        assert win.unrealized_pnl_pct == 10.0
+        assert win.risk_amount == 50.0
+
+    def test_empty(self):
+        assert PositionHealthScorer().score_positions([]) == []
+
+
+class TestLiquidityManager:
+    def test_sells_minimal_set_for_cash_target(self):
+        portfolio = PortfolioState(initial_equity=100000.0)
+        portfolio.open_trade("AAA", ENTRY, 100.0, 10, 100.0, 1)   # $1,000, sells first
+        portfolio.open_trade("BBB", ENTRY, 100.0, 20, 100.0, 3)   # $2,000
+        portfolio.open_trade("CCC", ENTRY, 100.0, 5, 100.0, 5)    # $500, keep
+        broker = FakeBroker()
+
+        result = make_manager(portfolio, broker).assess_and_liquidate(
+            account_cash=0.0, account_equity=100000.0, target_cash=1500.0
+        )
+
+        # AAA alone is not enough; once BBB is added AAA is redundant
+        assert broker.closed == ["BBB"]
+        assert result.positions_sold == ["BBB"]
+        assert result.cash_freed == pytest.approx(2000.0)
+        assert len(portfolio.open_positions["AAA"]) == 1
+        assert portfolio.open_positions["BBB"] == []
+        assert portfolio.consecutive_losses == 0
+
+    def test_closes_submitted_concurrently_and_ledger_persisted_once(self):
+        portfolio = PortfolioState(initial_equity=100000.0)
+        portfolio.open_trade("AAA", ENTRY, 100.0, 10, 100.0, 1)
+        portfolio.open_trade("AAA", ENTRY, 100.0, 10, 100.0, 1)
+        portfolio.open_trade("BBB", ENTRY, 100.0, 10, 100.0, 1)
+        broker = FakeBroker(barrier=threading.Barrier(2, timeout=5), concurrent=True)
+        ledger = FakeLedger()
+
+        result = make_manager(portfolio, broker, ledger).assess_and_liquidate(
+            account_cash=0.0, account_equity=100000.0, target_cash=3000.0
+        )
+
+        assert sorted(broker.closed) == ["AAA", "BBB"]
+        assert result.errors == []
+        assert portfolio.get_open_positions_count() == 0
+        assert ledger.batches == [["AAA", "AAA", "BBB"]]
+        assert ledger.saves == 1
+        assert ledger._open_positions == {}
+
+    def test_closes_serial_unless_broker_opts_in(self):
+        portfolio = PortfolioState(initial_equity=100000.0)
+        portfolio.open_trade("AAA", ENTRY, 100.0, 10, 100.0, 1)
+        portfolio.open_trade("BBB", ENTRY, 100.0, 10, 100.0, 1)
+        broker = FakeBroker()
+
+        result = make_manager(portfolio, broker).assess_and_liquidate(
+            account_cash=0.0, account_equity=100000.0, target_cash=2000.0
+        )
+
+        assert sorted(broker.closed) == ["AAA", "BBB"]
+        assert result.errors == []
+        assert broker.max_in_flight == 1
+
+    def test_heat_violation_uses_projected_risk(self):
+        portfolio = PortfolioState(initial_equity=10000.0)
+        portfolio.open_trade("AAA", ENTRY, 100.0, 10, 600.0, 1)
+        portfolio.open_trade("BBB", ENTRY, 100.0, 10, 400.0, 5)
+        broker = FakeBroker()
+
+        result = make_manager(portfolio, broker).assess_and_liquidate(
+            account_cash=5000.0, account_equity=10000.0
+        )
+
+        assert result.violations_detected[0].startswith("heat_exceeded")
+        assert broker.closed == ["AAA"]
+        assert result.heat_after == pytest.approx(0.04)
+
+    def test_pdt_lot_protects_whole_symbol(self):
+        portfolio = PortfolioState(initial_equity=100000.0)
+        portfolio.open_trade("AAA", ENTRY, 100.0, 10, 100.0, 1)
+        portfolio.open_trade("AAA", pd.Timestamp.now(tz="UTC"), 100.0, 10, 100.0, 1)
+        portfolio.open_trade("BBB", ENTRY, 100.0, 10, 100.0, 5)
+        broker = FakeBroker()
+
+        result = make_manager(portfolio, broker).assess_and_liquidate(
+            account_cash=0.0, account_equity=100000.0, target_cash=500.0
+        )
+
+        assert broker.closed == ["BBB"]
+        assert result.positions_skipped_pdt == ["AAA"]
@@ -0,0 +1,124 @@
+"""Tests for the precomputed market session calendar."""
+
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+from markets.base import IndiaMarket, MarketStatus, USMarket
+from markets.calendar import us_equity_early_closes, us_equity_holidays
+from policies.market_hours.india_equity_market_hours import IndiaEquityMarketHours
+
+NY = ZoneInfo("America/New_York")
+IST = ZoneInfo("Asia/Kolkata")
+
+
+def test_us_holidays_2026():
+    assert list(us_equity_holidays(2026)) == [
+        date(2026, 1, 1),
+        date(2026, 1, 19),
+        date(2026, 2, 16),
+        date(2026, 4, 3),
+        date(2026, 5, 25),
+        date(2026, 6, 19),
+        date(2026, 7, 3),   # July 4 falls on a Saturday
+        date(2026, 9, 7),
+        date(2026, 11, 26),
+        date(2026, 12, 25),
+    ]
+
+
+def test_saturday_new_year_not_observed_in_prior_year():
+    assert date(2021, 12, 31) not in us_equity_holidays(2021)
+    assert date(2021, 12, 31) not in us_equity_holidays(2022)
+
+
+def test_us_early_closes():
+    assert us_equity_early_closes(2026) == {
+        date(2026, 11, 27): time(13, 0),
+        date(2026, 12, 24): time(13, 0),
+    }
+    assert date(2025, 7, 3) in us_equity_early_closes(2025)
+
+
+def test_us_session_boundaries():
+    market = USMarket()
+    assert market.is_market_open(datetime(2026, 3, 6, 9, 30))
+    assert market.is_market_open(datetime(2026, 3, 6, 16, 0))
+    assert not market.is_market_open(datetime(2026, 3, 6, 16, 0, 1))
+    assert not market.is_market_open(datetime(2026, 3, 6, 9, 29, 59))
+    # Aware input in another timezone (first session after the DST switch)
+    assert market.is_market_open(datetime(2026, 3, 9, 13, 30, tzinfo=ZoneInfo("UTC")))
+    assert not market.is_market_open(datetime(2026, 3, 9, 13, 29, tzinfo=ZoneInfo("UTC")))
+
+
+def test_us_market_status():
+    market = USMarket()
+    assert market.get_market_status(datetime(2026, 3, 6, 5, 0)) == MarketStatus.PRE_MARKET
+    assert market.get_market_status(datetime(2026, 3, 6, 12, 0)) == MarketStatus.OPEN
+    assert market.get_market_status(datetime(2026, 3, 6, 17, 0)) == MarketStatus.POST_MARKET
+    assert market.get_market_status(datetime(2026, 3, 6, 21, 0)) == MarketStatus.CLOSED
+    assert market.get_market_status(datetime(2026, 3, 7, 12, 0)) == MarketStatus.HOLIDAY
+    assert market.get_market_status(datetime(2026, 11, 26, 12, 0)) == MarketStatus.HOLIDAY
+    # Early close
+    assert market.get_market_status(datetime(2026, 11, 27, 13, 30)) == MarketStatus.POST_MARKET
+
+
+def test_next_open_and_close():
+    calendar = USMarket().calendar
+    # Friday evening before a year end rolls into the next year's first session
+    clock = calendar.clock(datetime(2026, 12, 31, 17, 0))
+    assert clock["is_open"] is False
+    assert clock["next_open"] == datetime(2027, 1, 4, 9, 30, tzinfo=NY)
+    assert clock["next_close"] == datetime(2027, 1, 4, 16, 0, tzinfo=NY)
+
+    # During a session next_close is today's close, next_open is tomorrow's
+    clock = calendar.clock(datetime(2026, 11, 25, 10, 0))
+    assert clock["is_open"] is True
+    assert clock["next_close"] == datetime(2026, 11, 25, 16, 0, tzinfo=NY)
+    assert clock["next_open"] == datetime(2026, 11, 27, 9, 30, tzinfo=NY)
+    assert calendar.next_close(datetime(2026, 11, 26, 12, 0)) == datetime(2026, 11, 27, 13, 0, tzinfo=NY)
+
+
+def test_span_extends_on_demand():
+    calendar = USMarket().calendar
+    assert calendar.is_open(datetime(2040, 1, 3, 10, 0))
+    assert not calendar.is_open(datetime(2040, 1, 2, 10, 0))  # Sunday New Year's observed
+    assert calendar.is_trading_day(date(2010, 1, 4))
+
+
+def test_vectorized_trading_days_match_scalar():
+    market = USMarket()
+    days = pd.date_range("2025-12-01", "2027-02-01", freq="D")
+    mask = market.calendar.is_trading_day(days)
+    assert isinstance(mask, np.ndarray)
+    assert mask.tolist() == [market.is_trading_day(d.date()) for d in days]
+    assert market.is_trading_day(date(2026, 1, 19)) is False
+    assert market.is_trading_day(date(2026, 1, 20)) is True
+
+
+def test_india_market_uses_configured_holidays():
+    market = IndiaMarket()
+    market.holidays = [date(2026, 1, 26)]  # Before the calendar is first built
+    assert not market.is_trading_day(date(2026, 1, 26))
+    assert market.get_market_status(datetime(2026, 1, 26, 10, 0)) == MarketStatus.HOLIDAY
+    assert market.is_market_open(datetime(2026, 1, 27, 10, 0))
+    assert not market.is_market_open(datetime(2026, 1, 27, 15, 31))
+
+
+def test_india_policy_matches_previous_rules():
+    policy = IndiaEquityMarketHours()
+    start = datetime(2025, 12, 1, 12, 0, tzinfo=IST)
+    for offset in range(450):
+        day = start + timedelta(days=offset)
+        expected = day.weekday() < 5 and (day.month, day.day) not in policy.NSE_HOLIDAYS_2026
+        assert policy.is_trading_day(day) == expected, day
+
+    assert policy.is_market_open(datetime(2026, 1, 27, 9, 15, tzinfo=IST))
+    assert policy.is_market_open(datetime(2026, 1, 27, 15, 30, tzinfo=IST))
+    assert not policy.is_market_open(datetime(2026, 1, 27, 15, 30, 1, tzinfo=IST))
+    assert not policy.is_market_open(datetime(2026, 1, 26, 10, 0, tzinfo=IST))
+    assert policy.time_until_open(datetime(2026, 1, 23, 16, 0, tzinfo=IST)) == timedelta(days=3, hours=17, minutes=15)
+    # One calendar per process
+    assert IndiaEquityMarketHours().calendar is policy.calendar
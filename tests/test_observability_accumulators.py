@@ -0,0 +1,75 @@
+"""
+Unit tests for the running realized-PnL and drawdown accumulators behind
+RuntimeObservability.
+"""
+
+from datetime import date
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from broker.trade_ledger import TradeLedger, create_trade_from_fills
+from risk.portfolio_state import PortfolioState
+from runtime.observability import RuntimeObservability
+
+
+def make_trade(exit_ts: str, exit_price: float, entry_ts: str = "2026-02-01T10:00:00+00:00"):
+    return create_trade_from_fills(
+        symbol="BTC",
+        entry_order_id="e1",
+        entry_fill_timestamp=entry_ts,
+        entry_fill_price=100.0,
+        entry_fill_quantity=1.0,
+        exit_order_id="x1",
+        exit_fill_timestamp=exit_ts,
+        exit_fill_price=exit_price,
+        exit_fill_quantity=1.0,
+        exit_type="SWING_EXIT",
+        exit_reason="test",
+    )
+
+
+def test_realized_pnl_bucketed_by_utc_day_and_survives_reload(tmp_path):
+    ledger_file = tmp_path / "ledger" / "trades.jsonl"
+    ledger = TradeLedger(ledger_file)
+    ledger.add_trade(make_trade("2026-02-05T10:00:00+00:00", 110.0))
+    ledger.add_trade(make_trade("2026-02-05T23:30:00-05:00", 95.0))  # 2026-02-06 UTC
+    ledger.add_trade(make_trade("2026-02-05T12:00:00", 103.0, entry_ts="2026-02-01T10:00:00"))  # naive = UTC
+
+    assert ledger.get_realized_pnl_for_day(date(2026, 2, 5)) == pytest.approx(13.0)
+    assert ledger.get_realized_pnl_for_day(date(2026, 2, 6)) == pytest.approx(-5.0)
+    assert ledger.get_last_trade().exit_price == 103.0
+
+    reloaded = TradeLedger(ledger_file)
+    assert reloaded.get_realized_pnl_for_day(date(2026, 2, 5)) == pytest.approx(13.0)
+
+
+def test_portfolio_drawdown_tracks_equity_changes():
+    portfolio = PortfolioState(initial_equity=100000.0)
+    # First broker sync is the baseline, not a drawdown from the configured equity
+    portfolio.sync_account_balances(equity=1000.0, cash=1000.0, buying_power=1000.0, cash_only=True)
+    assert portfolio.max_drawdown_pct == 0.0
+
+    entry = pd.Timestamp("2026-01-05")
+    portfolio.open_trade("AAPL", entry, 100.0, 2, 10.0, 3)
+    portfolio.close_trade("AAPL", entry, 150.0)  # equity 1100
+    portfolio.open_trade("AAPL", entry, 100.0, 2, 10.0, 3)
+    portfolio.close_trade("AAPL", entry, 45.0)  # equity 990
+    portfolio.sync_account_balances(equity=1050.0, cash=1050.0, buying_power=1050.0, cash_only=True)
+
+    assert portfolio.peak_equity == pytest.approx(1100.0)
+    assert portfolio.max_drawdown_pct == pytest.approx(110.0 / 1100.0)
+
+
+def test_observability_reads_accumulators(tmp_path):
+    ledger = TradeLedger(tmp_path / "trades.jsonl")
+    portfolio = PortfolioState(initial_equity=1000.0)
+    portfolio.max_drawdown_pct = 0.25
+    obs = RuntimeObservability()
+    obs.attach_runtime(SimpleNamespace(
+        trade_ledger=ledger, risk_manager=SimpleNamespace(portfolio=portfolio)
+    ))
+
+    assert obs._daily_realized_pnl() == 0.0
+    assert obs._max_drawdown() == 0.25
@@ -0,0 +1,248 @@
+"""
+Tests for Telegram long-polling, concurrent reply workers and the shared
+reader snapshot cache, against a local fake Telegram Bot API server.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from ops_agent.ops_loop import OpsLoop
+from ops_agent.persistence import OpsEventLogger
+from ops_agent.response_generator import ResponseGenerator
+from ops_agent.snapshot_cache import CachedReader, SnapshotCache
+from ops_agent.telegram_handler import TelegramHandler
+
+CHAT_IDS = [101, 202, 303]
+
+
+class FakeTelegram:
+    """Minimal Bot API: getUpdates (honours offset/timeout) and sendMessage."""
+
+    def __init__(self):
+        self.updates = []
+        self.sent = []
+        self.poll_requests = 0
+        self.cond = threading.Condition()
+
+    def push(self, chat_id, text):
+        with self.cond:
+            update_id = len(self.updates) + 1
+            self.updates.append({
+                "update_id": update_id,
+                "message": {
+                    "message_id": update_id,
+                    "chat": {"id": chat_id},
+                    "from": {"id": chat_id},
+                    "text": text,
+                },
+            })
+            self.cond.notify_all()
+
+    def get_updates(self, offset, timeout):
+        deadline = time.monotonic() + timeout
+        with self.cond:
+            self.poll_requests += 1
+            while True:
+                pending = [u for u in self.updates if u["update_id"] >= offset]
+                remaining = deadline - time.monotonic()
+                if pending or remaining <= 0:
+                    return pending
+                self.cond.wait(remaining)
+
+    def record_send(self, payload):
+        with self.cond:
+            self.sent.append((time.monotonic(), payload["chat_id"], payload["text"]))
+            self.cond.notify_all()
+
+
+@pytest.fixture
+def fake_telegram():
+    fake = FakeTelegram()
+
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self, result):
+            body = json.dumps({"ok": True, "result": result}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            params = parse_qs(url.query)
+            offset = int(params.get("offset", ["0"])[0])
+            timeout = min(float(params.get("timeout", ["0"])[0]), 5.0)
+            self._reply(fake.get_updates(offset, timeout))
+
+        def do_POST(self):
+            payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            fake.record_send(payload)
+            self._reply({"message_id": len(fake.sent)})
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    fake.base_url = f"http://127.0.0.1:{server.server_port}"
+    yield fake
+    server.shutdown()
+    server.server_close()
+
+
+def make_handler(fake, long_poll_timeout_seconds=5):
+    return TelegramHandler(
+        "test-token",
+        CHAT_IDS,
+        long_poll_timeout_seconds=long_poll_timeout_seconds,
+        api_base_url=fake.base_url,
+    )
+
+
+class TestTelegramLongPolling:
+    def test_long_poll_returns_as_soon_as_message_arrives(self, fake_telegram):
+        handler = make_handler(fake_telegram, long_poll_timeout_seconds=5)
+        threading.Timer(0.3, fake_telegram.push, args=(101, "status live crypto")).start()
+
+        started = time.monotonic()
+        messages = handler.get_updates()
+        elapsed = time.monotonic() - started
+
+        assert [m.text for m in messages] == ["status live crypto"]
+        assert 0.2 < elapsed < 2.0
+        assert fake_telegram.poll_requests == 1  # One held request, not repeated polls
+
+    def test_offset_advances_past_delivered_updates(self, fake_telegram):
+        handler = make_handler(fake_telegram, long_poll_timeout_seconds=0)
+        fake_telegram.push(101, "first")
+        assert [m.text for m in handler.get_updates()] == ["first"]
+        assert handler.get_updates() == []
+        assert handler.last_update_id == 1
+
+    def test_unauthorized_chat_is_rejected(self, fake_telegram):
+        handler = make_handler(fake_telegram, long_poll_timeout_seconds=0)
+        fake_telegram.push(999, "hello")
+
+        assert handler.get_updates() == []
+        assert fake_telegram.sent[0][1] == 999
+
+
+class TestConcurrentReplies:
+    def test_slow_reply_does_not_block_other_operators(self, fake_telegram, tmp_path):
+        generator = Mock(spec=ResponseGenerator)
+
+        def generate_response(intent):
+            if "errors" in (intent.original_text or ""):
+                time.sleep(1.5)  # e.g. a slow OpenAI round trip
+            return f"reply: {intent.original_text}"
+
+        generator.generate_response.side_effect = generate_response
+        loop = OpsLoop(
+            telegram_handler=make_handler(fake_telegram),
+            response_generator=generator,
+            event_logger=OpsEventLogger(logs_root=str(tmp_path)),
+            poll_interval_seconds=1,
+            reply_workers=4,
+        )
+
+        fake_telegram.push(101, "give me recent errors all containers")
+        fake_telegram.push(202, "status live crypto")
+        fake_telegram.push(303, "status paper crypto")
+
+        async def main():
+            stop = asyncio.Event()
+            runner = asyncio.create_task(loop.run_async(stop))
+            started = time.monotonic()
+            while len(fake_telegram.sent) < 3 and time.monotonic() - started < 10:
+                await asyncio.sleep(0.05)
+            stop.set()
+            await runner
+            return started
+
+        started = asyncio.run(main())
+
+        replies = {chat_id: ts - started for ts, chat_id, _ in fake_telegram.sent}
+        assert set(replies) == set(CHAT_IDS)
+        assert replies[202] < 1.0
+        assert replies[303] < 1.0
+        assert replies[101] >= 1.0
+
+    def test_tick_still_handles_messages_synchronously(self, fake_telegram, tmp_path):
+        generator = Mock(spec=ResponseGenerator)
+        generator.generate_response.return_value = "ok"
+        loop = OpsLoop(
+            telegram_handler=make_handler(fake_telegram, long_poll_timeout_seconds=0),
+            response_generator=generator,
+            event_logger=OpsEventLogger(logs_root=str(tmp_path)),
+        )
+        fake_telegram.push(101, "status live crypto")
+
+        loop._tick()
+
+        assert [(chat_id, text) for _, chat_id, text in fake_telegram.sent] == [(101, "ok")]
+
+
+class CountingReader:
+    def __init__(self):
+        self.calls = 0
+
+    def get_snapshot(self, scope):
+        self.calls += 1
+        return {"scope": scope, "positions": [1, 2]}
+
+
+class TestSnapshotCache:
+    def test_identical_calls_within_ttl_read_once(self):
+        reader = CountingReader()
+        cached = CachedReader(reader, SnapshotCache(ttl_seconds=60))
+
+        assert cached.get_snapshot("live_crypto") == cached.get_snapshot("live_crypto")
+        cached.get_snapshot("paper_crypto")
+
+        assert reader.calls == 2
+
+    def test_callers_get_independent_copies(self):
+        cached = CachedReader(CountingReader(), SnapshotCache(ttl_seconds=60))
+
+        cached.get_snapshot("live_crypto")["positions"].append(3)
+
+        assert cached.get_snapshot("live_crypto")["positions"] == [1, 2]
+
+    def test_entries_expire(self):
+        reader = CountingReader()
+        cached = CachedReader(reader, SnapshotCache(ttl_seconds=0.05))
+
+        cached.get_snapshot("live_crypto")
+        time.sleep(0.1)
+        cached.get_snapshot("live_crypto")
+
+        assert reader.calls == 2
+
+    def test_readers_in_same_namespace_share_entries(self):
+        cache = SnapshotCache(ttl_seconds=60)
+        first, second = CountingReader(), CountingReader()
+
+        CachedReader(first, cache, namespace="logs").get_snapshot("live_crypto")
+        CachedReader(second, cache, namespace="logs").get_snapshot("live_crypto")
+
+        assert (first.calls, second.calls) == (1, 0)
+
+    def test_response_generator_shares_cache_with_smart_responder(self, tmp_path):
+        generator = ResponseGenerator(logs_root=str(tmp_path))
+        calls = []
+        generator.obs_reader.get_snapshot = lambda scope: calls.append(scope) or {"scope": scope}
+
+        assert generator.smart_responder.obs_reader._cache is generator.snapshot_cache
+        generator.obs_reader.get_snapshot("live_crypto")
+        generator.obs_reader.get_snapshot("live_crypto")
+        assert calls == ["live_crypto"]
@@ -356,6 +356,135 @@ class TestPersistence:
             # Restore
             phase_d.persistence.PHASE_D_PERSIST_ROOT = original_root
 
+    def test_block_events_tail_incrementally_per_scope(self):
+        """Test that cached reads pick up appended events and keep scopes apart."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            import phase_d.persistence
+            original_root = phase_d.persistence.PHASE_D_PERSIST_ROOT
+            phase_d.persistence.PHASE_D_PERSIST_ROOT = tmpdir
+
+            writer = PhaseDPersistence()
+            reader = PhaseDPersistence()
+
+            def block(block_id, scope, block_type=None):
+                return BlockEvent(
+                    block_id=block_id,
+                    scope=scope,
+                    event_type="BLOCK_END",
+                    timestamp=datetime.utcnow(),
+                    regime="BTC",
+                    reason="test",
+                    block_start_ts=datetime.utcnow(),
+                    block_type=block_type,
+                )
+
+            writer.write_block_event(block("a1", "scope_a", BlockType.COMPRESSION))
+            writer.write_block_event(block("b1", "scope_b"))
+            assert [e.block_id for e in reader.read_block_events("scope_a")] == ["a1"]
+            assert reader.read_block_events("scope_a")[0].block_type == BlockType.COMPRESSION
+
+            writer.write_block_event(block("a2", "scope_a"))
+            assert [e.block_id for e in reader.read_block_events("scope_a")] == ["a1", "a2"]
+            assert [e.block_id for e in reader.read_block_events("scope_b")] == ["b1"]
+            assert reader.read_block_events("missing") == []
+
+            # "scope/a" shares scope_a's partition file but not its events
+            writer.write_block_event(block("c1", "scope/a"))
+            assert [e.block_id for e in reader.read_block_events("scope/a")] == ["c1"]
+            assert [e.block_id for e in reader.read_block_events("scope_a")] == ["a1", "a2"]
+
+            phase_d.persistence.PHASE_D_PERSIST_ROOT = original_root
+
+    def test_block_partition_migration_runs_once(self):
+        """Test legacy block log is partitioned exactly once, even with concurrent starts and crash leftovers."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            import json
+            from concurrent.futures import ThreadPoolExecutor
+            import phase_d.persistence
+            original_root = phase_d.persistence.PHASE_D_PERSIST_ROOT
+            phase_d.persistence.PHASE_D_PERSIST_ROOT = tmpdir
+
+            blocks = Path(tmpdir) / "crypto" / "blocks"
+            blocks.mkdir(parents=True)
+            event = {
+                "block_id": "x", "scope": "s1", "event_type": "BLOCK_END",
+                "timestamp": datetime(2026, 1, 1).isoformat(), "regime": "BTC", "reason": "test",
+                "block_start_ts": datetime(2026, 1, 1).isoformat(),
+            }
+            (blocks / "block_events.jsonl").write_text("".join(
+                json.dumps({**event, "block_id": block_id, "scope": scope}) + "\n"
+                for block_id, scope in (("a1", "s1"), ("b1", "s2"), ("a2", "s1"))
+            ))
+            # Half-built partitions from a crashed migration
+            crashed = blocks / "by_scope.1.dead.tmp"
+            crashed.mkdir()
+            (crashed / "s1.jsonl").write_text(json.dumps(event) + "\n")
+
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                instances = list(pool.map(lambda _: PhaseDPersistence(), range(4)))
+
+            assert not crashed.exists()
+            assert [e.block_id for e in instances[0].read_block_events("s1")] == ["a1", "a2"]
+            assert [e.block_id for e in instances[1].read_block_events("s2")] == ["b1"]
+
+            phase_d.persistence.PHASE_D_PERSIST_ROOT = original_root
+
+    def test_latest_eligibility_index(self):
+        """Test latest eligibility per scope is served from the index, including legacy history."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            import json
+            import phase_d.persistence
+            original_root = phase_d.persistence.PHASE_D_PERSIST_ROOT
+            phase_d.persistence.PHASE_D_PERSIST_ROOT = tmpdir
+
+            # Legacy history written before the index existed
+            history = Path(tmpdir) / "crypto" / "eligibility" / "eligibility_history.jsonl"
+            history.parent.mkdir(parents=True)
+            legacy = {
+                "timestamp": datetime(2026, 1, 1).isoformat(),
+                "scope": "s1",
+                "eligible": False,
+                "evidence_sufficiency_passed": False,
+                "duration_anomaly_passed": False,
+                "block_type_passed": False,
+                "cost_benefit_passed": False,
+                "regime_safety_passed": False,
+            }
+            history.write_text(json.dumps(legacy) + "\n")
+
+            persistence = PhaseDPersistence()
+            assert persistence.read_latest_eligibility("s1").eligible is False
+
+            result = PhaseEligibilityResult(
+                timestamp=datetime.utcnow(),
+                scope="s1",
+                eligible=True,
+                evidence_sufficiency_passed=True,
+                duration_anomaly_passed=True,
+                block_type_passed=True,
+                cost_benefit_passed=True,
+                regime_safety_passed=True,
+            )
+            persistence.write_eligibility_result(result)
+
+            assert persistence.read_latest_eligibility("s1").eligible is True
+            assert PhaseDPersistence().read_latest_eligibility("s1").eligible is True
+            assert persistence.read_latest_eligibility("s2") is None
+
+            # Concurrent writers (separate instances) never drop each other's scopes
+            from concurrent.futures import ThreadPoolExecutor
+            scopes = [f"c{i}" for i in range(20)]
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(
+                    lambda scope: PhaseDPersistence().write_eligibility_result(result.model_copy(update={"scope": scope})),
+                    scopes,
+                ))
+            fresh = PhaseDPersistence()
+            assert all(fresh.read_latest_eligibility(scope) is not None for scope in ["s1"] + scopes)
+            assert not list(history.parent.glob("*.tmp"))
+
+            phase_d.persistence.PHASE_D_PERSIST_ROOT = original_root
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
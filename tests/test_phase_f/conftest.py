@@ -0,0 +1,12 @@
+"""Test configuration for Phase F tests."""
+
+import pytest
+
+import phase_f.logging as phase_f_logging
+
+
+@pytest.fixture(autouse=True)
+def phase_f_logs_root(tmp_path, monkeypatch):
+    """Keep pipeline/audit logs written by tests out of persist/."""
+    monkeypatch.setattr(phase_f_logging, "LOGS_ROOT", tmp_path / "phase_f")
+    return tmp_path / "phase_f"
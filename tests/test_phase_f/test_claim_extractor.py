@@ -158,3 +158,84 @@ class TestClaimExtractor:
                 SentimentEnum.NEUTRAL,
                 SentimentEnum.NEGATIVE
             ]
+
+    def test_batch_extraction_matches_per_article(self, extractor):
+        """Batch extraction returns the per-article claims in order."""
+        articles = [
+            NewsArticle(
+                title=f"Bitcoin rallied to {50 + i}k as the SEC approved filings",
+                description="Analysts say the rally may possibly continue",
+                source=f"Source{i}",
+                source_url="https://test.com",
+                published_at="2026-02-11T10:30:00Z",
+            )
+            for i in range(3)
+        ]
+
+        batch = extractor.extract_from_articles(articles)
+        single = [c for a in articles for c in extractor.extract_from_article(a)]
+
+        assert [c.claim_text for c in batch] == [c.claim_text for c in single]
+        assert [c.source for c in batch] == ["Source0", "Source1", "Source2"]
+
+    def test_claims_carry_article_source_count(self, extractor):
+        """Claims keep the number of sources that carried their article."""
+        from phase_f.fetchers.news_fetcher_multi_source import NewsArticle as ClusteredArticle
+
+        article = ClusteredArticle(
+            title="Bitcoin rallied to 50k as the SEC approved filings",
+            description="",
+            source="CoinDesk",
+            source_url="https://coindesk.com/article",
+            published_at="2026-02-11T10:30:00Z",
+            source_count=3,
+        )
+
+        claims = extractor.extract_from_article(article)
+
+        assert claims
+        assert all(c.source_count == 3 for c in claims)
+
+
+class TestKeywordMatcher:
+    """Single-pass matcher must agree with per-word substring tests."""
+
+    TEXTS = [
+        "bullish bull case with strength and support",
+        "the bear case: bearish headwinds, weakness, fear",
+        "prices fell; the fed may hit resistance",
+        "markets -> results in a crash that forces selling",
+        "mayor says bullishness could outperform",
+        "",
+    ]
+
+    def test_matches_substring_semantics(self):
+        from phase_f.extractors.claim_extractor import KeywordMatcher
+
+        extractor = ClaimExtractor()
+        words = (
+            extractor.forbidden_causation
+            + extractor.sentiment_indicators["positive"]
+            + extractor.sentiment_indicators["negative"]
+            + ["may", "might", "possibly", "hit", "fell"]
+        )
+        matcher = KeywordMatcher(words)
+
+        for text in self.TEXTS:
+            assert matcher.find(text) == {w for w in words if w in text}
+
+    def test_sentiment_counts_overlapping_words(self):
+        extractor = ClaimExtractor()
+        # "bullish" also contains "bull"; both count, as with substring tests
+        assert extractor._classify_sentiment("Bullish outlook amid a crash") == SentimentEnum.POSITIVE
+
+    def test_recompile_after_changing_word_lists(self):
+        extractor = ClaimExtractor()
+        extractor.forbidden_causation.append("triggers")
+        extractor._compile()
+
+        claim = extractor._sentence_to_claim(
+            "The halving triggers a supply shock for miners",
+            "Test", "https://test.com", "2026-02-11T10:30:00Z",
+        )
+        assert claim is None
@@ -171,3 +171,25 @@ class TestHypothesisBuilder:
         if hypotheses:
             # High uncertainty when claims conflict
             assert any(h.uncertainty > 0.3 for h in hypotheses)
+
+    def test_source_count_weights_claims(self, builder):
+        """A syndicated story counts once per distinct source carrying it."""
+        positive = Claim(
+            claim_text="Positive",
+            source="Test",
+            source_url="https://test.com",
+            publication_timestamp="2026-02-11T10:00:00Z",
+            confidence_in_claim=0.8,
+            is_factual=True,
+            sentiment=SentimentEnum.POSITIVE,
+        )
+        negative = positive.model_copy(
+            update={"claim_text": "Negative", "sentiment": SentimentEnum.NEGATIVE, "source_count": 3}
+        )
+
+        hypotheses = builder.build_hypotheses([positive, negative])
+
+        assert hypotheses
+        for hyp in hypotheses:
+            assert hyp.confidence == pytest.approx(0.0)
+            assert hyp.uncertainty == pytest.approx(0.75)
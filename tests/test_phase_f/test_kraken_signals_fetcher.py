@@ -7,7 +7,11 @@ without executing any trades or modifying state.
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-from phase_f.fetchers.kraken_signals_fetcher import KrakenSignalsFetcher, MarketSignal
+from phase_f.fetchers.kraken_signals_fetcher import (
+    KrakenSignalsFetcher,
+    MarketSignal,
+    get_kraken_signals_fetcher,
+)
 
 
 class TestKrakenSignalsFetcher:
@@ -148,6 +152,81 @@ class TestKrakenSignalsFetcher:
         assert "kraken_adapter" not in source
 
 
+class TestMarketSignalsBatch:
+    """Test multi-symbol snapshots, array metrics and TTL cache"""
+
+    @staticmethod
+    def _fake_request(calls):
+        def request(endpoint, params=None):
+            calls.append((endpoint, dict(params or {})))
+            pair = params["pair"]
+            if endpoint == "/Ticker":
+                return {
+                    p: {"v": [0, 2000000], "c": ["100", "1"], "b": ["99.9", "1"], "a": ["100.1", "1"]}
+                    for p in pair.split(",")
+                }
+            if endpoint == "/Depth":
+                return {pair: {
+                    "bids": [["100.0", "5", 1707000000], ["99.5", "1", 1707000000], ["90.0", "50", 1707000000]],
+                    "asks": [["100.2", "2", 1707000000], ["100.8", "1", 1707000000]],
+                }}
+            return {pair: [["100", "1", 1707000000, "b", "m", ""]]}
+        return request
+
+    def test_batch_uses_single_ticker_request(self):
+        calls = []
+        fetcher = KrakenSignalsFetcher()
+        fetcher._kraken_request_uncached = self._fake_request(calls)
+
+        result = fetcher.get_market_signals_batch(["BTC", "ETH", "UNKNOWN"])
+
+        assert set(result) == {"BTC", "ETH"}
+        ticker_calls = [c for c in calls if c[0] == "/Ticker"]
+        assert ticker_calls == [("/Ticker", {"pair": "XBTUSD,ETHUSD"})]
+        assert sum(1 for c in calls if c[0] == "/Depth") == 2
+        assert result["ETH"]["trades"][0]["direction"] == "buy"
+
+    def test_order_book_metrics_from_arrays(self):
+        fetcher = KrakenSignalsFetcher()
+        fetcher._kraken_request_uncached = self._fake_request([])
+
+        book = fetcher.fetch_order_book("BTC")
+
+        assert book["bids"][0] == [100.0, 5.0]
+        assert book["bid_volume"] == 56
+        assert book["ask_volume"] == 3
+        assert book["mid_price"] == pytest.approx(100.1)
+        assert book["bid_depth_1pct"] == 6  # 90.0 level is outside the band
+        assert book["ask_depth_1pct"] == 3
+        assert book["bid_wall_price"] == 90.0
+        assert book["ask_wall_price"] == 100.2
+
+    def test_responses_are_cached_within_ttl(self):
+        calls = []
+        fetcher = KrakenSignalsFetcher(ttl_seconds=60)
+        fetcher._kraken_request_uncached = self._fake_request(calls)
+
+        fetcher.get_market_signals("BTC")
+        fetcher.get_market_signals("BTC")
+        assert len(calls) == 3
+
+        fetcher.clear_cache()
+        fetcher.get_market_signals("BTC")
+        assert len(calls) == 6
+
+    def test_zero_ttl_disables_cache(self):
+        calls = []
+        fetcher = KrakenSignalsFetcher(ttl_seconds=0)
+        fetcher._kraken_request_uncached = self._fake_request(calls)
+
+        fetcher.fetch_order_book("BTC")
+        fetcher.fetch_order_book("BTC")
+        assert len(calls) == 2
+
+    def test_shared_fetcher_is_singleton(self):
+        assert get_kraken_signals_fetcher() is get_kraken_signals_fetcher()
+
+
 class TestMarketSignalSchema:
     """Test immutable market signal schema"""
     
@@ -10,6 +10,7 @@ import tempfile
 from pathlib import Path
 from datetime import datetime
 
+import phase_f.logging as phase_f_logging
 from phase_f.logging import PhaseFLogger
 from phase_f.schemas import Verdict, VerdictType, NarrativeConsistency
 
@@ -30,8 +31,9 @@ class TestLoggerInitialization:
     def test_logger_creates_logs_directory(self):
         """Test that logger creates logs directory."""
         logger = PhaseFLogger(scope="crypto")
-        logs_dir = Path("persist/phase_f/crypto/logs")
+        logs_dir = phase_f_logging.LOGS_ROOT / "crypto" / "logs"
         assert logger.logs_dir == logs_dir
+        assert logs_dir.is_dir()
 
     def test_logger_initializes_with_scope(self):
         """Test logger initialization with scope."""
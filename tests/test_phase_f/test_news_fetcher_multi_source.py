@@ -0,0 +1,230 @@
+"""
+Tests for concurrent multi-source news fetching and the conditional GET cache.
+"""
+
+import json
+import threading
+import time
+from dataclasses import asdict
+
+import pytest
+
+from phase_f.fetchers.http_cache import CachedHTTPClient, run_concurrently
+from phase_f.fetchers.near_duplicates import NearDuplicateClusterer
+from phase_f.fetchers.news_fetcher_multi_source import (
+    MultiSourceNewsFetcher,
+    NewsAPIFetcher,
+    NewsArticle,
+)
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class FakeSession:
+    """Serves one body per URL with an ETag; answers 304 when it matches."""
+
+    def __init__(self, bodies, delay=0.0):
+        self.bodies = bodies
+        self.delay = delay
+        self.calls = []
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        with self.lock:
+            self.calls.append((url, dict(headers or {})))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            body = self.bodies[url]
+            etag = f'"{hash(body)}"'
+            if (headers or {}).get("If-None-Match") == etag:
+                return FakeResponse(304)
+            return FakeResponse(200, body, {"ETag": etag})
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+TOPICS = [
+    "Bitcoin miners expand capacity in Texas",
+    "Ethereum staking withdrawals hit record",
+    "Regulators open consultation on stablecoin reserves",
+]
+
+
+def newsapi_body(n):
+    return json.dumps({
+        "articles": [
+            {
+                "title": TOPICS[i],
+                "description": "desc",
+                "source": {"name": "Reuters"},
+                "url": f"https://example.com/{i}",
+                "publishedAt": f"2026-01-0{i % 9 + 1}T00:00:00Z",
+            }
+            for i in range(n)
+        ]
+    }).encode()
+
+
+@pytest.fixture
+def newsapi(monkeypatch, tmp_path):
+    monkeypatch.setenv("NEWSAPI_KEY", "test-key")
+    session = FakeSession({"https://newsapi.org/v2/everything": newsapi_body(3)})
+    client = CachedHTTPClient(cache_dir=str(tmp_path), session=session)
+    return NewsAPIFetcher(client), session
+
+
+def test_not_modified_reuses_parsed_articles(newsapi, monkeypatch):
+    fetcher, session = newsapi
+    first = fetcher._search("Bitcoin market", limit=10)
+
+    def fail_parse(resp):
+        raise AssertionError("304 response must not be re-parsed")
+
+    monkeypatch.setattr(fetcher, "_parse", fail_parse)
+    second = fetcher._search("Bitcoin market", limit=10)
+
+    assert len(first) == 3
+    assert second == first
+    assert "If-None-Match" in session.calls[-1][1]
+
+
+def test_limit_is_applied_after_cache(newsapi):
+    fetcher, _ = newsapi
+    assert len(fetcher._search("Bitcoin market", limit=1)) == 1
+    assert len(fetcher._search("Bitcoin market", limit=3)) == 3
+
+
+def test_fetch_all_runs_requests_concurrently(monkeypatch, tmp_path):
+    monkeypatch.setenv("NEWSAPI_KEY", "test-key")
+    monkeypatch.setenv("PHASE_F_RSS_ENABLED", "false")
+    monkeypatch.setenv("PHASE_F_WEB_SCRAPER_ENABLED", "false")
+    session = FakeSession({"https://newsapi.org/v2/everything": newsapi_body(3)}, delay=0.05)
+    client = CachedHTTPClient(cache_dir=str(tmp_path), session=session)
+
+    fetcher = MultiSourceNewsFetcher(client=client, max_workers=8)
+    articles = fetcher.fetch_all(limit=10)
+
+    assert len(session.calls) == len(NewsAPIFetcher.KEYWORDS)
+    assert session.max_in_flight > 1
+    # Top 2 per keyword (limit 5 // 5 keywords + 1); same URLs collapse in dedup
+    assert [a.url for a in articles] == ["https://example.com/1", "https://example.com/0"]
+
+
+def test_run_concurrently_deadline_and_errors():
+    def boom():
+        raise ValueError("nope")
+
+    results = run_concurrently(
+        [("fast", lambda: 1), ("slow", lambda: time.sleep(0.5) or 2), ("error", boom)],
+        deadline_seconds=0.1,
+        default=[],
+    )
+
+    assert results == [1, [], []]
+
+
+def test_response_without_validators_is_not_cached(tmp_path):
+    class NoValidators(FakeSession):
+        def get(self, url, params=None, headers=None, timeout=None):
+            self.calls.append((url, dict(headers or {})))
+            return FakeResponse(200, b"{}")
+
+    session = NoValidators({})
+    client = CachedHTTPClient(cache_dir=str(tmp_path), session=session)
+    client.get("https://example.com/feed")
+    client.get("https://example.com/feed")
+
+    assert all("If-None-Match" not in headers for _, headers in session.calls)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_sweep_removes_idle_entries(tmp_path):
+    import os
+
+    for key in ("stale", "fresh"):
+        for suffix in (".json", ".body", ".parsed.json"):
+            path = tmp_path / f"{key}{suffix}"
+            path.write_text("{}")
+            mtime = time.time() - 100 * 3600
+            os.utime(path, (mtime, mtime))
+    # A 304 revalidation touches the meta file, keeping the whole entry
+    os.utime(tmp_path / "fresh.json", None)
+
+    CachedHTTPClient(cache_dir=str(tmp_path), session=FakeSession({}), max_age_hours=72)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["fresh.body", "fresh.json", "fresh.parsed.json"]
+    assert CachedHTTPClient(cache_dir=str(tmp_path / "missing"), session=FakeSession({})).sweep() == 0
+
+
+def article(title, source, description="", url=None):
+    return NewsArticle(
+        title=title,
+        description=description,
+        source=source,
+        source_url=url or f"https://{source.lower()}.example/{abs(hash(title))}",
+        published_at="2026-01-05T00:00:00Z",
+        url=url or f"https://{source.lower()}.example/{abs(hash(title))}",
+    )
+
+
+def test_clusterer_groups_syndicated_copies():
+    clusterer = NearDuplicateClusterer()
+    texts = [
+        "Bitcoin surges past $50,000 as ETF inflows accelerate. Spot ETFs saw record inflows on Monday",
+        "Solana network suffers outage as validators fail to reach consensus",
+        "Bitcoin Surges Past $50K as ETF Inflows Accelerate - Yahoo Finance. Spot ETFs saw record inflows Monday",
+        "",
+        "",
+    ]
+
+    assert clusterer.cluster(texts) == [[0, 2], [1], [3], [4]]
+
+
+def test_clusterer_is_deterministic():
+    texts = [f"Ethereum upgrade scheduled for block {i} according to developers" for i in range(20)]
+    assert NearDuplicateClusterer().cluster(texts) == NearDuplicateClusterer().cluster(texts)
+
+
+def test_near_duplicates_collapse_to_weighted_representative(tmp_path):
+    fetcher = MultiSourceNewsFetcher(client=CachedHTTPClient(cache_dir=str(tmp_path)))
+    articles = [
+        article("Bitcoin surges past $50,000 as ETF inflows accelerate", "Reuters",
+                "Spot ETFs saw record inflows on Monday"),
+        article("Bitcoin Surges Past $50K as ETF Inflows Accelerate", "Yahoo Finance",
+                "Spot ETFs saw record inflows on Monday, data showed"),
+        article("Bitcoin surges past $50,000 as ETF inflows accelerate", "Reuters",
+                "Spot ETFs saw record inflows on Monday"),
+        article("Solana network suffers outage as validators fail to reach consensus", "CoinDesk"),
+    ]
+    articles[2] = articles[0]  # exact duplicate
+
+    result = fetcher._deduplicate(articles)
+
+    assert len(result) == 2
+    merged = result[0]
+    assert merged.source == "Yahoo Finance"  # longest text wins
+    assert merged.source_count == 2
+    assert merged.syndicated_sources == ("Reuters",)
+    assert result[1].source_count == 1
+
+
+def test_article_round_trips_through_cache_dict():
+    original = article("Title long enough for a test", "Reuters")
+    restored = NewsArticle(**json.loads(json.dumps(asdict(original))))
+
+    assert restored == original
+    assert hash(restored) == hash(original)
@@ -322,3 +322,106 @@ class TestVerdictMetadata:
             metadata = reader.get_verdict_metadata("crypto")
 
             assert metadata is None
+
+
+class TestVerdictCaching:
+    """Test tail-seek reading and per-file-version caching."""
+
+    @staticmethod
+    def _write(verdicts_file, records, mode="w"):
+        with open(verdicts_file, mode) as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+
+    @staticmethod
+    def _record(i, verdict="REGIME_VALIDATED"):
+        return {"run_id": f"run{i}", "timestamp": "2026-02-11T03:00:00", "verdict": {"verdict": verdict}}
+
+    def test_accessors_share_one_parse_until_file_changes(self, monkeypatch):
+        """Test that all accessors reuse the parsed verdict for an unchanged file."""
+        import governance.verdict_reader as verdict_reader_module
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            verdicts_dir = Path(tmpdir) / "crypto" / "verdicts"
+            verdicts_dir.mkdir(parents=True)
+            verdicts_file = verdicts_dir / "verdicts.jsonl"
+            self._write(verdicts_file, [self._record(1, "REGIME_QUESTIONABLE")])
+
+            parses = []
+            real_loads = json.loads
+            monkeypatch.setattr(
+                verdict_reader_module.json, "loads",
+                lambda s: parses.append(s) or real_loads(s),
+            )
+
+            reader = VerdictReader(phase_f_root=tmpdir)
+            assert reader.read_latest_verdict("crypto")["run_id"] == "run1"
+            assert reader.should_apply_confidence_penalty("crypto") is True
+            assert reader.get_penalty_factor("crypto") == 0.8
+            assert reader.get_verdict_metadata("crypto")["phase_f_run_id"] == "run1"
+            assert len(parses) == 1
+
+            self._write(verdicts_file, [self._record(2)], mode="a")
+
+            assert reader.read_latest_verdict("crypto")["run_id"] == "run2"
+            assert reader.get_penalty_factor("crypto") == 1.0
+            assert len(parses) == 2
+
+    def test_returned_verdict_is_a_copy(self):
+        """Test that mutating a returned verdict doesn't affect the cache."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            verdicts_dir = Path(tmpdir) / "crypto" / "verdicts"
+            verdicts_dir.mkdir(parents=True)
+            self._write(verdicts_dir / "verdicts.jsonl", [self._record(1)])
+
+            reader = VerdictReader(phase_f_root=tmpdir)
+            reader.read_latest_verdict("crypto")["verdict"]["verdict"] = "HIGH_NOISE_NO_ACTION"
+
+            assert reader.get_penalty_factor("crypto") == 1.0
+
+    def test_reads_last_line_of_large_file(self):
+        """Test that the last record is found across tail read blocks."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            verdicts_dir = Path(tmpdir) / "crypto" / "verdicts"
+            verdicts_dir.mkdir(parents=True)
+            records = [self._record(i) for i in range(2000)]
+            records[-1]["verdict"]["reasoning_summary"] = "x" * 20000  # Spans several blocks
+            self._write(verdicts_dir / "verdicts.jsonl", records)
+
+            latest = VerdictReader(phase_f_root=tmpdir).read_latest_verdict("crypto")
+
+            assert latest["run_id"] == "run1999"
+            assert len(latest["verdict"]["reasoning_summary"]) == 20000
+
+    def test_trailing_blank_line_returns_none(self):
+        """Test that a blank last line behaves like the previous readlines() reader."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            verdicts_dir = Path(tmpdir) / "crypto" / "verdicts"
+            verdicts_dir.mkdir(parents=True)
+            verdicts_file = verdicts_dir / "verdicts.jsonl"
+            self._write(verdicts_file, [self._record(1)])
+            with open(verdicts_file, "a") as f:
+                f.write("\n")
+
+            assert VerdictReader(phase_f_root=tmpdir).read_latest_verdict("crypto") is None
+
+    def test_deleted_file_clears_cached_verdict(self):
+        """Test that removing the verdicts file drops the cached verdict."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            verdicts_dir = Path(tmpdir) / "crypto" / "verdicts"
+            verdicts_dir.mkdir(parents=True)
+            verdicts_file = verdicts_dir / "verdicts.jsonl"
+            self._write(verdicts_file, [self._record(1)])
+
+            reader = VerdictReader(phase_f_root=tmpdir)
+            assert reader.read_latest_verdict("crypto") is not None
+            verdicts_file.unlink()
+
+            assert reader.read_latest_verdict("crypto") is None
+
+    def test_shared_reader_per_root(self):
+        """Test that get_verdict_reader returns one reader per root."""
+        from governance.verdict_reader import get_verdict_reader
+
+        assert get_verdict_reader("/tmp/a") is get_verdict_reader("/tmp/a")
+        assert get_verdict_reader("/tmp/a") is not get_verdict_reader("/tmp/b")
@@ -0,0 +1,94 @@
+"""
+Unit tests for the array-backed position book behind PortfolioState.
+"""
+
+import pandas as pd
+import pytest
+
+from risk.portfolio_state import OpenPosition, PortfolioState
+
+
+@pytest.fixture
+def portfolio():
+    portfolio = PortfolioState(initial_equity=100000.0)
+    entry = pd.Timestamp("2026-01-05")
+    portfolio.open_trade("AAPL", entry, 100.0, 10, 500.0, 4)
+    portfolio.open_trade("AAPL", entry, 110.0, 5, 250.0, 3)
+    portfolio.open_trade("MSFT", entry, 200.0, 20, 1000.0, 5)
+    return portfolio
+
+
+def brute_force_totals(portfolio):
+    positions = [p for ps in portfolio.open_positions.values() for p in ps]
+    return (
+        sum(p.risk_amount for p in positions),
+        sum(p.get_current_value() for p in positions),
+        sum(p.unrealized_pnl for p in positions),
+    )
+
+
+def test_totals_match_positions(portfolio):
+    risk, value, unrealized = brute_force_totals(portfolio)
+
+    assert portfolio.book.total_risk == pytest.approx(risk)
+    assert portfolio.book.total_value == pytest.approx(value)
+    assert portfolio.book.total_unrealized_pnl == pytest.approx(unrealized)
+    assert portfolio.get_open_positions_count() == 3
+    assert portfolio.get_symbol_risk("AAPL") == pytest.approx(750.0)
+
+
+def test_bulk_price_update_is_visible_through_views(portfolio):
+    heat = portfolio.get_portfolio_heat({"AAPL": 120.0, "TSLA": 300.0})
+
+    assert heat == pytest.approx(1750.0 / 100000.0)
+    aapl = portfolio.open_positions["AAPL"]
+    assert [p.current_price for p in aapl] == [120.0, 120.0]
+    assert aapl[0].unrealized_pnl == pytest.approx(200.0)
+    assert portfolio.get_symbol_exposure("AAPL") == pytest.approx(15 * 120.0 / 100000.0)
+    assert portfolio.book.total_value == pytest.approx(brute_force_totals(portfolio)[1])
+
+
+def test_single_position_update_keeps_totals(portfolio):
+    portfolio.open_positions["MSFT"][0].update_price(190.0)
+
+    assert portfolio.get_symbol_exposure("MSFT") == pytest.approx(3800.0 / 100000.0)
+    assert portfolio.book.total_unrealized_pnl == pytest.approx(-200.0)
+
+
+def test_close_is_fifo_and_releases_slot(portfolio):
+    trade = portfolio.close_trade("AAPL", pd.Timestamp("2026-01-10"), 105.0)
+
+    assert trade["entry_price"] == 100.0
+    assert trade["pnl"] == pytest.approx(50.0)
+    assert portfolio.get_symbol_risk("AAPL") == pytest.approx(250.0)
+    assert portfolio.get_open_positions_count() == 2
+
+    portfolio.close_trade("AAPL", pd.Timestamp("2026-01-10"), 105.0)
+    portfolio.close_trade("MSFT", pd.Timestamp("2026-01-10"), 210.0)
+
+    assert portfolio.get_open_symbols() == []
+    assert portfolio.book.total_risk == 0.0
+    assert portfolio.book.total_value == 0.0
+    assert portfolio.get_portfolio_heat({}) == 0.0
+
+
+def test_book_grows_beyond_initial_capacity():
+    portfolio = PortfolioState(initial_equity=1e9)
+    entry = pd.Timestamp("2026-01-05")
+    for i in range(200):
+        portfolio.open_trade(f"SYM{i}", entry, 10.0, 1, 1.0, 3)
+
+    portfolio.update_prices({f"SYM{i}": 11.0 for i in range(200)})
+
+    assert portfolio.get_open_positions_count() == 200
+    assert portfolio.book.total_risk == pytest.approx(200.0)
+    assert portfolio.book.total_unrealized_pnl == pytest.approx(200.0)
+
+
+def test_standalone_position_still_works():
+    pos = OpenPosition("AAPL", pd.Timestamp("2026-01-05"), 100.0, 10, 500.0, 4)
+    pos.update_price(90.0)
+
+    assert pos.current_price == 90.0
+    assert pos.unrealized_pnl == pytest.approx(-100.0)
+    assert pos.get_current_value() == pytest.approx(900.0)
@@ -0,0 +1,107 @@
+"""Tests for the regime history index and retrospective drift detection."""
+
+import statistics
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from phase_g_regime.regime_alignment import duration_percentile, volatility_band, volatility_band_ids
+from phase_g_regime.regime_drift_detector import RegimeDriftDetector
+from phase_g_regime.regime_history import RegimeHistoryIndex
+
+
+def list_percentile(current, history):
+    """Reference: share of history <= current (50 when history < 3)."""
+    if len(history) < 3:
+        return 50.0
+    return sum(1 for d in history if d <= current) / len(history) * 100.0
+
+
+def test_percentiles_match_list_scan():
+    rng = np.random.default_rng(0)
+    history = list(rng.exponential(48, 60).round(1))
+    index = RegimeHistoryIndex.from_durations(history)
+    probes = [0.0, 12.0, 48.0, history[5], 500.0]
+    for probe in probes:
+        assert index.duration_percentile(probe) == pytest.approx(list_percentile(probe, history))
+        assert duration_percentile(probe, history) == pytest.approx(list_percentile(probe, history))
+    assert index.duration_percentiles(probes) == pytest.approx([list_percentile(p, history) for p in probes])
+    assert RegimeHistoryIndex.from_durations([5.0, 9.0]).duration_percentile(7.0) == 50.0
+
+
+def test_quantiles_and_window():
+    values = [30, 10, 50, 20, 40, 25]
+    index = RegimeHistoryIndex()
+    for v in values:
+        index.add("panic", v)
+    assert index.quantile(50, "panic") == statistics.median(values)
+    assert index.quantile(90, "panic") == pytest.approx(np.percentile(values, 90))
+    assert index.quantile(10) == pytest.approx(np.percentile(values, 10))
+
+    window = RegimeHistoryIndex(max_spells=3)
+    for v in values:
+        window.add("panic", v)
+    assert list(window.durations()) == [20, 25, 40]  # Last three spells
+    assert list(window.durations("panic")) == [20, 25, 40]
+
+
+def test_transitions_from_labels():
+    labels = ["risk_on", "risk_on", "neutral", "risk_off", "neutral", "neutral", "risk_on", "neutral"]
+    index = RegimeHistoryIndex.from_labels(labels)
+    assert index.transition_counts() == {
+        "risk_on->neutral": 2,
+        "neutral->risk_off": 1,
+        "risk_off->neutral": 1,
+        "neutral->risk_on": 1,
+    }
+    assert index.transition_probability("neutral", "risk_on") == 0.5
+    assert index.transition_count("panic", "risk_on") == 0
+    # Completed spells only (the trailing neutral spell is open)
+    assert list(index.durations("neutral")) == [1.0, 2.0]
+
+    hourly = RegimeHistoryIndex.from_labels(
+        ["a", "a", "b"], timestamps=pd.date_range("2026-01-01", periods=3, freq="4h")
+    )
+    assert list(hourly.durations("a")) == [8.0]
+
+
+def test_volatility_band_ids_match_scalar():
+    vols = [0.0, 19.99, 20.0, 49.9, 50.0, 80.0, 150.0]
+    labels = ["low", "medium", "high", "extreme"]
+    assert [labels[i] for i in volatility_band_ids(vols)] == [volatility_band(v) for v in vols]
+
+
+def test_detect_history_matches_replay():
+    rng = np.random.default_rng(3)
+    n = 600
+    times = pd.date_range("2024-01-01", periods=n, freq="2h")
+    regimes = np.array(["risk_on", "neutral", "risk_off", "panic"])[
+        np.cumsum(rng.random(n) < 0.08) % 4
+    ]
+    vols = rng.uniform(10, 100, n)
+
+    frame = RegimeDriftDetector().detect_history(times, regimes, vols, scope_type="crypto", max_history=20)
+
+    # Replay the live bookkeeping observation by observation
+    history, entered, entry_vol = [], times[0], vols[0]
+    for i in range(n):
+        if i and regimes[i] != regimes[i - 1]:
+            history = (history + [(times[i] - entered).total_seconds() / 3600])[-20:]
+            entered, entry_vol = times[i], vols[i]
+        duration = (times[i] - entered).total_seconds() / 3600
+        row = frame.iloc[i]
+        assert row["duration_hours"] == pytest.approx(duration)
+        assert row["duration_percentile"] == pytest.approx(list_percentile(duration, history))
+        assert row["volatility_shift"] == (volatility_band(entry_vol) != volatility_band(vols[i]))
+        assert row["minimum_dwell"] == (duration >= 4.0)
+    assert frame["history_conditions_met"].any()
+
+
+def test_detect_history_emergency_override():
+    times = pd.date_range("2026-01-01", periods=3, freq="1h")
+    frame = RegimeDriftDetector().detect_history(
+        times, ["panic"] * 3, [30.0] * 3, drawdown=[-10.0, -30.0, -5.0], scope_type="crypto",
+    )
+    assert frame["minimum_dwell"].tolist() == [False, True, False]
+    assert frame["emergency_override"].tolist() == [False, True, False]
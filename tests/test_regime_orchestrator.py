@@ -0,0 +1,119 @@
+"""Tests for the regime validation cycle's input loading."""
+
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import crypto.features.regime_features as regime_features
+import data.crypto_price_loader as crypto_price_loader
+import phase_g_regime.regime_orchestrator as orchestrator_module
+from phase_g_regime.regime_orchestrator import RegimeOrchestrator
+
+
+def make_bars(n=200, seed=0, end=None):
+    rng = np.random.default_rng(seed)
+    end = end or pd.Timestamp.now(tz="UTC").floor("4h")
+    index = pd.date_range(end=end, periods=n, freq="4h")
+    close = 30000 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    return pd.DataFrame(
+        {"Open": close, "High": close * 1.01, "Low": close * 0.99, "Close": close, "Volume": 1.0},
+        index=index,
+    )
+
+
+@pytest.fixture
+def crypto_env(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    orchestrator_module._feature_cache.clear()
+    loads, builds = [], []
+    bars = {"BTC": make_bars(seed=1), "ETH": make_bars(seed=2)}
+
+    def load(symbol, lookback, interval):
+        loads.append(symbol)
+        return bars[symbol]
+
+    build = regime_features.build_regime_features
+
+    def counting_build(*args, **kwargs):
+        builds.append(kwargs.get("symbol", args[0] if args else None))
+        return build(*args, **kwargs)
+
+    monkeypatch.setattr(crypto_price_loader, "load_crypto_price_data_interval", load)
+    monkeypatch.setattr(regime_features, "build_regime_features", counting_build)
+    yield SimpleNamespace(bars=bars, loads=loads, builds=builds)
+    orchestrator_module._feature_cache.clear()
+
+
+def test_features_memoized_per_bar(crypto_env):
+    orchestrator = RegimeOrchestrator(scope="paper_kraken_crypto_global")
+    first = orchestrator.run_validation_cycle(trigger="startup")
+    assert first.outcome not in ("VALIDATION_FAILED", "TIMEOUT")
+    assert sorted(crypto_env.builds) == ["BTC", "ETH"]
+
+    # Same bars: no rebuild (new orchestrator, as the daemon does per cycle)
+    RegimeOrchestrator(scope="paper_kraken_crypto_global").run_validation_cycle(trigger="startup")
+    assert len(crypto_env.builds) == 2
+
+    # New bar close for BTC only
+    crypto_env.bars["BTC"] = make_bars(seed=3)
+    RegimeOrchestrator(scope="paper_kraken_crypto_global").run_validation_cycle(trigger="startup")
+    assert sorted(crypto_env.builds) == ["BTC", "BTC", "ETH"]
+
+
+def test_reuses_current_pipeline_features(crypto_env):
+    features = regime_features.build_regime_features("BTC", crypto_env.bars["BTC"])
+    runtime = SimpleNamespace(crypto_regime_engine=None, crypto_regime_features=features)
+    orchestrator = RegimeOrchestrator(scope="paper_kraken_crypto_global", runtime=runtime)
+    orchestrator.run_validation_cycle(trigger="startup")
+    assert crypto_env.loads == ["ETH"]
+
+    # Stale pipeline features are not reused
+    runtime.crypto_regime_features = regime_features.build_regime_features(
+        "BTC", make_bars(end=pd.Timestamp("2025-01-01", tz="UTC"))
+    )
+    orchestrator.run_validation_cycle(trigger="startup")
+    assert "BTC" in crypto_env.loads
+
+
+def test_slow_input_dropped_at_deadline(crypto_env, monkeypatch):
+    monkeypatch.setattr(orchestrator_module, "INPUT_LOAD_SECONDS", 0.3)
+
+    class SlowVerdictReader:
+        def read_latest_verdict(self, scope):
+            time.sleep(2)
+            return {"verdict": {"verdict": "NEUTRAL", "num_sources_analyzed": 5}}
+
+    orchestrator = RegimeOrchestrator(scope="paper_kraken_crypto_global", verdict_reader=SlowVerdictReader())
+    started = time.time()
+    result = orchestrator.run_validation_cycle(trigger="startup")
+    assert time.time() - started < 1.5
+    assert result.missing_inputs == ["verdict"]
+    assert result.validation is not None
+    assert result.outcome not in ("VALIDATION_FAILED", "TIMEOUT")
+
+
+def test_duration_index_tracks_run_state_history(monkeypatch, tmp_path):
+    from phase_g_regime.regime_alignment import duration_percentile
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(orchestrator_module, "_duration_indexes", {})
+    limit = orchestrator_module.MAX_DURATION_HISTORY
+    history = [float(h) for h in range(limit)]
+
+    first = RegimeOrchestrator(scope="paper_kraken_crypto_global")._duration_history_index(history)
+
+    # A later cycle (new orchestrator) after one regime change reuses the index
+    history = (history + [500.0])[-limit:]
+    index = RegimeOrchestrator(scope="paper_kraken_crypto_global")._duration_history_index(history)
+    assert index is first
+    np.testing.assert_array_equal(index.durations(), np.sort(history))
+    for hours in (0.5, 50.0, 99.0, 600.0):
+        assert index.duration_percentile(hours) == duration_percentile(hours, history)
+
+    # Any other change rebuilds
+    rebuilt = RegimeOrchestrator(scope="paper_kraken_crypto_global")._duration_history_index([1.0, 2.0])
+    assert rebuilt is not first
+    np.testing.assert_array_equal(rebuilt.durations(), [1.0, 2.0])
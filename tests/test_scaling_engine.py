@@ -9,6 +9,8 @@ Tests cover:
 - Backward compatibility
 """
 
+import copy
+import random
 import unittest
 from datetime import datetime, timedelta
 from risk.scaling_policy import (
@@ -20,8 +22,11 @@ from risk.scaling_policy import (
     StrategyScalingPolicy,
     count_entries,
     last_entry_price,
+    summarize_entries,
+    total_entry_quantity,
 )
 from strategies.scaling_engine import (
+    evaluate_scaling_batch,
     should_scale_position,
     check_strategy_permits_scaling,
     check_max_entries_not_exceeded,
@@ -381,6 +386,66 @@ class TestMainDecisionEngine(unittest.TestCase):
         )
 
 
+class TestBatchEvaluation(unittest.TestCase):
+    """evaluate_scaling_batch must match should_scale_position per context."""
+
+    def setUp(self):
+        self.base = TestMainDecisionEngine("test_scale_approved_all_checks_pass")
+        self.base.setUp()
+
+    def variant(self, rng, policies, pending_buys):
+        context = copy.copy(self.base.context)
+        context.symbol = rng.choice(["AAA", "BBB", "CCC", "TEST"])
+        context.scaling_policy = rng.choice(policies)
+        context.pending_buy_orders = pending_buys
+        context.ledger_entries = [
+            {"price": rng.uniform(98, 104), "qty": 5.0, "status": rng.choice(["open", "closed"])}
+            for _ in range(rng.randint(0, 3))
+        ]
+        context.current_position_qty = total_entry_quantity(context.ledger_entries) + rng.choice([0, 0, 1])
+        context.proposed_entry_price = rng.uniform(98, 106)
+        context.proposed_entry_size = rng.choice([0.001, 0.05, 5.0, 60.0])
+        context.bars_since_last_entry = rng.randint(0, 10)
+        context.minutes_since_last_entry = rng.randint(0, 10)
+        context.current_signal_confidence = rng.uniform(0, 8)
+        context.has_lower_low = rng.random() < 0.2
+        context.has_bearish_divergence = rng.random() < 0.1
+        context.signal_matches_position_direction = rng.random() < 0.9
+        context.atr_rolling_median = rng.uniform(1.0, 2.5)
+        context.price_lowest_since_last_entry = rng.uniform(94, 100)
+        context.proposed_risk_amount = rng.uniform(0, 6000)
+        return context
+
+    def test_matches_scalar_engine(self):
+        rng = random.Random(7)
+        base_policy = self.base.context.scaling_policy
+        policies = [None, StrategyScalingPolicy(allows_multiple_entries=True, max_entries_per_symbol=0)]
+        for scaling_type in ScalingType:
+            for require_vol in (True, False):
+                policy = copy.copy(base_policy)
+                policy.scaling_type = scaling_type
+                policy.require_volatility_above_median = require_vol
+                policies.append(policy)
+        pending_buys = [{"symbol": "BBB", "order_type": "BUY"}]
+        contexts = [self.variant(rng, policies, pending_buys) for _ in range(500)]
+
+        batch = evaluate_scaling_batch(contexts)
+
+        self.assertEqual(len(batch), len(contexts))
+        seen = set()
+        for context, result in zip(contexts, batch):
+            expected = should_scale_position(context)
+            for attr in ("decision", "reason_code", "reason_text", "current_entry_count",
+                         "would_exceed_max", "proposed_position_pct", "estimated_risk", "debug_info"):
+                self.assertEqual(getattr(result, attr), getattr(expected, attr), attr)
+            seen.add(result.reason_code if result.decision != ScalingDecision.SCALE else None)
+        # The sample exercises most branches
+        self.assertGreaterEqual(len(seen), 10)
+
+    def test_empty_batch(self):
+        self.assertEqual(evaluate_scaling_batch([]), [])
+
+
 class TestHelperFunctions(unittest.TestCase):
     """Test helper utility functions."""
 
@@ -408,6 +473,18 @@ class TestHelperFunctions(unittest.TestCase):
         price = last_entry_price([])
         self.assertIsNone(price)
 
+    def test_summarize_entries(self):
+        """Summary should match the individual helpers."""
+        entries = [
+            {"price": 100.0, "qty": 10.0, "status": "open"},
+            {"price": 101.0, "qty": 5.0, "status": "open"},
+            {"price": 102.0, "qty": 10.0, "status": "closed"},
+        ]
+        summary = summarize_entries(entries)
+        self.assertEqual(summary.count, count_entries(entries))
+        self.assertEqual(summary.total_qty, total_entry_quantity(entries))
+        self.assertEqual(summary.last_price, last_entry_price(entries))
+
 
 if __name__ == "__main__":
     unittest.main()
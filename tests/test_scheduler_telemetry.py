@@ -0,0 +1,106 @@
+"""
+Unit tests for per-phase scheduler telemetry (execution.scheduler_telemetry).
+"""
+
+import json
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from execution.scheduler_telemetry import SchedulerTelemetry
+from ops_agent.logs_reader import LogsReader
+
+
+class FakeBroker:
+    def __init__(self):
+        self.orders = []
+
+    @property
+    def account_equity(self) -> float:
+        return 1000.0
+
+    def get_positions(self):
+        return {}
+
+    def submit_market_order(self, symbol, qty):
+        self.orders.append((symbol, qty))
+        return "ok"
+
+
+def test_phases_record_wall_cpu_and_broker_calls(tmp_path):
+    telemetry = SchedulerTelemetry(tmp_path, window=10, summary_every_ticks=1)
+    broker = FakeBroker()
+    telemetry.instrument_broker(broker)
+    telemetry.instrument_broker(broker)  # idempotent
+
+    telemetry.begin_tick(datetime(2026, 2, 5, 15, 30, tzinfo=timezone.utc))
+    with telemetry.phase("clock"):
+        telemetry.count_broker_call()
+        time.sleep(0.01)
+    with telemetry.phase("entry"):
+        broker.get_positions()
+        assert broker.submit_market_order("AAPL", 1) == "ok"
+        assert broker.account_equity == 1000.0
+    with telemetry.phase("entry"):
+        broker.get_positions()
+    record = telemetry.end_tick(market_open=True, clock_retries=0)
+
+    assert record["market_open"] is True
+    assert record["phases"]["clock"]["broker_calls"] == 1
+    assert record["phases"]["clock"]["wall_ms"] >= 10
+    assert record["phases"]["clock"]["cpu_ms"] < record["phases"]["clock"]["wall_ms"]
+    assert record["phases"]["entry"]["broker_calls"] == 3
+    assert broker.orders == [("AAPL", 1)]
+
+    lines = (tmp_path / "scheduler_telemetry.jsonl").read_text().splitlines()
+    assert json.loads(lines[-1])["tick"] == 1
+
+
+def test_rolling_window_percentiles():
+    telemetry = SchedulerTelemetry(None, window=3)
+    for calls in (1, 2, 3, 10):
+        telemetry.begin_tick(datetime.now(timezone.utc))
+        with telemetry.phase("reconciliation"):
+            telemetry.count_broker_call(calls)
+        telemetry.end_tick()
+
+    stats = telemetry.summary()["phases"]["reconciliation"]
+    assert stats["count"] == 3
+    assert stats["broker_calls"]["max"] == 10
+    assert stats["broker_calls"]["p50"] == pytest.approx(3)
+    assert telemetry.summary()["phases"]["tick"]["count"] == 3
+
+
+def test_ops_agent_reads_summary_and_last_tick(tmp_path):
+    logs_dir = tmp_path / "paper_alpaca_swing_us" / "logs"
+    telemetry = SchedulerTelemetry(logs_dir, summary_every_ticks=2)
+    for _ in range(2):
+        telemetry.begin_tick(datetime.now(timezone.utc))
+        with telemetry.phase("clock"):
+            pass
+        telemetry.end_tick(market_open=False)
+
+    result = LogsReader(str(tmp_path)).get_scheduler_telemetry("paper_us")
+
+    assert result["ticks"] == 2
+    assert "clock" in result["phases"]
+    assert result["last_tick"]["tick"] == 2
+    assert LogsReader(str(tmp_path)).get_scheduler_telemetry("live_us") is None
+
+
+def test_tick_log_rotates_past_size_cap(tmp_path):
+    telemetry = SchedulerTelemetry(tmp_path, max_log_bytes=600)
+    for _ in range(20):
+        telemetry.begin_tick(datetime.now(timezone.utc))
+        with telemetry.phase("clock"):
+            pass
+        telemetry.end_tick()
+
+    log = tmp_path / "scheduler_telemetry.jsonl"
+    backup = tmp_path / "scheduler_telemetry.jsonl.1"
+    assert backup.exists()
+    assert log.stat().st_size < 600 + 300
+    assert sorted(p.name for p in tmp_path.glob("scheduler_telemetry.jsonl*")) == [log.name, backup.name]
+    last = json.loads(log.read_text().splitlines()[-1])
+    assert last["tick"] == 20
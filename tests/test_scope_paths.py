@@ -0,0 +1,51 @@
+"""Tests for shared scope path resolution."""
+
+import pytest
+
+import config.scope_paths as scope_paths
+from config.scope import Scope
+from config.scope_paths import clear_scope_path_cache, get_scope_path, get_scope_paths
+
+SCOPE = Scope(env="paper", broker="alpaca", mode="swing", market="us")
+
+
+@pytest.fixture
+def persist_root(monkeypatch, tmp_path):
+    monkeypatch.setenv("PERSISTENCE_ROOT", str(tmp_path))
+    monkeypatch.setattr(scope_paths, "_is_docker_environment", lambda: False)
+    builds = []
+    validate = scope_paths._validate_persistence_root
+    monkeypatch.setattr(scope_paths, "_validate_persistence_root", lambda root: (builds.append(root), validate(root)))
+    clear_scope_path_cache()
+    yield tmp_path, builds
+    clear_scope_path_cache()
+
+
+def test_resolver_built_once_per_scope(persist_root):
+    root, builds = persist_root
+    logs = get_scope_path(SCOPE, "logs")
+    assert logs == root / "paper_alpaca_swing_us" / "logs"
+    assert logs.is_dir()
+    assert (root / "paper_alpaca_swing_us" / "cache" / "ohlcv").is_dir()
+
+    for _ in range(100):
+        assert get_scope_path("paper_alpaca_swing_us", "logs") == logs
+        assert get_scope_path(SCOPE, "state") == root / "paper_alpaca_swing_us" / "state"
+    assert get_scope_paths(SCOPE) is get_scope_paths(SCOPE)
+    assert len(builds) == 1
+
+
+def test_new_persistence_root_gets_new_resolver(persist_root, monkeypatch, tmp_path_factory):
+    root, builds = persist_root
+    get_scope_path(SCOPE, "logs")
+    other = tmp_path_factory.mktemp("other_root")
+    monkeypatch.setenv("PERSISTENCE_ROOT", str(other))
+    assert get_scope_path(SCOPE, "logs") == other / "paper_alpaca_swing_us" / "logs"
+    assert len(builds) == 2
+
+
+def test_invalid_component_rejected(persist_root):
+    with pytest.raises(ValueError, match="Invalid component"):
+        get_scope_path(SCOPE, "secrets")
+    with pytest.raises(TypeError):
+        get_scope_paths(SCOPE).components["logs"] = None
@@ -0,0 +1,85 @@
+"""
+Unit tests for the columnar trade-statistics engine (monitoring.trade_stats).
+"""
+
+import numpy as np
+import pytest
+
+from monitoring.trade_stats import TradeStats
+from risk.portfolio_state import PortfolioState
+
+
+@pytest.fixture
+def trades():
+    """Closed trades as dicts (PortfolioState format)."""
+    returns = [0.05, -0.02, 0.0, 0.03, -0.04, 0.01, 0.02, -0.01]
+    confidence = [5, 3, 3, 4, 2, 5, None, 4]
+    return [{"return": r, "confidence": c} for r, c in zip(returns, confidence)]
+
+
+def test_win_rate_breakeven_handling(trades):
+    stats = TradeStats.from_trades(trades, returns="return", confidence="confidence")
+
+    assert stats.win_count() == 4
+    assert stats.win_count(breakeven_is_win=True) == 5
+    assert stats.win_rate(breakeven_is_win=True) == pytest.approx(5 / 8)
+
+
+def test_by_confidence_matches_scalar_grouping(trades):
+    stats = TradeStats.from_trades(trades, returns="return", confidence="confidence")
+
+    tiers = stats.by_confidence()
+
+    # Trade without confidence is not assigned a tier
+    assert sorted(tiers) == [2, 3, 4, 5]
+    for conf, tier in tiers.items():
+        rets = [t["return"] for t in trades if t["confidence"] == conf]
+        assert tier["count"] == len(rets)
+        assert tier["win_rate"] == pytest.approx(sum(r > 0 for r in rets) / len(rets))
+        assert tier["avg_return"] == pytest.approx(np.mean(rets))
+        assert tier["median_return"] == pytest.approx(np.median(rets))
+        assert tier["max_loss"] == pytest.approx(min(rets))
+
+
+def test_by_confidence_keeps_fractional_scores_apart():
+    stats = TradeStats([0.02, -0.01, 0.03], confidence=[0.6, 0.65, 1.0])
+
+    tiers = stats.by_confidence()
+
+    assert sorted(tiers) == [0.6, 0.65, 1]
+    assert isinstance(next(k for k in tiers if k == 1), int)
+    assert [tiers[k]["count"] for k in (0.6, 0.65, 1)] == [1, 1, 1]
+    assert tiers[0.65]["avg_return"] == pytest.approx(-0.01)
+
+
+def test_max_drawdown_uses_starting_peak():
+    equity = [100.0, 120.0, 90.0, 130.0, 110.0]
+
+    max_dd, max_dd_pct = TradeStats.max_drawdown(equity, starting_peak=100.0)
+
+    assert max_dd == pytest.approx(30.0)
+    assert max_dd_pct == pytest.approx(30.0 / 120.0)
+    assert TradeStats.max_drawdown([100.0, 101.0]) == (0.0, 0.0)
+
+
+def test_rolling_sharpe_matches_pandas_style_window():
+    returns = np.array([0.01, 0.02, -0.01, 0.03, 0.0, 0.015])
+    stats = TradeStats(returns)
+
+    sharpe = stats.rolling_sharpe(window=3, periods_per_year=1)
+
+    assert np.isnan(sharpe[:2]).all()
+    for end in range(3, len(returns) + 1):
+        window = returns[end - 3:end]
+        expected = window.mean() / window.std(ddof=1)
+        assert sharpe[end - 1] == pytest.approx(expected)
+
+
+def test_portfolio_state_win_rate_cache_tracks_new_trades():
+    portfolio = PortfolioState(initial_equity=10000.0)
+    portfolio.trades_closed.extend([{"return": 0.02}, {"return": -0.01}])
+
+    assert portfolio.get_win_rate_from_trades() == pytest.approx(50.0)
+
+    portfolio.trades_closed.append({"return": 0.0})
+    assert portfolio.get_win_rate_from_trades() == pytest.approx(200 / 3)
@@ -0,0 +1,122 @@
+"""
+Unit tests for walk-forward cross-validation (ml.walk_forward).
+"""
+
+import numpy as np
+import pytest
+
+import runtime.environment_guard as environment_guard
+from ml.walk_forward import WalkForwardValidator, expanding_window_folds
+
+
+@pytest.fixture(autouse=True)
+def paper_environment(monkeypatch):
+    """Walk-forward training is paper-only; give each test a fresh guard."""
+    monkeypatch.setenv("ENV", "paper")
+    monkeypatch.setattr(environment_guard, "_guard_instance", None)
+
+
+@pytest.fixture
+def dataset():
+    """Time-ordered synthetic dataset where feature 0 predicts bad trades."""
+    rng = np.random.default_rng(7)
+    X = rng.normal(size=(120, 3))
+    y = (X[:, 0] + 0.3 * rng.normal(size=120) > 0).astype(int)
+    pnl = np.where(y == 1, -0.02, 0.01)
+    return X, y, pnl
+
+
+def test_folds_expand_and_cover_tail():
+    folds = expanding_window_folds(n_samples=100, n_folds=4, min_train_size=20)
+
+    assert [f[0] for f in folds] == [0, 1, 2, 3]
+    assert folds[0][1] == 20
+    assert folds[-1][2] == 100
+    # Each test window starts where the previous one ended (no leakage, no gaps)
+    for prev, cur in zip(folds, folds[1:]):
+        assert cur[1] == prev[2]
+
+
+def test_folds_empty_when_insufficient_data():
+    assert expanding_window_folds(n_samples=22, n_folds=5, min_train_size=20) == []
+
+
+def test_run_produces_fold_and_aggregate_metrics(dataset):
+    X, y, pnl = dataset
+    validator = WalkForwardValidator(n_folds=4, min_train_size=40, max_workers=1)
+
+    result = validator.run(X, y, pnl=pnl)
+
+    assert result["n_folds"] == 4
+    assert sum(f["test_size"] for f in result["folds"]) == 80
+    assert result["aggregate"]["accuracy_mean"] > 0.8
+    improvement = result["improvement"]
+    assert improvement["bad_trades_avoided"] > 0
+    assert improvement["expectancy_improvement"] > 0
+
+
+def test_parallel_matches_serial(dataset):
+    X, y, pnl = dataset
+
+    serial = WalkForwardValidator(n_folds=3, min_train_size=30, max_workers=1).run(X, y, pnl)
+    parallel = WalkForwardValidator(n_folds=3, min_train_size=30, max_workers=2).run(X, y, pnl)
+
+    assert serial["folds"] == parallel["folds"]
+
+
+def test_standardized_folds_are_cached(dataset):
+    X, y, _ = dataset
+    validator = WalkForwardValidator(n_folds=3, min_train_size=30, max_workers=1)
+
+    validator.run(X, y)
+    cached = dict(validator._fold_cache)
+    validator.run(X, y)
+
+    assert len(validator._fold_cache) == 3
+    for key, matrices in cached.items():
+        assert validator._fold_cache[key] is matrices
+
+
+def test_returns_none_when_too_small(dataset):
+    X, y, _ = dataset
+    validator = WalkForwardValidator(n_folds=5, min_train_size=118, max_workers=1)
+
+    assert validator.run(X, y) is None
+
+
+def test_cache_keeps_only_current_dataset(dataset):
+    X, y, _ = dataset
+    validator = WalkForwardValidator(n_folds=3, min_train_size=30, max_workers=1)
+
+    validator.run(X, y)
+    validator.run(X[:-1], y[:-1])
+
+    assert len(validator._fold_cache) == 3
+    assert len({key[0] for key in validator._fold_cache}) == 1
+
+
+def test_offline_trainer_reuses_validator(dataset, tmp_path):
+    import pandas as pd
+    from ml.offline_trainer import OfflineTrainer
+
+    X, y, pnl = dataset
+
+    class Builder:
+        def to_dataframe(self):
+            return pd.DataFrame({
+                "decision_timestamp": pd.date_range("2026-01-01", periods=len(X), freq="h"),
+                "rule_features": [dict(zip(["a", "b", "c"], row)) for row in X],
+                "realized_pnl_pct": pnl,
+                "mae_pct": np.zeros(len(X)),
+            })
+
+    validator = WalkForwardValidator(max_workers=1)
+    trainer = OfflineTrainer(tmp_path, Builder(), walk_forward_validator=validator)
+
+    trainer.train(walk_forward_folds=3)
+    cached = dict(validator._fold_cache)
+    result = trainer.train(walk_forward_folds=3)
+
+    assert trainer.walk_forward_validator is validator
+    assert result["walk_forward"]["n_folds"] == 3
+    assert cached and all(validator._fold_cache[key] is matrices for key, matrices in cached.items())
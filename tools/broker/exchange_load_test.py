@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Load-test the execution path against the local exchange simulator.
+
+Usage:
+  PYTHONPATH=. python tools/broker/exchange_load_test.py --orders-per-minute 3000 --duration 20
+  PYTHONPATH=. python tools/broker/exchange_load_test.py --bars-csv data/BTC_1m.csv --latency-ms 25
+  PERSISTENCE_ROOT=/app/persist PYTHONPATH=. python tools/broker/exchange_load_test.py --through-executor --orders-per-minute 600
+
+No network: orders go to an in-process SimulatedExchange with seeded
+latency, rate limiting and volume-capped partial fills. By default orders
+hit the adapter directly; --through-executor routes them through
+TradingExecutor.execute_signal -> poll_order_fills (risk limits apply, so
+expect most signals to be blocked after the daily trade cap; executor logs
+go to the current scope's paths, so PERSISTENCE_ROOT must be set).
+
+Reports submit/fill latency percentiles and throughput; --json writes the
+report for comparison across commits.
+"""
+
+import argparse
+import json
+import logging
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from broker.exchange_load_driver import LoadDriver
+from broker.exchange_simulator import (
+    LatencyModel,
+    SimulatedExchange,
+    SimulatedExchangeAdapter,
+    bars_from_frame,
+    synthetic_bars,
+)
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+
+def build_exchange(args) -> SimulatedExchange:
+    symbols = [f"SYM{i:02d}" for i in range(args.symbols)]
+    if args.bars_csv:
+        replay = bars_from_frame(pd.read_csv(args.bars_csv))
+        bars = {symbol: replay for symbol in symbols}
+    else:
+        bars = {
+            symbol: synthetic_bars(2_000, start_price=50.0 + 10 * i, mean_volume=args.bar_volume, seed=args.seed + i)
+            for i, symbol in enumerate(symbols)
+        }
+    return SimulatedExchange(
+        bars,
+        participation_rate=args.participation,
+        starting_cash=args.starting_cash,
+        max_requests_per_sec=args.rate_limit or None,
+    )
+
+
+def build_executor(adapter):
+    from broker.trade_ledger import TradeLedger
+    from broker.trading_executor import TradingExecutor
+    from risk.portfolio_state import PortfolioState
+    from risk.risk_manager import RiskManager
+
+    ledger_file = Path(tempfile.mkdtemp(prefix="load_test_")) / "trades.json"
+    return TradingExecutor(
+        broker=adapter,
+        risk_manager=RiskManager(PortfolioState(adapter.account_equity)),
+        trade_ledger=TradeLedger(ledger_file=ledger_file),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Execution path load test (no network)")
+    parser.add_argument("--orders-per-minute", type=float, default=3000, help="Target submission rate")
+    parser.add_argument("--duration", type=float, default=20, help="Seconds to keep submitting")
+    parser.add_argument("--symbols", type=int, default=20, help="Symbols to spread orders over")
+    parser.add_argument("--quantity", type=float, default=1.0, help="Order quantity")
+    parser.add_argument("--workers", type=int, default=16, help="Concurrent submitters")
+    parser.add_argument("--latency-ms", type=float, default=15.0, help="Median request latency")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="Lognormal latency shape")
+    parser.add_argument("--rate-limit", type=float, default=0, help="Requests/s (0 = unlimited)")
+    parser.add_argument("--participation", type=float, default=0.1, help="Max share of bar volume filled")
+    parser.add_argument("--bar-volume", type=float, default=50.0, help="Mean synthetic bar volume")
+    parser.add_argument("--bar-interval", type=float, default=0.05, help="Seconds per replayed bar")
+    parser.add_argument("--bars-csv", help="OHLCV CSV to replay for every symbol")
+    parser.add_argument("--starting-cash", type=float, default=10_000_000.0, help="Account cash")
+    parser.add_argument("--through-executor", action="store_true", help="Route via TradingExecutor")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    parser.add_argument("--json", help="Write the report to this file")
+    args = parser.parse_args()
+
+    exchange = build_exchange(args)
+    adapter = SimulatedExchangeAdapter(exchange, LatencyModel(args.latency_ms, args.latency_sigma, seed=args.seed))
+    symbols = list(exchange.bars)
+
+    if args.through_executor:
+        driver = LoadDriver.for_executor(build_executor(adapter), symbols)
+    else:
+        driver = LoadDriver.for_adapter(adapter, symbols, quantity=args.quantity, workers=args.workers)
+
+    logging.getLogger("broker").setLevel(logging.WARNING)
+    exchange.start(args.bar_interval)
+    try:
+        report = driver.run(args.orders_per_minute, args.duration)
+    finally:
+        exchange.stop()
+
+    logger.info(
+        f"submitted={report.submitted} filled={report.filled} failed={report.failed} "
+        f"blocked={report.blocked} unfinished={report.unfinished} rate_limited={report.rate_limited} "
+        f"partial_polls={report.partial_seen} fills/min={report.fills_per_minute:,.0f}"
+    )
+    for name, stats in (("submit", report.submit_latency), ("fill", report.fill_latency)):
+        logger.info(
+            f"{name:>6} latency: p50={stats.p50_ms:.1f}ms p90={stats.p90_ms:.1f}ms "
+            f"p99={stats.p99_ms:.1f}ms max={stats.max_ms:.1f}ms (n={stats.count})"
+        )
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report.to_dict(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Benchmark scope path resolution.
+
+Usage:
+  PERSISTENCE_ROOT=/app/persist PYTHONPATH=. python tools/config/benchmark_scope_paths.py --calls 20000
+
+Compares building a ScopePathResolver per call (root validation, write
+probe and subdirectory mkdirs every time) against the shared resolver
+behind get_scope_path/get_scope_paths. Reports per-call latency.
+"""
+
+import argparse
+import logging
+import time
+
+from config.scope import get_scope
+from config.scope_paths import ScopePathResolver, clear_scope_path_cache, get_scope_path, get_scope_paths
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+COMPONENTS = ["ledger", "models", "features", "labels", "state", "logs", "cache"]
+
+
+def bench(fn, calls: int) -> float:
+    """Per-call microseconds."""
+    t0 = time.perf_counter()
+    for i in range(calls):
+        fn(i)
+    return (time.perf_counter() - t0) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scope path resolution")
+    parser.add_argument("--calls", type=int, default=20000, help="Lookups per variant")
+    args = parser.parse_args()
+
+    scope = get_scope()
+    logging.getLogger("config.scope_paths").setLevel(logging.WARNING)
+
+    uncached = bench(
+        lambda i: ScopePathResolver(scope).components[COMPONENTS[i % len(COMPONENTS)]],
+        max(1, args.calls // 10),
+    )
+    clear_scope_path_cache()
+    get_scope_paths(scope)  # Startup resolution
+    cached = bench(lambda i: get_scope_path(scope, COMPONENTS[i % len(COMPONENTS)]), args.calls)
+    cached_default = bench(lambda i: get_scope_path(None, COMPONENTS[i % len(COMPONENTS)]), args.calls)
+
+    logger.info(f"scope={scope}")
+    logger.info(f"resolver per call:   {uncached:10.2f} us/call")
+    logger.info(f"shared resolver:     {cached:10.2f} us/call ({uncached / cached:,.0f}x)")
+    logger.info(f"shared, global scope:{cached_default:10.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
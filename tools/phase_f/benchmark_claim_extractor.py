@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark Phase F claim extraction on synthetic articles.
+
+Usage:
+  python tools/phase_f/benchmark_claim_extractor.py --articles 5000 --repeat 3
+
+Articles are generated deterministically from a fixed vocabulary so runs
+are comparable across commits. Reports best-of-N wall time, articles/s
+and claims extracted.
+"""
+
+import argparse
+import logging
+import random
+import time
+
+from phase_f.extractors import ClaimExtractor
+from phase_f.fetchers import NewsArticle
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+SUBJECTS = ["Bitcoin", "Ethereum", "Solana", "The Fed", "The SEC", "CME futures", "Crypto markets"]
+VERBS = ["rallied", "fell", "reached", "hit", "surged", "declined", "may recover", "could collapse"]
+TAILS = [
+    "amid bullish sentiment and strong support",
+    "as bearish headwinds weigh on investor confidence",
+    "after reportedly breaking key resistance",
+    "while analysts flag weakness and fear",
+    "which leads to forced liquidations across exchanges",
+    "in a move that surprised many traders this week",
+]
+
+
+def make_articles(n: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+
+    def sentence() -> str:
+        return f"{rng.choice(SUBJECTS)} {rng.choice(VERBS)} {rng.randint(1, 99)}% {rng.choice(TAILS)}"
+
+    return [
+        NewsArticle(
+            title=sentence(),
+            description=". ".join(sentence() for _ in range(2)),
+            source=f"source_{i % 20}",
+            source_url=f"https://example.com/{i}",
+            published_at="2026-02-11T10:30:00Z",
+            content=". ".join(sentence() for _ in range(6)),
+        )
+        for i in range(n)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ClaimExtractor")
+    parser.add_argument("--articles", type=int, default=5000, help="Synthetic articles to extract from")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs (best time is reported)")
+    parser.add_argument("--max-claims", type=int, default=3, help="Claims per article")
+    args = parser.parse_args()
+
+    articles = make_articles(args.articles)
+    extractor = ClaimExtractor()
+    logging.getLogger("phase_f.extractors.claim_extractor").setLevel(logging.WARNING)
+
+    best = float("inf")
+    claims = []
+    for _ in range(max(1, args.repeat)):
+        t0 = time.perf_counter()
+        claims = extractor.extract_from_articles(articles, max_claims=args.max_claims)
+        best = min(best, time.perf_counter() - t0)
+
+    logger.info(
+        f"articles={len(articles)} claims={len(claims)} best={best * 1000:.1f}ms "
+        f"rate={len(articles) / best:,.0f} articles/s"
+    )
+
+
+if __name__ == "__main__":
+    main()